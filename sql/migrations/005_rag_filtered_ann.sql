@@ -0,0 +1,100 @@
+-- Migration: 005_rag_filtered_ann.sql
+-- Description: Denormalize document filter columns onto document_chunks so filtered
+--              semantic search can stay on the HNSW index
+-- Run this after 001_add_pgvector.sql
+-- Requires pgvector >= 0.8 for iterative index scans (hnsw.iterative_scan)
+
+-- ============================================================================
+-- FILTER COLUMNS ON CHUNKS
+-- semantic_search filters on doc_type/symbol/timeframe; keeping them on the
+-- chunk row avoids a join before the vector ORDER BY
+-- ============================================================================
+ALTER TABLE document_chunks ADD COLUMN IF NOT EXISTS doc_type VARCHAR(50);
+ALTER TABLE document_chunks ADD COLUMN IF NOT EXISTS symbol VARCHAR(20);
+ALTER TABLE document_chunks ADD COLUMN IF NOT EXISTS timeframe VARCHAR(10);
+
+-- Backfill existing chunks
+UPDATE document_chunks dc
+SET doc_type = d.doc_type,
+    symbol = d.symbol,
+    timeframe = d.timeframe
+FROM documents d
+WHERE dc.document_id = d.id
+  AND (dc.doc_type IS DISTINCT FROM d.doc_type
+       OR dc.symbol IS DISTINCT FROM d.symbol
+       OR dc.timeframe IS DISTINCT FROM d.timeframe);
+
+-- Fill filter columns for chunks inserted without them
+CREATE OR REPLACE FUNCTION document_chunks_copy_filters() RETURNS trigger AS $$
+BEGIN
+    IF NEW.doc_type IS NULL THEN
+        SELECT d.doc_type, d.symbol, d.timeframe
+        INTO NEW.doc_type, NEW.symbol, NEW.timeframe
+        FROM documents d
+        WHERE d.id = NEW.document_id;
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_document_chunks_copy_filters ON document_chunks;
+CREATE TRIGGER trg_document_chunks_copy_filters
+    BEFORE INSERT ON document_chunks
+    FOR EACH ROW EXECUTE FUNCTION document_chunks_copy_filters();
+
+-- Keep chunks in sync when a document's filter columns change
+CREATE OR REPLACE FUNCTION documents_propagate_filters() RETURNS trigger AS $$
+BEGIN
+    UPDATE document_chunks
+    SET doc_type = NEW.doc_type,
+        symbol = NEW.symbol,
+        timeframe = NEW.timeframe
+    WHERE document_id = NEW.id;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_documents_propagate_filters ON documents;
+CREATE TRIGGER trg_documents_propagate_filters
+    AFTER UPDATE OF doc_type, symbol, timeframe ON documents
+    FOR EACH ROW
+    WHEN (OLD.doc_type IS DISTINCT FROM NEW.doc_type
+          OR OLD.symbol IS DISTINCT FROM NEW.symbol
+          OR OLD.timeframe IS DISTINCT FROM NEW.timeframe)
+    EXECUTE FUNCTION documents_propagate_filters();
+
+-- ============================================================================
+-- INDEXES
+-- ============================================================================
+-- Selective filters (e.g. a single symbol) are cheaper as a B-tree scan plus
+-- exact distance sort than as an ANN scan that discards most candidates
+CREATE INDEX IF NOT EXISTS idx_document_chunks_symbol_type
+ON document_chunks (symbol, doc_type);
+
+-- Partial HNSW indexes for the doc types retrieval filters on most, so a
+-- doc_type filter is satisfied by the index itself instead of post-filtering
+CREATE INDEX IF NOT EXISTS idx_document_chunks_embedding_signal
+ON document_chunks USING hnsw (embedding vector_cosine_ops)
+WITH (m = 16, ef_construction = 64)
+WHERE doc_type = 'signal';
+
+CREATE INDEX IF NOT EXISTS idx_document_chunks_embedding_backtest
+ON document_chunks USING hnsw (embedding vector_cosine_ops)
+WITH (m = 16, ef_construction = 64)
+WHERE doc_type = 'backtest';
+
+CREATE INDEX IF NOT EXISTS idx_document_chunks_embedding_trade_analysis
+ON document_chunks USING hnsw (embedding vector_cosine_ops)
+WITH (m = 16, ef_construction = 64)
+WHERE doc_type = 'trade_analysis';
+
+CREATE INDEX IF NOT EXISTS idx_document_chunks_embedding_strategy
+ON document_chunks USING hnsw (embedding vector_cosine_ops)
+WITH (m = 16, ef_construction = 64)
+WHERE doc_type = 'strategy';
+
+ANALYZE document_chunks;
+
+COMMENT ON COLUMN document_chunks.doc_type IS 'Copied from documents.doc_type for filtered vector search';
+COMMENT ON COLUMN document_chunks.symbol IS 'Copied from documents.symbol for filtered vector search';
+COMMENT ON COLUMN document_chunks.timeframe IS 'Copied from documents.timeframe for filtered vector search';
@@ -0,0 +1,134 @@
+-- Migration: 006_ohlcv_hypertable.sql
+-- Description: Convert the data service ohlcv table to a TimescaleDB hypertable with
+--              compression and continuous aggregates for 5m/1h/1d bars
+-- Requires TimescaleDB 2.11+ (upserts into compressed chunks)
+-- Mirrors store.TIMESCALE_DDL in the data service; ensure_schema applies the same
+-- statements when the timescaledb extension is installed
+
+CREATE EXTENSION IF NOT EXISTS timescaledb;
+
+CREATE TABLE IF NOT EXISTS ohlcv (
+    source TEXT NOT NULL,
+    symbol TEXT NOT NULL,
+    interval TEXT NOT NULL,
+    ts TIMESTAMPTZ NOT NULL,
+    open DOUBLE PRECISION,
+    high DOUBLE PRECISION,
+    low DOUBLE PRECISION,
+    close DOUBLE PRECISION,
+    volume DOUBLE PRECISION,
+    PRIMARY KEY (source, symbol, interval, ts)
+);
+
+-- ============================================================================
+-- HYPERTABLE
+-- 1-day time chunks, space-partitioned by symbol; existing rows are migrated
+-- ============================================================================
+SELECT create_hypertable(
+    'ohlcv',
+    'ts',
+    partitioning_column => 'symbol',
+    number_partitions => 4,
+    chunk_time_interval => INTERVAL '1 day',
+    migrate_data => TRUE,
+    if_not_exists => TRUE
+);
+
+-- ============================================================================
+-- COMPRESSION
+-- Segment by series so range scans for one symbol decompress only its rows
+-- ============================================================================
+ALTER TABLE ohlcv SET (
+    timescaledb.compress,
+    timescaledb.compress_segmentby = 'source, symbol, interval',
+    timescaledb.compress_orderby = 'ts DESC'
+);
+
+SELECT add_compression_policy('ohlcv', INTERVAL '7 days', if_not_exists => TRUE);
+
+-- ============================================================================
+-- CONTINUOUS AGGREGATES
+-- Built from 1m rows; real-time aggregation (materialized_only = false) keeps
+-- the not-yet-materialized tail visible to readers
+-- ============================================================================
+CREATE MATERIALIZED VIEW IF NOT EXISTS ohlcv_5m
+WITH (timescaledb.continuous, timescaledb.materialized_only = false) AS
+SELECT
+    source,
+    symbol,
+    time_bucket(INTERVAL '5 minutes', ts) AS bucket,
+    first(open, ts) AS open,
+    max(high) AS high,
+    min(low) AS low,
+    last(close, ts) AS close,
+    sum(volume) AS volume
+FROM ohlcv
+WHERE interval = '1m'
+GROUP BY source, symbol, bucket
+WITH NO DATA;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS ohlcv_1h
+WITH (timescaledb.continuous, timescaledb.materialized_only = false) AS
+SELECT
+    source,
+    symbol,
+    time_bucket(INTERVAL '1 hour', ts) AS bucket,
+    first(open, ts) AS open,
+    max(high) AS high,
+    min(low) AS low,
+    last(close, ts) AS close,
+    sum(volume) AS volume
+FROM ohlcv
+WHERE interval = '1m'
+GROUP BY source, symbol, bucket
+WITH NO DATA;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS ohlcv_1d
+WITH (timescaledb.continuous, timescaledb.materialized_only = false) AS
+SELECT
+    source,
+    symbol,
+    time_bucket(INTERVAL '1 day', ts) AS bucket,
+    first(open, ts) AS open,
+    max(high) AS high,
+    min(low) AS low,
+    last(close, ts) AS close,
+    sum(volume) AS volume
+FROM ohlcv
+WHERE interval = '1m'
+GROUP BY source, symbol, bucket
+WITH NO DATA;
+
+CREATE INDEX IF NOT EXISTS idx_ohlcv_5m_series ON ohlcv_5m (source, symbol, bucket DESC);
+CREATE INDEX IF NOT EXISTS idx_ohlcv_1h_series ON ohlcv_1h (source, symbol, bucket DESC);
+CREATE INDEX IF NOT EXISTS idx_ohlcv_1d_series ON ohlcv_1d (source, symbol, bucket DESC);
+
+SELECT add_continuous_aggregate_policy('ohlcv_5m',
+    start_offset => INTERVAL '1 day',
+    end_offset => INTERVAL '5 minutes',
+    schedule_interval => INTERVAL '5 minutes',
+    if_not_exists => TRUE
+);
+
+SELECT add_continuous_aggregate_policy('ohlcv_1h',
+    start_offset => INTERVAL '3 days',
+    end_offset => INTERVAL '1 hour',
+    schedule_interval => INTERVAL '30 minutes',
+    if_not_exists => TRUE
+);
+
+SELECT add_continuous_aggregate_policy('ohlcv_1d',
+    start_offset => INTERVAL '7 days',
+    end_offset => INTERVAL '1 day',
+    schedule_interval => INTERVAL '1 hour',
+    if_not_exists => TRUE
+);
+
+-- Materialize existing history (must run outside a transaction block)
+CALL refresh_continuous_aggregate('ohlcv_5m', NULL, NULL);
+CALL refresh_continuous_aggregate('ohlcv_1h', NULL, NULL);
+CALL refresh_continuous_aggregate('ohlcv_1d', NULL, NULL);
+
+COMMENT ON MATERIALIZED VIEW ohlcv_5m IS '5-minute bars aggregated from 1m ohlcv rows';
+COMMENT ON MATERIALIZED VIEW ohlcv_1h IS '1-hour bars aggregated from 1m ohlcv rows';
+COMMENT ON MATERIALIZED VIEW ohlcv_1d IS '1-day bars aggregated from 1m ohlcv rows';
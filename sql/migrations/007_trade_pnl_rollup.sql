@@ -0,0 +1,47 @@
+-- Migration: 007_trade_pnl_rollup.sql
+-- Description: Daily P&L rollup of trades per account, strategy and symbol so the web
+--              dashboard aggregates a few rows per day instead of the whole trade history
+-- Requires TimescaleDB 2.7+ (trades is already a hypertable, see init.sql)
+-- Read by web/src/db_helpers.py; without this view the helpers aggregate trades directly
+
+CREATE EXTENSION IF NOT EXISTS timescaledb;
+
+-- ============================================================================
+-- DAILY TRADE P&L
+-- Unlike daily_account_performance this keeps trades without realized_pnl (they
+-- count towards total_trades) and splits wins/losses so profit factor and
+-- average win/loss can be derived from sums. Real-time aggregation means
+-- trades newer than the last refresh are folded in at query time; each policy
+-- run only re-materializes the trailing window, not the full history.
+-- ============================================================================
+CREATE MATERIALIZED VIEW IF NOT EXISTS daily_trade_pnl
+WITH (timescaledb.continuous, timescaledb.materialized_only = false) AS
+SELECT
+    time_bucket(INTERVAL '1 day', time) AS day,
+    account_id,
+    strategy_name,
+    symbol,
+    COUNT(*) AS trades_count,
+    SUM(CASE WHEN realized_pnl > 0 THEN 1 ELSE 0 END) AS winning_trades,
+    SUM(CASE WHEN realized_pnl < 0 THEN 1 ELSE 0 END) AS losing_trades,
+    SUM(CASE WHEN realized_pnl > 0 THEN realized_pnl ELSE 0 END) AS gross_profit,
+    SUM(CASE WHEN realized_pnl < 0 THEN -realized_pnl ELSE 0 END) AS gross_loss,
+    COALESCE(SUM(realized_pnl), 0) AS total_pnl,
+    COALESCE(SUM(fee), 0) AS total_fees
+FROM trades
+GROUP BY day, account_id, strategy_name, symbol
+WITH NO DATA;
+
+CREATE INDEX IF NOT EXISTS idx_daily_trade_pnl_account_day ON daily_trade_pnl (account_id, day DESC);
+
+SELECT add_continuous_aggregate_policy('daily_trade_pnl',
+    start_offset => INTERVAL '3 days',
+    end_offset => INTERVAL '1 hour',
+    schedule_interval => INTERVAL '15 minutes',
+    if_not_exists => TRUE
+);
+
+-- Materialize existing history (must run outside a transaction block)
+CALL refresh_continuous_aggregate('daily_trade_pnl', NULL, NULL);
+
+COMMENT ON MATERIALIZED VIEW daily_trade_pnl IS 'Daily trade counts, wins/losses and P&L per account, strategy and symbol';
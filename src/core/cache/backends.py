@@ -113,7 +113,7 @@ class MemoryBackend(CacheBackend):
         """Get all keys from the memory cache."""
         import fnmatch
 
-        all_keys = list(self._cache.cache.keys())
+        all_keys = self._cache.keys()
         if pattern == "*":
             return all_keys
         return [key for key in all_keys if fnmatch.fnmatch(key, pattern)]
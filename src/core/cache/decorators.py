@@ -10,6 +10,8 @@ import functools
 import hashlib
 import inspect
 import json
+import math
+import random
 import time
 from collections.abc import Awaitable, Callable
 from concurrent.futures import ThreadPoolExecutor
@@ -26,6 +28,15 @@ AF = TypeVar("AF", bound=Callable[..., Awaitable[Any]])
 # Global thread pool for sync operations
 _thread_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="cache_")
 
+# Argument types that can go into a cache key verbatim via repr()
+_PRIMITIVE_TYPES = (str, int, float, bool, type(None))
+
+# Marker key for values stored with metadata (negative entries, early refresh)
+_ENVELOPE_KEY = "__fks_cache__"
+
+# Keys longer than this are hashed
+_MAX_KEY_LENGTH = 200
+
 
 class CacheConfig:
     """Configuration for cache decorators."""
@@ -43,6 +54,9 @@ class CacheConfig:
         condition: Callable | None = None,
         on_cache_hit: Callable | None = None,
         on_cache_miss: Callable | None = None,
+        single_flight: bool = True,
+        negative_ttl: int | None = None,
+        early_refresh_beta: float = 0.0,
     ):
         """
         Initialize cache configuration.
@@ -59,18 +73,31 @@ class CacheConfig:
             condition: Function to determine if result should be cached
             on_cache_hit: Callback for cache hits
             on_cache_miss: Callback for cache misses
+            single_flight: Coalesce concurrent misses for the same key into one call
+            negative_ttl: If set, cache None/empty results for this many seconds
+            early_refresh_beta: Probabilistic early refresh factor (0 disables);
+                1.0 is the usual choice, larger values refresh earlier
         """
         self.backend = backend or MemoryBackend()
         self.ttl = ttl
         self.key_prefix = key_prefix
         self.include_args = include_args
         self.include_kwargs = include_kwargs
-        self.exclude_args = exclude_args or []
-        self.exclude_kwargs = exclude_kwargs or []
+        self.exclude_args = set(exclude_args or [])
+        self.exclude_kwargs = set(exclude_kwargs or [])
         self.key_generator = key_generator
         self.condition = condition
         self.on_cache_hit = on_cache_hit
         self.on_cache_miss = on_cache_miss
+        self.single_flight = single_flight
+        self.negative_ttl = negative_ttl
+        self.early_refresh_beta = early_refresh_beta
+
+        # In-flight computations keyed by cache key, for single-flight
+        self._inflight: dict[str, asyncio.Future] = {}
+        # Pending early refreshes keyed by cache key; also the strong reference
+        # that keeps each task alive, since the event loop only holds weak ones
+        self._refresh_tasks: dict[str, asyncio.Task] = {}
 
 
 def _generate_cache_key(
@@ -86,53 +113,93 @@ def _generate_cache_key(
         except Exception as e:
             logger.warning(f"Custom key generator failed: {e}, falling back to default")
 
-    # Build key components
-    key_parts = [func.__module__, func.__qualname__]
-
-    # Add arguments if enabled
+    filtered_args = []
     if config.include_args and args:
-        filtered_args = []
-        for i, arg in enumerate(args):
-            if i not in config.exclude_args:
-                filtered_args.append(arg)
+        filtered_args = [
+            arg for i, arg in enumerate(args) if i not in config.exclude_args
+        ]
 
-        if filtered_args:
-            try:
-                args_str = json.dumps(filtered_args, sort_keys=True, default=str)
-                if len(args_str) > 100:
-                    args_str = hashlib.md5(args_str.encode()).hexdigest()
-                key_parts.append(f"args:{args_str}")
-            except (TypeError, ValueError):
-                # Fallback for non-serializable objects
-                args_hash = hashlib.md5(str(filtered_args).encode()).hexdigest()
-                key_parts.append(f"args:{args_hash}")
-
-    # Add keyword arguments if enabled
+    filtered_kwargs = {}
     if config.include_kwargs and kwargs:
         filtered_kwargs = {
             k: v for k, v in kwargs.items() if k not in config.exclude_kwargs
         }
 
-        if filtered_kwargs:
-            try:
-                kwargs_str = json.dumps(
-                    sorted(filtered_kwargs.items()), sort_keys=True, default=str
-                )
-                if len(kwargs_str) > 100:
-                    kwargs_str = hashlib.md5(kwargs_str.encode()).hexdigest()
-                key_parts.append(f"kwargs:{kwargs_str}")
-            except (TypeError, ValueError):
-                # Fallback for non-serializable objects
-                kwargs_hash = hashlib.md5(
-                    str(sorted(filtered_kwargs.items())).encode()
-                ).hexdigest()
-                key_parts.append(f"kwargs:{kwargs_hash}")
-
-    # Create final key
-    key_string = ":".join(key_parts)
-    cache_key = hashlib.md5(key_string.encode()).hexdigest()
-
-    return f"{config.key_prefix}{cache_key}"
+    func_part = f"{func.__module__}:{func.__qualname__}"
+
+    # Fast path: primitive arguments go into the key as-is, no JSON or hashing
+    if all(type(arg) in _PRIMITIVE_TYPES for arg in filtered_args) and all(
+        type(v) in _PRIMITIVE_TYPES for v in filtered_kwargs.values()
+    ):
+        parts = [repr(arg) for arg in filtered_args]
+        parts.extend(f"{k}={filtered_kwargs[k]!r}" for k in sorted(filtered_kwargs))
+        args_part = ",".join(parts)
+        if len(args_part) > _MAX_KEY_LENGTH:
+            args_part = hashlib.md5(args_part.encode()).hexdigest()
+        return f"{config.key_prefix}{func_part}:{args_part}"
+
+    key_parts = []
+
+    if filtered_args:
+        try:
+            key_parts.append(
+                f"args:{json.dumps(filtered_args, sort_keys=True, default=str)}"
+            )
+        except (TypeError, ValueError):
+            # Fallback for non-serializable objects
+            key_parts.append(f"args:{filtered_args}")
+
+    if filtered_kwargs:
+        try:
+            kwargs_str = json.dumps(
+                sorted(filtered_kwargs.items()), sort_keys=True, default=str
+            )
+            key_parts.append(f"kwargs:{kwargs_str}")
+        except (TypeError, ValueError):
+            # Fallback for non-serializable objects
+            key_parts.append(f"kwargs:{sorted(filtered_kwargs.items())}")
+
+    args_hash = hashlib.md5(":".join(key_parts).encode()).hexdigest()
+    return f"{config.key_prefix}{func_part}:{args_hash}"
+
+
+def _is_empty_result(result: Any) -> bool:
+    """Check whether a result counts as empty for negative caching."""
+    if result is None:
+        return True
+    try:
+        return len(result) == 0
+    except TypeError:
+        return False
+
+
+def _wrap_value(value: Any, delta: float, expiry: float) -> dict[str, Any]:
+    """Wrap a value with the metadata needed for negative caching and early refresh."""
+    return {_ENVELOPE_KEY: 1, "value": value, "delta": delta, "expiry": expiry}
+
+
+def _unwrap_value(cached: Any) -> tuple[Any, dict[str, Any] | None]:
+    """Split a cached value into (value, metadata); metadata is None for bare values."""
+    if isinstance(cached, dict) and cached.get(_ENVELOPE_KEY) == 1:
+        return cached.get("value"), cached
+    return cached, None
+
+
+def _should_refresh_early(meta: dict[str, Any] | None, config: CacheConfig) -> bool:
+    """
+    Decide whether to recompute a cached value ahead of its expiry.
+
+    Implements probabilistic early expiration: a value that took ``delta``
+    seconds to compute is refreshed with rising probability as its expiry
+    approaches, so concurrent readers don't all miss at the same instant.
+    """
+    if not meta or config.early_refresh_beta <= 0:
+        return False
+    delta = meta.get("delta") or 0.0
+    expiry = meta.get("expiry") or 0.0
+    # 1 - random() is in (0, 1], keeping log() finite
+    jitter = -delta * config.early_refresh_beta * math.log(1.0 - random.random())
+    return time.time() + jitter >= expiry
 
 
 def _should_cache_result(result: Any, config: CacheConfig) -> bool:
@@ -148,6 +215,113 @@ def _should_cache_result(result: Any, config: CacheConfig) -> bool:
     return result is not None
 
 
+async def _call_function(func: Callable, *args, **kwargs) -> Any:
+    """Call the wrapped function, running sync functions in the thread pool."""
+    if asyncio.iscoroutinefunction(func):
+        return await func(*args, **kwargs)
+    return await asyncio.get_running_loop().run_in_executor(
+        _thread_pool, functools.partial(func, *args, **kwargs)
+    )
+
+
+async def _compute_and_store(
+    func: Callable, config: CacheConfig, cache_key: str, *args, **kwargs
+) -> Any:
+    """Execute the function, store its result and fire the miss callback."""
+    start_time = time.time()
+
+    try:
+        result = await _call_function(func, *args, **kwargs)
+    except Exception as e:
+        logger.error(f"Function execution failed for {func.__name__}: {e}")
+        raise
+
+    elapsed = time.time() - start_time
+    execution_time = elapsed * 1000  # ms
+
+    # Cache the result if it meets the condition, or as a negative entry
+    ttl = None
+    if config.negative_ttl is not None and _is_empty_result(result):
+        ttl = config.negative_ttl
+    elif _should_cache_result(result, config):
+        ttl = config.ttl
+
+    if ttl is not None:
+        value = result
+        if result is None or config.early_refresh_beta > 0:
+            value = _wrap_value(result, elapsed, time.time() + ttl)
+        try:
+            await config.backend.set(cache_key, value, ttl)
+        except Exception as e:
+            logger.warning(f"Cache set failed for {func.__name__}: {e}")
+
+    if config.on_cache_miss:
+        try:
+            config.on_cache_miss(func, args, kwargs, result, execution_time)
+        except Exception as e:
+            logger.warning(f"Cache miss callback failed: {e}")
+
+    return result
+
+
+async def _single_flight(
+    func: Callable, config: CacheConfig, cache_key: str, *args, **kwargs
+) -> Any:
+    """
+    Compute a value at most once per key across concurrent callers.
+
+    The first caller runs the function; callers arriving while it is in
+    flight await the same future and share its result or exception. If the
+    leader is cancelled, its joiners retry and one of them takes over.
+    """
+    if not config.single_flight:
+        return await _compute_and_store(func, config, cache_key, *args, **kwargs)
+
+    while (inflight := config._inflight.get(cache_key)) is not None:
+        logger.debug(f"Joining in-flight call for {func.__name__}: {cache_key}")
+        try:
+            return await asyncio.shield(inflight)
+        except asyncio.CancelledError:
+            if not inflight.cancelled():
+                raise  # this caller was cancelled, not the leader
+
+    future = asyncio.get_running_loop().create_future()
+    config._inflight[cache_key] = future
+    try:
+        result = await _compute_and_store(func, config, cache_key, *args, **kwargs)
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        # Mark retrieved so a failure nobody joined isn't logged as unhandled
+        future.exception()
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        config._inflight.pop(cache_key, None)
+
+
+def _refresh_in_background(
+    func: Callable, config: CacheConfig, cache_key: str, *args, **kwargs
+) -> None:
+    """Start an early refresh unless one is already running for this key."""
+    if cache_key in config._inflight or cache_key in config._refresh_tasks:
+        return
+
+    async def refresh():
+        try:
+            await _single_flight(func, config, cache_key, *args, **kwargs)
+        except Exception as e:
+            logger.warning(f"Early cache refresh failed for {func.__name__}: {e}")
+
+    task = asyncio.get_running_loop().create_task(refresh())
+    config._refresh_tasks[cache_key] = task
+    task.add_done_callback(lambda _: config._refresh_tasks.pop(cache_key, None))
+
+
 async def _async_cache_wrapper(
     func: Callable, config: CacheConfig, *args, **kwargs
 ) -> Any:
@@ -158,49 +332,23 @@ async def _async_cache_wrapper(
     try:
         cached_result = await config.backend.get(cache_key)
         if cached_result is not None:
+            value, meta = _unwrap_value(cached_result)
             logger.debug(f"Cache hit for {func.__name__}: {cache_key}")
+            if _should_refresh_early(meta, config):
+                logger.debug(f"Early refresh for {func.__name__}: {cache_key}")
+                _refresh_in_background(func, config, cache_key, *args, **kwargs)
             if config.on_cache_hit:
                 try:
-                    config.on_cache_hit(func, args, kwargs, cached_result)
+                    config.on_cache_hit(func, args, kwargs, value)
                 except Exception as e:
                     logger.warning(f"Cache hit callback failed: {e}")
-            return cached_result
+            return value
     except Exception as e:
         logger.warning(f"Cache get failed for {func.__name__}: {e}")
 
-    # Cache miss - execute function
+    # Cache miss - execute function (once per key across concurrent callers)
     logger.debug(f"Cache miss for {func.__name__}: {cache_key}")
-    start_time = time.time()
-
-    try:
-        if asyncio.iscoroutinefunction(func):
-            result = await func(*args, **kwargs)
-        else:
-            # Run sync function in thread pool
-            result = await asyncio.get_event_loop().run_in_executor(
-                _thread_pool, functools.partial(func, *args, **kwargs)
-            )
-
-        execution_time = (time.time() - start_time) * 1000  # ms
-
-        # Cache the result if it meets the condition
-        if _should_cache_result(result, config):
-            try:
-                await config.backend.set(cache_key, result, config.ttl)
-            except Exception as e:
-                logger.warning(f"Cache set failed for {func.__name__}: {e}")
-
-        if config.on_cache_miss:
-            try:
-                config.on_cache_miss(func, args, kwargs, result, execution_time)
-            except Exception as e:
-                logger.warning(f"Cache miss callback failed: {e}")
-
-        return result
-
-    except Exception as e:
-        logger.error(f"Function execution failed for {func.__name__}: {e}")
-        raise
+    return await _single_flight(func, config, cache_key, *args, **kwargs)
 
 
 def async_cached(
@@ -215,6 +363,9 @@ def async_cached(
     condition: Callable | None = None,
     on_cache_hit: Callable | None = None,
     on_cache_miss: Callable | None = None,
+    single_flight: bool = True,
+    negative_ttl: int | None = None,
+    early_refresh_beta: float = 0.0,
 ) -> Callable[[AF], AF]:
     """
     Decorator for caching async functions.
@@ -231,6 +382,9 @@ def async_cached(
         condition: Function to determine if result should be cached
         on_cache_hit: Callback for cache hits
         on_cache_miss: Callback for cache misses
+        single_flight: Coalesce concurrent misses for the same key into one call
+        negative_ttl: If set, cache None/empty results for this many seconds
+        early_refresh_beta: Probabilistic early refresh factor (0 disables)
 
     Returns:
         Decorated async function
@@ -252,6 +406,9 @@ def async_cached(
             condition=condition,
             on_cache_hit=on_cache_hit,
             on_cache_miss=on_cache_miss,
+            single_flight=single_flight,
+            negative_ttl=negative_ttl,
+            early_refresh_beta=early_refresh_beta,
         )
 
         @functools.wraps(func)
@@ -295,6 +452,9 @@ def cached(
     condition: Callable | None = None,
     on_cache_hit: Callable | None = None,
     on_cache_miss: Callable | None = None,
+    single_flight: bool = True,
+    negative_ttl: int | None = None,
+    early_refresh_beta: float = 0.0,
 ) -> Callable[[F], F]:
     """
     Decorator for caching sync functions (executed in async context).
@@ -311,6 +471,9 @@ def cached(
         condition: Function to determine if result should be cached
         on_cache_hit: Callback for cache hits
         on_cache_miss: Callback for cache misses
+        single_flight: Coalesce concurrent misses for the same key into one call
+        negative_ttl: If set, cache None/empty results for this many seconds
+        early_refresh_beta: Probabilistic early refresh factor (0 disables)
 
     Returns:
         Decorated async function that caches the sync function
@@ -332,6 +495,9 @@ def cached(
             condition=condition,
             on_cache_hit=on_cache_hit,
             on_cache_miss=on_cache_miss,
+            single_flight=single_flight,
+            negative_ttl=negative_ttl,
+            early_refresh_beta=early_refresh_beta,
         )
 
         @functools.wraps(func)
@@ -374,6 +540,9 @@ def method_cached(
     exclude_kwargs: list | None = None,
     key_generator: Callable | None = None,
     condition: Callable | None = None,
+    single_flight: bool = True,
+    negative_ttl: int | None = None,
+    early_refresh_beta: float = 0.0,
 ) -> Callable:
     """
     Decorator for caching class methods.
@@ -389,6 +558,9 @@ def method_cached(
         exclude_kwargs: List of kwarg names to exclude from key
         key_generator: Custom key generation function
         condition: Function to determine if result should be cached
+        single_flight: Coalesce concurrent misses for the same key into one call
+        negative_ttl: If set, cache None/empty results for this many seconds
+        early_refresh_beta: Probabilistic early refresh factor (0 disables)
 
     Returns:
         Decorated method
@@ -413,6 +585,9 @@ def method_cached(
                 exclude_kwargs=exclude_kwargs,
                 key_generator=key_generator,
                 condition=condition,
+                single_flight=single_flight,
+                negative_ttl=negative_ttl,
+                early_refresh_beta=early_refresh_beta,
             )
         else:
             cache_decorator = cached(
@@ -425,6 +600,9 @@ def method_cached(
                 exclude_kwargs=exclude_kwargs,
                 key_generator=key_generator,
                 condition=condition,
+                single_flight=single_flight,
+                negative_ttl=negative_ttl,
+                early_refresh_beta=early_refresh_beta,
             )
 
         return cache_decorator(method)
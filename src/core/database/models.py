@@ -304,12 +304,19 @@ class DocumentChunk(Base):
     embedding = Column(ARRAY(Float))  # pgvector will be used via raw SQL
     token_count = Column(Integer)
     chunk_metadata = Column(JSONB)  # chunk-specific metadata - renamed from 'metadata' to avoid SQLAlchemy conflict
+    # Copied from the parent document so filtered vector search stays on one table
+    doc_type = Column(String(50))
+    symbol = Column(String(20))
+    timeframe = Column(String(10))
     created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(TIMEZONE))
 
     # Relationships
     document = relationship("Document", back_populates="chunks")
 
-    __table_args__ = (Index("idx_document_chunks_document_id", "document_id"),)
+    __table_args__ = (
+        Index("idx_document_chunks_document_id", "document_id"),
+        Index("idx_document_chunks_symbol_type", "symbol", "doc_type"),
+    )
 
 
 class QueryHistory(Base):
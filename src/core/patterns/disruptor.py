@@ -1,74 +1,262 @@
 import asyncio
 import contextlib
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from typing import Any, List, Optional
 
 
 class EventProcessor:
     """Base class for event processors used by Disruptor.
 
-    Subclasses should override `on_event` to process events.
+    Subclasses should override `on_event` to process events. Processors that
+    can handle a run of events more cheaply may override `on_batch` instead.
     """
 
     async def on_event(self, event: Any, sequence: int) -> None:
         raise NotImplementedError
 
+    async def on_batch(self, events: List[Any], first_sequence: int) -> None:
+        """Process events published at first_sequence, first_sequence + 1, ...
+
+        The default dispatches to `on_event`, isolating exceptions per event.
+        """
+        for offset, event in enumerate(events):
+            try:
+                await self.on_event(event, first_sequence + offset)
+            except Exception:
+                # Keep running even if a single event fails
+                pass
+
+
+class Sequence:
+    """Monotonic sequence counter; -1 means nothing claimed or processed yet."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: int = -1) -> None:
+        self.value = value
+
+
+class _Signal:
+    """Wakes every waiter on each notify (asyncio equivalent of a blocking wait strategy)."""
+
+    __slots__ = ("_event",)
+
+    def __init__(self) -> None:
+        self._event = asyncio.Event()
+
+    def notify(self) -> None:
+        # set() resolves current waiters; clearing re-arms for the next wait
+        self._event.set()
+        self._event.clear()
+
+    async def wait(self) -> None:
+        await self._event.wait()
+
+
+class RingBuffer:
+    """Pre-allocated power-of-two ring of event slots.
+
+    Producers claim sequences with `next`, fill `buffer[sequence & mask]`,
+    then `publish`. The cursor only advances over contiguously published
+    sequences, so consumers never see a slot whose producer hasn't finished
+    even if producers publish out of order. Claims wait while the slot they
+    would overwrite hasn't been processed by every gating sequence.
+    """
+
+    def __init__(self, size: int, event_factory: Optional[Callable[[], Any]] = None) -> None:
+        if size < 1 or size & (size - 1):
+            raise ValueError(f"Ring buffer size must be a power of two, got {size}")
+        self.size = size
+        self.mask = size - 1
+        self.slots: List[Any] = [event_factory() if event_factory else None for _ in range(size)]
+        self.cursor = Sequence()
+        self._next = -1
+        self._published = [-1] * size
+        self._gating: List[Sequence] = []
+        self.signal = _Signal()
+
+    def add_gating_sequences(self, *sequences: Sequence) -> None:
+        self._gating.extend(sequences)
+
+    def _min_gating(self) -> int:
+        if not self._gating:
+            return self._next
+        return min(s.value for s in self._gating)
+
+    def remaining_capacity(self) -> int:
+        return self.size - (self._next - self._min_gating())
+
+    async def next(self, n: int = 1) -> int:
+        """Claim the next n sequences and return the highest one."""
+        if not 1 <= n <= self.size:
+            raise ValueError(f"Can only claim between 1 and {self.size} slots, got {n}")
+        while self._next + n - self.size > self._min_gating():
+            await self.signal.wait()
+        self._next += n
+        return self._next
+
+    def publish(self, low: int, high: Optional[int] = None) -> None:
+        """Mark sequences low..high as published and wake consumers."""
+        high = low if high is None else high
+        published = self._published
+        mask = self.mask
+        for seq in range(low, high + 1):
+            published[seq & mask] = seq
+        cursor = self.cursor.value
+        while published[(cursor + 1) & mask] == cursor + 1:
+            cursor += 1
+        if cursor != self.cursor.value:
+            self.cursor.value = cursor
+            self.signal.notify()
+
+    def __getitem__(self, sequence: int) -> Any:
+        return self.slots[sequence & self.mask]
+
+    def __setitem__(self, sequence: int, event: Any) -> None:
+        self.slots[sequence & self.mask] = event
+
+
+class SequenceBarrier:
+    """Tracks how far a consumer may read: the cursor, capped by the stages it depends on."""
+
+    def __init__(self, ring: RingBuffer, dependents: Iterable[Sequence] = ()) -> None:
+        self._ring = ring
+        self._dependents = list(dependents)
+        self.alerted = False
+
+    def available(self) -> int:
+        cursor = self._ring.cursor.value
+        if not self._dependents:
+            return cursor
+        return min(cursor, min(s.value for s in self._dependents))
+
+    async def wait_for(self, sequence: int) -> int:
+        """Return the highest available sequence once it reaches `sequence`.
+
+        After `alert`, returns a value below `sequence` once everything up to
+        the cursor has passed this barrier, signalling the consumer to exit.
+        """
+        while True:
+            available = self.available()
+            if available >= sequence:
+                return available
+            if self.alerted and available >= self._ring.cursor.value:
+                return available
+            await self._ring.signal.wait()
+
+    def alert(self) -> None:
+        self.alerted = True
+        self._ring.signal.notify()
+
 
 class Disruptor:
-    """Minimal async disruptor-like ring buffer using an asyncio.Queue.
+    """Async disruptor over a pre-allocated ring buffer.
 
-    This is a pragmatic, simplified implementation to satisfy the engine's
-    expectations: processors can be registered, start() spawns a background
-    task that consumes events and dispatches to processors, and publish()
-    enqueues events.
+    Events are published into a power-of-two RingBuffer by sequence. Each
+    processor runs as its own consumer task that reads every batch of
+    events up to the published cursor, so a burst is handled in one pass
+    rather than one wake-up per event. Processors added with `depends_on`
+    only see an event after the processors they depend on have handled it;
+    processors without dependencies consume in parallel. A full buffer
+    makes publishers wait for the slowest processor.
     """
 
-    def __init__(self, buffer_size: int = 65536) -> None:
-        self._queue: asyncio.Queue = asyncio.Queue(maxsize=buffer_size)
+    def __init__(self, buffer_size: int = 65536, event_factory: Optional[Callable[[], Any]] = None) -> None:
+        self._ring = RingBuffer(buffer_size, event_factory)
         self._processors: list[EventProcessor] = []
-        self._worker_task: asyncio.Task | None = None
-        self._sequence: int = 0
-        self._stopped = asyncio.Event()
+        self._sequences: dict[int, Sequence] = {}
+        self._barriers: dict[int, SequenceBarrier] = {}
+        self._tasks: list[asyncio.Task] = []
 
-    def add_processor(self, processor: EventProcessor) -> None:
+    @property
+    def ring_buffer(self) -> RingBuffer:
+        return self._ring
+
+    @property
+    def cursor(self) -> int:
+        """Highest published sequence."""
+        return self._ring.cursor.value
+
+    def add_processor(self, processor: EventProcessor, depends_on: Optional[Iterable[EventProcessor]] = None) -> None:
+        """Register a processor, optionally as a later stage after `depends_on`."""
+        if self._tasks:
+            raise RuntimeError("Processors must be added before start()")
+        dependents = []
+        for upstream in depends_on or ():
+            if id(upstream) not in self._sequences:
+                raise ValueError(f"{upstream!r} must be added before processors that depend on it")
+            dependents.append(self._sequences[id(upstream)])
+        sequence = Sequence(self._ring.cursor.value)
         self._processors.append(processor)
+        self._sequences[id(processor)] = sequence
+        self._barriers[id(processor)] = SequenceBarrier(self._ring, dependents)
+        self._ring.add_gating_sequences(sequence)
 
     async def start(self) -> None:
-        if self._worker_task is not None and not self._worker_task.done():
+        if any(not task.done() for task in self._tasks):
             return
-        self._stopped.clear()
-        self._worker_task = asyncio.create_task(self._run())
+        self._tasks = []
+        for processor in self._processors:
+            barrier = self._barriers[id(processor)]
+            barrier.alerted = False
+            self._tasks.append(asyncio.create_task(self._run(processor, barrier, self._sequences[id(processor)])))
 
     async def stop(self) -> None:
-        self._stopped.set()
-        # Enqueue sentinel to unblock queue.get()
-        with contextlib.suppress(asyncio.QueueFull):
-            self._queue.put_nowait(None)
-        if self._worker_task:
+        """Stop consumers after they have processed everything already published."""
+        for barrier in self._barriers.values():
+            barrier.alert()
+        for task in self._tasks:
             with contextlib.suppress(Exception):
-                await self._worker_task
-            self._worker_task = None
+                await task
+        self._tasks = []
+
+    async def publish(self, event: Any) -> int:
+        """Publish one event, waiting for capacity; returns its sequence."""
+        ring = self._ring
+        sequence = await ring.next()
+        ring.slots[sequence & ring.mask] = event
+        ring.publish(sequence)
+        return sequence
+
+    async def publish_batch(self, events: List[Any]) -> int:
+        """Publish events in chunks of at most the buffer size; returns the last sequence."""
+        ring = self._ring
+        sequence = ring.cursor.value
+        for start in range(0, len(events), ring.size):
+            chunk = events[start:start + ring.size]
+            high = await ring.next(len(chunk))
+            low = high - len(chunk) + 1
+            for offset, event in enumerate(chunk):
+                ring.slots[(low + offset) & ring.mask] = event
+            ring.publish(low, high)
+            sequence = high
+        return sequence
 
-    async def publish(self, event: Any) -> None:
-        await self._queue.put(event)
+    async def publish_event(self, translator: Callable[..., None], *args: Any) -> int:
+        """Fill the next pre-allocated slot in place via translator(slot, sequence, *args)."""
+        ring = self._ring
+        sequence = await ring.next()
+        translator(ring.slots[sequence & ring.mask], sequence, *args)
+        ring.publish(sequence)
+        return sequence
 
-    async def _run(self) -> None:
-        while not self._stopped.is_set():
-            event = await self._queue.get()
-            if event is None:
-                # sentinel for shutdown
+    async def _run(self, processor: EventProcessor, barrier: SequenceBarrier, sequence: Sequence) -> None:
+        ring = self._ring
+        on_batch = getattr(processor, "on_batch", None) or EventProcessor.on_batch.__get__(processor)
+        while True:
+            next_sequence = sequence.value + 1
+            available = await barrier.wait_for(next_sequence)
+            if available < next_sequence:
                 break
-            seq = self._sequence
-            self._sequence += 1
-            # fan-out to processors; exceptions are isolated per processor
-            await asyncio.gather(
-                *[self._safe_call(p, event, seq) for p in self._processors],
-                return_exceptions=True,
-            )
-
-    async def _safe_call(self, processor: EventProcessor, event: Any, seq: int) -> None:
-        try:
-            await processor.on_event(event, seq)
-        except Exception:
-            # Keep running even if a processor fails
-            pass
+            low, high = next_sequence & ring.mask, available & ring.mask
+            if low <= high:
+                events = ring.slots[low:high + 1]
+            else:
+                events = ring.slots[low:] + ring.slots[:high + 1]
+            try:
+                await on_batch(events, next_sequence)
+            except Exception:
+                # Keep running even if a processor fails
+                pass
+            sequence.value = available
+            ring.signal.notify()
@@ -7,39 +7,107 @@ with thread-safety, key generation, and performance monitoring.
 
 import asyncio
 import hashlib
+import heapq
+import itertools
 import json
 import re
 import sys
 import time
+from collections import OrderedDict
 from collections.abc import Awaitable, Callable
 from typing import Any, Dict, Generic, List, Optional, TypeVar, Union, cast
 
 from loguru import logger
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
 # Type variable for better type hinting
 T = TypeVar("T")
 
+# Containers larger than this are sized from a sample and extrapolated
+_SIZE_SAMPLE = 100
+_SIZE_MAX_DEPTH = 4
+
+
+def estimate_size(obj: Any, _depth: int = 0) -> int:
+    """
+    Estimate the in-memory size of a cached value in bytes.
+
+    DataFrames, Series and NumPy arrays report their real buffer sizes;
+    containers are measured recursively, sampling large ones.
+
+    Args:
+        obj: Value to measure
+
+    Returns:
+        Estimated size in bytes
+    """
+    if obj is None:
+        return 0
+
+    if pd is not None and isinstance(obj, (pd.DataFrame, pd.Series, pd.Index)):
+        usage = obj.memory_usage(deep=True)
+        return int(usage.sum()) if hasattr(usage, "sum") else int(usage)
+
+    if np is not None and isinstance(obj, np.ndarray):
+        if obj.dtype == object and obj.size:
+            return obj.nbytes + estimate_size(obj.ravel().tolist(), _depth + 1)
+        return int(obj.nbytes)
+
+    if isinstance(obj, (str, bytes, bytearray, memoryview)):
+        return sys.getsizeof(obj)
+
+    if _depth >= _SIZE_MAX_DEPTH:
+        return sys.getsizeof(obj)
+
+    if isinstance(obj, dict):
+        items = list(itertools.islice(obj.items(), _SIZE_SAMPLE))
+        sampled = sum(
+            estimate_size(k, _depth + 1) + estimate_size(v, _depth + 1)
+            for k, v in items
+        )
+        scale = len(obj) / len(items) if items else 0
+        return sys.getsizeof(obj) + int(sampled * scale)
+
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        items = list(itertools.islice(obj, _SIZE_SAMPLE))
+        sampled = sum(estimate_size(item, _depth + 1) for item in items)
+        scale = len(obj) / len(items) if items else 0
+        return sys.getsizeof(obj) + int(sampled * scale)
+
+    if hasattr(obj, "__dict__"):
+        return sys.getsizeof(obj) + estimate_size(vars(obj), _depth + 1)
+
+    return sys.getsizeof(obj)
+
 
 class CacheEntry[T]:
     """Represents a cached response with metadata."""
 
+    __slots__ = (
+        "data",
+        "expiry",
+        "created_at",
+        "hit_count",
+        "last_accessed",
+        "size_bytes",
+    )
+
     def __init__(self, data: T, expiry: float):
         self.data = data
         self.expiry = expiry  # Timestamp when this entry expires
         self.created_at = time.time()
         self.hit_count = 0
-        self.last_accessed = time.time()
-
-        # Estimate size of cached data
-        try:
-            if data is not None:
-                # Rough size estimation using JSON serialization
-                self.size_bytes = len(json.dumps(data, default=str).encode("utf-8"))
-            else:
-                self.size_bytes = 0
-        except (TypeError, OverflowError):
-            # For objects that can't be JSON serialized
-            self.size_bytes = sys.getsizeof(data) if data is not None else 0
+        self.last_accessed = self.created_at
+        self.size_bytes = estimate_size(data)
 
     @property
     def is_expired(self) -> bool:
@@ -57,6 +125,58 @@ class CacheEntry[T]:
         self.last_accessed = time.time()
 
 
+class _TimerWheel:
+    """
+    TTL timer wheel for AsyncCache.
+
+    Keys are bucketed by expiry tick, with a heap of pending ticks so that
+    due buckets are found in O(log n) without scanning entries. Each key is
+    held in at most one bucket, and buckets are only dropped once due, so
+    the wheel is bounded by the live keys plus the ticks in the TTL window.
+    """
+
+    __slots__ = ("buckets", "ticks", "key_ticks")
+
+    def __init__(self):
+        self.buckets: dict[int, set[str]] = {}
+        self.ticks: list[int] = []
+        self.key_ticks: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.key_ticks)
+
+    def schedule(self, key: str, tick: int) -> None:
+        """Register a key to be checked for expiry at the given tick."""
+        self.discard(key)
+        bucket = self.buckets.get(tick)
+        if bucket is None:
+            bucket = self.buckets[tick] = set()
+            heapq.heappush(self.ticks, tick)
+        bucket.add(key)
+        self.key_ticks[key] = tick
+
+    def discard(self, key: str) -> None:
+        """Forget a key's pending expiry; its (possibly empty) bucket stays until due."""
+        tick = self.key_ticks.pop(key, None)
+        if tick is not None:
+            self.buckets[tick].discard(key)
+
+    def pop_due(self, now_tick: int) -> list[str]:
+        """Remove and return keys from all buckets due at or before now_tick."""
+        due: list[str] = []
+        while self.ticks and self.ticks[0] <= now_tick:
+            tick = heapq.heappop(self.ticks)
+            for key in self.buckets.pop(tick, ()):
+                del self.key_ticks[key]
+                due.append(key)
+        return due
+
+    def clear(self) -> None:
+        self.buckets.clear()
+        self.ticks.clear()
+        self.key_ticks.clear()
+
+
 class CacheStats:
     """Statistics for cache performance."""
 
@@ -122,13 +242,22 @@ class CacheStats:
 
 
 class AsyncCache[T]:
-    """Thread-safe asynchronous cache implementation."""
+    """
+    Asynchronous LRU cache with per-entry TTL.
+
+    Entries are kept in an OrderedDict in least-recently-used order, so the
+    LRU victim is always at the front, and expiries are tracked in a TTL
+    timer wheel that is drained on every get and set. Gets, sets and
+    evictions are O(1) apart from the O(log n) wheel bookkeeping; none of
+    them sort or scan the whole cache.
+    """
 
     def __init__(
         self,
         default_ttl: int = 300,
         max_size: int = 1000,
         max_bytes: int | None = None,
+        ttl_resolution: float = 1.0,
     ):
         """
         Initialize the cache.
@@ -137,13 +266,50 @@ class AsyncCache[T]:
             default_ttl: Default time-to-live in seconds for cache entries
             max_size: Maximum number of entries to store
             max_bytes: Maximum cache size in bytes (optional)
+            ttl_resolution: Width of a TTL timer-wheel bucket in seconds
         """
+        if ttl_resolution <= 0:
+            raise ValueError("ttl_resolution must be positive")
+
         self.default_ttl = default_ttl
         self.max_size = max_size
         self.max_bytes = max_bytes
-        self.cache: dict[str, CacheEntry[T]] = {}
+        self.ttl_resolution = ttl_resolution
         self.stats = CacheStats()
-        self._lock = asyncio.Lock()  # Async lock for thread safety
+        self.cache: OrderedDict[str, CacheEntry[T]] = OrderedDict()
+        self._wheel = _TimerWheel()
+        self._lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        return len(self.cache)
+
+    def keys(self) -> list[str]:
+        """Get all keys currently held, including not-yet-purged expired ones."""
+        return list(self.cache)
+
+    def _tick(self, timestamp: float) -> int:
+        """Map a timestamp to its timer-wheel bucket."""
+        return int(timestamp // self.ttl_resolution)
+
+    def _remove(self, key: str) -> CacheEntry[T] | None:
+        """Drop an entry and update size accounting."""
+        entry = self.cache.pop(key, None)
+        if entry is not None:
+            self._wheel.discard(key)
+            self.stats.total_size_bytes -= entry.size_bytes
+        return entry
+
+    def _expire_due(self, now: float) -> int:
+        """Purge entries in due timer-wheel buckets."""
+        expired = 0
+        # Keys sit in the bucket after their expiry tick, so everything due has expired
+        for key in self._wheel.pop_due(self._tick(now)):
+            entry = self.cache.pop(key, None)
+            if entry is not None:
+                self.stats.total_size_bytes -= entry.size_bytes
+                self.stats.record_expiration()
+                expired += 1
+        return expired
 
     async def _generate_key(
         self, func_name: str, args: tuple, kwargs: dict, include_args: bool = True
@@ -212,19 +378,20 @@ class AsyncCache[T]:
             Cached data or None if not found or expired
         """
         async with self._lock:
+            self._expire_due(time.time())
             entry = self.cache.get(key)
 
             if entry and not entry.is_expired:
+                self.cache.move_to_end(key)
                 entry.record_hit()
                 self.stats.record_hit()
                 logger.debug(f"Async cache hit for key: {key}")
                 return entry.data
 
-            if entry and entry.is_expired:
+            if entry:
                 logger.debug(f"Async cache entry expired for key: {key}")
                 self.stats.record_expiration()
-                self.stats.total_size_bytes -= entry.size_bytes
-                del self.cache[key]
+                self._remove(key)
             else:
                 logger.debug(f"Async cache miss for key: {key}")
 
@@ -240,90 +407,60 @@ class AsyncCache[T]:
             data: Data to cache
             ttl: Time-to-live in seconds (uses default if not specified)
         """
-        async with self._lock:
-            # Create the entry first to get its size
-            ttl = ttl if ttl is not None else self.default_ttl
-            expiry = time.time() + ttl
-            entry = CacheEntry(data, expiry)
-
-            # Check size constraints
-            if self.max_bytes and entry.size_bytes > self.max_bytes:
-                logger.warning(
-                    f"Entry too large to cache: {entry.size_bytes} bytes exceeds max {self.max_bytes}"
-                )
-                return
-
-            # Manage cache size
-            if len(self.cache) >= self.max_size or (
-                self.max_bytes
-                and self.stats.total_size_bytes + entry.size_bytes > self.max_bytes
-            ):
-                await self._evict_entries(required_bytes=entry.size_bytes)
+        # Size the entry before taking the lock; deep sizing can be costly
+        ttl = ttl if ttl is not None else self.default_ttl
+        entry = CacheEntry(data, time.time() + ttl)
 
-            # If replacing an existing entry, subtract its size first
-            if key in self.cache:
-                self.stats.total_size_bytes -= self.cache[key].size_bytes
+        if self.max_bytes and entry.size_bytes > self.max_bytes:
+            logger.warning(
+                f"Entry too large to cache: {entry.size_bytes} bytes exceeds max {self.max_bytes}"
+            )
+            return
 
+        async with self._lock:
+            self._expire_due(time.time())
+            self._remove(key)
             self.cache[key] = entry
+            # Bucket after the expiry tick, so everything in a due bucket is expired
+            self._wheel.schedule(key, self._tick(entry.expiry) + 1)
             self.stats.total_size_bytes += entry.size_bytes
+
+            if len(self.cache) > self.max_size or (
+                self.max_bytes and self.stats.total_size_bytes > self.max_bytes
+            ):
+                self._evict_entries()
+
             logger.debug(
                 f"Cached async response for key: {key}, expires in {ttl}s, size: {entry.size_bytes} bytes"
             )
 
-    async def _evict_entries(self, required_bytes: int = 0) -> None:
+    def _evict_entries(self, required_bytes: int = 0) -> None:
         """
-        Evict entries to make space in the cache.
+        Evict entries until the cache is within its count and byte limits.
+
+        Expired entries in due timer-wheel buckets go first; after that
+        entries are evicted from the least recently used end. Must be called
+        with the lock held.
 
         Args:
-            required_bytes: How many bytes are needed for a new entry
+            required_bytes: Extra bytes to free beyond the configured limit
         """
-        async with self._lock:
-            # First remove expired entries
-            expired_keys = [k for k, v in self.cache.items() if v.is_expired]
-            for key in expired_keys:
-                self.stats.total_size_bytes -= self.cache[key].size_bytes
-                del self.cache[key]
-                self.stats.record_expiration()
-                logger.debug(f"Evicted expired async cache entry: {key}")
+        self._expire_due(time.time())
 
-            # If still need space, remove least recently used entries
-            if (
+        def over_limit() -> bool:
+            if len(self.cache) > self.max_size:
+                return True
+            return bool(
                 self.max_bytes
                 and self.stats.total_size_bytes + required_bytes > self.max_bytes
-            ):
-                # Sort by last accessed time (oldest first)
-                sorted_entries = sorted(
-                    self.cache.items(), key=lambda x: x[1].last_accessed
-                )
-
-                bytes_to_free = required_bytes
-                for key, entry in sorted_entries:
-                    if self.stats.total_size_bytes + bytes_to_free <= self.max_bytes:
-                        break
-
-                    self.stats.total_size_bytes -= entry.size_bytes
-                    bytes_to_free = max(0, bytes_to_free - entry.size_bytes)
-                    del self.cache[key]
-                    self.stats.record_eviction()
-                    logger.debug(
-                        f"Evicted async cache entry due to size constraints: {key}"
-                    )
-
-            # If still too many entries, remove by count limit
-            if len(self.cache) >= self.max_size:
-                sorted_entries = sorted(
-                    self.cache.items(), key=lambda x: x[1].last_accessed
-                )
-                entries_to_remove = (
-                    len(self.cache) - self.max_size + 10
-                )  # Remove extra to avoid frequent evictions
+            )
 
-                for i in range(min(entries_to_remove, len(sorted_entries))):
-                    key, entry = sorted_entries[i]
-                    self.stats.total_size_bytes -= entry.size_bytes
-                    del self.cache[key]
-                    self.stats.record_eviction()
-                    logger.debug(f"Evicted least used async cache entry: {key}")
+        while self.cache and over_limit():
+            key, entry = self.cache.popitem(last=False)
+            self._wheel.discard(key)
+            self.stats.total_size_bytes -= entry.size_bytes
+            self.stats.record_eviction()
+            logger.debug(f"Evicted least recently used async cache entry: {key}")
 
     async def invalidate(self, key: str) -> bool:
         """
@@ -336,9 +473,7 @@ class AsyncCache[T]:
             True if an entry was found and removed, False otherwise
         """
         async with self._lock:
-            if key in self.cache:
-                self.stats.total_size_bytes -= self.cache[key].size_bytes
-                del self.cache[key]
+            if self._remove(key) is not None:
                 logger.debug(f"Manually invalidated async cache entry: {key}")
                 return True
             return False
@@ -359,14 +494,11 @@ class AsyncCache[T]:
             logger.error(f"Invalid regex pattern for cache invalidation: {pattern}")
             return 0
 
-        count = 0
-
         async with self._lock:
             keys_to_remove = [k for k in self.cache if regex.search(k)]
             for key in keys_to_remove:
-                self.stats.total_size_bytes -= self.cache[key].size_bytes
-                del self.cache[key]
-                count += 1
+                self._remove(key)
+            count = len(keys_to_remove)
 
         if count > 0:
             logger.debug(f"Invalidated {count} entries matching pattern: {pattern}")
@@ -376,9 +508,14 @@ class AsyncCache[T]:
         """Clear the entire cache."""
         async with self._lock:
             count = len(self.cache)
-            self.cache.clear()
-            self.stats.total_size_bytes = 0
-            logger.debug(f"Cleared entire async cache ({count} entries)")
+            self._clear()
+        logger.debug(f"Cleared entire async cache ({count} entries)")
+
+    def _clear(self) -> None:
+        """Drop every entry and pending expiry."""
+        self.cache.clear()
+        self._wheel.clear()
+        self.stats.total_size_bytes = 0
 
     def clear_sync(self) -> None:
         """
@@ -388,8 +525,7 @@ class AsyncCache[T]:
         the async clear() method is not possible. Use with caution.
         """
         count = len(self.cache)
-        self.cache.clear()
-        self.stats.total_size_bytes = 0
+        self._clear()
         logger.debug(f"Cleared entire async cache synchronously ({count} entries)")
 
     def get_stats(self) -> dict[str, Any]:
@@ -24,6 +24,7 @@ from .setup import (
     DEFAULT_LOG_LEVEL,
     ENVIRONMENT_CONFIGS,
     LOGURU_AVAILABLE,
+    AsyncLogWriter,
     AuditLogger,
     LogConfig,
     PerformanceLogger,
@@ -31,12 +32,14 @@ from .setup import (
     SecurityLogger,
     configure_logging,
     custom_formatter,
+    flush_logging,
     get_logger,
     json_formatter,
     log_performance,
     log_performance_context,
     log_request_context,
     request_context,
+    shutdown_logging,
 )
 
 # Import loguru logger if available
@@ -432,6 +435,8 @@ __all__ = [
     "configure_logging",
     "get_current_config",
     "is_configured",
+    "flush_logging",
+    "shutdown_logging",
     # Logger utilities
     "get_logger",
     "create_logger",
@@ -469,6 +474,7 @@ __all__ = [
     "AuditLogger",
     "SecurityLogger",
     "RequestContext",
+    "AsyncLogWriter",
     # Quick setup functions
     "setup_development_logging",
     "setup_production_logging",
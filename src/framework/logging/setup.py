@@ -6,8 +6,13 @@ including structured logging, multiple output targets, log rotation,
 performance monitoring, and environment-specific configurations.
 """
 
+import atexit
+import gzip
 import json
 import os
+import queue
+import re
+import shutil
 import sys
 import threading
 import time
@@ -15,7 +20,8 @@ import traceback
 from collections.abc import Callable
 from contextlib import contextmanager
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from datetime import time as clock_time
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
@@ -36,6 +42,8 @@ DEFAULT_LOG_DIR = "logs"
 DEFAULT_MAX_FILE_SIZE = "100 MB"
 DEFAULT_RETENTION = "30 days"
 DEFAULT_ROTATION = "1 day"
+DEFAULT_QUEUE_SIZE = 10000
+OVERFLOW_POLICIES = ("block", "drop", "sample")
 
 # Environment-specific configurations
 ENVIRONMENT_CONFIGS = {
@@ -92,10 +100,21 @@ class LogConfig:
     enable_audit_logging: bool = True
     enable_security_logging: bool = True
     extra_fields: dict[str, Any] = None
+    # Non-blocking mode: one sink feeding a background writer (see AsyncLogWriter)
+    async_sinks: bool = False
+    queue_size: int = DEFAULT_QUEUE_SIZE
+    overflow_policy: str = "block"
+    overflow_sample_every: int = 10
+    batch_size: int = 256
+    flush_interval: float = 0.5
 
     def __post_init__(self):
         if self.extra_fields is None:
             self.extra_fields = {}
+        if self.overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(
+                f"overflow_policy must be one of {OVERFLOW_POLICIES}, got {self.overflow_policy!r}"
+            )
 
 
 class RequestContext:
@@ -144,9 +163,14 @@ class RequestContext:
 
     def get_context_dict(self) -> dict[str, str]:
         """Get all context as a dictionary."""
+        # Read the thread's attribute dict directly: getattr misses raise
+        # internally, and this runs for every log record
+        values = self._local.__dict__
+        if not values:
+            return {}
         context = {}
         for attr in ["request_id", "correlation_id", "user_id", "session_id"]:
-            value = getattr(self._local, attr, None)
+            value = values.get(attr)
             if value:
                 context[attr] = value
         return context
@@ -165,7 +189,9 @@ def custom_formatter(record):
         record["extra"][key] = value
 
     # Add timestamp in ISO format
-    record["extra"]["timestamp_iso"] = datetime.utcnow().isoformat() + "Z"
+    record["extra"]["timestamp_iso"] = (
+        record["time"].astimezone(timezone.utc).replace(tzinfo=None).isoformat() + "Z"
+    )
 
     # Add process and thread info
     record["extra"]["process_id"] = os.getpid()
@@ -175,13 +201,18 @@ def custom_formatter(record):
     return record
 
 
-def json_formatter(record):
-    """JSON formatter for structured logging."""
+def _record_flag(record, name: str) -> bool:
+    """Check a routing flag passed via bind()/kwargs or via the helpers' extra={...}."""
+    extra = record["extra"]
+    if extra.get(name):
+        return True
+    nested = extra.get("extra")
+    return isinstance(nested, dict) and bool(nested.get(name))
 
-    # Apply custom formatting first
-    record = custom_formatter(record)
 
-    # Create JSON structure
+def _json_entry(record) -> dict[str, Any]:
+    """Build the structured log entry for a record already passed through custom_formatter."""
+
     log_entry = {
         "timestamp": record["time"].isoformat(),
         "level": record["level"].name,
@@ -223,12 +254,32 @@ def json_formatter(record):
             "correlation_id",
             "user_id",
             "session_id",
+            "serialized",
         ]
     }
     if extra_fields:
         log_entry["extra"] = extra_fields
 
-    return json.dumps(log_entry, default=str, ensure_ascii=False)
+    return log_entry
+
+
+def json_formatter(record):
+    """JSON formatter for structured logging."""
+
+    # Apply custom formatting first
+    record = custom_formatter(record)
+
+    return json.dumps(_json_entry(record), default=str, ensure_ascii=False)
+
+
+def _json_format(record):
+    """Loguru format callable emitting the record as one JSON line.
+
+    Loguru treats a format callable's return value as a template, so the
+    JSON is stashed in extra rather than returned (braces would be parsed).
+    """
+    record["extra"]["serialized"] = json_formatter(record)
+    return "{extra[serialized]}\n"
 
 
 def setup_console_logging(config: LogConfig):
@@ -243,7 +294,7 @@ def setup_console_logging(config: LogConfig):
         logger.add(
             sys.stdout,
             level=config.level,
-            format=json_formatter,
+            format=_json_format,
             colorize=False,
             backtrace=config.backtrace,
             diagnose=config.diagnose,
@@ -278,7 +329,7 @@ def setup_file_logging(config: LogConfig):
         logger.add(
             str(app_log_file),
             level=config.level,
-            format=json_formatter,
+            format=_json_format,
             rotation=config.rotation,
             retention=config.retention,
             compression="gz",
@@ -306,7 +357,7 @@ def setup_file_logging(config: LogConfig):
         str(error_log_file),
         level="ERROR",
         format=(
-            json_formatter if (config.structured or config.json_logs) else format_string
+            _json_format if (config.structured or config.json_logs) else format_string
         ),
         rotation=config.rotation,
         retention=config.retention,
@@ -330,11 +381,11 @@ def setup_audit_logging(config: LogConfig):
     logger.add(
         str(audit_log_file),
         level="INFO",
-        format=json_formatter,
+        format=_json_format,
         rotation=config.rotation,
         retention="1 year",  # Keep audit logs longer
         compression="gz",
-        filter=lambda record: record["extra"].get("audit", False)
+        filter=lambda record: _record_flag(record, "audit")
         and (custom_formatter(record) or True),
     )
 
@@ -351,11 +402,11 @@ def setup_performance_logging(config: LogConfig):
     logger.add(
         str(perf_log_file),
         level="INFO",
-        format=json_formatter,
+        format=_json_format,
         rotation=config.rotation,
         retention=config.retention,
         compression="gz",
-        filter=lambda record: record["extra"].get("performance", False)
+        filter=lambda record: _record_flag(record, "performance")
         and (custom_formatter(record) or True),
     )
 
@@ -372,15 +423,421 @@ def setup_security_logging(config: LogConfig):
     logger.add(
         str(security_log_file),
         level="WARNING",
-        format=json_formatter,
+        format=_json_format,
         rotation=config.rotation,
         retention="6 months",  # Keep security logs longer
         compression="gz",
-        filter=lambda record: record["extra"].get("security", False)
+        filter=lambda record: _record_flag(record, "security")
         and (custom_formatter(record) or True),
     )
 
 
+_SIZE_UNITS = {"b": 1, "kb": 1000, "mb": 1000**2, "gb": 1000**3, "kib": 1024, "mib": 1024**2, "gib": 1024**3}
+_DURATION_UNITS = {
+    "us": 1e-6,
+    "microsecond": 1e-6,
+    "ms": 1e-3,
+    "millisecond": 1e-3,
+    "s": 1,
+    "sec": 1,
+    "second": 1,
+    "m": 60,
+    "min": 60,
+    "minute": 60,
+    "h": 3600,
+    "hour": 3600,
+    "d": 86400,
+    "day": 86400,
+    "w": 7 * 86400,
+    "week": 7 * 86400,
+    "month": 30 * 86400,
+    "y": 365 * 86400,
+    "year": 365 * 86400,
+}
+_ANSI_ESCAPE = re.compile(r"\x1b\[[0-9;]*m")
+
+
+def _parse_size(value: str) -> int:
+    """Parse sizes such as "100 MB" into bytes."""
+    match = re.fullmatch(r"\s*([\d.]+)\s*([a-zA-Z]*)\s*", value)
+    unit = (match.group(2) or "b").lower() if match else None
+    if unit not in _SIZE_UNITS:
+        raise ValueError(f"Invalid size: {value!r}")
+    return int(float(match.group(1)) * _SIZE_UNITS[unit])
+
+
+def _parse_duration(value: str) -> float:
+    """Parse durations such as "1 day", "6 months" or "1 week, 3 days" into seconds."""
+    parts = re.findall(r"([\d.]+)\s*([a-zA-Z]+)", value)
+    if not parts or re.sub(r"[\d.]+\s*[a-zA-Z]+|[\s,]", "", value):
+        raise ValueError(f"Invalid duration: {value!r}")
+    total = 0.0
+    for number, unit in parts:
+        unit = unit.lower()
+        if unit not in _DURATION_UNITS and unit.endswith("s"):
+            unit = unit[:-1]
+        if unit not in _DURATION_UNITS:
+            raise ValueError(f"Invalid duration: {value!r}")
+        total += float(number) * _DURATION_UNITS[unit]
+    return total
+
+
+@dataclass(frozen=True)
+class _Rotation:
+    """When a batched log file rolls over: past a size, after an interval and/or daily at a time."""
+
+    max_bytes: int | None = None
+    every_seconds: float | None = None
+    at: clock_time | None = None
+
+    def next_rollover(self, opened: datetime) -> float | None:
+        """Epoch time of the next time-based rollover for a file opened at `opened` (local time)."""
+        deadlines = []
+        if self.every_seconds:
+            deadlines.append(opened.timestamp() + self.every_seconds)
+        if self.at is not None:
+            candidate = datetime.combine(opened.date(), self.at)
+            if candidate <= opened:
+                candidate += timedelta(days=1)
+            deadlines.append(candidate.timestamp())
+        return min(deadlines, default=None)
+
+
+def _parse_rotation(rotation: str, max_file_size: str) -> _Rotation:
+    """Interpret a loguru-style rotation ("1 day", "500 MB", "00:00") together with max_file_size.
+
+    Weekday schedules such as "sunday at 12:00" are not supported and raise
+    ValueError, like any other value that cannot be parsed.
+    """
+    max_bytes = _parse_size(max_file_size) if max_file_size else None
+    every_seconds = at = None
+    value = (rotation or "").strip()
+    clock = re.fullmatch(r"(?:at\s+)?(\d{1,2}):(\d{2})(?::(\d{2}))?", value, re.IGNORECASE)
+    if clock:
+        at = clock_time(int(clock.group(1)), int(clock.group(2)), int(clock.group(3) or 0))
+    elif re.fullmatch(r"[\d.]+\s*[kmg]?i?b", value, re.IGNORECASE):
+        size = _parse_size(value)
+        max_bytes = min(max_bytes, size) if max_bytes else size
+    elif value:
+        every_seconds = _parse_duration(value)
+    return _Rotation(max_bytes, every_seconds, at)
+
+
+def _check_async_file_settings(config: LogConfig) -> None:
+    """Raise ValueError if the async writer cannot interpret the rotation/retention settings."""
+    _parse_rotation(config.rotation, config.max_file_size)
+    if config.retention:
+        _parse_duration(config.retention)
+
+
+class _BatchedLogFile:
+    """Append-only log file written a batch at a time, with size/time rotation.
+
+    Rotated files are gzipped and removed once older than the retention period.
+    """
+
+    def __init__(self, path: Path, rotation: _Rotation, retention: str):
+        self.path = path
+        self.rotation = rotation
+        self.retention_seconds = _parse_duration(retention) if retention else None
+        self._open()
+
+    def _open(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "ab")
+        self._size = self._file.tell()
+        self._rollover_at = self.rotation.next_rollover(datetime.now())
+
+    def write(self, lines: list[str]) -> None:
+        if self._should_rotate():
+            self._rotate()
+        data = "".join(lines).encode("utf-8")
+        self._file.write(data)
+        self._file.flush()
+        self._size += len(data)
+
+    def _should_rotate(self) -> bool:
+        if self.rotation.max_bytes and self._size >= self.rotation.max_bytes:
+            return True
+        return self._rollover_at is not None and time.time() >= self._rollover_at
+
+    def _rotate(self) -> None:
+        self._file.close()
+        if self._size:
+            stamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S_%f")
+            rotated = self.path.with_name(f"{self.path.stem}.{stamp}{self.path.suffix}.gz")
+            with open(self.path, "rb") as src, gzip.open(rotated, "wb") as dst:
+                shutil.copyfileobj(src, dst)
+            self.path.unlink()
+            self._prune()
+        self._open()
+
+    def _prune(self) -> None:
+        if not self.retention_seconds:
+            return
+        cutoff = time.time() - self.retention_seconds
+        for old in self.path.parent.glob(f"{self.path.stem}.*{self.path.suffix}.gz"):
+            if old.stat().st_mtime < cutoff:
+                old.unlink(missing_ok=True)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _ConsoleOutput:
+    """Writes batches to stdout."""
+
+    def write(self, lines: list[str]) -> None:
+        sys.stdout.write("".join(lines))
+        sys.stdout.flush()
+
+    def close(self) -> None:
+        pass
+
+
+@dataclass
+class _Route:
+    """One output of the async writer and the records it accepts."""
+
+    output: Any
+    min_level: int
+    structured: bool
+    flag: str | None = None
+
+
+class AsyncLogWriter:
+    """Non-blocking replacement for the per-destination loguru sinks.
+
+    A single loguru sink runs `custom_formatter` once and puts the record on
+    a bounded in-memory queue, together with its text line when a text
+    destination needs one. Loguru renders that line from `format_string`
+    (with `colorize`, `backtrace` and `diagnose` applied), as the
+    synchronous sinks do; files get it with colour codes stripped. A
+    background thread drains the queue in batches, serializes each record
+    to JSON at most once and shares each line between every destination
+    that accepts it, then writes each destination's batch with one write
+    and flush.
+
+    When the queue is full, `overflow_policy` decides what the logging
+    thread does: "block" waits for space, "drop" discards the record and
+    "sample" keeps one in `overflow_sample_every` records. Records at ERROR
+    and above and audit/security records always wait rather than being
+    discarded. Discarded records are counted and reported in the app log.
+    """
+
+    _STOP = object()
+
+    def __init__(self, config: LogConfig):
+        self.config = config
+        self.dropped = 0
+        self.written = 0
+        self._reported_dropped = 0
+        self._overflow_count = 0
+        self._overflow_lock = threading.Lock()
+        self._queue: queue.Queue = queue.Queue(maxsize=config.queue_size)
+        self._routes = self._build_routes(config)
+        self.needs_text = any(not route.structured for route in self._routes)
+        # Colour codes are rendered only for a colourised text console, and stripped for files
+        self.colorize = bool(
+            config.colorize and any(isinstance(r.output, _ConsoleOutput) and not r.structured for r in self._routes)
+        )
+        self._error_level = logger.level("ERROR").no
+        self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+
+    @property
+    def min_level(self) -> int:
+        """Lowest level any destination accepts; used as the loguru sink level."""
+        return min((route.min_level for route in self._routes), default=logger.level("CRITICAL").no)
+
+    def _build_routes(self, config: LogConfig) -> list[_Route]:
+        structured = config.structured or config.json_logs
+        level = logger.level(config.level).no
+        routes = []
+
+        if config.console:
+            routes.append(_Route(_ConsoleOutput(), level, structured))
+
+        log_dir = Path(config.log_dir)
+        rotation = _parse_rotation(config.rotation, config.max_file_size)
+
+        def log_file(name: str, retention: str) -> _BatchedLogFile:
+            return _BatchedLogFile(log_dir / name, rotation, retention)
+
+        if config.file:
+            routes.append(_Route(log_file("app.log", config.retention), level, structured))
+            routes.append(_Route(log_file("error.log", config.retention), logger.level("ERROR").no, structured))
+        # Audit, performance and security logs are always JSON, as in the synchronous setup
+        if config.enable_audit_logging:
+            routes.append(_Route(log_file("audit.log", "1 year"), logger.level("INFO").no, True, "audit"))
+        if config.enable_performance_logging:
+            routes.append(
+                _Route(log_file("performance.log", config.retention), logger.level("INFO").no, True, "performance")
+            )
+        if config.enable_security_logging:
+            routes.append(
+                _Route(log_file("security.log", "6 months"), logger.level("WARNING").no, True, "security")
+            )
+        return routes
+
+    def start(self) -> "AsyncLogWriter":
+        self._thread.start()
+        return self
+
+    def sink(self, message) -> None:
+        """Loguru sink: hand the record to the writer thread."""
+        record = message.record
+        item = (record, str(message) if self.needs_text else None)
+        try:
+            self._queue.put_nowait(item)
+            return
+        except queue.Full:
+            pass
+
+        policy = self.config.overflow_policy
+        must_keep = (
+            record["level"].no >= self._error_level
+            or _record_flag(record, "audit")
+            or _record_flag(record, "security")
+        )
+        if policy == "block" or must_keep:
+            self._queue.put(item)
+            return
+        with self._overflow_lock:
+            keep = False
+            if policy == "sample":
+                self._overflow_count += 1
+                keep = self._overflow_count % self.config.overflow_sample_every == 0
+            if not keep:
+                self.dropped += 1
+        if keep:
+            self._queue.put(item)
+
+    def _run(self) -> None:
+        get = self._queue.get
+        get_nowait = self._queue.get_nowait
+        batch_size = self.config.batch_size
+        while True:
+            try:
+                first = get(timeout=self.config.flush_interval)
+            except queue.Empty:
+                continue
+            batch = [first]
+            while len(batch) < batch_size:
+                try:
+                    batch.append(get_nowait())
+                except queue.Empty:
+                    break
+            stop = any(item is self._STOP for item in batch)
+            records = [item for item in batch if item is not self._STOP]
+            try:
+                self._write_batch(records)
+            except Exception:
+                traceback.print_exc()
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            if stop:
+                return
+
+    def _write_batch(self, records: list) -> None:
+        pending: dict[int, list[str]] = {}
+        for record, text in records:
+            plain = structured = None
+            for index, route in enumerate(self._routes):
+                if record["level"].no < route.min_level:
+                    continue
+                if route.flag and not _record_flag(record, route.flag):
+                    continue
+                if route.structured:
+                    if structured is None:
+                        structured = json.dumps(_json_entry(record), default=str, ensure_ascii=False) + "\n"
+                    line = structured
+                elif self.colorize and not isinstance(route.output, _ConsoleOutput):
+                    if plain is None:
+                        plain = _ANSI_ESCAPE.sub("", text)
+                    line = plain
+                else:
+                    line = text
+                pending.setdefault(index, []).append(line)
+        self.written += len(records)
+
+        if self.dropped > self._reported_dropped:
+            notice = f"Log queue full: dropped {self.dropped - self._reported_dropped} records"
+            self._reported_dropped = self.dropped
+            for index, route in enumerate(self._routes):
+                if route.flag is None and route.min_level <= logger.level("WARNING").no:
+                    pending.setdefault(index, []).append(
+                        json.dumps({"level": "WARNING", "message": notice}) + "\n"
+                        if route.structured
+                        else f"{datetime.now():%Y-%m-%d %H:%M:%S} | WARNING  | {__name__} - {notice}\n"
+                    )
+
+        for index, lines in pending.items():
+            self._routes[index].output.write(lines)
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Wait until every queued record has been written; returns False on timeout."""
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if time.monotonic() >= deadline or not self._thread.is_alive():
+                return False
+            time.sleep(0.005)
+        return True
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Write out everything queued, stop the writer thread and close the files."""
+        if self._thread.is_alive():
+            self._queue.put(self._STOP)
+            self._thread.join(timeout)
+        for route in self._routes:
+            route.output.close()
+
+    def stats(self) -> dict[str, int]:
+        return {"queued": self._queue.qsize(), "written": self.written, "dropped": self.dropped}
+
+
+# Writer behind the current configuration, when async_sinks is enabled
+_async_writer: AsyncLogWriter | None = None
+
+
+def setup_async_logging(config: LogConfig) -> AsyncLogWriter:
+    """Route every destination through one non-blocking sink and a background writer."""
+    global _async_writer
+
+    writer = AsyncLogWriter(config).start()
+    logger.add(
+        writer.sink,
+        level=writer.min_level,
+        format=(config.format_string or DEFAULT_LOG_FORMAT) if writer.needs_text else "{message}",
+        colorize=writer.colorize,
+        backtrace=config.backtrace,
+        diagnose=config.diagnose,
+        filter=lambda record: custom_formatter(record) or True,
+        catch=True,
+    )
+    _async_writer = writer
+    return writer
+
+
+def flush_logging(timeout: float = 5.0) -> bool:
+    """Block until records queued for the async writer are on disk (no-op when synchronous)."""
+    if _async_writer is None:
+        return True
+    return _async_writer.flush(timeout)
+
+
+def shutdown_logging(timeout: float = 5.0) -> None:
+    """Flush and stop the async writer, if one is running."""
+    global _async_writer
+
+    writer, _async_writer = _async_writer, None
+    if writer is not None:
+        writer.stop(timeout)
+
+
+atexit.register(shutdown_logging)
+
+
 def configure_logging(
     config: LogConfig | dict[str, Any] | None = None,
     environment: str | None = None,
@@ -400,9 +857,6 @@ def configure_logging(
         print("Warning: loguru not available, falling back to standard logging")
         return LogConfig()
 
-    # Remove all existing handlers
-    logger.remove()
-
     # Determine environment
     if environment is None:
         environment = os.getenv("ENVIRONMENT", "development").lower()
@@ -441,14 +895,37 @@ def configure_logging(
         )
     if os.getenv("LOG_FILE"):
         final_config.file = os.getenv("LOG_FILE", "").lower() in ("true", "1", "yes")
+    if os.getenv("LOG_ASYNC"):
+        final_config.async_sinks = os.getenv("LOG_ASYNC", "").lower() in (
+            "true",
+            "1",
+            "yes",
+        )
+    if os.getenv("LOG_OVERFLOW") in OVERFLOW_POLICIES:
+        final_config.overflow_policy = os.getenv("LOG_OVERFLOW")
+
+    # Validate async file settings before the current handlers are removed
+    if final_config.async_sinks:
+        try:
+            _check_async_file_settings(final_config)
+        except ValueError as e:
+            print(f"Async logging unavailable ({e}); falling back to synchronous sinks")
+            final_config.async_sinks = False
+
+    # Remove all existing handlers
+    logger.remove()
+    shutdown_logging()
 
     # Setup logging handlers
     try:
-        setup_console_logging(final_config)
-        setup_file_logging(final_config)
-        setup_audit_logging(final_config)
-        setup_performance_logging(final_config)
-        setup_security_logging(final_config)
+        if final_config.async_sinks:
+            setup_async_logging(final_config)
+        else:
+            setup_console_logging(final_config)
+            setup_file_logging(final_config)
+            setup_audit_logging(final_config)
+            setup_performance_logging(final_config)
+            setup_security_logging(final_config)
 
         # Log the configuration
         logger.info(
@@ -459,6 +936,7 @@ def configure_logging(
                     "console": final_config.console,
                     "file": final_config.file,
                     "structured": final_config.structured,
+                    "async_sinks": final_config.async_sinks,
                     "log_dir": final_config.log_dir,
                 }
             },
@@ -8,9 +8,11 @@ role-based access control, dependency injection for FastAPI, and security utilit
 import hashlib
 import os
 import secrets
+import threading
 import time
+from collections import OrderedDict
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import UTC, datetime, timedelta, timezone
 from enum import Enum
 from typing import Any, Dict, List, Optional, Set, Union
@@ -29,6 +31,8 @@ AUTHELIA_JWT_ALGORITHM = os.getenv("AUTHELIA_JWT_ALGORITHM", "HS256")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
 REFRESH_TOKEN_EXPIRE_DAYS = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", "7"))
 PASSWORD_MIN_LENGTH = int(os.getenv("PASSWORD_MIN_LENGTH", "8"))
+TOKEN_CACHE_SIZE = int(os.getenv("TOKEN_CACHE_SIZE", "4096"))
+TOKEN_CACHE_MAX_TTL = int(os.getenv("TOKEN_CACHE_MAX_TTL", "300"))
 
 # Password hashing
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -134,6 +138,151 @@ class UserInfo:
         return all(self.has_permission(perm) for perm in permissions)
 
 
+def _secret_fingerprint(secret: str | None, algorithm: str) -> str | None:
+    """Short, non-reversible identifier for a signing secret."""
+    if not secret:
+        return None
+    return hashlib.sha256(f"{algorithm}:{secret}".encode()).hexdigest()[:16]
+
+
+class _VerifiedToken:
+    """A token whose signature has already been verified."""
+
+    __slots__ = ("payload", "secret_id", "expires_at")
+
+    def __init__(self, payload: TokenPayload, secret_id: str, expires_at: float):
+        self.payload = payload
+        self.secret_id = secret_id
+        self.expires_at = expires_at
+
+
+class VerifiedTokenCache:
+    """
+    Bounded LRU cache of verified token claims.
+
+    Entries are keyed by a SHA-256 digest of the raw token, so tokens are never
+    held in memory as cache keys. Each entry records which secret validated the
+    token and is dropped once the token expires (or after ``max_ttl`` seconds,
+    whichever comes first), when its secret is rotated, or when its ``jti`` is
+    revoked.
+    """
+
+    def __init__(self, max_size: int = TOKEN_CACHE_SIZE, max_ttl: float = TOKEN_CACHE_MAX_TTL):
+        self.max_size = max_size
+        self.max_ttl = max_ttl
+        self._entries: OrderedDict[bytes, _VerifiedToken] = OrderedDict()
+        self._revoked: dict[str, float] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def digest(token: str) -> bytes:
+        """Cache key for a raw token."""
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str, valid_secrets: set[str | None]) -> TokenPayload | None:
+        """
+        Get the cached payload for a token.
+
+        Args:
+            token: Raw JWT
+            valid_secrets: Fingerprints of the secrets currently accepted
+
+        Returns:
+            Cached TokenPayload, or None on a miss
+        """
+        if self.max_size <= 0:
+            return None
+
+        key = self.digest(token)
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if (
+                entry.expires_at <= now
+                or entry.secret_id not in valid_secrets
+                or self._is_revoked(entry.payload.jti, now)
+            ):
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.payload
+
+    def put(self, token: str, payload: TokenPayload, secret_id: str) -> None:
+        """Cache the payload of a freshly verified token."""
+        if self.max_size <= 0:
+            return
+
+        expires_at = time.time() + self.max_ttl
+        if payload.exp is not None:
+            expires_at = min(expires_at, float(payload.exp))
+
+        key = self.digest(token)
+        with self._lock:
+            self._entries[key] = _VerifiedToken(payload, secret_id, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def revoke(self, jti: str, until: float | None = None) -> None:
+        """
+        Revoke a token ID.
+
+        Args:
+            jti: Token ID to revoke
+            until: When the revocation can be forgotten (the token's ``exp``);
+                defaults to the refresh token lifetime
+        """
+        if until is None:
+            until = time.time() + REFRESH_TOKEN_EXPIRE_DAYS * 86400
+        with self._lock:
+            self._revoked[jti] = until
+            stale = [k for k, e in self._entries.items() if e.payload.jti == jti]
+            for key in stale:
+                del self._entries[key]
+
+    def is_revoked(self, jti: str | None) -> bool:
+        """Check whether a token ID has been revoked."""
+        with self._lock:
+            return self._is_revoked(jti, time.time())
+
+    def _is_revoked(self, jti: str | None, now: float) -> bool:
+        """Revocation check; caller must hold the lock."""
+        if jti is None or not self._revoked:
+            return False
+        until = self._revoked.get(jti)
+        if until is None:
+            return False
+        if until <= now:
+            del self._revoked[jti]
+            return False
+        return True
+
+    def clear(self) -> None:
+        """Drop all cached tokens (revocations are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "revoked": len(self._revoked),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
 class JWTManager:
     """JWT token management."""
 
@@ -143,11 +292,13 @@ class JWTManager:
         algorithm: str = JWT_ALGORITHM,
         access_token_expire_minutes: int = ACCESS_TOKEN_EXPIRE_MINUTES,
         refresh_token_expire_days: int = REFRESH_TOKEN_EXPIRE_DAYS,
+        token_cache_size: int = TOKEN_CACHE_SIZE,
     ):
         self.secret_key = secret_key
         self.algorithm = algorithm
         self.access_token_expire_minutes = access_token_expire_minutes
         self.refresh_token_expire_days = refresh_token_expire_days
+        self.token_cache = VerifiedTokenCache(max_size=token_cache_size)
 
         # Validate configuration
         if not self.secret_key or len(self.secret_key) < 32:
@@ -241,7 +392,22 @@ class JWTManager:
             TokenExpiredError: If token has expired
             InvalidTokenError: If token is invalid
         """
+        authelia_id = _secret_fingerprint(AUTHELIA_JWT_SECRET, AUTHELIA_JWT_ALGORITHM)
+        local_id = _secret_fingerprint(self.secret_key, self.algorithm)
+
+        # Expired or revoked tokens are never served from the cache, so a hit
+        # is only possible when expiry is being verified
+        if verify_exp:
+            cached = self.token_cache.get(token, {authelia_id, local_id})
+            if cached is not None:
+                return replace(
+                    cached,
+                    roles=list(cached.roles),
+                    permissions=list(cached.permissions),
+                )
+
         try:
+            secret_id = local_id
             # First try to decode with Authentik JWT secret if available
             if AUTHELIA_JWT_SECRET:
                 try:
@@ -251,6 +417,7 @@ class JWTManager:
                         algorithms=[AUTHELIA_JWT_ALGORITHM],
                         options={"verify_exp": verify_exp},
                     )
+                    secret_id = authelia_id
                     logger.debug("Token validated with Authentik JWT secret")
                 except jwt.InvalidTokenError:
                     # If Authentik validation fails, try regular JWT
@@ -283,9 +450,25 @@ class JWTManager:
                 jti=payload.get("jti"),
             )
 
+            if self.token_cache.is_revoked(token_payload.jti):
+                raise InvalidTokenError("Token has been revoked")
+
+            if verify_exp:
+                self.token_cache.put(
+                    token,
+                    replace(
+                        token_payload,
+                        roles=list(token_payload.roles),
+                        permissions=list(token_payload.permissions),
+                    ),
+                    secret_id,
+                )
+
             logger.debug(f"Successfully decoded token for user {token_payload.sub}")
             return token_payload
 
+        except InvalidTokenError:
+            raise
         except jwt.ExpiredSignatureError:
             logger.warning("Token has expired")
             raise TokenExpiredError("Token has expired")
@@ -296,6 +479,22 @@ class JWTManager:
             logger.error(f"Token decode error: {e}")
             raise InvalidTokenError("Token decode failed")
 
+    def revoke_token(self, token: str) -> None:
+        """
+        Revoke a token so it is rejected until it expires.
+
+        Args:
+            token: Token to revoke (its signature must still be valid)
+
+        Raises:
+            InvalidTokenError: If the token is invalid or carries no ``jti``
+        """
+        payload = self.decode_token(token, verify_exp=False)
+        if not payload.jti:
+            raise InvalidTokenError("Token has no jti and cannot be revoked")
+        self.token_cache.revoke(payload.jti, until=payload.exp)
+        logger.info(f"Revoked token {payload.jti} for user {payload.sub}")
+
     def refresh_token(self, refresh_token: str) -> dict[str, str]:
         """
         Create new access token from refresh token.
@@ -801,6 +1000,7 @@ def get_auth_config() -> dict[str, Any]:
         "refresh_token_expire_days": REFRESH_TOKEN_EXPIRE_DAYS,
         "password_min_length": PASSWORD_MIN_LENGTH,
         "secret_key_configured": bool(JWT_SECRET and len(JWT_SECRET) >= 32),
+        "token_cache": jwt_manager.token_cache.stats(),
     }
 
 
@@ -852,6 +1052,7 @@ __all__ = [
     "get_auth_token",
     # Core classes
     "JWTManager",
+    "VerifiedTokenCache",
     "TokenPayload",
     "UserInfo",
     "TokenType",
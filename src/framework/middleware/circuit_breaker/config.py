@@ -23,6 +23,8 @@ class CircuitBreakerConfig:
     storage_provider: str | None = (
         None  # Storage provider type ("memory", "redis", etc.)
     )
+    persist_interval: float = 5.0  # Debounce window for non-transition state writes (0 = write every update)
+    executor_max_workers: int = 16  # Size of the shared timeout executor
 
     def __post_init__(self):
         """Validate configuration parameters."""
@@ -36,6 +38,10 @@ class CircuitBreakerConfig:
             raise ValueError("timeout must be non-negative")
         if self.max_state_history <= 0:
             raise ValueError("max_state_history must be positive")
+        if self.persist_interval < 0:  # Allow 0 for "persist on every update"
+            raise ValueError("persist_interval must be non-negative")
+        if self.executor_max_workers <= 0:
+            raise ValueError("executor_max_workers must be positive")
 
         # Validate log levels
         valid_log_levels = {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
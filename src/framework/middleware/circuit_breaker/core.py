@@ -1,8 +1,8 @@
+import asyncio
 import threading
 import time
 from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor
-from concurrent.futures import TimeoutError as FuturesTimeoutError
 from typing import Any, Dict, List, Optional, Type, Union
 
 from loguru import logger
@@ -40,6 +40,7 @@ class CircuitBreaker:
 
     _instances: dict[str, "CircuitBreaker"] = {}
     _lock = threading.RLock()  # Class-level lock for thread safety
+    _executor: ThreadPoolExecutor | None = None  # Shared executor for timed calls
 
     @classmethod
     def get_instance(cls, name: str, **kwargs) -> "CircuitBreaker":
@@ -82,6 +83,45 @@ class CircuitBreaker:
             if name in cls._instances:
                 del cls._instances[name]
 
+    @classmethod
+    def get_executor(cls, max_workers: int = 16) -> ThreadPoolExecutor:
+        """
+        Get the bounded executor shared by all circuit breakers.
+
+        The executor is created lazily on first use so that breakers which
+        never run with a timeout don't spawn any threads.
+
+        Args:
+            max_workers: Maximum number of worker threads (used on creation only)
+
+        Returns:
+            The shared ThreadPoolExecutor
+        """
+        with cls._lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(
+                    max_workers=max_workers, thread_name_prefix="circuit-breaker"
+                )
+            return cls._executor
+
+    @classmethod
+    def shutdown_executor(cls, wait: bool = True) -> None:
+        """
+        Shut down the shared executor and flush any pending state writes.
+
+        A new executor is created on the next timed call, so this is safe to
+        call from application teardown or between tests.
+
+        Args:
+            wait: Whether to wait for running calls to finish
+        """
+        with cls._lock:
+            for circuit in cls._instances.values():
+                circuit.flush_state()
+            executor, cls._executor = cls._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
     @classmethod
     def list_instances(cls) -> list[str]:
         """
@@ -136,6 +176,11 @@ class CircuitBreaker:
         # Metrics
         self.metrics = CircuitMetrics()
 
+        # Debounced persistence
+        self._last_persist_time = 0.0
+        self._persist_pending = False
+        self._persist_timer: threading.Timer | None = None
+
         # State change notification hooks
         self.state_change_hooks: list[
             Callable[[str, CircuitState, CircuitState], None]
@@ -278,6 +323,10 @@ class CircuitBreaker:
                         "timeout_requests": self.metrics.timeout_requests,
                     }
 
+                self._cancel_persist_timer()
+                self._persist_pending = False
+                self._last_persist_time = time.time()
+
                 success = self.state_provider.persist_state(
                     f"circuit_breaker:{self.name}", state
                 )
@@ -289,6 +338,48 @@ class CircuitBreaker:
         except Exception as e:
             self._log("error", f"Error persisting circuit breaker state: {e}")
 
+    def _schedule_persist(self) -> None:
+        """
+        Persist counter updates that don't change the circuit state.
+
+        Writes are debounced to at most one per ``persist_interval`` seconds;
+        updates inside the window are flushed by a one-shot timer. State
+        transitions bypass this and call ``_persist_state`` directly.
+        """
+        interval = self.config.persist_interval
+        with self._lock:
+            if interval <= 0:
+                self._persist_state()
+                return
+
+            elapsed = time.time() - self._last_persist_time
+            if elapsed >= interval and self._persist_timer is None:
+                self._persist_state()
+                return
+
+            self._persist_pending = True
+            if self._persist_timer is None:
+                self._persist_timer = threading.Timer(
+                    max(interval - elapsed, 0.0), self.flush_state
+                )
+                self._persist_timer.daemon = True
+                self._persist_timer.start()
+
+    def _cancel_persist_timer(self) -> None:
+        """Cancel the pending debounce timer, if any. Caller holds the lock."""
+        if self._persist_timer is not None:
+            if self._persist_timer is not threading.current_thread():
+                self._persist_timer.cancel()
+            self._persist_timer = None
+
+    def flush_state(self) -> None:
+        """Write any debounced state updates to the state provider now."""
+        with self._lock:
+            if self._persist_pending:
+                self._persist_state()
+            else:
+                self._cancel_persist_timer()
+
     def _record_state_change(
         self, old_state: CircuitState, new_state: CircuitState
     ) -> None:
@@ -440,11 +531,80 @@ class CircuitBreaker:
             # Re-raise the original exception
             raise
 
+    async def execute_async(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Execute the provided coroutine function with circuit breaker protection.
+
+        The timeout is enforced with ``asyncio.wait_for`` on the event loop, so
+        no worker thread is involved.
+
+        Args:
+            func: The coroutine function to execute
+            *args: Positional arguments to pass to the function
+            **kwargs: Keyword arguments to pass to the function
+
+        Returns:
+            The result of the awaited function call
+
+        Raises:
+            CircuitOpenError: If the circuit is open
+            CircuitTimeoutError: If the function execution times out
+            Any exceptions raised by the function
+        """
+        self.allow_request()
+
+        timeout = kwargs.pop("_timeout", None) or self.config.timeout
+
+        start_time = time.time()
+
+        try:
+            if timeout and timeout > 0:
+                try:
+                    result = await asyncio.wait_for(
+                        func(*args, **kwargs), timeout=timeout
+                    )
+                except TimeoutError as timeout_error:
+                    self._log(
+                        "error", f"Request to '{self.name}' timed out after {timeout}s"
+                    )
+                    raise CircuitTimeoutError(
+                        f"Request to '{self.name}' timed out after {timeout}s",
+                        timeout_seconds=timeout,
+                        circuit_name=self.name,
+                    ) from timeout_error
+            else:
+                result = await func(*args, **kwargs)
+
+            if self.config.track_metrics:
+                execution_time_ms = (time.time() - start_time) * 1000
+                self.metrics.record_request(
+                    success=True, response_time_ms=execution_time_ms
+                )
+
+            self._on_success()
+            return result
+
+        except Exception as e:
+            if self.config.track_metrics:
+                execution_time_ms = (time.time() - start_time) * 1000
+                is_timeout = isinstance(e, (TimeoutError, CircuitTimeoutError))
+                self.metrics.record_request(
+                    success=False,
+                    response_time_ms=execution_time_ms,
+                    timeout=is_timeout,
+                )
+
+            if type(e) not in self.config.excluded_exceptions:
+                failure_type = self._classify_failure(e)
+                self._on_failure(failure_type, e)
+
+            raise
+
     def _execute_with_timeout(
         self, func: Callable, timeout: float, *args, **kwargs
     ) -> Any:
         """
-        Execute function with timeout using ThreadPoolExecutor.
+        Execute function with timeout on the shared ThreadPoolExecutor.
 
         Args:
             func: Function to execute
@@ -458,19 +618,22 @@ class CircuitBreaker:
         Raises:
             CircuitTimeoutError: If execution times out
         """
-        with ThreadPoolExecutor(max_workers=1) as executor:
-            future = executor.submit(func, *args, **kwargs)
-            try:
-                return future.result(timeout=timeout)
-            except FuturesTimeoutError as timeout_error:
-                self._log(
-                    "error", f"Request to '{self.name}' timed out after {timeout}s"
-                )
-                raise CircuitTimeoutError(
-                    f"Request to '{self.name}' timed out after {timeout}s",
-                    timeout_seconds=timeout,
-                    circuit_name=self.name,
-                ) from timeout_error
+        executor = self.get_executor(self.config.executor_max_workers)
+        future = executor.submit(func, *args, **kwargs)
+        try:
+            return future.result(timeout=timeout)
+        except TimeoutError as timeout_error:
+            # Drop the call if it hasn't started; a running call can't be
+            # interrupted and will release its worker when it returns.
+            future.cancel()
+            self._log(
+                "error", f"Request to '{self.name}' timed out after {timeout}s"
+            )
+            raise CircuitTimeoutError(
+                f"Request to '{self.name}' timed out after {timeout}s",
+                timeout_seconds=timeout,
+                circuit_name=self.name,
+            ) from timeout_error
 
     def _classify_failure(self, exception: Exception) -> str:
         """
@@ -541,7 +704,10 @@ class CircuitBreaker:
                     if old_state != self.state:
                         self._record_state_change(old_state, self.state)
 
-            self._persist_state()
+            if old_state != self.state:
+                self._persist_state()
+            else:
+                self._schedule_persist()
 
     def _on_failure(
         self,
@@ -587,8 +753,9 @@ class CircuitBreaker:
             # Update metrics and persist state
             if state_changed:
                 self._record_state_change(old_state, self.state)
-
-            self._persist_state()
+                self._persist_state()
+            else:
+                self._schedule_persist()
 
     def record_failure(self, failure_type: str = "transient") -> None:
         """
@@ -1,11 +1,8 @@
-import asyncio
 import functools
 import inspect
 from collections.abc import Callable
 from typing import Any, Dict, List, Optional, Type, TypeVar, Union, cast
 
-from framework.exceptions.api import SourceUnavailableError
-
 from .config import CircuitBreakerConfig
 from .core import CircuitBreaker
 
@@ -97,54 +94,8 @@ def with_circuit_breaker(
         @functools.wraps(func)
         async def async_wrapper(*args, **kwargs) -> Any:
             """Asynchronous wrapper for the decorated function."""
-            # Get or create the circuit breaker
             circuit = CircuitBreaker.get_instance(circuit_name, config=config)
-
-            # Check if request is allowed (this may raise exceptions)
-            circuit.allow_request()
-
-            # Extract timeout from kwargs or use default
-            req_timeout = kwargs.pop("_timeout", None) or config.timeout
-
-            try:
-                # Execute with timeout if needed
-                if req_timeout and req_timeout > 0:
-                    try:
-                        result = await asyncio.wait_for(
-                            func(*args, **kwargs), timeout=req_timeout
-                        )
-                    except TimeoutError:
-                        if config.track_metrics:
-                            circuit.metrics.timeout_requests += 1
-                        circuit._on_failure("persistent")
-                        raise TimeoutError(
-                            f"Request to '{circuit_name}' timed out after {req_timeout}s"
-                        )
-                else:
-                    result = await func(*args, **kwargs)
-
-                # Record success
-                circuit._on_success()
-                return result
-
-            except Exception as e:
-                # Skip failure handling for excluded exceptions
-                if type(e) not in config.excluded_exceptions:
-                    failure_type = (
-                        "persistent"
-                        if isinstance(
-                            e,
-                            (
-                                SourceUnavailableError,
-                                TimeoutError,
-                                asyncio.TimeoutError,
-                            ),
-                        )
-                        else "transient"
-                    )
-                    circuit._on_failure(failure_type)
-                # Re-raise the original exception
-                raise
+            return await circuit.execute_async(func, *args, **kwargs)
 
         # Create a callable class that can hold attributes
         class CircuitBreakerWrapper:
@@ -142,12 +142,14 @@ class StateProviderError(CircuitBreakerError):
         self.underlying_error = underlying_error
 
 
-class CircuitTimeoutError(CircuitBreakerError):
+class CircuitTimeoutError(CircuitBreakerError, TimeoutError):
     """
     Raised when a circuit breaker operation times out.
 
     This exception is used when the circuit breaker's timeout
-    mechanism triggers during function execution.
+    mechanism triggers during function execution. It also subclasses
+    the builtin ``TimeoutError`` so existing ``except TimeoutError``
+    handlers keep catching circuit timeouts.
     """
 
     def __init__(
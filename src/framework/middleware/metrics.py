@@ -6,7 +6,7 @@ performance, error rates, and usage patterns. It integrates with the application
 metrics collection system and provides detailed context for analysis.
 """
 
-import statistics
+import threading
 import time
 import traceback
 from collections import defaultdict, deque
@@ -23,6 +23,8 @@ from loguru import logger
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.types import ASGIApp
 
+from .quantiles import QuantileSketch
+
 
 class MetricType(Enum):
     """Types of metrics that can be collected."""
@@ -72,58 +74,149 @@ class RequestMetrics:
         }
 
 
+PERCENTILES = (0.5, 0.95, 0.99)
+
+
+class _EndpointStats:
+    """Per-endpoint counters with streaming duration and response-size sketches."""
+
+    __slots__ = ("count", "errors", "total_duration", "status_codes", "durations", "response_sizes")
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total_duration = 0.0
+        self.status_codes: dict[int, int] = defaultdict(int)
+        self.durations = QuantileSketch()
+        self.response_sizes = QuantileSketch()
+
+    def merge(self, other: "_EndpointStats") -> None:
+        self.count += other.count
+        self.errors += other.errors
+        self.total_duration += other.total_duration
+        for code, count in other.status_codes.items():
+            self.status_codes[code] += count
+        self.durations.merge(other.durations)
+        self.response_sizes.merge(other.response_sizes)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "total_duration": self.total_duration,
+            "status_codes": {str(code): count for code, count in self.status_codes.items()},
+            "durations": self.durations.to_dict(),
+            "response_sizes": self.response_sizes.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "_EndpointStats":
+        stats = cls()
+        stats.count = data["count"]
+        stats.errors = data["errors"]
+        stats.total_duration = data["total_duration"]
+        for code, count in data["status_codes"].items():
+            stats.status_codes[int(code)] = count
+        stats.durations = QuantileSketch.from_dict(data["durations"])
+        stats.response_sizes = QuantileSketch.from_dict(data["response_sizes"])
+        return stats
+
+
+class _MetricsShard:
+    """Aggregates recorded by one thread.
+
+    Only the owning thread writes to a shard, so its lock is uncontended on
+    the request path; readers take it briefly while merging shards.
+    """
+
+    def __init__(self, owner: threading.Thread | None = None):
+        self.owner = owner
+        self.lock = Lock()
+        self.clear()
+
+    def clear(self) -> None:
+        self.request_count = 0
+        self.error_count = 0
+        self.total_duration = 0.0
+        self.performance_buckets = {"fast": 0, "normal": 0, "slow": 0, "very_slow": 0}
+        self.status_codes: dict[int, int] = defaultdict(int)
+        self.endpoint_stats: dict[str, _EndpointStats] = {}
+        self.method_stats = defaultdict(lambda: {"count": 0, "errors": 0, "total_duration": 0.0})
+
+    def merge(self, other: "_MetricsShard") -> None:
+        self.request_count += other.request_count
+        self.error_count += other.error_count
+        self.total_duration += other.total_duration
+        for bucket, count in other.performance_buckets.items():
+            self.performance_buckets[bucket] += count
+        for code, count in other.status_codes.items():
+            self.status_codes[code] += count
+        for endpoint, stats in other.endpoint_stats.items():
+            mine = self.endpoint_stats.get(endpoint)
+            if mine is None:
+                mine = self.endpoint_stats[endpoint] = _EndpointStats()
+            mine.merge(stats)
+        for method, stats in other.method_stats.items():
+            mine = self.method_stats[method]
+            for key, value in stats.items():
+                mine[key] += value
+
+
 class MetricsCollector:
-    """Thread-safe metrics collector for aggregating request metrics."""
+    """Thread-safe metrics collector for aggregating request metrics.
+
+    Each recording thread accumulates into its own shard, so request threads
+    never contend on a shared lock. Per-endpoint durations and response sizes
+    are kept in QuantileSketch histograms: memory per endpoint is bounded no
+    matter how many requests are recorded, p50/p95/p99 are read from a
+    bounded number of buckets instead of sorting samples, and the state of
+    several workers can be combined with `export_state` / `merge_state`.
+    """
 
     def __init__(self, max_samples: int = 10000, retention_hours: int = 24):
         """
         Initialize metrics collector.
 
         Args:
-            max_samples: Maximum number of samples to keep in memory
+            max_samples: Maximum number of recent raw samples to keep in memory
             retention_hours: How long to retain metrics in hours
         """
         self.max_samples = max_samples
         self.retention_hours = retention_hours
         self._lock = Lock()
+        self._local = threading.local()
+        self._shards: list[_MetricsShard] = []
+        # Holds shards of finished threads and state merged from other workers
+        self._retired = _MetricsShard()
 
-        # Raw metrics storage
+        # Recent raw metrics (deque appends are atomic)
         self.metrics: deque = deque(maxlen=max_samples)
 
-        # Aggregated statistics
-        self.request_count = 0
-        self.error_count = 0
-        self.total_duration = 0.0
-
-        # Per-endpoint statistics
-        self.endpoint_stats = defaultdict(
-            lambda: {
-                "count": 0,
-                "errors": 0,
-                "total_duration": 0.0,
-                "status_codes": defaultdict(int),
-                "response_sizes": deque(maxlen=100),
-                "durations": deque(maxlen=100),
-            }
-        )
-
-        # Per-method statistics
-        self.method_stats = defaultdict(
-            lambda: {"count": 0, "errors": 0, "total_duration": 0.0}
-        )
-
-        # Performance buckets
-        self.performance_buckets = {
-            "fast": 0,  # < 100ms
-            "normal": 0,  # 100ms - 500ms
-            "slow": 0,  # 500ms - 1s
-            "very_slow": 0,  # > 1s
-        }
+        logger.debug(f"Metrics collector initialized with max_samples={max_samples}")
 
-        # Status code tracking
-        self.status_codes = defaultdict(int)
+    def _new_shard(self) -> _MetricsShard:
+        """Create and register the calling thread's shard."""
+        shard = _MetricsShard(threading.current_thread())
+        with self._lock:
+            self._shards.append(shard)
+        self._local.shard = shard
+        return shard
 
-        logger.debug(f"Metrics collector initialized with max_samples={max_samples}")
+    def _collect(self) -> _MetricsShard:
+        """Merge every shard into a snapshot, folding in shards of finished threads."""
+        snapshot = _MetricsShard()
+        with self._lock:
+            live = []
+            for shard in self._shards:
+                with shard.lock:
+                    if shard.owner is not None and not shard.owner.is_alive():
+                        self._retired.merge(shard)
+                        continue
+                    snapshot.merge(shard)
+                live.append(shard)
+            self._shards = live
+            snapshot.merge(self._retired)
+        return snapshot
 
     def add_metrics(self, metrics: RequestMetrics) -> None:
         """
@@ -132,55 +225,70 @@ class MetricsCollector:
         Args:
             metrics: Request metrics to add
         """
-        with self._lock:
-            # Add to raw metrics
-            self.metrics.append(metrics)
+        self.metrics.append(metrics)
+        is_error = bool(metrics.error or (metrics.status_code and metrics.status_code >= 400))
+        duration = metrics.duration
+        endpoint_key = f"{metrics.method} {metrics.endpoint}"
 
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._new_shard()
+        with shard.lock:
             # Update global counters
-            self.request_count += 1
-            if metrics.error or (metrics.status_code and metrics.status_code >= 400):
-                self.error_count += 1
+            shard.request_count += 1
+            if is_error:
+                shard.error_count += 1
 
-            if metrics.duration:
-                self.total_duration += metrics.duration
+            if duration:
+                shard.total_duration += duration
 
                 # Update performance buckets
-                duration_ms = metrics.duration * 1000
+                duration_ms = duration * 1000
                 if duration_ms < 100:
-                    self.performance_buckets["fast"] += 1
+                    shard.performance_buckets["fast"] += 1
                 elif duration_ms < 500:
-                    self.performance_buckets["normal"] += 1
+                    shard.performance_buckets["normal"] += 1
                 elif duration_ms < 1000:
-                    self.performance_buckets["slow"] += 1
+                    shard.performance_buckets["slow"] += 1
                 else:
-                    self.performance_buckets["very_slow"] += 1
+                    shard.performance_buckets["very_slow"] += 1
 
             # Update endpoint statistics
-            endpoint_key = f"{metrics.method} {metrics.endpoint}"
-            endpoint_stat = self.endpoint_stats[endpoint_key]
-            endpoint_stat["count"] += 1
+            endpoint_stat = shard.endpoint_stats.get(endpoint_key)
+            if endpoint_stat is None:
+                endpoint_stat = shard.endpoint_stats[endpoint_key] = _EndpointStats()
+            endpoint_stat.count += 1
 
-            if metrics.error or (metrics.status_code and metrics.status_code >= 400):
-                endpoint_stat["errors"] += 1
+            if is_error:
+                endpoint_stat.errors += 1
 
-            if metrics.duration:
-                endpoint_stat["total_duration"] += metrics.duration
-                endpoint_stat["durations"].append(metrics.duration)
+            if duration:
+                endpoint_stat.total_duration += duration
+                endpoint_stat.durations.add(duration)
 
             if metrics.status_code:
-                endpoint_stat["status_codes"][metrics.status_code] += 1
-                self.status_codes[metrics.status_code] += 1
+                endpoint_stat.status_codes[metrics.status_code] += 1
+                shard.status_codes[metrics.status_code] += 1
 
             if metrics.response_size:
-                endpoint_stat["response_sizes"].append(metrics.response_size)
+                endpoint_stat.response_sizes.add(metrics.response_size)
 
             # Update method statistics
-            method_stat = self.method_stats[metrics.method]
+            method_stat = shard.method_stats[metrics.method]
             method_stat["count"] += 1
-            if metrics.error or (metrics.status_code and metrics.status_code >= 400):
+            if is_error:
                 method_stat["errors"] += 1
-            if metrics.duration:
-                method_stat["total_duration"] += metrics.duration
+            if duration:
+                method_stat["total_duration"] += duration
+
+    @property
+    def request_count(self) -> int:
+        return self._collect().request_count
+
+    @property
+    def error_count(self) -> int:
+        return self._collect().error_count
 
     def get_summary(self) -> dict[str, Any]:
         """
@@ -189,26 +297,26 @@ class MetricsCollector:
         Returns:
             Dict containing summary metrics
         """
-        with self._lock:
-            avg_duration = (
-                (self.total_duration / self.request_count)
-                if self.request_count > 0
-                else 0
-            )
-            error_rate = (
-                (self.error_count / self.request_count) if self.request_count > 0 else 0
-            )
+        totals = self._collect()
+        avg_duration = (
+            (totals.total_duration / totals.request_count)
+            if totals.request_count > 0
+            else 0
+        )
+        error_rate = (
+            (totals.error_count / totals.request_count) if totals.request_count > 0 else 0
+        )
 
-            return {
-                "total_requests": self.request_count,
-                "total_errors": self.error_count,
-                "error_rate": error_rate,
-                "avg_duration_ms": avg_duration * 1000,
-                "performance_distribution": self.performance_buckets.copy(),
-                "status_code_distribution": dict(self.status_codes),
-                "samples_in_memory": len(self.metrics),
-                "retention_hours": self.retention_hours,
-            }
+        return {
+            "total_requests": totals.request_count,
+            "total_errors": totals.error_count,
+            "error_rate": error_rate,
+            "avg_duration_ms": avg_duration * 1000,
+            "performance_distribution": dict(totals.performance_buckets),
+            "status_code_distribution": dict(totals.status_codes),
+            "samples_in_memory": len(self.metrics),
+            "retention_hours": self.retention_hours,
+        }
 
     def get_endpoint_stats(self, top_n: int = 10) -> dict[str, Any]:
         """
@@ -220,81 +328,57 @@ class MetricsCollector:
         Returns:
             Dict containing endpoint statistics
         """
-        with self._lock:
-            endpoint_summaries = {}
-
-            for endpoint, stats in self.endpoint_stats.items():
-                avg_duration = (
-                    (stats["total_duration"] / stats["count"])
-                    if stats["count"] > 0
-                    else 0
-                )
-                error_rate = (
-                    (stats["errors"] / stats["count"]) if stats["count"] > 0 else 0
-                )
-
-                # Calculate percentiles if we have duration data
-                p95_duration = 0
-                avg_response_size = 0
-
-                if stats["durations"]:
-                    try:
-                        durations_sorted = sorted(stats["durations"])
-                        p95_index = int(0.95 * len(durations_sorted))
-                        p95_duration = durations_sorted[
-                            min(p95_index, len(durations_sorted) - 1)
-                        ]
-                    except (IndexError, ValueError):
-                        p95_duration = avg_duration
-
-                if stats["response_sizes"]:
-                    avg_response_size = sum(stats["response_sizes"]) / len(
-                        stats["response_sizes"]
-                    )
-
-                endpoint_summaries[endpoint] = {
-                    "count": stats["count"],
-                    "errors": stats["errors"],
-                    "error_rate": error_rate,
-                    "avg_duration_ms": avg_duration * 1000,
-                    "p95_duration_ms": p95_duration * 1000,
-                    "avg_response_size_bytes": avg_response_size,
-                    "status_codes": dict(stats["status_codes"]),
-                }
+        endpoint_stats = self._collect().endpoint_stats
 
-            # Sort by request count and return top N
-            sorted_endpoints = sorted(
-                endpoint_summaries.items(), key=lambda x: x[1]["count"], reverse=True
-            )
+        # Only summarize the top N endpoints by request count
+        ranked = sorted(endpoint_stats.items(), key=lambda x: x[1].count, reverse=True)
+
+        endpoint_summaries = {}
+        for endpoint, stats in ranked[:top_n]:
+            avg_duration = (stats.total_duration / stats.count) if stats.count > 0 else 0
+            error_rate = (stats.errors / stats.count) if stats.count > 0 else 0
+            p50, p95, p99 = stats.durations.quantiles(list(PERCENTILES))
 
-            return {
-                "endpoints": dict(sorted_endpoints[:top_n]),
-                "total_endpoints": len(endpoint_summaries),
+            endpoint_summaries[endpoint] = {
+                "count": stats.count,
+                "errors": stats.errors,
+                "error_rate": error_rate,
+                "avg_duration_ms": avg_duration * 1000,
+                "p50_duration_ms": p50 * 1000,
+                "p95_duration_ms": p95 * 1000,
+                "p99_duration_ms": p99 * 1000,
+                "avg_response_size_bytes": stats.response_sizes.mean,
+                "p95_response_size_bytes": stats.response_sizes.quantile(0.95),
+                "status_codes": dict(stats.status_codes),
             }
 
+        return {
+            "endpoints": endpoint_summaries,
+            "total_endpoints": len(endpoint_stats),
+        }
+
     def get_method_stats(self) -> dict[str, Any]:
         """Get per-method statistics."""
-        with self._lock:
-            method_summaries = {}
-
-            for method, stats in self.method_stats.items():
-                avg_duration = (
-                    (stats["total_duration"] / stats["count"])
-                    if stats["count"] > 0
-                    else 0
-                )
-                error_rate = (
-                    (stats["errors"] / stats["count"]) if stats["count"] > 0 else 0
-                )
-
-                method_summaries[method] = {
-                    "count": stats["count"],
-                    "errors": stats["errors"],
-                    "error_rate": error_rate,
-                    "avg_duration_ms": avg_duration * 1000,
-                }
+        method_summaries = {}
+
+        for method, stats in self._collect().method_stats.items():
+            avg_duration = (
+                (stats["total_duration"] / stats["count"])
+                if stats["count"] > 0
+                else 0
+            )
+            error_rate = (
+                (stats["errors"] / stats["count"]) if stats["count"] > 0 else 0
+            )
 
-            return method_summaries
+            method_summaries[method] = {
+                "count": stats["count"],
+                "errors": stats["errors"],
+                "error_rate": error_rate,
+                "avg_duration_ms": avg_duration * 1000,
+            }
+
+        return method_summaries
 
     def get_recent_metrics(self, limit: int = 100) -> list[dict[str, Any]]:
         """
@@ -306,21 +390,57 @@ class MetricsCollector:
         Returns:
             List of recent metrics
         """
+        recent = list(self.metrics)[-limit:]
+        return [metric.to_dict() for metric in recent]
+
+    def export_state(self) -> dict[str, Any]:
+        """
+        Export aggregate statistics in a JSON-serializable form.
+
+        Returns:
+            Dict that another collector can combine with `merge_state`
+        """
+        totals = self._collect()
+        return {
+            "request_count": totals.request_count,
+            "error_count": totals.error_count,
+            "total_duration": totals.total_duration,
+            "performance_buckets": dict(totals.performance_buckets),
+            "status_codes": {str(code): count for code, count in totals.status_codes.items()},
+            "endpoints": {key: stats.to_dict() for key, stats in totals.endpoint_stats.items()},
+            "methods": {method: dict(stats) for method, stats in totals.method_stats.items()},
+        }
+
+    def merge_state(self, state: dict[str, Any]) -> None:
+        """
+        Merge statistics exported by another collector (e.g. another worker process).
+
+        Args:
+            state: Output of `export_state`
+        """
+        incoming = _MetricsShard()
+        incoming.request_count = state["request_count"]
+        incoming.error_count = state["error_count"]
+        incoming.total_duration = state["total_duration"]
+        incoming.performance_buckets.update(state["performance_buckets"])
+        for code, count in state["status_codes"].items():
+            incoming.status_codes[int(code)] = count
+        for key, stats in state["endpoints"].items():
+            incoming.endpoint_stats[key] = _EndpointStats.from_dict(stats)
+        for method, stats in state["methods"].items():
+            incoming.method_stats[method].update(stats)
+
         with self._lock:
-            recent = list(self.metrics)[-limit:]
-            return [metric.to_dict() for metric in recent]
+            self._retired.merge(incoming)
 
     def reset_stats(self) -> None:
         """Reset all statistics."""
         with self._lock:
             self.metrics.clear()
-            self.request_count = 0
-            self.error_count = 0
-            self.total_duration = 0.0
-            self.endpoint_stats.clear()
-            self.method_stats.clear()
-            self.performance_buckets = dict.fromkeys(self.performance_buckets, 0)
-            self.status_codes.clear()
+            for shard in self._shards:
+                with shard.lock:
+                    shard.clear()
+            self._retired = _MetricsShard()
             logger.info("Metrics collector statistics reset")
 
 
@@ -819,6 +939,7 @@ async def metrics_middleware(request: Request, call_next: Callable) -> Response:
 __all__ = [
     "MetricsMiddleware",
     "MetricsCollector",
+    "QuantileSketch",
     "RequestMetrics",
     "MetricType",
     "setup_metrics_middleware",
@@ -53,7 +53,7 @@ Example Usage:
 """
 
 import logging
-from typing import Optional
+from typing import Callable, Optional
 
 # Package metadata
 __version__ = "1.0.0"
@@ -217,7 +217,9 @@ def register_service(
     service_instance,
     startup_priority: int = 100,
     dependencies: set | None = None,
-    health_check: callable | None = None,
+    health_check: Callable | None = None,
+    startup_timeout: float | None = None,
+    shutdown_timeout: float | None = None,
 ) -> bool:
     """
     Convenience function to register a service with the global registry.
@@ -228,6 +230,8 @@ def register_service(
         startup_priority: Startup priority (lower = earlier)
         dependencies: Set of service names this depends on
         health_check: Optional health check function
+        startup_timeout: Seconds allowed for the service to start (registry default if None)
+        shutdown_timeout: Seconds allowed for the service to stop (registry default if None)
 
     Returns:
         True if registration successful, False otherwise
@@ -250,6 +254,8 @@ def register_service(
             startup_priority=startup_priority,
             dependencies=dependencies,
             health_check=health_check,
+            startup_timeout=startup_timeout,
+            shutdown_timeout=shutdown_timeout,
         )
         return True
     except Exception as e:
@@ -8,6 +8,7 @@ handling proper startup and shutdown sequencing with dependency management.
 import asyncio
 import inspect
 import logging
+import time
 from collections.abc import Awaitable, Callable
 from contextlib import asynccontextmanager, suppress
 from dataclasses import dataclass, field
@@ -57,6 +58,11 @@ class ServiceInfo:
     stop_time: datetime | None = None
     error_message: str | None = None
     restart_count: int = 0
+    startup_timeout: float | None = None
+    shutdown_timeout: float | None = None
+    startup_duration: float | None = None  # seconds spent in start()
+    shutdown_duration: float | None = None  # seconds spent in stop()
+    last_health_check: datetime | None = None
 
 
 @dataclass
@@ -98,7 +104,10 @@ class ServiceRegistry:
         self._shutdown_timeout = 30.0  # seconds
         self._startup_timeout = 60.0  # seconds
         self._health_check_interval = 30.0  # seconds
+        self._health_check_timeout = 10.0  # seconds
         self._health_check_task: asyncio.Task | None = None
+        self._startup_layers: list[list[str]] = []
+        self._startup_duration: float | None = None
 
     def register(
         self,
@@ -107,16 +116,24 @@ class ServiceRegistry:
         startup_priority: int = 100,
         dependencies: set[str] | None = None,
         health_check: Callable[[], Awaitable[bool]] | None = None,
+        startup_timeout: float | None = None,
+        shutdown_timeout: float | None = None,
     ) -> None:
         """
         Register a service with the registry.
 
+        Services whose dependencies are all running start concurrently, so
+        ordering between services must be expressed through ``dependencies``;
+        ``startup_priority`` only orders services within the same layer.
+
         Args:
             name: Unique identifier for the service
             service: Service instance to register
             startup_priority: Priority for startup sequencing (lower starts earlier)
             dependencies: Set of service names this service depends on
             health_check: Optional health check function
+            startup_timeout: Seconds allowed for start() (registry default if None)
+            shutdown_timeout: Seconds allowed for stop() (registry default if None)
         """
         if name in self._services:
             self._logger.warning(f"Service {name} already registered, will be replaced")
@@ -127,6 +144,8 @@ class ServiceRegistry:
             priority=startup_priority,
             dependencies=dependencies or set(),
             health_check=health_check,
+            startup_timeout=startup_timeout,
+            shutdown_timeout=shutdown_timeout,
         )
 
         self._logger.info(f"Registered service: {name} (priority: {startup_priority})")
@@ -226,30 +245,90 @@ class ServiceRegistry:
 
         return result
 
+    def _resolve_startup_layers(self) -> list[list[str]]:
+        """
+        Group services into dependency layers.
+
+        Every service in a layer depends only on services in earlier layers,
+        so a layer can be started concurrently once the previous one is running.
+        Services within a layer are ordered by priority.
+
+        Returns:
+            List of layers, each a list of service names
+
+        Raises:
+            ValueError: If circular dependencies are detected
+        """
+        order = self._resolve_startup_order()
+        depth: dict[str, int] = {}
+        for name in order:
+            deps = self._services[name].dependencies
+            depth[name] = 1 + max((depth[dep] for dep in deps), default=-1)
+
+        layers: list[list[str]] = [[] for _ in range(max(depth.values(), default=-1) + 1)]
+        for name in order:
+            layers[depth[name]].append(name)
+        for layer in layers:
+            layer.sort(key=lambda n: (self._services[n].priority, n))
+        return layers
+
     async def start_all(self, enable_health_checks: bool = True) -> None:
         """
-        Start all registered services in dependency-resolved order.
+        Start all registered services layer by layer.
+
+        Services in the same dependency layer are started concurrently; the
+        next layer starts once every service in the current one is running.
 
         Args:
             enable_health_checks: Whether to enable periodic health checking
         """
         self._logger.info("Starting all services")
-        startup_order = self._resolve_startup_order()
+        layers = self._resolve_startup_layers()
+        self._startup_layers = layers
+        started = time.perf_counter()
 
         started_count = 0
-        for name in startup_order:
-            if await self._start_service(name):
-                started_count += 1
-            else:
-                self._logger.error(f"Failed to start service {name}, aborting startup")
+        for layer in layers:
+            results = await asyncio.gather(*(self._start_service(name) for name in layer))
+            failed = [name for name, ok in zip(layer, results) if not ok]
+            started_count += len(layer) - len(failed)
+            if failed:
+                self._logger.error(
+                    f"Failed to start service(s) {', '.join(failed)}, aborting startup"
+                )
                 await self.stop_all()
-                raise RuntimeError(f"Service startup failed at {name}")
+                raise RuntimeError(f"Service startup failed at {', '.join(failed)}")
 
-        self._logger.info(f"Started {started_count} services")
+        self._startup_duration = time.perf_counter() - started
+        self._logger.info(
+            f"Started {started_count} services in {len(layers)} layers "
+            f"({self._startup_duration:.3f}s)"
+        )
 
         if enable_health_checks:
             await self._start_health_monitoring()
 
+    def get_startup_timings(self) -> dict[str, Any]:
+        """
+        Get timing information from the last start_all() call.
+
+        Returns:
+            Dictionary with total startup seconds, the layers that were started
+            and per-service startup/shutdown durations
+        """
+        return {
+            "total_seconds": self._startup_duration,
+            "layers": [list(layer) for layer in self._startup_layers],
+            "services": {
+                name: {
+                    "startup_seconds": info.startup_duration,
+                    "shutdown_seconds": info.shutdown_duration,
+                    "status": info.status.value,
+                }
+                for name, info in self._services.items()
+            },
+        }
+
     async def _start_service(self, name: str) -> bool:
         """
         Start a single service by name.
@@ -281,6 +360,8 @@ class ServiceRegistry:
         service_info.status = ServiceStatus.STARTING
         service = service_info.instance
         self._logger.debug(f"Starting service: {name}")
+        timeout = service_info.startup_timeout or self._startup_timeout
+        started = time.perf_counter()
 
         try:
             # Try different methods of starting the service
@@ -301,21 +382,26 @@ class ServiceRegistry:
                 self._logger.warning(f"Service {name} has no start/start_async method")
                 service_info.status = ServiceStatus.RUNNING
                 service_info.start_time = datetime.now()
+                service_info.startup_duration = 0.0
                 return True
 
             # Start with timeout
-            await asyncio.wait_for(start_coro, timeout=self._startup_timeout)
+            await asyncio.wait_for(start_coro, timeout=timeout)
 
             service_info.status = ServiceStatus.RUNNING
             service_info.start_time = datetime.now()
             service_info.error_message = None
-            self._logger.info(f"Started service: {name}")
+            service_info.startup_duration = time.perf_counter() - started
+            self._logger.info(
+                f"Started service: {name} ({service_info.startup_duration:.3f}s)"
+            )
             return True
 
         except TimeoutError:
-            self._logger.error(f"Timeout starting service {name}")
+            self._logger.error(f"Timeout starting service {name} after {timeout}s")
             service_info.status = ServiceStatus.ERROR
             service_info.error_message = "Startup timeout"
+            service_info.startup_duration = time.perf_counter() - started
             return False
         except Exception as e:
             self._logger.error(
@@ -323,11 +409,15 @@ class ServiceRegistry:
             )
             service_info.status = ServiceStatus.ERROR
             service_info.error_message = str(e)
+            service_info.startup_duration = time.perf_counter() - started
             return False
 
     async def stop_all(self) -> None:
         """
         Stop all running services in reverse startup order.
+
+        Layers are stopped from the last to the first; services within a
+        layer are stopped concurrently.
         """
         self._logger.info("Stopping all services")
 
@@ -338,19 +428,22 @@ class ServiceRegistry:
                 await self._health_check_task
             self._health_check_task = None
 
-        # Get reverse startup order
+        # Get reverse startup layers
         try:
-            startup_order = self._resolve_startup_order()
-            stop_order = list(reversed(startup_order))
+            stop_layers = list(reversed(self._resolve_startup_layers()))
         except ValueError:
             # If we can't resolve order due to circular deps, just stop in registration order
-            stop_order = list(self._services.keys())
+            stop_layers = [[name] for name in self._services]
 
         # Stop services
-        for name in stop_order:
-            service_info = self._services.get(name)
-            if service_info and service_info.status == ServiceStatus.RUNNING:
-                await self._stop_service(name)
+        for layer in stop_layers:
+            running = [
+                name
+                for name in layer
+                if self._services[name].status == ServiceStatus.RUNNING
+            ]
+            if running:
+                await asyncio.gather(*(self._stop_service(name) for name in running))
 
         self._logger.info("All services stopped")
 
@@ -376,6 +469,8 @@ class ServiceRegistry:
         service_info.status = ServiceStatus.STOPPING
         service = service_info.instance
         self._logger.debug(f"Stopping service: {name}")
+        timeout = service_info.shutdown_timeout or self._shutdown_timeout
+        started = time.perf_counter()
 
         try:
             # Try different methods of stopping the service
@@ -402,20 +497,25 @@ class ServiceRegistry:
                 )
                 service_info.status = ServiceStatus.STOPPED
                 service_info.stop_time = datetime.now()
+                service_info.shutdown_duration = 0.0
                 return True
 
             # Stop with timeout
-            await asyncio.wait_for(stop_coro, timeout=self._shutdown_timeout)
+            await asyncio.wait_for(stop_coro, timeout=timeout)
 
             service_info.status = ServiceStatus.STOPPED
             service_info.stop_time = datetime.now()
-            self._logger.info(f"Stopped service: {name}")
+            service_info.shutdown_duration = time.perf_counter() - started
+            self._logger.info(
+                f"Stopped service: {name} ({service_info.shutdown_duration:.3f}s)"
+            )
             return True
 
         except TimeoutError:
-            self._logger.error(f"Timeout stopping service {name}")
+            self._logger.error(f"Timeout stopping service {name} after {timeout}s")
             service_info.status = ServiceStatus.ERROR
             service_info.error_message = "Shutdown timeout"
+            service_info.shutdown_duration = time.perf_counter() - started
             return False
         except Exception as e:
             self._logger.error(
@@ -426,6 +526,7 @@ class ServiceRegistry:
             )  # Consider it stopped even with error
             service_info.stop_time = datetime.now()
             service_info.error_message = str(e)
+            service_info.shutdown_duration = time.perf_counter() - started
             return False
 
     def is_service_running(self, name: str) -> bool:
@@ -461,22 +562,41 @@ class ServiceRegistry:
                 self._logger.error(f"Error in health monitoring: {e}", exc_info=True)
 
     async def _check_all_services_health(self) -> None:
-        """Check health of all running services."""
-        for name, service_info in self._services.items():
-            if (
-                service_info.status == ServiceStatus.RUNNING
-                and service_info.health_check
-            ):
-                try:
-                    is_healthy = await service_info.health_check()
-                    if not is_healthy:
-                        self._logger.warning(f"Service {name} failed health check")
-                        service_info.status = ServiceStatus.ERROR
-                        service_info.error_message = "Health check failed"
-                except Exception as e:
-                    self._logger.error(f"Health check error for {name}: {e}")
-                    service_info.status = ServiceStatus.ERROR
-                    service_info.error_message = f"Health check exception: {str(e)}"
+        """Check health of all running services concurrently."""
+        checks = [
+            self._check_service_health(name, service_info)
+            for name, service_info in self._services.items()
+            if service_info.status == ServiceStatus.RUNNING
+            and service_info.health_check
+        ]
+        if checks:
+            await asyncio.gather(*checks)
+
+    async def _check_service_health(self, name: str, service_info: ServiceInfo) -> None:
+        """
+        Run one service's health check and record the result.
+
+        Args:
+            name: Service identifier
+            service_info: Service information to update
+        """
+        try:
+            is_healthy = await asyncio.wait_for(
+                service_info.health_check(), timeout=self._health_check_timeout
+            )
+            service_info.last_health_check = datetime.now()
+            if not is_healthy:
+                self._logger.warning(f"Service {name} failed health check")
+                service_info.status = ServiceStatus.ERROR
+                service_info.error_message = "Health check failed"
+        except TimeoutError:
+            self._logger.error(f"Health check timeout for {name}")
+            service_info.status = ServiceStatus.ERROR
+            service_info.error_message = "Health check timeout"
+        except Exception as e:
+            self._logger.error(f"Health check error for {name}: {e}")
+            service_info.status = ServiceStatus.ERROR
+            service_info.error_message = f"Health check exception: {str(e)}"
 
     @asynccontextmanager
     async def lifecycle(self):
@@ -1,29 +1,132 @@
 """Service layer for monitoring and health checks."""
 
 import logging
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from typing import Any
 
 import httpx
-from django.db import models
+from django.conf import settings
+from django.core.cache import cache
+from django.db import close_old_connections, models
 from django.utils import timezone
 
 from .models import HealthCheck, ServiceRegistry
 
 logger = logging.getLogger(__name__)
 
+SWEEP_CACHE_KEY = "monitor:health:sweep"
+
+_shared_lock = threading.Lock()
+_shared_client: httpx.Client | None = None
+_executor: ThreadPoolExecutor | None = None
+
+# Serializes sweeps in this process so concurrent viewers share one
+_sweep_lock = threading.Lock()
+_refresher: "HealthCheckRefresher | None" = None
+
+
+def get_shared_client() -> httpx.Client:
+    """Get the process-wide pooled HTTP client used for health probes."""
+    global _shared_client
+    with _shared_lock:
+        if _shared_client is None or _shared_client.is_closed:
+            _shared_client = httpx.Client(
+                follow_redirects=True,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            )
+        return _shared_client
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _shared_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=getattr(settings, "MONITOR_HEALTH_MAX_WORKERS", 16),
+                thread_name_prefix="health-probe",
+            )
+        return _executor
+
+
+@dataclass
+class ProbeResult:
+    """Outcome of one HTTP health probe, before it is recorded."""
+
+    status_code: int
+    response_time_ms: float
+    success: bool
+    response_data: dict = field(default_factory=dict)
+    error_message: str = ""
+    timed_out: bool = False
+    response_text: str = ""
+
 
 class HealthCheckService:
     """Service for performing health checks on registered services."""
 
-    def __init__(self, timeout: float = 5.0):
+    def __init__(self, timeout: float = 5.0, client: httpx.Client | None = None, cache_ttl: float | None = None):
         """Initialize health check service.
 
         Args:
-            timeout: HTTP request timeout in seconds
+            timeout: Default HTTP request timeout in seconds; a service can
+                override it with a "health_check_timeout" metadata entry
+            client: HTTP client to use (defaults to the shared pooled client)
+            cache_ttl: Seconds check_all_services results are reused
+                (defaults to settings.MONITOR_HEALTH_CACHE_TTL)
         """
         self.timeout = timeout
-        self.client = httpx.Client(timeout=timeout, follow_redirects=True)
+        self.client = client or get_shared_client()
+        self.cache_ttl = cache_ttl if cache_ttl is not None else getattr(settings, "MONITOR_HEALTH_CACHE_TTL", 10.0)
+
+    def _timeout_for(self, service: ServiceRegistry) -> float:
+        try:
+            return float((service.metadata or {}).get("health_check_timeout", self.timeout))
+        except (TypeError, ValueError):
+            return self.timeout
+
+    def probe(self, url: str, timeout: float) -> ProbeResult:
+        """Request a health URL without touching the database.
+
+        Args:
+            url: Health endpoint URL
+            timeout: Request timeout in seconds
+
+        Returns:
+            ProbeResult describing the response or failure
+        """
+        start_time = time.time()
+        try:
+            response = self.client.get(url, timeout=timeout)
+            response_time_ms = (time.time() - start_time) * 1000
+            try:
+                response_data = response.json()
+            except Exception:
+                response_data = {"raw": response.text[:1000]}
+            return ProbeResult(
+                status_code=response.status_code,
+                response_time_ms=response_time_ms,
+                success=response.status_code == 200,
+                response_data=response_data,
+                response_text=response.text[:500],
+            )
+        except httpx.TimeoutException:
+            return ProbeResult(
+                status_code=0,
+                response_time_ms=(time.time() - start_time) * 1000,
+                success=False,
+                error_message=f"Request timeout after {timeout}s",
+                timed_out=True,
+            )
+        except Exception as e:
+            return ProbeResult(
+                status_code=0,
+                response_time_ms=(time.time() - start_time) * 1000,
+                success=False,
+                error_message=str(e),
+            )
 
     def check_service(self, service: ServiceRegistry) -> HealthCheck:
         """Perform health check on a single service.
@@ -34,21 +137,18 @@ class HealthCheckService:
         Returns:
             HealthCheck record
         """
-        start_time = time.time()
-        health_check = HealthCheck(service=service)
-
-        try:
-            response = self.client.get(service.health_url)
-            response_time_ms = (time.time() - start_time) * 1000
+        return self._record(service, self.probe(service.health_url, self._timeout_for(service)))
 
-            health_check.status_code = response.status_code
-            health_check.response_time_ms = response_time_ms
-            health_check.success = response.status_code == 200
+    def _record(self, service: ServiceRegistry, probe: ProbeResult) -> HealthCheck:
+        """Save a probe result and update the service status."""
+        health_check = HealthCheck(service=service)
+        health_check.status_code = probe.status_code
+        health_check.response_time_ms = probe.response_time_ms
+        health_check.success = probe.success
 
-            try:
-                health_check.response_data = response.json()
-            except Exception:
-                health_check.response_data = {"raw": response.text[:1000]}
+        if probe.status_code:
+            health_check.response_data = probe.response_data
+            response_time_ms = probe.response_time_ms
 
             if health_check.success:
                 # Extract version and metadata from response
@@ -57,42 +157,80 @@ class HealthCheckService:
                 service.mark_healthy(version=version, metadata=metadata)
                 logger.info(f"✅ Health check passed for {service.name} ({response_time_ms:.2f}ms)")
             else:
-                health_check.error_message = f"HTTP {response.status_code}: {response.text[:500]}"
+                health_check.error_message = f"HTTP {probe.status_code}: {probe.response_text}"
                 service.mark_down()
                 logger.warning(f"⚠️ Health check failed for {service.name}: {health_check.error_message}")
 
-        except httpx.TimeoutException:
-            response_time_ms = (time.time() - start_time) * 1000
-            health_check.status_code = 0
-            health_check.response_time_ms = response_time_ms
-            health_check.success = False
-            health_check.error_message = f"Request timeout after {self.timeout}s"
+        elif probe.timed_out:
+            health_check.error_message = probe.error_message
             service.mark_down()
             logger.error(f"❌ Timeout checking {service.name}: {health_check.error_message}")
 
-        except Exception as e:
-            response_time_ms = (time.time() - start_time) * 1000
-            health_check.status_code = 0
-            health_check.response_time_ms = response_time_ms
-            health_check.success = False
-            health_check.error_message = str(e)
+        else:
+            health_check.error_message = probe.error_message
             service.mark_down()
-            logger.error(f"❌ Error checking {service.name}: {e}")
+            logger.error(f"❌ Error checking {service.name}: {probe.error_message}")
 
         health_check.save()
         return health_check
 
-    def check_all_services(self) -> dict[str, Any]:
+    def check_all_services(self, max_age: float | None = None) -> dict[str, Any]:
         """Check health of all active services.
 
+        Probes run concurrently on the shared client, so a sweep takes about
+        as long as the slowest service rather than the sum of all of them.
+        A sweep younger than max_age is returned from cache instead; while a
+        background refresher is running the latest sweep is always returned,
+        so callers never wait on probes once it has completed one sweep.
+
+        Args:
+            max_age: Maximum age in seconds of a reusable sweep (defaults to
+                cache_ttl; 0 forces a new sweep)
+
         Returns:
             Dictionary with check results
         """
-        services = ServiceRegistry.objects.filter(is_active=True)
-        results = {"total": 0, "healthy": 0, "unhealthy": 0, "checks": []}
+        max_age = self.cache_ttl if max_age is None else max_age
+        cached = self._cached_sweep(max_age)
+        if cached is not None:
+            return cached
+
+        with _sweep_lock:
+            # Another thread may have finished a sweep while we waited
+            cached = self._cached_sweep(max_age)
+            if cached is not None:
+                return cached
+            results = self._sweep()
+            # Publish before releasing the lock so waiting threads find this sweep
+            try:
+                cache_timeout = max(self.cache_ttl, 3 * _refresher.interval) if _refresher else self.cache_ttl
+                if cache_timeout > 0:
+                    cache.set(SWEEP_CACHE_KEY, results, timeout=cache_timeout)
+            except Exception as e:
+                logger.warning(f"Could not cache health check results: {e}")
+        return results
 
-        for service in services:
-            health_check = self.check_service(service)
+    def _cached_sweep(self, max_age: float) -> dict[str, Any] | None:
+        if max_age <= 0:
+            return None
+        try:
+            cached = cache.get(SWEEP_CACHE_KEY)
+        except Exception:
+            return None
+        if cached is None:
+            return None
+        if (_refresher is not None and _refresher.is_running) or time.time() - cached["checked_at"] <= max_age:
+            return {**cached, "cached": True}
+        return None
+
+    def _sweep(self) -> dict[str, Any]:
+        services = list(ServiceRegistry.objects.filter(is_active=True))
+        executor = _get_executor()
+        futures = [executor.submit(self.probe, service.health_url, self._timeout_for(service)) for service in services]
+
+        results = {"total": 0, "healthy": 0, "unhealthy": 0, "checks": []}
+        for service, future in zip(services, futures):
+            health_check = self._record(service, future.result())
             results["total"] += 1
             if health_check.success:
                 results["healthy"] += 1
@@ -107,6 +245,8 @@ class HealthCheckService:
                 }
             )
 
+        results["checked_at"] = time.time()
+        results["cached"] = False
         return results
 
     def get_service_health_summary(self, service: ServiceRegistry, hours: int = 24) -> dict[str, Any]:
@@ -146,8 +286,9 @@ class HealthCheckService:
         }
 
     def close(self):
-        """Close HTTP client."""
-        self.client.close()
+        """Close HTTP client unless it is the shared pooled client."""
+        if self.client is not _shared_client:
+            self.client.close()
 
     def __enter__(self):
         """Context manager entry."""
@@ -158,6 +299,83 @@ class HealthCheckService:
         self.close()
 
 
+class HealthCheckRefresher:
+    """Background thread that re-runs check_all_services on an interval."""
+
+    def __init__(self, interval: float, timeout: float = 5.0):
+        """Initialize refresher.
+
+        Args:
+            interval: Seconds between sweeps
+            timeout: Default probe timeout passed to HealthCheckService
+        """
+        self.interval = interval
+        self.timeout = timeout
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """Start refreshing in a daemon thread."""
+        if self.is_running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="health-refresher", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None):
+        """Stop refreshing and wait for the current sweep to finish."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self):
+        checker = HealthCheckService(timeout=self.timeout)
+        while not self._stop.is_set():
+            try:
+                checker.check_all_services(max_age=0)
+            except Exception as e:
+                logger.error(f"❌ Background health check failed: {e}")
+            finally:
+                close_old_connections()
+            self._stop.wait(self.interval)
+
+
+def start_background_refresh(interval: float | None = None) -> HealthCheckRefresher | None:
+    """Start the process-wide health check refresher.
+
+    Called from the WSGI/ASGI entry points, so only processes that serve
+    requests sweep in the background; management commands never do.
+
+    Args:
+        interval: Seconds between sweeps (defaults to settings.MONITOR_HEALTH_REFRESH_INTERVAL;
+            0 leaves the refresher off)
+
+    Returns:
+        The running refresher, or None if disabled
+    """
+    global _refresher
+    interval = interval if interval is not None else getattr(settings, "MONITOR_HEALTH_REFRESH_INTERVAL", 0)
+    if not interval or interval <= 0:
+        return None
+    if _refresher is None:
+        _refresher = HealthCheckRefresher(interval)
+    _refresher.start()
+    return _refresher
+
+
+def stop_background_refresh():
+    """Stop the process-wide health check refresher if running."""
+    global _refresher
+    if _refresher is not None:
+        _refresher.stop()
+        _refresher = None
+
+
 class ServiceDiscoveryService:
     """Service for discovering and registering FKS microservices."""
 
@@ -15,7 +15,7 @@ def check_all_services_task():
     logger.info("🔍 Starting health check for all services...")
 
     with HealthCheckService() as checker:
-        results = checker.check_all_services()
+        results = checker.check_all_services(max_age=0)
 
     logger.info(
         f"✅ Health check complete: {results['healthy']}/{results['total']} services healthy"
@@ -2,10 +2,15 @@
 
 from .state import AgentState, create_initial_state
 from .base import create_agent, create_structured_agent
+from .llm_pool import get_chat_model, pooled_llm, get_pool_stats, clear_response_cache
 
 __all__ = [
     "AgentState",
     "create_initial_state",
     "create_agent",
-    "create_structured_agent"
+    "create_structured_agent",
+    "get_chat_model",
+    "pooled_llm",
+    "get_pool_stats",
+    "clear_response_cache"
 ]
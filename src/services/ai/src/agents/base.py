@@ -2,14 +2,15 @@
 Base Agent Factory for Multi-Agent Trading System
 
 Creates Ollama-based agents with configurable prompts and parameters.
+LLM calls go through the shared client pool in agents.llm_pool.
 """
 
-import os
 from typing import Optional
-from langchain_ollama import ChatOllama
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.runnables import Runnable
 
+from agents.llm_pool import pooled_llm
+
 
 def create_agent(
     role: str,
@@ -39,12 +40,8 @@ def create_agent(
         ... )
         >>> response = await technical_agent.ainvoke({"input": "Analyze BTCUSDT"})
     """
-    # Use environment variable or fallback to localhost
-    if base_url is None:
-        base_url = os.getenv("OLLAMA_HOST", "http://localhost:11434")
-    
-    # Initialize Ollama LLM
-    llm = ChatOllama(
+    # Shared, concurrency-capped Ollama client
+    llm = pooled_llm(
         model=model,
         temperature=temperature,
         base_url=base_url
@@ -85,11 +82,7 @@ def create_structured_agent(
     Note:
         Structured output requires Ollama >=0.3.0 and model support
     """
-    # Use environment variable or fallback to localhost
-    if base_url is None:
-        base_url = os.getenv("OLLAMA_HOST", "http://localhost:11434")
-    
-    llm = ChatOllama(
+    llm = pooled_llm(
         model=model,
         temperature=temperature,
         base_url=base_url,
@@ -0,0 +1,201 @@
+"""
+Pooled LLM Client Layer for Multi-Agent Trading System
+
+Shares ChatOllama clients across agents, caps concurrent Ollama requests with
+a process-wide semaphore, and answers repeated deterministic calls from cache.
+
+Every agent built by agents.base goes through this layer, so analysts, debaters
+and the manager draw from the same concurrency budget.
+"""
+
+import asyncio
+import copy
+import hashlib
+import os
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from langchain_core.runnables import Runnable, RunnableLambda
+from langchain_ollama import ChatOllama
+
+# Maximum in-flight Ollama requests across all agents in this process
+MAX_CONCURRENCY = int(os.getenv("OLLAMA_MAX_CONCURRENCY", "4"))
+
+# Maximum cached responses for temperature=0 calls (0 disables the cache)
+RESPONSE_CACHE_SIZE = int(os.getenv("LLM_RESPONSE_CACHE_SIZE", "256"))
+
+_clients: Dict[Tuple, ChatOllama] = {}
+_clients_lock = threading.Lock()
+
+# asyncio semaphores are bound to one event loop, so keep one per loop
+_async_gates: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+_sync_gate = threading.BoundedSemaphore(MAX_CONCURRENCY)
+_gates_lock = threading.Lock()
+
+_response_cache: "OrderedDict[str, Any]" = OrderedDict()
+_cache_lock = threading.Lock()
+_cache_stats = {"hits": 0, "misses": 0}
+
+
+def get_chat_model(
+    model: str = "llama3.2:3b",
+    temperature: float = 0.7,
+    base_url: Optional[str] = None,
+    format: Optional[str] = None
+) -> ChatOllama:
+    """
+    Get the shared ChatOllama client for a model configuration.
+
+    Clients are created once per (model, temperature, base_url, format) and
+    reused, so their underlying HTTP connection pools are reused too.
+
+    Args:
+        model: Ollama model name
+        temperature: Sampling temperature
+        base_url: Ollama API base URL (defaults to OLLAMA_HOST env var or localhost)
+        format: Optional output format (e.g. "json")
+
+    Returns:
+        Shared ChatOllama instance
+    """
+    if base_url is None:
+        base_url = os.getenv("OLLAMA_HOST", "http://localhost:11434")
+
+    key = (model, temperature, base_url, format)
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = ChatOllama(
+                model=model,
+                temperature=temperature,
+                base_url=base_url,
+                format=format
+            )
+            _clients[key] = client
+        return client
+
+
+def _get_async_gate() -> asyncio.Semaphore:
+    """Get the concurrency semaphore for the running event loop."""
+    loop = asyncio.get_running_loop()
+    with _gates_lock:
+        gate = _async_gates.get(loop)
+        if gate is None:
+            gate = asyncio.Semaphore(MAX_CONCURRENCY)
+            _async_gates[loop] = gate
+        return gate
+
+
+def _cache_key(client: ChatOllama, prompt: Any) -> Optional[str]:
+    """Build a response cache key, or None if the call isn't cacheable."""
+    if RESPONSE_CACHE_SIZE <= 0 or client.temperature != 0:
+        return None
+    text = prompt.to_string() if hasattr(prompt, "to_string") else str(prompt)
+    raw = f"{client.model}\x00{client.format}\x00{text}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _cache_get(key: Optional[str]) -> Any:
+    """Look up a cached response, refreshing its LRU position.
+
+    Callers get their own copy, so one agent editing a message (its
+    content or metadata) can't change what the next cache hit returns.
+    """
+    if key is None:
+        return None
+    with _cache_lock:
+        response = _response_cache.get(key)
+        if response is None:
+            _cache_stats["misses"] += 1
+            return None
+        _response_cache.move_to_end(key)
+        _cache_stats["hits"] += 1
+    return copy.deepcopy(response)
+
+
+def _cache_put(key: Optional[str], response: Any) -> None:
+    """Store a copy of a response, evicting the least recently used entry when full."""
+    if key is None:
+        return
+    response = copy.deepcopy(response)
+    with _cache_lock:
+        _response_cache[key] = response
+        _response_cache.move_to_end(key)
+        while len(_response_cache) > RESPONSE_CACHE_SIZE:
+            _response_cache.popitem(last=False)
+
+
+def pooled_llm(
+    model: str = "llama3.2:3b",
+    temperature: float = 0.7,
+    base_url: Optional[str] = None,
+    format: Optional[str] = None
+) -> Runnable:
+    """
+    Create a Runnable that calls a shared ChatOllama client through the pool.
+
+    Calls wait on the process-wide concurrency semaphore, and temperature=0
+    calls with an identical prompt and model are served from the response cache.
+
+    Args:
+        model: Ollama model name
+        temperature: Sampling temperature
+        base_url: Ollama API base URL (defaults to OLLAMA_HOST env var or localhost)
+        format: Optional output format (e.g. "json")
+
+    Returns:
+        Runnable accepting a prompt value and returning the model message
+    """
+    client = get_chat_model(model, temperature, base_url, format)
+
+    def invoke(prompt: Any) -> Any:
+        key = _cache_key(client, prompt)
+        cached = _cache_get(key)
+        if cached is not None:
+            return cached
+        with _sync_gate:
+            response = client.invoke(prompt)
+        _cache_put(key, response)
+        return response
+
+    async def ainvoke(prompt: Any) -> Any:
+        key = _cache_key(client, prompt)
+        cached = _cache_get(key)
+        if cached is not None:
+            return cached
+        async with _get_async_gate():
+            response = await client.ainvoke(prompt)
+        _cache_put(key, response)
+        return response
+
+    return RunnableLambda(invoke, afunc=ainvoke, name=f"pooled_{model}")
+
+
+def clear_response_cache() -> None:
+    """Drop all cached LLM responses."""
+    with _cache_lock:
+        _response_cache.clear()
+        _cache_stats["hits"] = 0
+        _cache_stats["misses"] = 0
+
+
+def get_pool_stats() -> Dict[str, Any]:
+    """
+    Get LLM pool statistics.
+
+    Returns:
+        Dict with client count, concurrency limit and response cache stats
+    """
+    with _cache_lock:
+        return {
+            "clients": len(_clients),
+            "max_concurrency": MAX_CONCURRENCY,
+            "cache_entries": len(_response_cache),
+            "cache_size": RESPONSE_CACHE_SIZE,
+            "cache_hits": _cache_stats["hits"],
+            "cache_misses": _cache_stats["misses"],
+        }
@@ -30,7 +30,7 @@ from agents.analysts.risk import risk_analyst
 from agents.debaters.bull import bull_agent
 from agents.debaters.bear import bear_agent
 from agents.debaters.manager import manager_agent
-from memory import TradingMemory
+from memory import get_trading_memory
 from processors.signal_processor import SignalProcessor
 from evaluators.llm_judge import LLMJudge
 
@@ -47,7 +47,7 @@ app = FastAPI(
 
 # Initialize global components
 try:
-    trading_memory = TradingMemory()
+    trading_memory = get_trading_memory()
     signal_processor = SignalProcessor()
     llm_judge = LLMJudge()
     logger.info("Initialized TradingMemory, SignalProcessor, and LLMJudge")
@@ -4,11 +4,20 @@ AI Model Evaluators
 Provides evaluation tools for assessing agent performance and reasoning quality.
 """
 
-from .llm_judge import LLMJudge, ConsistencyReport, DiscrepancyReport, BiasReport
+from .llm_judge import (
+    LLMJudge,
+    ConsistencyReport,
+    DiscrepancyReport,
+    BiasReport,
+    clear_judgment_cache,
+    get_judgment_cache_stats,
+)
 
 __all__ = [
     'LLMJudge',
     'ConsistencyReport',
     'DiscrepancyReport',
     'BiasReport',
+    'clear_judgment_cache',
+    'get_judgment_cache_stats',
 ]
@@ -36,6 +36,7 @@ Usage:
 """
 
 import asyncio
+import bisect
 from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
@@ -356,8 +357,8 @@ class GroundTruthValidator:
         """
         # Initialize ChromaDB memory if needed
         if self.memory is None:
-            from memory import TradingMemory
-            self.memory = TradingMemory()
+            from memory import get_trading_memory
+            self.memory = get_trading_memory()
         
         predictions = []
         
@@ -498,80 +499,16 @@ class GroundTruthValidator:
             if not rows:
                 return []
             
-            # Convert to list of OHLCV tuples
-            ohlcv_data = [
-                {
-                    'time': row[0],
-                    'open': float(row[1]),
-                    'high': float(row[2]),
-                    'low': float(row[3]),
-                    'close': float(row[4]),
-                    'volume': float(row[5])
-                }
-                for row in rows
-            ]
+            times = [row[0] for row in rows]
+            prices = np.array([row[2:5] for row in rows], dtype=np.float64)
             
-            # Find optimal trades by identifying significant price movements
-            i = 0
-            while i < len(ohlcv_data) - 1:
-                entry_candle = ohlcv_data[i]
-                entry_time = entry_candle['time']
-                entry_price = entry_candle['close']
-                
-                # Look ahead for the timeframe duration
-                exit_index = self._find_exit_index(i, len(ohlcv_data), timeframe_hours, ohlcv_data)
-                
-                if exit_index is None:
-                    break
-                
-                # Calculate max profit in this window (both long and short)
-                max_high = max(c['high'] for c in ohlcv_data[i:exit_index + 1])
-                min_low = min(c['low'] for c in ohlcv_data[i:exit_index + 1])
-                
-                long_profit = ((max_high - entry_price) / entry_price) * 100
-                short_profit = ((entry_price - min_low) / entry_price) * 100
-                
-                # Only create trade if profit exceeds threshold (after costs)
-                if long_profit - self.slippage - (2 * self.fees) > self.profit_threshold:
-                    # Find the candle with the high
-                    exit_candle = max(
-                        ohlcv_data[i:exit_index + 1],
-                        key=lambda c: c['high']
-                    )
-                    
-                    optimal_trades.append(OptimalTrade(
-                        entry_time=entry_time,
-                        exit_time=exit_candle['time'],
-                        direction="long",
-                        entry_price=entry_price,
-                        exit_price=exit_candle['high'],
-                        profit_percent=long_profit,
-                        max_profit_percent=long_profit,
-                        slippage_percent=self.slippage,
-                        fee_percent=self.fees
-                    ))
-                
-                elif short_profit - self.slippage - (2 * self.fees) > self.profit_threshold:
-                    # Find the candle with the low
-                    exit_candle = min(
-                        ohlcv_data[i:exit_index + 1],
-                        key=lambda c: c['low']
-                    )
-                    
-                    optimal_trades.append(OptimalTrade(
-                        entry_time=entry_time,
-                        exit_time=exit_candle['time'],
-                        direction="short",
-                        entry_price=entry_price,
-                        exit_price=exit_candle['low'],
-                        profit_percent=short_profit,
-                        max_profit_percent=short_profit,
-                        slippage_percent=self.slippage,
-                        fee_percent=self.fees
-                    ))
-                
-                # Move to next potential entry (non-overlapping windows)
-                i = exit_index + 1
+            optimal_trades = self._label_optimal_trades(
+                times=times,
+                high=prices[:, 0],
+                low=prices[:, 1],
+                close=prices[:, 2],
+                timeframe_hours=timeframe_hours
+            )
             
         except Exception as e:
             print(f"Warning: Error calculating optimal trades: {e}")
@@ -579,6 +516,88 @@ class GroundTruthValidator:
         
         return optimal_trades
     
+    def _label_optimal_trades(
+        self,
+        times: List[datetime],
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        timeframe_hours: int
+    ) -> List[OptimalTrade]:
+        """
+        Label optimal trades over consecutive, non-overlapping windows.
+        
+        Each window starts at an entry candle and ends at the first candle at
+        least timeframe_hours later. Window ends are found by bisection and
+        all window extrema come from a single reduceat, so the only Python
+        work is per window rather than per candle.
+        
+        Args:
+            times: Candle timestamps in ascending order
+            high: Candle highs
+            low: Candle lows
+            close: Candle closes (entry prices)
+            timeframe_hours: Trade duration
+            
+        Returns:
+            List of OptimalTrade objects in entry time order
+        """
+        n = len(times)
+        if n < 2:
+            return []
+        
+        horizon = timedelta(hours=timeframe_hours)
+        starts = []
+        ends = []
+        i = 0
+        while i < n - 1:
+            # First candle at or after entry + horizon, never the entry itself
+            exit_index = bisect.bisect_left(times, times[i] + horizon, lo=i + 1)
+            if exit_index >= n:
+                break
+            starts.append(i)
+            ends.append(exit_index)
+            i = exit_index + 1
+        
+        if not starts:
+            return []
+        
+        # Windows are contiguous, so reduceat over the covered prefix yields
+        # each window's extrema
+        stop = ends[-1] + 1
+        max_high = np.maximum.reduceat(high[:stop], starts)
+        min_low = np.minimum.reduceat(low[:stop], starts)
+        entry_prices = close[starts]
+        
+        long_profit = ((max_high - entry_prices) / entry_prices) * 100
+        short_profit = ((entry_prices - min_low) / entry_prices) * 100
+        is_long = long_profit - self.slippage - (2 * self.fees) > self.profit_threshold
+        is_short = ~is_long & (short_profit - self.slippage - (2 * self.fees) > self.profit_threshold)
+        
+        optimal_trades = []
+        for k in np.flatnonzero(is_long | is_short):
+            start, end = starts[k], ends[k] + 1
+            if is_long[k]:
+                exit_index = start + int(np.argmax(high[start:end]))
+                direction, exit_price, profit = "long", high[exit_index], long_profit[k]
+            else:
+                exit_index = start + int(np.argmin(low[start:end]))
+                direction, exit_price, profit = "short", low[exit_index], short_profit[k]
+            
+            optimal_trades.append(OptimalTrade(
+                entry_time=times[start],
+                exit_time=times[exit_index],
+                direction=direction,
+                entry_price=float(entry_prices[k]),
+                exit_price=float(exit_price),
+                profit_percent=float(profit),
+                max_profit_percent=float(profit),
+                slippage_percent=self.slippage,
+                fee_percent=self.fees
+            ))
+        
+        return optimal_trades
+    
     def _parse_timeframe_to_hours(self, timeframe: str) -> int:
         """Convert timeframe string to hours"""
         timeframe = timeframe.lower()
@@ -591,24 +610,6 @@ class GroundTruthValidator:
         else:
             return 24  # Default to 1 day
     
-    def _find_exit_index(
-        self,
-        start_index: int,
-        total_length: int,
-        timeframe_hours: int,
-        ohlcv_data: List[Dict]
-    ) -> Optional[int]:
-        """Find the index of the candle at the exit time"""
-        entry_time = ohlcv_data[start_index]['time']
-        target_exit_time = entry_time + timedelta(hours=timeframe_hours)
-        
-        # Find closest candle to target exit time
-        for i in range(start_index + 1, total_length):
-            if ohlcv_data[i]['time'] >= target_exit_time:
-                return i
-        
-        return None  # No exit found in range
-    
     async def _compare_predictions_to_optimal(
         self,
         predictions: List[AgentPrediction],
@@ -637,8 +638,12 @@ class GroundTruthValidator:
         # Create time window for matching (±30 minutes default)
         time_window = timedelta(minutes=30)
         
-        # Match predictions to optimal trades
+        # Match predictions to optimal trades. Unmatched trades are kept sorted
+        # by entry time so the nearest one is found by bisection; ties go to
+        # the later trade
         matched_trades = set()  # Track which trades have been matched
+        order = sorted(range(len(optimal_trades)), key=lambda i: (optimal_trades[i].entry_time, i))
+        unmatched_times = [optimal_trades[i].entry_time for i in order]
         
         for prediction in predictions:
             pred_time = prediction.timestamp
@@ -646,17 +651,23 @@ class GroundTruthValidator:
             
             # Find matching optimal trade (if any)
             matching_trade = None
-            min_time_diff = time_window.total_seconds()
+            pos = bisect.bisect_right(unmatched_times, pred_time)
+            candidate = None
+            if pos > 0 and pred_time - unmatched_times[pos - 1] <= time_window:
+                candidate = pos - 1
+            if pos < len(unmatched_times):
+                # Last of the trades sharing the next entry time
+                right = bisect.bisect_right(unmatched_times, unmatched_times[pos]) - 1
+                right_diff = unmatched_times[right] - pred_time
+                if right_diff <= time_window and (
+                    candidate is None or right_diff <= pred_time - unmatched_times[candidate]
+                ):
+                    candidate = right
             
-            for i, trade in enumerate(optimal_trades):
-                if i in matched_trades:
-                    continue
-                
-                # Check if prediction time is close to trade entry
-                time_diff = abs((trade.entry_time - pred_time).total_seconds())
-                if time_diff <= min_time_diff:
-                    min_time_diff = time_diff
-                    matching_trade = (i, trade)
+            if candidate is not None:
+                trade_idx = order.pop(candidate)
+                del unmatched_times[candidate]
+                matching_trade = (trade_idx, optimal_trades[trade_idx])
             
             if matching_trade:
                 trade_idx, trade = matching_trade
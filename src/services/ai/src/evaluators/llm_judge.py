@@ -33,13 +33,32 @@ Usage:
 """
 
 import os
+import json
 import asyncio
-from typing import Dict, Any, List, Optional
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
-from langchain_ollama import ChatOllama
 from langchain_core.prompts import ChatPromptTemplate
 
+from agents.llm_pool import get_chat_model
+
+# Maximum judge requests in flight during validate_agent_batch
+JUDGE_CONCURRENCY = int(os.getenv("LLM_JUDGE_CONCURRENCY", "4"))
+
+# Per-call timeout in seconds and retries after a timeout or client error
+JUDGE_TIMEOUT = float(os.getenv("LLM_JUDGE_TIMEOUT", "60"))
+JUDGE_MAX_RETRIES = int(os.getenv("LLM_JUDGE_MAX_RETRIES", "2"))
+
+# Maximum cached judgments keyed by (prompt hash, model, temperature, endpoint); 0 disables
+JUDGE_CACHE_SIZE = int(os.getenv("LLM_JUDGE_CACHE_SIZE", "1024"))
+
+_judgment_cache: "OrderedDict[Tuple[str, str, float, str], str]" = OrderedDict()
+_judgment_cache_lock = threading.Lock()
+_judgment_cache_stats = {"hits": 0, "misses": 0}
+
 
 @dataclass
 class ConsistencyReport:
@@ -134,7 +153,10 @@ class LLMJudge:
         self,
         model: str = "llama3.2:3b",
         temperature: float = 0.1,  # Low temp for consistent evaluation
-        base_url: Optional[str] = None
+        base_url: Optional[str] = None,
+        timeout: float = JUDGE_TIMEOUT,
+        max_retries: int = JUDGE_MAX_RETRIES,
+        retry_backoff: float = 1.0
     ):
         """
         Initialize LLM-Judge system.
@@ -143,13 +165,23 @@ class LLMJudge:
             model: Ollama model name for judge LLM
             temperature: Sampling temperature (lower = more consistent)
             base_url: Ollama API URL (defaults to OLLAMA_HOST env var)
+            timeout: Seconds to wait for each judge call
+            max_retries: Retries after a timeout or client error
+            retry_backoff: Initial retry delay in seconds (doubles per retry)
         """
         # Use environment variable or fallback
         if base_url is None:
             base_url = os.getenv("OLLAMA_HOST", "http://localhost:11434")
         
-        # Initialize judge LLM with low temperature for consistency
-        self.llm = ChatOllama(
+        self.model = model
+        self.temperature = temperature
+        self.base_url = base_url
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+
+        # Shared judge LLM client with low temperature for consistency
+        self.llm = get_chat_model(
             model=model,
             temperature=temperature,
             base_url=base_url
@@ -251,6 +283,54 @@ Analyze for systematic bias. Consider:
 Output JSON only.""")
         ])
     
+    async def _judge(self, messages: List[Any]) -> str:
+        """
+        Invoke the judge LLM and return the response text.
+
+        Identical prompts for the same model, temperature and endpoint are answered
+        from the judgment cache. Each call is bounded by self.timeout and
+        retried with exponential backoff up to self.max_retries times.
+        Only responses that parse as a JSON object are cached, so a
+        malformed judgment is asked for again next time.
+
+        Args:
+            messages: Formatted prompt messages
+
+        Returns:
+            Judge response content
+        """
+        prompt = "\n".join(f"{m.type}: {m.content}" for m in messages)
+        key = (hashlib.sha256(prompt.encode("utf-8")).hexdigest(), self.model, self.temperature, self.base_url)
+
+        if JUDGE_CACHE_SIZE > 0:
+            with _judgment_cache_lock:
+                cached = _judgment_cache.get(key)
+                if cached is not None:
+                    _judgment_cache.move_to_end(key)
+                    _judgment_cache_stats["hits"] += 1
+                    return cached
+                _judgment_cache_stats["misses"] += 1
+
+        attempt = 0
+        while True:
+            try:
+                response = await asyncio.wait_for(self.llm.ainvoke(messages), timeout=self.timeout)
+                break
+            except Exception:
+                if attempt >= self.max_retries:
+                    raise
+                await asyncio.sleep(self.retry_backoff * (2 ** attempt))
+                attempt += 1
+
+        content = response.content
+        if JUDGE_CACHE_SIZE > 0 and _is_judgment(content):
+            with _judgment_cache_lock:
+                _judgment_cache[key] = content
+                _judgment_cache.move_to_end(key)
+                while len(_judgment_cache) > JUDGE_CACHE_SIZE:
+                    _judgment_cache.popitem(last=False)
+        return content
+
     async def verify_factual_consistency(
         self,
         agent_claim: str,
@@ -280,7 +360,7 @@ Output JSON only.""")
         data_str = "\n".join(f"- {k}: {v}" for k, v in market_data.items())
         
         # Invoke judge LLM
-        response = await self.llm.ainvoke(
+        content = await self._judge(
             self.consistency_prompt.format_messages(
                 claim=agent_claim,
                 data=data_str
@@ -290,7 +370,7 @@ Output JSON only.""")
         # Parse JSON response
         import json
         try:
-            result = json.loads(response.content)
+            result = json.loads(content)
             
             return ConsistencyReport(
                 is_consistent=result.get("is_consistent", False),
@@ -307,7 +387,7 @@ Output JSON only.""")
             return ConsistencyReport(
                 is_consistent=False,
                 confidence=0.0,
-                explanation=f"Judge LLM error: {response.content}",
+                explanation=f"Judge LLM error: {content}",
                 discrepancies=["Failed to parse judge response"],
                 severity="critical",
                 timestamp=datetime.now(),
@@ -346,7 +426,7 @@ Output JSON only.""")
             outcome_str = f"{actual_outcome:+.2f}%"
         
         # Invoke judge LLM
-        response = await self.llm.ainvoke(
+        content = await self._judge(
             self.discrepancy_prompt.format_messages(
                 analysis=agent_analysis,
                 outcome=outcome_str
@@ -356,7 +436,7 @@ Output JSON only.""")
         # Parse JSON response
         import json
         try:
-            result = json.loads(response.content)
+            result = json.loads(content)
             
             return DiscrepancyReport(
                 has_discrepancy=result.get("has_discrepancy", True),
@@ -374,7 +454,7 @@ Output JSON only.""")
                 severity="critical",
                 analysis_summary=agent_analysis,
                 actual_outcome=actual_outcome,
-                explanation=f"Judge LLM error: {response.content}",
+                explanation=f"Judge LLM error: {content}",
                 confidence=0.0,
                 timestamp=datetime.now(),
                 error_type="judge_error"
@@ -452,7 +532,7 @@ Output JSON only.""")
             pairs_str += f"\n... and {len(decision_pairs) - 20} more"
         
         # Invoke judge LLM
-        response = await self.llm.ainvoke(
+        content = await self._judge(
             self.bias_prompt.format_messages(
                 agent_name=agent_name,
                 sample_size=sample_size,
@@ -466,7 +546,7 @@ Output JSON only.""")
         # Parse JSON response
         import json
         try:
-            result = json.loads(response.content)
+            result = json.loads(content)
             bias_strength = result.get("bias_strength", 0.0)
             
             return BiasReport(
@@ -490,7 +570,7 @@ Output JSON only.""")
                 accuracy_rate=accuracy,
                 false_positive_rate=false_pos_rate,
                 false_negative_rate=false_neg_rate,
-                explanation=f"Judge LLM error: {response.content}",
+                explanation=f"Judge LLM error: {content}",
                 recommendations=["Fix judge LLM response parsing"],
                 timestamp=datetime.now()
             )
@@ -498,39 +578,68 @@ Output JSON only.""")
     async def validate_agent_batch(
         self,
         agent_outputs: List[Dict[str, Any]],
-        ground_truth: List[Dict[str, Any]]
+        ground_truth: List[Dict[str, Any]],
+        max_concurrency: int = JUDGE_CONCURRENCY
     ) -> Dict[str, Any]:
         """
         Batch validation of multiple agent outputs against ground truth.
         
         Useful for validating a series of agent predictions/analyses
-        against actual market data and outcomes.
+        against actual market data and outcomes. Items are judged
+        concurrently, at most max_concurrency at a time, and results keep
+        the order of agent_outputs. An item whose judge call still fails
+        after retries is reported under "errors" instead of aborting the
+        batch.
         
         Args:
             agent_outputs: List of agent output dicts
             ground_truth: Corresponding ground truth data
+            max_concurrency: Maximum items validated at once
             
         Returns:
             Summary report with consistency/discrepancy statistics
         """
+        gate = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def validate_item(output: Dict[str, Any], truth: Dict[str, Any]):
+            async with gate:
+                consistency = discrepancy = None
+
+                # Check factual consistency
+                if "claim" in output and "market_data" in truth:
+                    consistency = await self.verify_factual_consistency(
+                        agent_claim=output["claim"],
+                        market_data=truth["market_data"]
+                    )
+
+                # Check discrepancies
+                if "analysis" in output and "outcome" in truth:
+                    discrepancy = await self.detect_discrepancies(
+                        agent_analysis=output["analysis"],
+                        actual_outcome=truth["outcome"]
+                    )
+
+                return consistency, discrepancy
+
+        results = await asyncio.gather(
+            *(validate_item(output, truth) for output, truth in zip(agent_outputs, ground_truth)),
+            return_exceptions=True
+        )
+
         consistency_results = []
         discrepancy_results = []
+        errors = []
         
-        for output, truth in zip(agent_outputs, ground_truth):
-            # Check factual consistency
-            if "claim" in output and "market_data" in truth:
-                consistency = await self.verify_factual_consistency(
-                    agent_claim=output["claim"],
-                    market_data=truth["market_data"]
-                )
+        for index, result in enumerate(results):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result
+                errors.append({"index": index, "error": repr(result)})
+                continue
+            consistency, discrepancy = result
+            if consistency is not None:
                 consistency_results.append(consistency)
-            
-            # Check discrepancies
-            if "analysis" in output and "outcome" in truth:
-                discrepancy = await self.detect_discrepancies(
-                    agent_analysis=output["analysis"],
-                    actual_outcome=truth["outcome"]
-                )
+            if discrepancy is not None:
                 discrepancy_results.append(discrepancy)
         
         # Aggregate results
@@ -546,7 +655,41 @@ Output JSON only.""")
             "consistency_rate": (consistent / total * 100) if total > 0 else 0,
             "critical_issues": critical_issues,
             "discrepancies_found": sum(1 for r in discrepancy_results if r.has_discrepancy),
+            "failed_validations": len(errors),
             "consistency_results": consistency_results,
             "discrepancy_results": discrepancy_results,
+            "errors": errors,
             "timestamp": datetime.now()
         }
+
+
+def _is_judgment(content: Any) -> bool:
+    """Whether a judge response parses as a JSON object."""
+    try:
+        return isinstance(json.loads(content), dict)
+    except (TypeError, ValueError):
+        return False
+
+
+def clear_judgment_cache() -> None:
+    """Drop all cached judge responses."""
+    with _judgment_cache_lock:
+        _judgment_cache.clear()
+        _judgment_cache_stats["hits"] = 0
+        _judgment_cache_stats["misses"] = 0
+
+
+def get_judgment_cache_stats() -> Dict[str, Any]:
+    """
+    Get judgment cache statistics.
+
+    Returns:
+        Dict with cache size, entry count, hits and misses
+    """
+    with _judgment_cache_lock:
+        return {
+            "cache_entries": len(_judgment_cache),
+            "cache_size": JUDGE_CACHE_SIZE,
+            "cache_hits": _judgment_cache_stats["hits"],
+            "cache_misses": _judgment_cache_stats["misses"],
+        }
@@ -17,7 +17,7 @@ from agents.debaters import (
     generate_bear_case,
     synthesize_debate
 )
-from memory import TradingMemory
+from memory import get_trading_memory
 import asyncio
 
 
@@ -183,7 +183,7 @@ async def reflection_node(state: AgentState) -> AgentState:
     Returns:
         Updated state with memory context
     """
-    memory = TradingMemory()
+    memory = get_trading_memory()
     
     # Create insight text
     decision = state['final_decision']
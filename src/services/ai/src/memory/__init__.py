@@ -1,5 +1,5 @@
 """Memory module exports"""
 
-from .chroma_client import TradingMemory
+from .chroma_client import TradingMemory, get_trading_memory
 
-__all__ = ["TradingMemory"]
+__all__ = ["TradingMemory", "get_trading_memory"]
@@ -6,9 +6,11 @@ Provides persistent memory for multi-agent system decisions and learnings.
 
 import chromadb
 from chromadb.config import Settings
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 import json
+import threading
+import uuid
 
 
 class TradingMemory:
@@ -74,7 +76,7 @@ class TradingMemory:
             ... )
         """
         if insight_id is None:
-            insight_id = f"insight_{len(self.collection.get()['ids']) + 1}"
+            insight_id = f"insight_{uuid.uuid4().hex}"
         
         self.collection.add(
             documents=[text],
@@ -180,3 +182,36 @@ class TradingMemory:
             name=self.collection.name,
             metadata={"description": "Multi-agent trading decisions and insights"}
         )
+
+
+_shared_memories: Dict[Tuple[str, str], TradingMemory] = {}
+_shared_lock = threading.Lock()
+
+
+def get_trading_memory(
+    persist_directory: str = "./chroma_data",
+    collection_name: str = "trading_insights"
+) -> TradingMemory:
+    """
+    Get the process-wide TradingMemory for a storage location and collection.
+
+    Creating a TradingMemory opens a ChromaDB client and collection, so
+    callers on the request path should share one instance instead.
+
+    Args:
+        persist_directory: Directory for persistent storage
+        collection_name: Name of ChromaDB collection
+
+    Returns:
+        Shared TradingMemory instance
+    """
+    key = (persist_directory, collection_name)
+    with _shared_lock:
+        memory = _shared_memories.get(key)
+        if memory is None:
+            memory = TradingMemory(
+                persist_directory=persist_directory,
+                collection_name=collection_name
+            )
+            _shared_memories[key] = memory
+        return memory
@@ -0,0 +1,160 @@
+"""
+Tests for ground truth labelling
+
+Checks the vectorized optimal-trade labelling and bisect-based prediction
+matching against the original per-window and per-trade scans.
+"""
+
+import asyncio
+import random
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+from evaluators.ground_truth import (
+    GroundTruthValidator,
+    AgentPrediction,
+    OptimalTrade,
+    PredictionType
+)
+
+
+def reference_optimal_trades(validator, ohlcv_data, timeframe_hours):
+    """Original forward-slice labelling, kept as the equivalence oracle."""
+    trades = []
+    cost = validator.slippage
+    i = 0
+    while i < len(ohlcv_data) - 1:
+        entry_time = ohlcv_data[i]['time']
+        entry_price = ohlcv_data[i]['close']
+        target = entry_time + timedelta(hours=timeframe_hours)
+        exit_index = next(
+            (j for j in range(i + 1, len(ohlcv_data)) if ohlcv_data[j]['time'] >= target),
+            None
+        )
+        if exit_index is None:
+            break
+
+        window = ohlcv_data[i:exit_index + 1]
+        long_profit = ((max(c['high'] for c in window) - entry_price) / entry_price) * 100
+        short_profit = ((entry_price - min(c['low'] for c in window)) / entry_price) * 100
+
+        if long_profit - cost - (2 * validator.fees) > validator.profit_threshold:
+            candle = max(window, key=lambda c: c['high'])
+            trades.append(OptimalTrade(entry_time, candle['time'], "long", entry_price, candle['high'],
+                                       long_profit, long_profit, validator.slippage, validator.fees))
+        elif short_profit - cost - (2 * validator.fees) > validator.profit_threshold:
+            candle = min(window, key=lambda c: c['low'])
+            trades.append(OptimalTrade(entry_time, candle['time'], "short", entry_price, candle['low'],
+                                       short_profit, short_profit, validator.slippage, validator.fees))
+        i = exit_index + 1
+    return trades
+
+
+def reference_matches(predictions, optimal_trades):
+    """Original nearest-unmatched-trade scan; returns matched trade index per prediction."""
+    window = timedelta(minutes=30).total_seconds()
+    matched = set()
+    result = []
+    for prediction in predictions:
+        match = None
+        best = window
+        for i, trade in enumerate(optimal_trades):
+            if i in matched:
+                continue
+            diff = abs((trade.entry_time - prediction.timestamp).total_seconds())
+            if diff <= best:
+                best = diff
+                match = i
+        if match is not None:
+            matched.add(match)
+        result.append(match)
+    return result
+
+
+def make_candles(n, seed, tz=None):
+    """Random walk candles with irregular gaps and coarse prices to force ties."""
+    rng = np.random.default_rng(seed)
+    start = datetime(2024, 1, 1, tzinfo=tz)
+    gaps = rng.choice([1, 1, 1, 2, 5, 90], size=n)
+    times = [start + timedelta(minutes=int(m)) for m in np.cumsum(gaps)]
+    close = np.round(100 + rng.normal(0, 0.4, n).cumsum(), 1)
+    high = close + np.round(rng.exponential(0.3, n), 1)
+    low = close - np.round(rng.exponential(0.3, n), 1)
+    return [
+        {'time': t, 'high': float(h), 'low': float(l), 'close': float(c)}
+        for t, h, l, c in zip(times, high, low, close)
+    ]
+
+
+def label(validator, candles, timeframe_hours):
+    return validator._label_optimal_trades(
+        times=[c['time'] for c in candles],
+        high=np.array([c['high'] for c in candles]),
+        low=np.array([c['low'] for c in candles]),
+        close=np.array([c['close'] for c in candles]),
+        timeframe_hours=timeframe_hours
+    )
+
+
+@pytest.mark.parametrize("seed,timeframe_hours,tz", [
+    (1, 1, None),
+    (2, 4, None),
+    (3, 1, timezone.utc),
+    (4, 24, None),
+])
+def test_labelling_matches_reference(seed, timeframe_hours, tz):
+    """Test vectorized labelling yields the same trades as the forward-slice scan"""
+    validator = GroundTruthValidator(profit_threshold=0.3)
+    candles = make_candles(5000, seed, tz)
+
+    expected = reference_optimal_trades(validator, candles, timeframe_hours)
+    actual = label(validator, candles, timeframe_hours)
+
+    assert expected
+    assert actual == expected
+
+
+def test_labelling_handles_short_series():
+    """Test series without a complete window produce no trades"""
+    validator = GroundTruthValidator()
+    candles = make_candles(1, 5)
+
+    assert label(validator, candles, 1) == []
+    assert label(validator, make_candles(3, 5)[:2], 1000) == []
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_matching_matches_reference(seed):
+    """Test bisect matching picks the same trades as the linear scan"""
+    validator = GroundTruthValidator(profit_threshold=0.3)
+    trades = label(validator, make_candles(3000, seed), 1)
+    rnd = random.Random(seed)
+
+    predictions = []
+    for _ in range(len(trades) * 2):
+        anchor = rnd.choice(trades).entry_time
+        # Whole-minute offsets create equidistant and out-of-window candidates
+        timestamp = anchor + timedelta(minutes=rnd.randint(-45, 45))
+        predictions.append(AgentPrediction(
+            timestamp=timestamp,
+            agent_name="Bull",
+            symbol="BTCUSDT",
+            prediction=rnd.choice(list(PredictionType)),
+            confidence=0.8,
+            reasoning="",
+            timeframe="1h",
+            price_at_prediction=100.0
+        ))
+
+    comparison = asyncio.run(
+        validator._compare_predictions_to_optimal(predictions, trades, "1h")
+    )
+
+    expected = reference_matches(predictions, trades)
+    outcomes = comparison['correct_predictions'] + comparison['incorrect_predictions']
+    actual = {id(o['prediction']): o['optimal_trade'] for o in outcomes}
+    assert [actual[id(p)] for p in predictions] == [
+        None if i is None else trades[i] for i in expected
+    ]
+    assert len(comparison['missed_opportunities']) == len(trades) - sum(i is not None for i in expected)
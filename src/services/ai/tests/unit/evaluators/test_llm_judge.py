@@ -7,11 +7,15 @@ Validates the meta-evaluation system that checks agent reasoning quality.
 import pytest
 import asyncio
 from datetime import datetime
+import json
+from types import SimpleNamespace
 from evaluators.llm_judge import (
     LLMJudge,
     ConsistencyReport,
     DiscrepancyReport,
-    BiasReport
+    BiasReport,
+    clear_judgment_cache,
+    get_judgment_cache_stats
 )
 
 
@@ -326,6 +330,178 @@ class TestLLMJudgeEdgeCases:
         assert report.actual_outcome is None
 
 
+class StubJudgeLLM:
+    """Judge LLM stand-in with artificial latency that tracks concurrency"""
+    
+    def __init__(self, latency=0.02, failures=0, hang_first=0):
+        self.latency = latency
+        self.failures = failures
+        self.hang_first = hang_first
+        self.calls = 0
+        self.active = 0
+        self.peak = 0
+    
+    async def ainvoke(self, messages):
+        self.calls += 1
+        if self.hang_first > 0:
+            self.hang_first -= 1
+            await asyncio.sleep(3600)
+        if self.failures > 0:
+            self.failures -= 1
+            raise ConnectionError("ollama unavailable")
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(self.latency)
+        self.active -= 1
+        claim = messages[-1].content
+        return SimpleNamespace(content=json.dumps({
+            "is_consistent": "[ok]" in claim,
+            "confidence": 0.9,
+            "explanation": claim,
+            "discrepancies": [],
+            "severity": "low"
+        }))
+
+
+class TestLLMJudgeBatch:
+    """Test concurrent batch validation against a stub judge LLM."""
+    
+    @pytest.fixture
+    def judge(self):
+        clear_judgment_cache()
+        judge = LLMJudge(temperature=0.1, timeout=0.5, max_retries=2, retry_backoff=0.001)
+        judge.llm = StubJudgeLLM()
+        yield judge
+        clear_judgment_cache()
+    
+    @staticmethod
+    def batch(n):
+        outputs = [{"claim": f"claim {i} {'[ok]' if i % 2 else '[bad]'}"} for i in range(n)]
+        truth = [{"market_data": {"rsi": i}} for i in range(n)]
+        return outputs, truth
+    
+    @pytest.mark.asyncio
+    async def test_batch_runs_concurrently_within_limit(self, judge):
+        """Test a batch overlaps judge calls without exceeding max_concurrency."""
+        outputs, truth = self.batch(40)
+        
+        start = asyncio.get_running_loop().time()
+        result = await judge.validate_agent_batch(outputs, truth, max_concurrency=8)
+        elapsed = asyncio.get_running_loop().time() - start
+        
+        assert judge.llm.calls == 40
+        assert judge.llm.peak == 8
+        assert elapsed < 40 * judge.llm.latency / 2
+        assert result["total_validations"] == 40
+        assert result["consistent_count"] == 20
+    
+    @pytest.mark.asyncio
+    async def test_batch_preserves_order(self, judge):
+        """Test results line up with the input order."""
+        outputs, truth = self.batch(25)
+        
+        result = await judge.validate_agent_batch(outputs, truth, max_concurrency=5)
+        
+        assert [r.agent_claim for r in result["consistency_results"]] == [o["claim"] for o in outputs]
+    
+    @pytest.mark.asyncio
+    async def test_retries_after_errors_and_timeouts(self, judge):
+        """Test failed and timed-out calls are retried."""
+        judge.llm = StubJudgeLLM(failures=1, hang_first=1)
+        
+        report = await judge.verify_factual_consistency("[ok] claim", {"rsi": 50})
+        
+        assert report.is_consistent
+        assert judge.llm.calls == 3
+    
+    @pytest.mark.asyncio
+    async def test_exhausted_retries_are_reported_per_item(self, judge):
+        """Test an item that keeps failing doesn't abort the batch."""
+        judge.llm = StubJudgeLLM(failures=3)
+        outputs, truth = self.batch(4)
+        
+        result = await judge.validate_agent_batch(outputs, truth, max_concurrency=1)
+        
+        assert result["failed_validations"] == 1
+        assert result["errors"][0]["index"] == 0
+        assert result["total_validations"] == 3
+    
+    @pytest.mark.asyncio
+    async def test_repeated_batches_hit_cache(self, judge):
+        """Test re-running the same evaluation reuses cached judgments."""
+        outputs, truth = self.batch(10)
+        
+        await judge.validate_agent_batch(outputs, truth)
+        second = await judge.validate_agent_batch(outputs, truth)
+        
+        assert judge.llm.calls == 10
+        assert get_judgment_cache_stats()["cache_hits"] == 10
+        assert second["consistent_count"] == 5
+    
+    @pytest.mark.asyncio
+    async def test_cache_is_keyed_by_temperature(self, judge):
+        """Test judges at different temperatures don't share judgments."""
+        other = LLMJudge(temperature=0.5)
+        other.llm = judge.llm
+        
+        await judge.verify_factual_consistency("[ok] claim", {"rsi": 50})
+        await other.verify_factual_consistency("[ok] claim", {"rsi": 50})
+        
+        assert judge.llm.calls == 2
+    
+    @pytest.mark.asyncio
+    async def test_cache_is_keyed_by_endpoint(self, judge):
+        """Test judges pointed at different Ollama hosts don't share judgments."""
+        other = LLMJudge(temperature=0.1, base_url="http://judge-2:11434")
+        other.llm = judge.llm
+        
+        await judge.verify_factual_consistency("[ok] claim", {"rsi": 50})
+        await other.verify_factual_consistency("[ok] claim", {"rsi": 50})
+        await other.verify_factual_consistency("[ok] claim", {"rsi": 50})
+        
+        assert judge.llm.calls == 2
+        assert get_judgment_cache_stats()["cache_hits"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_unparseable_judgments_are_not_cached(self, judge):
+        """Test a malformed response is asked for again instead of replayed from cache."""
+        stub = judge.llm
+        replies = iter(["not json", "{\"is_consistent\": tr"])
+        
+        async def flaky(messages):
+            reply = next(replies, None)
+            if reply is None:
+                return await StubJudgeLLM.ainvoke(stub, messages)
+            stub.calls += 1
+            return SimpleNamespace(content=reply)
+        
+        judge.llm = SimpleNamespace(ainvoke=flaky)
+        
+        first = await judge.verify_factual_consistency("[ok] claim", {"rsi": 50})
+        assert get_judgment_cache_stats()["cache_entries"] == 0
+        await judge.verify_factual_consistency("[ok] claim", {"rsi": 50})
+        parsed = await judge.verify_factual_consistency("[ok] claim", {"rsi": 50})
+        cached = await judge.verify_factual_consistency("[ok] claim", {"rsi": 50})
+        
+        assert first.severity == "critical" and "Failed to parse judge response" in first.discrepancies
+        assert parsed.is_consistent and cached.is_consistent
+        assert stub.calls == 3
+        assert get_judgment_cache_stats()["cache_hits"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_failed_calls_are_not_cached(self, judge):
+        """Test a call that exhausts its retries is attempted again next time."""
+        judge.llm = StubJudgeLLM(failures=3)
+        
+        with pytest.raises(ConnectionError):
+            await judge.verify_factual_consistency("[ok] claim", {"rsi": 50})
+        report = await judge.verify_factual_consistency("[ok] claim", {"rsi": 50})
+        
+        assert report.is_consistent
+        assert judge.llm.calls == 4
+        assert get_judgment_cache_stats()["cache_entries"] == 1
+
+
 if __name__ == "__main__":
     # Run tests
     pytest.main([__file__, "-v", "--tb=short"])
@@ -0,0 +1,128 @@
+"""
+Unit tests for the pooled LLM client layer
+
+Tests client sharing, the concurrency cap, and the temperature=0 response cache
+"""
+import pytest
+import asyncio
+from unittest.mock import patch
+
+
+class StubChatOllama:
+    """ChatOllama stand-in that tracks concurrent calls"""
+
+    active = 0
+    peak = 0
+    calls = 0
+
+    def __init__(self, model, temperature, base_url, format=None):
+        self.model = model
+        self.temperature = temperature
+        self.base_url = base_url
+        self.format = format
+
+    async def ainvoke(self, prompt):
+        cls = type(self)
+        cls.calls += 1
+        cls.active += 1
+        cls.peak = max(cls.peak, cls.active)
+        await asyncio.sleep(0.01)
+        cls.active -= 1
+        return f"response to {prompt}"
+
+    def invoke(self, prompt):
+        type(self).calls += 1
+        return f"response to {prompt}"
+
+
+@pytest.fixture
+def llm_pool():
+    """llm_pool module with stubbed ChatOllama and empty pools"""
+    from src.services.ai.src.agents import llm_pool
+
+    StubChatOllama.active = StubChatOllama.peak = StubChatOllama.calls = 0
+    with patch.object(llm_pool, 'ChatOllama', StubChatOllama), \
+            patch.dict(llm_pool._clients, clear=True):
+        llm_pool.clear_response_cache()
+        yield llm_pool
+        llm_pool.clear_response_cache()
+
+
+def test_get_chat_model_reuses_clients(llm_pool):
+    """Test identical configurations share one client"""
+    a = llm_pool.get_chat_model("llama3.2:3b", 0.3, "http://ollama:11434")
+    b = llm_pool.get_chat_model("llama3.2:3b", 0.3, "http://ollama:11434")
+    c = llm_pool.get_chat_model("llama3.2:3b", 0.7, "http://ollama:11434")
+
+    assert a is b
+    assert a is not c
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_capped(llm_pool):
+    """Test in-flight requests never exceed MAX_CONCURRENCY"""
+    llm = llm_pool.pooled_llm(temperature=0.7, base_url="http://ollama:11434")
+
+    await asyncio.gather(*[llm.ainvoke(f"prompt {i}") for i in range(20)])
+
+    assert StubChatOllama.calls == 20
+    assert StubChatOllama.peak <= llm_pool.MAX_CONCURRENCY
+
+
+@pytest.mark.asyncio
+async def test_deterministic_calls_are_cached(llm_pool):
+    """Test temperature=0 calls with identical prompts hit the cache"""
+    llm = llm_pool.pooled_llm(temperature=0, base_url="http://ollama:11434")
+
+    first = await llm.ainvoke("Analyze BTCUSDT")
+    second = await llm.ainvoke("Analyze BTCUSDT")
+    await llm.ainvoke("Analyze ETHUSDT")
+
+    assert first == second
+    assert StubChatOllama.calls == 2
+    assert llm_pool.get_pool_stats()['cache_hits'] == 1
+
+
+@pytest.mark.asyncio
+async def test_sampled_calls_are_not_cached(llm_pool):
+    """Test temperature>0 calls always reach the model"""
+    llm = llm_pool.pooled_llm(temperature=0.7, base_url="http://ollama:11434")
+
+    await llm.ainvoke("Analyze BTCUSDT")
+    await llm.ainvoke("Analyze BTCUSDT")
+
+    assert StubChatOllama.calls == 2
+    assert llm_pool.get_pool_stats()['cache_entries'] == 0
+
+
+def test_sync_invoke_uses_cache(llm_pool):
+    """Test the sync path shares the response cache"""
+    llm = llm_pool.pooled_llm(temperature=0, base_url="http://ollama:11434")
+
+    llm.invoke("Analyze BTCUSDT")
+    llm.invoke("Analyze BTCUSDT")
+
+    assert StubChatOllama.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_hits_return_independent_messages(llm_pool):
+    """Test a caller editing its cached message doesn't change later hits"""
+    from langchain_core.messages import AIMessage
+
+    async def ainvoke(self, prompt):
+        type(self).calls += 1
+        return AIMessage(content=f"response to {prompt}")
+
+    with patch.object(StubChatOllama, 'ainvoke', ainvoke):
+        llm = llm_pool.pooled_llm(temperature=0, base_url="http://ollama:11434")
+
+        first = await llm.ainvoke("Analyze BTCUSDT")
+        first.content = "edited by caller"
+        second = await llm.ainvoke("Analyze BTCUSDT")
+        second.response_metadata["seen"] = True
+        third = await llm.ainvoke("Analyze BTCUSDT")
+
+    assert StubChatOllama.calls == 1
+    assert second.content == third.content == "response to Analyze BTCUSDT"
+    assert second is not third and "seen" not in third.response_metadata
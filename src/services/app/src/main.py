@@ -8,8 +8,8 @@ This service provides:
 - Portfolio optimization with Optuna
 - Integration with fks_data, fks_ai, fks_execution
 """
-from fastapi import FastAPI
-from fastapi.responses import JSONResponse, PlainTextResponse
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, PlainTextResponse, Response
 from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 # Ensure ASMBTR Prometheus metrics are registered at startup
 try:
@@ -42,6 +42,36 @@ async def metrics():
         media_type=CONTENT_TYPE_LATEST
     )
 
+def accepts_gzip(accept_encoding: str) -> bool:
+    """Whether an Accept-Encoding header allows gzip (q=0 refuses it)"""
+    for part in accept_encoding.split(","):
+        coding, _, params = part.partition(";")
+        if coding.strip().lower() not in ("gzip", "x-gzip", "*"):
+            continue
+        name, _, value = params.strip().partition("=")
+        if name.strip().lower() != "q":
+            return True
+        try:
+            return float(value) > 0
+        except ValueError:
+            return False
+    return False
+
+@app.get("/metrics/asmbtr/transitions")
+async def asmbtr_transitions(request: Request, symbol: str, top_k: int | None = None):
+    """ASMBTR transition matrix snapshot for one symbol (JSON, gzip-compressed if accepted)"""
+    from src.metrics.asmbtr_metrics import export_transition_matrix  # type: ignore
+
+    compress = accepts_gzip(request.headers.get("accept-encoding", ""))
+    headers = {"Vary": "Accept-Encoding"}
+    if compress:
+        headers["Content-Encoding"] = "gzip"
+    return Response(
+        content=export_transition_matrix(symbol, top_k, compress=compress),
+        media_type="application/json",
+        headers=headers,
+    )
+
 @app.get("/signals")
 async def get_signals():
     """Get trading signals (placeholder)"""
@@ -2,11 +2,22 @@
 Prometheus metrics for ASMBTR strategy.
 
 Metrics exported:
-- asmbtr_state_transitions_total: Counter for state transitions (by symbol, from_state, to_state)
+- asmbtr_state_transitions_total: Counter for state transitions (by symbol)
+- asmbtr_transition_entropy_bits: Gauge for conditional entropy H(next | current) (by symbol)
+- asmbtr_distinct_states / asmbtr_distinct_transitions: Gauges for states and
+  transitions seen so far (by symbol)
+- asmbtr_transition_probability: Histogram of p(next | current) for each transition
 - asmbtr_prediction_confidence: Gauge for current prediction confidence (by symbol)
 - asmbtr_prediction_accuracy: Histogram for prediction accuracy over time
 - asmbtr_predictions_total: Counter for total predictions made (by symbol, prediction)
 - asmbtr_execution_duration_seconds: Histogram for prediction task execution time
+- asmbtr_observation_count / asmbtr_observed_states: Gauges for prediction table
+  size (by symbol)
+
+Every metric is labelled by symbol (plus the 3-valued prediction label), so
+series count stays constant as the BTR depth grows. The full transition
+matrix is kept in-process and exported on demand as a JSON snapshot
+(gzip-compressed by default) via export_transition_matrix().
 
 These metrics are exposed on the /metrics endpoint of fks_app (port 8002).
 Prometheus scrapes this endpoint every 15 seconds.
@@ -18,10 +29,15 @@ Usage in code:
     record_prediction(symbol='BTC/USDT', prediction=1, confidence=0.75, actual_outcome=1)
 """
 
+import gzip
+import json
 import logging
+import math
+import random
+import threading
 import time
 from contextlib import contextmanager
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 
 from prometheus_client import Counter, Gauge, Histogram
 
@@ -35,7 +51,34 @@ logger = logging.getLogger(__name__)
 asmbtr_state_transitions_total = Counter(
     "asmbtr_state_transitions_total",
     "Total number of ASMBTR state transitions",
-    ["symbol", "from_state", "to_state"],
+    ["symbol"],
+)
+
+# Transition summary gauges (derived from the in-process transition matrix)
+asmbtr_transition_entropy_bits = Gauge(
+    "asmbtr_transition_entropy_bits",
+    "Conditional entropy of the next ASMBTR state given the current one, in bits",
+    ["symbol"],
+)
+
+asmbtr_distinct_states = Gauge(
+    "asmbtr_distinct_states",
+    "Number of distinct ASMBTR states seen as a transition source",
+    ["symbol"],
+)
+
+asmbtr_distinct_transitions = Gauge(
+    "asmbtr_distinct_transitions",
+    "Number of distinct ASMBTR (from_state, to_state) pairs seen",
+    ["symbol"],
+)
+
+# Empirical probability of each transition as it happens (1.0 = fully predictable)
+asmbtr_transition_probability = Histogram(
+    "asmbtr_transition_probability",
+    "Empirical probability p(to_state | from_state) of observed ASMBTR transitions",
+    ["symbol"],
+    buckets=[0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0],
 )
 
 # Prediction confidence gauge (current value per symbol)
@@ -68,13 +111,158 @@ asmbtr_execution_duration_seconds = Histogram(
     buckets=[0.1, 0.5, 1.0, 2.0, 5.0, 10.0],
 )
 
-# Observation count gauge
+# Observation count gauges
 asmbtr_observation_count = Gauge(
     "asmbtr_observation_count",
     "Number of observations in ASMBTR prediction table",
-    ["symbol", "state"],
+    ["symbol"],
 )
 
+asmbtr_observed_states = Gauge(
+    "asmbtr_observed_states",
+    "Number of states with observations in ASMBTR prediction table",
+    ["symbol"],
+)
+
+# ==============================================================================
+# In-process Transition Matrix
+# ==============================================================================
+
+
+def _xlog2x(x: int) -> float:
+    """Return x * log2(x), with 0 * log2(0) = 0."""
+    return x * math.log2(x) if x > 0 else 0.0
+
+
+class TransitionStats:
+    """
+    Per-symbol ASMBTR transition matrix with O(1) entropy updates.
+
+    Conditional entropy is maintained incrementally from running sums of
+    c * log2(c) over source-state and pair counts:
+    H(next | current) = (S_from - S_pair) / N.
+
+    Args:
+        max_pairs: Maximum number of distinct pairs to track; new pairs beyond
+            this are counted as dropped
+        sample_rate: Fraction of transitions recorded into the matrix (0-1]
+    """
+
+    def __init__(self, max_pairs: int = 65536, sample_rate: float = 1.0):
+        self.max_pairs = max_pairs
+        self.sample_rate = sample_rate
+        self.from_counts: Dict[str, int] = {}
+        self.pair_counts: Dict[Tuple[str, str], int] = {}
+        self.total = 0
+        self.dropped = 0
+        self._s_from = 0.0
+        self._s_pair = 0.0
+
+    def record(self, from_state: str, to_state: str) -> Optional[float]:
+        """
+        Record a transition.
+
+        Returns:
+            Empirical p(to_state | from_state) after recording, or None if the
+            transition was not sampled or the pair could not be tracked
+        """
+        if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            return None
+
+        pair = (from_state, to_state)
+        pair_count = self.pair_counts.get(pair, 0)
+        if pair_count == 0 and len(self.pair_counts) >= self.max_pairs:
+            self.dropped += 1
+            return None
+
+        from_count = self.from_counts.get(from_state, 0)
+        self.pair_counts[pair] = pair_count + 1
+        self.from_counts[from_state] = from_count + 1
+        self._s_pair += _xlog2x(pair_count + 1) - _xlog2x(pair_count)
+        self._s_from += _xlog2x(from_count + 1) - _xlog2x(from_count)
+        self.total += 1
+
+        return (pair_count + 1) / (from_count + 1)
+
+    @property
+    def entropy_bits(self) -> float:
+        """Conditional entropy H(next | current) in bits."""
+        if self.total == 0:
+            return 0.0
+        # Clamp tiny negative values from floating-point accumulation
+        return max(0.0, (self._s_from - self._s_pair) / self.total)
+
+    def snapshot(self, top_k: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Build a serializable snapshot of the matrix.
+
+        Args:
+            top_k: Only include the k most frequent pairs (default: all)
+        """
+        pairs = sorted(self.pair_counts.items(), key=lambda item: item[1], reverse=True)
+        if top_k is not None:
+            pairs = pairs[:top_k]
+        return {
+            "total": self.total,
+            "dropped": self.dropped,
+            "sample_rate": self.sample_rate,
+            "entropy_bits": self.entropy_bits,
+            "distinct_states": len(self.from_counts),
+            "distinct_transitions": len(self.pair_counts),
+            "transitions": [[f, t, c] for (f, t), c in pairs],
+        }
+
+
+_transition_stats: Dict[str, TransitionStats] = {}
+_observation_counts: Dict[str, Dict[str, int]] = {}
+_observation_totals: Dict[str, int] = {}
+_stats_lock = threading.Lock()
+
+# Settings for TransitionStats created after configure_transition_tracking()
+_transition_settings: Dict[str, Any] = {"max_pairs": 65536, "sample_rate": 1.0}
+
+
+def configure_transition_tracking(max_pairs: int = 65536, sample_rate: float = 1.0):
+    """
+    Configure the in-process transition matrix for symbols not yet tracked.
+
+    Args:
+        max_pairs: Maximum distinct (from_state, to_state) pairs per symbol
+        sample_rate: Fraction of transitions recorded into the matrix (0-1]
+    """
+    if max_pairs <= 0:
+        raise ValueError("max_pairs must be positive")
+    if not 0.0 < sample_rate <= 1.0:
+        raise ValueError("sample_rate must be in (0, 1]")
+    with _stats_lock:
+        _transition_settings.update(max_pairs=max_pairs, sample_rate=sample_rate)
+
+
+def get_transition_stats(symbol: str) -> Optional[TransitionStats]:
+    """Get the transition matrix tracked for a symbol, if any."""
+    with _stats_lock:
+        return _transition_stats.get(symbol)
+
+
+def export_transition_matrix(symbol: str, top_k: Optional[int] = None, compress: bool = True) -> bytes:
+    """
+    Export a symbol's transition matrix as JSON.
+
+    Args:
+        symbol: Trading pair
+        top_k: Only include the k most frequent pairs (default: all)
+        compress: Gzip-compress the JSON
+
+    Returns:
+        JSON snapshot, gzip-compressed if requested (empty matrix if the symbol is untracked)
+    """
+    with _stats_lock:
+        stats = _transition_stats.get(symbol)
+        snapshot = stats.snapshot(top_k) if stats else TransitionStats().snapshot()
+    snapshot["symbol"] = symbol
+    payload = json.dumps(snapshot, separators=(",", ":")).encode("utf-8")
+    return gzip.compress(payload) if compress else payload
+
 # ==============================================================================
 # Helper Functions
 # ==============================================================================
@@ -90,9 +278,22 @@ def record_state_transition(symbol: str, from_state: str, to_state: str):
         to_state: New BTR state (e.g., '01010101')
     """
     try:
-        asmbtr_state_transitions_total.labels(
-            symbol=symbol, from_state=from_state, to_state=to_state
-        ).inc()
+        asmbtr_state_transitions_total.labels(symbol=symbol).inc()
+
+        with _stats_lock:
+            stats = _transition_stats.get(symbol)
+            if stats is None:
+                stats = _transition_stats[symbol] = TransitionStats(**_transition_settings)
+            probability = stats.record(from_state, to_state)
+            entropy = stats.entropy_bits
+            distinct_states = len(stats.from_counts)
+            distinct_transitions = len(stats.pair_counts)
+
+        asmbtr_transition_entropy_bits.labels(symbol=symbol).set(entropy)
+        asmbtr_distinct_states.labels(symbol=symbol).set(distinct_states)
+        asmbtr_distinct_transitions.labels(symbol=symbol).set(distinct_transitions)
+        if probability is not None:
+            asmbtr_transition_probability.labels(symbol=symbol).observe(probability)
         logger.debug(f"📊 Recorded state transition: {symbol} {from_state} → {to_state}")
     except Exception as e:
         logger.error(f"❌ Failed to record state transition: {e}")
@@ -156,13 +357,26 @@ def update_observation_count(symbol: str, state: str, count: int):
     """
     Update observation count for a specific state.
 
+    Per-state counts are kept in-process; only the per-symbol total and the
+    number of observed states are exported.
+
     Args:
         symbol: Trading pair
         state: BTR state
         count: Number of observations
     """
     try:
-        asmbtr_observation_count.labels(symbol=symbol, state=state).set(count)
+        with _stats_lock:
+            counts = _observation_counts.setdefault(symbol, {})
+            previous = counts.pop(state, 0)
+            if count > 0:
+                counts[state] = count
+            total = _observation_totals.get(symbol, 0) - previous + max(count, 0)
+            _observation_totals[symbol] = total
+            observed_states = len(counts)
+
+        asmbtr_observation_count.labels(symbol=symbol).set(total)
+        asmbtr_observed_states.labels(symbol=symbol).set(observed_states)
     except Exception as e:
         logger.error(f"❌ Failed to update observation count: {e}")
 
@@ -223,6 +437,11 @@ class ASMBTRMetrics:
         """Update observation count."""
         update_observation_count(symbol, state, count)
 
+    @staticmethod
+    def export_transitions(symbol: str, top_k: Optional[int] = None) -> bytes:
+        """Export the transition matrix as gzip-compressed JSON."""
+        return export_transition_matrix(symbol, top_k)
+
     @staticmethod
     @contextmanager
     def track_execution(symbol: str):
@@ -240,9 +459,14 @@ class ASMBTRMetrics:
         """
         return {
             "state_transitions_total": asmbtr_state_transitions_total,
+            "transition_entropy_bits": asmbtr_transition_entropy_bits,
+            "distinct_states": asmbtr_distinct_states,
+            "distinct_transitions": asmbtr_distinct_transitions,
+            "transition_probability": asmbtr_transition_probability,
             "prediction_confidence": asmbtr_prediction_confidence,
             "prediction_accuracy": asmbtr_prediction_accuracy,
             "predictions_total": asmbtr_predictions_total,
             "execution_duration_seconds": asmbtr_execution_duration_seconds,
             "observation_count": asmbtr_observation_count,
+            "observed_states": asmbtr_observed_states,
         }
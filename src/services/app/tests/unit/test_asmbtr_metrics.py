@@ -0,0 +1,190 @@
+"""Tests for low-cardinality ASMBTR Prometheus metrics.
+
+Tests coverage:
+- Incremental conditional entropy matches a direct computation
+- Pair cap and sampling in TransitionStats
+- Compressed transition matrix export and Accept-Encoding negotiation
+- Observation totals without per-state series
+"""
+
+import gzip
+import json
+import math
+import sys
+from collections import Counter
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
+
+import pytest
+from unittest.mock import MagicMock
+
+# Mock prometheus_client before importing metrics
+sys.modules['prometheus_client'] = MagicMock()
+
+from metrics import asmbtr_metrics
+from metrics.asmbtr_metrics import (
+    TransitionStats,
+    configure_transition_tracking,
+    export_transition_matrix,
+    get_transition_stats,
+    record_state_transition,
+    update_observation_count,
+)
+
+
+def _direct_conditional_entropy(pairs):
+    """Compute H(to | from) from a list of (from, to) pairs."""
+    pair_counts = Counter(pairs)
+    from_counts = Counter(f for f, _ in pairs)
+    total = len(pairs)
+    return -sum(
+        (c / total) * math.log2(c / from_counts[f]) for (f, _), c in pair_counts.items()
+    )
+
+
+class TestTransitionStats:
+    """Test suite for the in-process transition matrix."""
+
+    def test_entropy_matches_direct_computation(self):
+        """Incremental entropy equals the textbook formula."""
+        pairs = [
+            ('0101', '1010'), ('0101', '1011'), ('0101', '1010'),
+            ('1010', '0101'), ('1010', '0100'), ('1011', '0110'),
+        ] * 7
+        stats = TransitionStats()
+        for f, t in pairs:
+            stats.record(f, t)
+
+        assert stats.total == len(pairs)
+        assert stats.entropy_bits == pytest.approx(_direct_conditional_entropy(pairs))
+
+    def test_deterministic_transitions_have_zero_entropy(self):
+        """A chain with one successor per state is fully predictable."""
+        stats = TransitionStats()
+        for _ in range(10):
+            probability = stats.record('0011', '0110')
+
+        assert stats.entropy_bits == pytest.approx(0.0)
+        assert probability == 1.0
+
+    def test_pair_cap_drops_new_pairs(self):
+        """New pairs beyond max_pairs are counted as dropped."""
+        stats = TransitionStats(max_pairs=2)
+        stats.record('00', '01')
+        stats.record('01', '10')
+        assert stats.record('10', '00') is None
+        assert stats.record('00', '01') == 1.0
+
+        assert stats.dropped == 1
+        assert len(stats.pair_counts) == 2
+
+    def test_snapshot_top_k(self):
+        """Snapshots can be limited to the most frequent pairs."""
+        stats = TransitionStats()
+        for _ in range(3):
+            stats.record('00', '01')
+        stats.record('01', '10')
+
+        snapshot = stats.snapshot(top_k=1)
+        assert snapshot['transitions'] == [['00', '01', 3]]
+        assert snapshot['distinct_transitions'] == 2
+
+
+class TestASMBTRMetrics:
+    """Test suite for module-level recording helpers."""
+
+    def test_record_and_export_transition_matrix(self):
+        """Recorded transitions round-trip through the compressed export."""
+        record_state_transition('TEST/EXPORT', '1100', '1001')
+        record_state_transition('TEST/EXPORT', '1001', '0011')
+
+        snapshot = json.loads(gzip.decompress(export_transition_matrix('TEST/EXPORT')))
+
+        assert snapshot['symbol'] == 'TEST/EXPORT'
+        assert snapshot['total'] == 2
+        assert sorted(map(tuple, snapshot['transitions'])) == [
+            ('1001', '0011', 1),
+            ('1100', '1001', 1),
+        ]
+
+    def test_export_uncompressed(self):
+        """compress=False returns plain JSON."""
+        record_state_transition('TEST/PLAIN', '10', '01')
+
+        snapshot = json.loads(export_transition_matrix('TEST/PLAIN', compress=False))
+
+        assert snapshot['symbol'] == 'TEST/PLAIN'
+        assert snapshot['total'] == 1
+
+    def test_export_untracked_symbol(self):
+        """Exporting an unknown symbol yields an empty matrix."""
+        snapshot = json.loads(gzip.decompress(export_transition_matrix('TEST/NONE')))
+
+        assert snapshot['total'] == 0
+        assert snapshot['transitions'] == []
+
+    def test_configure_transition_tracking(self):
+        """Settings apply to symbols tracked afterwards."""
+        configure_transition_tracking(max_pairs=1)
+        try:
+            record_state_transition('TEST/CAPPED', '00', '01')
+            record_state_transition('TEST/CAPPED', '01', '10')
+            assert get_transition_stats('TEST/CAPPED').dropped == 1
+        finally:
+            configure_transition_tracking()
+
+        with pytest.raises(ValueError):
+            configure_transition_tracking(sample_rate=0.0)
+
+    def test_observation_totals(self):
+        """Per-state counts roll up into a per-symbol total."""
+        update_observation_count('TEST/OBS', '0101', 5)
+        update_observation_count('TEST/OBS', '1010', 3)
+        update_observation_count('TEST/OBS', '0101', 7)
+        update_observation_count('TEST/OBS', '1010', 0)
+
+        assert asmbtr_metrics._observation_totals['TEST/OBS'] == 7
+        assert asmbtr_metrics._observation_counts['TEST/OBS'] == {'0101': 7}
+
+
+class TestTransitionsEndpoint:
+    """Content negotiation for /metrics/asmbtr/transitions."""
+
+    @pytest.fixture
+    def client(self, monkeypatch):
+        from fastapi.testclient import TestClient
+
+        import main
+        import metrics
+
+        # main imports the metrics as src.metrics.*, relative to the service root
+        monkeypatch.setitem(sys.modules, 'src.metrics', metrics)
+        monkeypatch.setitem(sys.modules, 'src.metrics.asmbtr_metrics', asmbtr_metrics)
+        return TestClient(main.app)
+
+    @pytest.mark.parametrize('header,expected', [
+        ('gzip', True),
+        ('deflate, gzip;q=0.5', True),
+        ('*', True),
+        ('identity', False),
+        ('gzip;q=0', False),
+        ('', False),
+    ])
+    def test_accepts_gzip(self, header, expected):
+        from main import accepts_gzip
+
+        assert accepts_gzip(header) is expected
+
+    def test_gzip_only_when_accepted(self, client):
+        plain = client.get('/metrics/asmbtr/transitions', params={'symbol': 'TEST/HTTP'},
+                           headers={'Accept-Encoding': 'identity'})
+        assert 'content-encoding' not in plain.headers
+        assert json.loads(plain.content)['symbol'] == 'TEST/HTTP'
+
+        compressed = client.get('/metrics/asmbtr/transitions', params={'symbol': 'TEST/HTTP'},
+                                headers={'Accept-Encoding': 'gzip'})
+        assert compressed.headers['content-encoding'] == 'gzip'
+        assert compressed.json()['symbol'] == 'TEST/HTTP'
+        assert compressed.headers['vary'] == 'Accept-Encoding'
@@ -1,113 +1,254 @@
 """Market bar utilities (Week 3 DB schema groundwork).
 
-Provides conversion from adapter fetch output -> List[MarketBar] plus a thin
-repository scaffold wrapping existing upsert helpers. Actual DB round‑trip
-tests are deferred until a Postgres test fixture is available; current tests
-focus on pure transformation.
+Provides conversion from adapter fetch output -> validated numpy columns
+(`BarColumns`) or List[MarketBar], plus a thin repository over the ohlcv
+table. The columnar path validates whole columns at once, reports rejected
+rows instead of dropping them silently, and writes/reads through binary
+COPY without building a Python object per bar.
 """
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Iterable, List
-from pathlib import Path
-import json
-try:
-    from jsonschema import Draft202012Validator  # type: ignore
-except Exception:  # pragma: no cover
-    Draft202012Validator = None  # type: ignore
+from typing import Any, Iterable, List, Optional, Tuple
+
+import numpy as np
+from loguru import logger
 
 from shared_python.types import MarketBar  # type: ignore
 
-try:  # reuse existing upsert logic for now
-    from store import upsert_ohlcv  # type: ignore
+try:  # reuse existing store helpers for SQL
+    from store import bulk_upsert_ohlcv, read_ohlcv_columns  # type: ignore
 except Exception:  # pragma: no cover
-    upsert_ohlcv = None  # type: ignore
+    bulk_upsert_ohlcv = None  # type: ignore
+    read_ohlcv_columns = None  # type: ignore
 
 
-_SCHEMA_VALIDATOR = None
+PRICE_FIELDS = ("open", "high", "low", "close")
 
 
-def _get_validator():  # lazy load
-    global _SCHEMA_VALIDATOR
-    if _SCHEMA_VALIDATOR is not None:
-        return _SCHEMA_VALIDATOR
-    if Draft202012Validator is None:  # pragma: no cover
-        return None
-    schema_path = Path(__file__).resolve().parents[3] / "shared" / "shared_schema" / "bars" / "v1" / "market_bar.schema.json"
+@dataclass
+class BarColumns:
+    """Bars as parallel numpy arrays: ts (int64 epoch seconds) and float64 OHLCV.
+
+    `rejected` lists (row index, reason) for adapter rows that failed
+    validation and were left out of the arrays.
+    """
+
+    provider: Optional[str]
+    ts: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    rejected: List[Tuple[int, str]] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.ts)
+
+    @classmethod
+    def empty(cls, provider: Optional[str] = None) -> "BarColumns":
+        floats = [np.empty(0, dtype=np.float64) for _ in range(5)]
+        return cls(provider, np.empty(0, dtype=np.int64), *floats)
+
+    @classmethod
+    def from_market_bars(cls, bars: Iterable[MarketBar], provider: Optional[str] = None) -> "BarColumns":  # type: ignore[name-defined]
+        bar_list = list(bars)
+        n = len(bar_list)
+        return cls(
+            provider,
+            np.fromiter((b.ts for b in bar_list), dtype=np.int64, count=n),
+            *(np.fromiter((getattr(b, f) for b in bar_list), dtype=np.float64, count=n) for f in PRICE_FIELDS + ("volume",)),
+        )
+
+    def to_frame(self):
+        """DataFrame (ts, open, high, low, close, volume) with ts as UTC datetimes, like store.read_ohlcv."""
+        import pandas as pd  # local import to keep base deps light
+
+        return pd.DataFrame(
+            {
+                "ts": pd.to_datetime(self.ts, unit="s", utc=True),
+                "open": self.open,
+                "high": self.high,
+                "low": self.low,
+                "close": self.close,
+                "volume": self.volume,
+            }
+        )
+
+    def to_market_bars(self) -> List[MarketBar]:  # type: ignore[name-defined]
+        provider = self.provider
+        return [
+            MarketBar(ts=ts, open=o, high=h, low=l, close=c, volume=v, provider=provider)
+            for ts, o, h, l, c, v in zip(
+                self.ts.tolist(),
+                self.open.tolist(),
+                self.high.tolist(),
+                self.low.tolist(),
+                self.close.tolist(),
+                self.volume.tolist(),
+            )
+        ]
+
+
+def _column(rows: list, name: str, default: Any = None, dtype=np.float64) -> np.ndarray:
+    """One field of a list of row dicts as an array; missing or unparseable values become NaN."""
+    try:
+        values = [r.get(name, default) for r in rows]
+    except AttributeError:  # non-dict rows
+        values = [r.get(name, default) if isinstance(r, dict) else None for r in rows]
     try:
-        schema = json.loads(schema_path.read_text(encoding="utf-8"))
-        _SCHEMA_VALIDATOR = Draft202012Validator(schema)
-    except Exception:  # pragma: no cover
-        _SCHEMA_VALIDATOR = None
-    return _SCHEMA_VALIDATOR
+        return np.array(values, dtype=dtype)
+    except (TypeError, ValueError, OverflowError):
+        import pandas as pd  # local import to keep base deps light
+
+        return pd.to_numeric(pd.Series(values, dtype=object), errors="coerce").to_numpy(dtype=np.float64)
+
+
+def to_bar_columns(adapter_result: dict, *, provider_override: str | None = None, validate: bool = True) -> BarColumns:
+    """Convert normalized adapter result -> validated BarColumns.
+
+    Expects shape: { provider: str, data: [ {ts, open, high, low, close, volume, ...}, ... ] };
+    `data` may also be a DataFrame with those columns. Rows whose ts or
+    prices are missing or non-numeric, or whose ts or volume is negative,
+    are rejected (volume defaults to 0 when absent). With `validate`, rows
+    whose open/close fall outside [low, high] are rejected as well.
+    """
+    provider = provider_override or adapter_result.get("provider")
+    rows = adapter_result.get("data")
+    if rows is None or len(rows) == 0:
+        return BarColumns.empty(provider)
+
+    if hasattr(rows, "columns"):  # DataFrame
+        import pandas as pd  # local import to keep base deps light
+
+        def get(name, default=None):
+            if name not in rows.columns:
+                return np.full(len(rows), np.nan if default is None else default)
+            return pd.to_numeric(rows[name], errors="coerce").to_numpy(dtype=np.float64)
+
+        raw_ts = get("ts")
+        cols = {f: get(f) for f in PRICE_FIELDS}
+        volume = get("volume", 0.0)
+    else:
+        rows = list(rows)
+        try:  # integer timestamps, the common case, keep full precision
+            raw_ts = np.array([r["ts"] for r in rows], dtype=np.int64)
+        except Exception:
+            raw_ts = _column(rows, "ts")
+        cols = {f: _column(rows, f) for f in PRICE_FIELDS}
+        volume = _column(rows, "volume", 0.0)
+
+    checks = []
+    if raw_ts.dtype.kind == "f":
+        checks.append((~np.isfinite(raw_ts), "invalid ts"))
+    checks.append((raw_ts < 0, "negative ts"))
+    checks += [(~np.isfinite(cols[f]), f"invalid {f}") for f in PRICE_FIELDS]
+    checks += [(~np.isfinite(volume), "invalid volume"), (volume < 0, "negative volume")]
+    if validate:
+        o, h, l, c = (cols[f] for f in PRICE_FIELDS)
+        checks += [
+            (h < l, "high below low"),
+            ((o < l) | (o > h) | (c < l) | (c > h), "open/close outside high-low range"),
+        ]
+
+    bad = np.zeros(len(raw_ts), dtype=bool)
+    rejected: List[Tuple[int, str]] = []
+    for mask, reason in checks:
+        new = mask & ~bad
+        if new.any():
+            rejected.extend((int(i), reason) for i in np.flatnonzero(new).tolist())
+            bad |= new
+    rejected.sort()
+
+    keep = ~bad if rejected else slice(None)
+    return BarColumns(
+        provider,
+        raw_ts[keep].astype(np.int64),
+        *(cols[f][keep] for f in PRICE_FIELDS),
+        volume[keep],
+        rejected=rejected,
+    )
 
 
 def to_market_bars(adapter_result: dict, *, provider_override: str | None = None, validate: bool = True):  # -> List[MarketBar]
     """Convert normalized adapter result -> List[MarketBar].
 
     Expects shape: { provider: str, data: [ {ts, open, high, low, close, volume, ...}, ... ] }
+    Rejected rows are skipped with a warning; use `to_bar_columns` to get them.
     """
-    provider = provider_override or adapter_result.get("provider")
-    rows = adapter_result.get("data") or []
-    out = []
-    validator = _get_validator() if validate else None
-    for r in rows:
-        try:
-            if validator is not None:
-                validator.validate(r)
-            out.append(
-                MarketBar(
-                    ts=int(r["ts"]),
-                    open=float(r["open"]),
-                    high=float(r["high"]),
-                    low=float(r["low"]),
-                    close=float(r["close"]),
-                    volume=float(r.get("volume", 0.0)),
-                    provider=provider,
-                )
-            )
-        except Exception:  # pragma: no cover - skip malformed row
-            continue
-    return out
+    columns = to_bar_columns(adapter_result, provider_override=provider_override, validate=validate)
+    if columns.rejected:
+        logger.warning(
+            f"Skipped {len(columns.rejected)} invalid bar rows from {columns.provider}: {columns.rejected[:5]}"
+        )
+    return columns.to_market_bars()
 
 
 class BarRepository:
-    """Persistence facade for MarketBar objects.
+    """Persistence facade for MarketBar objects and BarColumns.
 
-    Current implementation delegates to existing DataFrame upsert helper to
-    avoid duplicating SQL; a future migration can replace with direct COPY or
-    bulk INSERT for performance.
+    Writes go through store.bulk_upsert_ohlcv (binary COPY into a staging
+    table, then one INSERT ... ON CONFLICT); `fetch_columns` reads a range
+    back as arrays via binary COPY.
     """
 
     def upsert(self, *, provider: str, symbol: str, interval: str, bars: Iterable[MarketBar]) -> int:  # type: ignore[name-defined]
-        import pandas as pd  # local import to keep base deps light
+        return self.upsert_columns(
+            provider=provider, symbol=symbol, interval=interval, columns=BarColumns.from_market_bars(bars, provider)
+        )
 
-        bar_list = list(bars)
-        if not bar_list:
+    def upsert_columns(self, *, provider: str, symbol: str, interval: str, columns: BarColumns) -> int:
+        """Bulk upsert BarColumns into ohlcv. Returns number of rows written."""
+        if len(columns) == 0:
             return 0
-        if upsert_ohlcv is None:  # pragma: no cover
+        if bulk_upsert_ohlcv is None:  # pragma: no cover
             raise RuntimeError("upsert helper unavailable")
-        df = pd.DataFrame(
-            [
-                {
-                    "provider": b.provider or provider,
-                    "symbol": symbol,
-                    "interval": interval,
-                    "datetime": datetime.fromtimestamp(b.ts, tz=timezone.utc),
-                    "open": b.open,
-                    "high": b.high,
-                    "low": b.low,
-                    "close": b.close,
-                    "volume": b.volume,
-                }
-                for b in bar_list
-            ]
+        return bulk_upsert_ohlcv(
+            provider,
+            symbol,
+            interval,
+            {
+                "ts": columns.ts,
+                "open": columns.open,
+                "high": columns.high,
+                "low": columns.low,
+                "close": columns.close,
+                "volume": columns.volume,
+            },
+        )
+
+    def fetch_columns(self, *, provider: str, symbol: str, interval: str, start_ts: int, end_ts: int) -> BarColumns:
+        """Fetch bars in [start_ts, end_ts] as BarColumns (NULL values as NaN). Empty on error."""
+        if read_ohlcv_columns is None:  # pragma: no cover
+            return BarColumns.empty(provider)
+        try:
+            data = read_ohlcv_columns(
+                provider,
+                symbol,
+                interval,
+                datetime.fromtimestamp(start_ts, tz=timezone.utc),
+                datetime.fromtimestamp(end_ts, tz=timezone.utc),
+            )
+        except Exception as e:
+            logger.warning(f"fetch_columns error: {e}")
+            return BarColumns.empty(provider)
+        return BarColumns(
+            provider,
+            data["ts"].astype("datetime64[s]").astype(np.int64),
+            data["open"],
+            data["high"],
+            data["low"],
+            data["close"],
+            data["volume"],
         )
-        # DataFrame helper expects some datetime-like column
-        return upsert_ohlcv(provider, symbol, interval, df)
 
     def fetch_range(self, *, provider: str, symbol: str, interval: str, start_ts: int, end_ts: int):
-        """Fetch bars in [start_ts, end_ts]; returns list of MarketBar. Empty list on error."""
+        """Fetch bars in [start_ts, end_ts]; returns list of MarketBar. Empty list on error.
+
+        Prefer `fetch_columns` for large ranges; it avoids a MarketBar per row.
+        """
         try:
             from infrastructure.database.postgres import get_connection  # type: ignore
         except Exception:  # pragma: no cover
@@ -172,4 +313,4 @@ class BarRepository:
         return None
 
 
-__all__ = ["to_market_bars", "BarRepository"]
+__all__ = ["BarColumns", "to_bar_columns", "to_market_bars", "BarRepository"]
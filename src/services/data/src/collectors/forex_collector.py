@@ -11,13 +11,16 @@ Phase: AI Enhancement Plan Phase 1 - Data Preparation
 import asyncio
 import logging
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 from decimal import Decimal
 
 import ccxt.async_support as ccxt  # type: ignore
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine  # type: ignore
 from sqlalchemy import select  # type: ignore
 
+if TYPE_CHECKING:
+    from models.tick import TickBatch
+
 logger = logging.getLogger(__name__)
 
 
@@ -197,11 +200,34 @@ class ForexTickCollector:
         
         return ticks
     
-    async def save_ticks_to_db(self, ticks: List[Dict[str, Any]]) -> int:
+    async def stream_tick_batch(self, duration_seconds: int = 60) -> "TickBatch":
+        """Stream tick data and return it as a columnar TickBatch.
+        
+        Prices are the ticker's last trade price. Use this instead of
+        stream_ticks when handing data to batch consumers such as
+        DeltaScanner.scan_batch.
+        
+        Args:
+            duration_seconds: How long to collect data
+            
+        Returns:
+            TickBatch of collected ticks
+        """
+        from models.tick import TickBatch
+
+        ticks = await self.stream_ticks(duration_seconds)
+        return TickBatch.from_records(
+            ticks,
+            symbol=self.symbol,
+            price_key='last',
+            source=self.exchange_id,
+        )
+    
+    async def save_ticks_to_db(self, ticks: Union[List[Dict[str, Any]], "TickBatch"]) -> int:
         """Save collected ticks to TimescaleDB.
         
         Args:
-            ticks: List of tick dictionaries
+            ticks: List of tick dictionaries, or a TickBatch
             
         Returns:
             Number of ticks saved
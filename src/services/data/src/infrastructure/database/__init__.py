@@ -15,7 +15,14 @@ from loguru import logger
 from .base import Database
 from .orm import init_engine, shutdown_engine
 from .postgres import PostgresConnection, close_postgres_connections
-from .repository import BaseRepository
+from .repository import (
+    BaseRepository,
+    KeysetPage,
+    KeysetPagination,
+    Pagination,
+    PaginatedResult,
+    QueryFilter,
+)
 
 # Export public components
 __all__ = [
@@ -23,6 +30,11 @@ __all__ = [
     "Database",
     "PostgresConnection",
     "BaseRepository",
+    "QueryFilter",
+    "Pagination",
+    "PaginatedResult",
+    "KeysetPagination",
+    "KeysetPage",
     # Connection management
     "register_connection",
     "unregister_connection",
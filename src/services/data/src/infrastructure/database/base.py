@@ -6,22 +6,21 @@ Provides centralized database connection handling for the application.
 
 import asyncio
 import logging
-from contextlib import asynccontextmanager
-from typing import Any, Dict, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional, TypeVar, Union
 
 from framework.exceptions.data import DatabaseError
-from infrastructure.persistence.database import (
-    register_connection,
-    unregister_connection,
-)
-from infrastructure.persistence.database.orm import init_engine, shutdown_engine
-from infrastructure.persistence.database.postgres import PostgresConnection
+from .orm import init_engine, shutdown_engine
+from .postgres import PostgresConnection
 from pydantic import BaseModel, Field, field_validator
 from typing_extensions import Self
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
+R = TypeVar("R")
+
 
 class DatabaseConfig(BaseModel):
     """Database configuration model."""
@@ -61,7 +60,7 @@ class DatabaseConfig(BaseModel):
         return v
 
     def to_connection_params(self) -> Dict[str, Any]:
-        """Convert config to connection parameters dict."""
+        """Convert config to PostgresConnection keyword arguments."""
         return {
             "dsn": self.dsn,
             "host": self.host,
@@ -70,9 +69,9 @@ class DatabaseConfig(BaseModel):
             "user": self.user,
             "password": self.password,
             "use_pool": self.use_pool,
-            "pool_min_size": self.pool_min_size,
-            "pool_max_size": self.pool_max_size,
-            "connection_timeout": self.connection_timeout,
+            "min_connections": self.pool_min_size,
+            "max_connections": self.pool_max_size,
+            "connect_timeout": int(self.connection_timeout),
         }
 
 
@@ -92,6 +91,7 @@ class Database:
         self._is_connected: bool = False
         self._connecting: bool = False
         self._connection_lock = asyncio.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
 
     def configure(self, config: Union[DatabaseConfig, Dict[str, Any]]) -> Self:
         """
@@ -153,6 +153,8 @@ class Database:
 
                 if connected:
                     # Register the connection with the tracking system
+                    from . import register_connection
+
                     register_connection(self._pg_connection, db_type="postgres")
 
                 # Initialize ORM engine if requested
@@ -210,6 +212,8 @@ class Database:
                 # Close PostgreSQL connection
                 if self._pg_connection:
                     # Unregister connection before closing
+                    from . import unregister_connection
+
                     unregister_connection(self._pg_connection, db_type="postgres")
 
                     pg_result = await loop.run_in_executor(
@@ -219,6 +223,10 @@ class Database:
                         success = False
                     self._pg_connection = None
 
+                if self._executor is not None:
+                    self._executor.shutdown(wait=False)
+                    self._executor = None
+
                 self._is_connected = False
                 return success
 
@@ -282,6 +290,63 @@ class Database:
             logger.error(f"Transaction error: {str(e)}", exc_info=True)
             raise
 
+    async def run_in_transaction(self, func: Callable[..., R], *args: Any) -> R:
+        """
+        Run a blocking function against its own pooled connection in a worker thread.
+
+        `func(conn, *args)` runs inside a transaction that is committed when
+        it returns and rolled back when it raises. The event loop stays free
+        while the query runs. Calls check out connections from the same pool
+        as `connect()`, which holds one for the lifetime of the connection,
+        so at most `pool_max_size - 1` calls run at once and further calls
+        queue. With `pool_max_size=1` one call runs at a time, and it only
+        gets a connection if `connect()` has not taken it.
+
+        Usage:
+            rows = await database.run_in_transaction(lambda conn: fetch(conn, symbol))
+
+        Raises:
+            DatabaseError: If the database is not configured or no connection is available
+            Exception: Any exception raised by `func` is propagated
+        """
+        if not self._config:
+            raise DatabaseError(
+                "Database not configured. Call configure() before running queries."
+            )
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._transaction_workers(), thread_name_prefix="db"
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._run_checked_out, func, args)
+
+    def _transaction_workers(self) -> int:
+        """Worker threads for run_in_transaction, leaving the connect() connection its pool slot."""
+        if not self._config.use_pool:
+            return self._config.pool_max_size
+        return max(1, self._config.pool_max_size - 1)
+
+    def _run_checked_out(self, func: Callable[..., R], args: tuple) -> R:
+        with self._checkout() as conn:
+            try:
+                result = func(conn, *args)
+                conn.commit()
+                return result
+            except Exception:
+                conn.rollback()
+                raise
+
+    @contextmanager
+    def _checkout(self) -> Iterator[Any]:
+        """Borrow a connection from the pool for one transaction."""
+        pg = PostgresConnection(**self._config.to_connection_params())
+        if not pg.connect():
+            raise DatabaseError("Could not acquire a database connection")
+        try:
+            yield pg.conn
+        finally:
+            pg.close()
+
 
 # Global database instance for application-wide use
 database = Database()
@@ -91,6 +91,8 @@ class PostgresConnection:
         """
         self.dsn = dsn
         self.use_pool = use_pool
+        self.min_connections = min_connections
+        self.max_connections = max_connections
         self.cursor_factory = cursor_factory
         self.conn = None
         self.pool_key = None
@@ -213,10 +215,7 @@ class PostgresConnection:
             assert self.pool_key is not None, "Pool key cannot be None"
             pool = _connection_pools[self.pool_key]["pool"]
 
-            if HAS_PSYCOPG2:
-                return pool.getconn()
-            elif HAS_PSYCOPG3:
-                return pool.connection()
+            return pool.getconn()
 
     def _create_pool(self) -> None:
         """Create a new connection pool for this DSN."""
@@ -224,8 +223,8 @@ class PostgresConnection:
             if self.pool_key in _connection_pools:
                 return  # Pool already exists
 
-            min_conn = DEFAULT_POOL_MIN_CONN
-            max_conn = DEFAULT_POOL_MAX_CONN
+            min_conn = self.min_connections
+            max_conn = self.max_connections
 
             if HAS_PSYCOPG2:
                 # Create psycopg2 pool
@@ -242,6 +241,7 @@ class PostgresConnection:
                 _logger.debug(
                     f"Created new psycopg2 connection pool for {self.pool_key}"
                 )
+            elif HAS_PSYCOPG3:
                 # Create psycopg3 pool
                 if isinstance(self.dsn, dict):
                     dsn_str = " ".join(f"{k}={v}" for k, v in self.dsn.items())
@@ -316,9 +316,8 @@ class PostgresConnection:
             try:
                 if pool_info["type"] == "psycopg2":
                     pool_info["pool"].putconn(self.conn)
-                # psycopg3 connections are automatically returned to pool when closed
                 elif pool_info["type"] == "psycopg3":
-                    self.conn.close()
+                    pool_info["pool"].putconn(self.conn)
             except Exception as e:
                 _logger.error(f"Error returning connection to pool: {e}")
                 # Try to close it directly as a fallback
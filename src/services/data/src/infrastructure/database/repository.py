@@ -5,15 +5,19 @@ This module provides a clean abstraction layer over database operations,
 implementing the repository pattern for consistent data access.
 """
 
-import asyncio
+import base64
+import json
 from datetime import datetime
 from typing import (
     Any,
-    Callable,
     Dict,
     Generic,
+    Iterable,
+    Iterator,
     List,
+    Mapping,
     Optional,
+    Sequence,
     Tuple,
     Type,
     TypeVar,
@@ -27,7 +31,7 @@ from framework.exceptions.data import (
     DataNotFoundError,
     DataValidationException,
 )
-from infrastructure.persistence.database.base import Database
+from infrastructure.database.base import Database
 from loguru import logger
 from pydantic import BaseModel
 
@@ -77,7 +81,7 @@ class QueryFilter:
         Returns:
             Self for method chaining
         """
-        self._conditions.append(condition)
+        self._conditions.append(f"({condition})")
         self._params.extend(params)
         return self
 
@@ -100,6 +104,13 @@ class QueryFilter:
         self._params.extend(values)
         return self
 
+    def copy(self) -> "QueryFilter":
+        """Return an independent copy of this filter."""
+        clone = QueryFilter()
+        clone._conditions = list(self._conditions)
+        clone._params = list(self._params)
+        return clone
+
     def build(self) -> Tuple[str, List[Any]]:
         """
         Build the WHERE clause and parameters.
@@ -225,12 +236,171 @@ class PaginatedResult(Generic[T]):
         }
 
 
+class KeysetPagination:
+    """
+    Keyset (seek) pagination parameters for repository queries.
+
+    Instead of skipping `OFFSET` rows, each page continues after the sort key
+    of the previous page's last row, so deep pages cost the same as the
+    first one when the sort columns are indexed. The ID field is appended as
+    a tie-breaker, so (order_by..., id) should be covered by an index and the
+    sort columns should be NOT NULL.
+    """
+
+    def __init__(
+        self,
+        page_size: int = 50,
+        order_by: Union[str, Sequence[str], None] = None,
+        order_dir: str = "ASC",
+        after: Optional[str] = None,
+    ):
+        """
+        Initialize keyset pagination.
+
+        Args:
+            page_size: Number of items per page
+            order_by: Field or fields to order by (the ID field is always appended)
+            order_dir: Order direction for all sort fields (ASC or DESC)
+            after: Cursor returned as `next_cursor` by the previous page
+        """
+        self.page_size = min(max(1, page_size), 1000)  # Prevent excessive page sizes
+        fields = [order_by] if isinstance(order_by, str) else list(order_by or [])
+        # Sanitize field names to prevent SQL injection
+        self.order_by = [
+            safe for safe in ("".join(c for c in f if c.isalnum() or c == "_") for f in fields) if safe
+        ]
+        self.order_dir = (
+            order_dir.upper() if order_dir.upper() in ["ASC", "DESC"] else "ASC"
+        )
+        self.after = after
+
+    def sort_fields(self, id_field: str) -> List[str]:
+        """Sort fields including the ID tie-breaker."""
+        return self.order_by + ([id_field] if id_field not in self.order_by else [])
+
+    @staticmethod
+    def encode_cursor(values: Sequence[Any]) -> str:
+        """Encode a row's sort key as an opaque, URL-safe cursor."""
+        raw = json.dumps(list(values), default=str, separators=(",", ":"))
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> List[Any]:
+        """Decode a cursor produced by `encode_cursor`."""
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list):
+            raise ValueError("Malformed pagination cursor")
+        return values
+
+
+class KeysetPage(Generic[T]):
+    """
+    Result of a keyset-paginated query.
+    """
+
+    def __init__(
+        self,
+        items: List[T],
+        next_cursor: Optional[str],
+        page_size: int,
+        total: Optional[int] = None,
+        total_is_estimate: bool = False,
+    ):
+        """
+        Initialize keyset page.
+
+        Args:
+            items: List of items on the current page
+            next_cursor: Cursor for the following page, None on the last page
+            page_size: Number of items per page
+            total: Total number of matching items, if it was requested
+            total_is_estimate: Whether `total` is a planner estimate
+        """
+        self.items = items
+        self.next_cursor = next_cursor
+        self.page_size = page_size
+        self.total = total
+        self.total_is_estimate = total_is_estimate
+
+    def has_next(self) -> bool:
+        """Check if there's a next page."""
+        return self.next_cursor is not None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary representation."""
+        return {
+            "items": [
+                item.model_dump() if hasattr(item, "model_dump") else item.dict()
+                for item in self.items
+            ],
+            "pagination": {
+                "page_size": self.page_size,
+                "next_cursor": self.next_cursor,
+                "has_next": self.has_next(),
+                "total": self.total,
+                "total_is_estimate": self.total_is_estimate,
+            },
+        }
+
+
+def _as_dict(cursor: Any, row: Any) -> Dict[str, Any]:
+    """Convert a row from a plain or dict cursor to a dictionary."""
+    if isinstance(row, Mapping):
+        return dict(row)
+    return dict(zip([col[0] for col in cursor.description], row))
+
+
+def _fetch_one(cursor: Any) -> Optional[Dict[str, Any]]:
+    row = cursor.fetchone()
+    return None if row is None else _as_dict(cursor, row)
+
+
+def _fetch_all(cursor: Any) -> List[Dict[str, Any]]:
+    return [_as_dict(cursor, row) for row in cursor.fetchall()]
+
+
+def _scalar(cursor: Any) -> Any:
+    row = cursor.fetchone()
+    if row is None:
+        return None
+    return next(iter(row.values())) if isinstance(row, Mapping) else row[0]
+
+
+def _estimate_count(cursor: Any, table_name: str, where_clause: str, params: List[Any]) -> int:
+    """Planner row estimate for a filtered table, read from EXPLAIN instead of scanning it."""
+    cursor.execute(f"EXPLAIN (FORMAT JSON) SELECT 1 FROM {table_name} {where_clause}", params)
+    plan = _scalar(cursor)
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def _runs_by_fields(
+    rows: Iterable[Dict[str, Any]], chunk_size: int
+) -> Iterator[Tuple[List[str], List[Dict[str, Any]]]]:
+    """Group consecutive rows with the same field set into chunks of at most chunk_size."""
+    fields: Optional[List[str]] = None
+    chunk: List[Dict[str, Any]] = []
+    for row in rows:
+        row_fields = list(row.keys())
+        if chunk and (row_fields != fields or len(chunk) >= chunk_size):
+            yield fields, chunk
+            chunk = []
+        fields = row_fields
+        chunk.append(row)
+    if chunk:
+        yield fields, chunk
+
+
 class BaseRepository(Generic[T, ID]):
     """
     Base repository for data access operations.
 
     Provides a generic implementation of the repository pattern
-    for consistent data access across the application.
+    for consistent data access across the application. Every query runs
+    through `Database.run_in_transaction`, on a pooled connection in a
+    bounded worker thread, so slow queries never block the event loop.
     """
 
     def __init__(
@@ -281,18 +451,15 @@ class BaseRepository(Generic[T, ID]):
         Raises:
             DatabaseError: If a database error occurs
         """
-        try:
-            async with self.db.transaction() as conn:
-                query = f"SELECT * FROM {self.table_name} WHERE {self.id_field} = %s"
-                cursor = conn.cursor()
-                cursor.execute(query, (id,))
-                row = cursor.fetchone()
+        query = f"SELECT * FROM {self.table_name} WHERE {self.id_field} = %s"
 
-                if row is None:
-                    return None
-
-                return self._row_to_model(dict(row))
+        def work(conn):
+            cursor = conn.cursor()
+            cursor.execute(query, (id,))
+            return _fetch_one(cursor)
 
+        try:
+            row = await self.db.run_in_transaction(work)
         except Exception as e:
             _logger.error(f"Error getting record by ID {id}: {str(e)}")
             raise DatabaseError(
@@ -300,6 +467,8 @@ class BaseRepository(Generic[T, ID]):
                 details={"id": id, "error": str(e)},
             )
 
+        return None if row is None else self._row_to_model(row)
+
     async def find_one(self, filter: QueryFilter) -> Optional[T]:
         """
         Find a single record matching the filter.
@@ -313,20 +482,16 @@ class BaseRepository(Generic[T, ID]):
         Raises:
             DatabaseError: If a database error occurs
         """
-        try:
-            where_clause, params = filter.build()
-
-            async with self.db.transaction() as conn:
-                query = f"SELECT * FROM {self.table_name} {where_clause} LIMIT 1"
-                cursor = conn.cursor()
-                cursor.execute(query, params)
-                row = cursor.fetchone()
+        where_clause, params = filter.build()
+        query = f"SELECT * FROM {self.table_name} {where_clause} LIMIT 1"
 
-                if row is None:
-                    return None
-
-                return self._row_to_model(dict(row))
+        def work(conn):
+            cursor = conn.cursor()
+            cursor.execute(query, params)
+            return _fetch_one(cursor)
 
+        try:
+            row = await self.db.run_in_transaction(work)
         except Exception as e:
             _logger.error(f"Error finding record with filter: {str(e)}")
             raise DatabaseQueryError(
@@ -334,17 +499,24 @@ class BaseRepository(Generic[T, ID]):
                 details={"error": str(e)},
             )
 
+        return None if row is None else self._row_to_model(row)
+
     async def find_all(
         self,
         filter: Optional[QueryFilter] = None,
         pagination: Optional[Pagination] = None,
+        count: str = "exact",
     ) -> PaginatedResult[T]:
         """
-        Find all records matching the filter with pagination.
+        Find all records matching the filter with page/offset pagination.
+
+        Deep pages get slower as OFFSET grows; prefer `find_page` for
+        iterating large tables.
 
         Args:
             filter: Query filter
             pagination: Pagination parameters
+            count: "exact" for COUNT(*), "approximate" for the planner estimate
 
         Returns:
             Paginated result with model instances
@@ -352,46 +524,172 @@ class BaseRepository(Generic[T, ID]):
         Raises:
             DatabaseError: If a database error occurs
         """
-        try:
-            where_clause, params = filter.build() if filter else ("", [])
-            pagination = pagination or Pagination()
-            limit, offset = pagination.get_limit_offset()
-            order_clause = pagination.build_order_clause()
-
-            async with self.db.transaction() as conn:
-                # Get total count
-                count_query = f"SELECT COUNT(*) FROM {self.table_name} {where_clause}"
-                cursor = conn.cursor()
+        where_clause, params = filter.build() if filter else ("", [])
+        pagination = pagination or Pagination()
+        limit, offset = pagination.get_limit_offset()
+        order_clause = pagination.build_order_clause()
+        count_query = f"SELECT COUNT(*) FROM {self.table_name} {where_clause}"
+        query = f"""
+            SELECT * FROM {self.table_name}
+            {where_clause}
+            {order_clause}
+            LIMIT %s OFFSET %s
+        """
+
+        def work(conn):
+            cursor = conn.cursor()
+            if count == "approximate":
+                total = _estimate_count(cursor, self.table_name, where_clause, params)
+            else:
                 cursor.execute(count_query, params)
-                total = cursor.fetchone()[0]
+                total = _scalar(cursor)
 
-                # Get paginated results
-                query = f"""
-                    SELECT * FROM {self.table_name}
-                    {where_clause}
-                    {order_clause}
-                    LIMIT %s OFFSET %s
-                """
-                cursor = conn.cursor()
-                cursor.execute(query, params + [limit, offset])
-                rows = cursor.fetchall()
+            cursor.execute(query, params + [limit, offset])
+            return total, _fetch_all(cursor)
+
+        try:
+            total, rows = await self.db.run_in_transaction(work)
+        except Exception as e:
+            _logger.error(f"Error finding records with filter: {str(e)}")
+            raise DatabaseQueryError(
+                message=f"Failed to find {self.model_cls.__name__} records",
+                details={"error": str(e)},
+            )
+
+        return PaginatedResult(
+            items=[self._row_to_model(row) for row in rows],
+            total=total,
+            page=pagination.page,
+            page_size=pagination.page_size,
+        )
+
+    async def find_page(
+        self,
+        filter: Optional[QueryFilter] = None,
+        pagination: Optional[KeysetPagination] = None,
+        count: Optional[str] = None,
+    ) -> KeysetPage[T]:
+        """
+        Find records matching the filter with keyset pagination.
+
+        Each page is one indexed range scan of `page_size + 1` rows,
+        whatever its depth. Pass the returned `next_cursor` as `after` to
+        get the following page.
+
+        Args:
+            filter: Query filter
+            pagination: Keyset pagination parameters
+            count: None to skip counting, "exact" for COUNT(*), or
+                "approximate" for the planner estimate
 
-                items = [self._row_to_model(dict(row)) for row in rows]
+        Returns:
+            Keyset page with model instances
 
-                return PaginatedResult(
-                    items=items,
-                    total=total,
-                    page=pagination.page,
-                    page_size=pagination.page_size,
+        Raises:
+            DataValidationException: If the cursor doesn't match the sort fields
+            DatabaseError: If a database error occurs
+        """
+        pagination = pagination or KeysetPagination()
+        sort_fields = pagination.sort_fields(self.id_field)
+        base_where, base_params = filter.build() if filter else ("", [])
+
+        page_filter = filter.copy() if filter else QueryFilter()
+        if pagination.after:
+            try:
+                key: Optional[List[Any]] = KeysetPagination.decode_cursor(pagination.after)
+            except ValueError:
+                key = None
+            if key is None or len(key) != len(sort_fields):
+                raise DataValidationException(
+                    message="Pagination cursor does not match the sort fields",
+                    details={"cursor": pagination.after, "sort_fields": sort_fields},
                 )
+            op = ">" if pagination.order_dir == "ASC" else "<"
+            placeholders = ", ".join(["%s"] * len(key))
+            page_filter.add_raw(f"({', '.join(sort_fields)}) {op} ({placeholders})", *key)
+
+        where_clause, params = page_filter.build()
+        order_clause = ", ".join(f"{field} {pagination.order_dir}" for field in sort_fields)
+        query = f"SELECT * FROM {self.table_name} {where_clause} ORDER BY {order_clause} LIMIT %s"
+
+        def work(conn):
+            cursor = conn.cursor()
+            cursor.execute(query, params + [pagination.page_size + 1])
+            rows = _fetch_all(cursor)
+            total = None
+            if count == "approximate":
+                total = _estimate_count(cursor, self.table_name, base_where, base_params)
+            elif count == "exact":
+                cursor.execute(f"SELECT COUNT(*) FROM {self.table_name} {base_where}", base_params)
+                total = _scalar(cursor)
+            return rows, total
 
+        try:
+            rows, total = await self.db.run_in_transaction(work)
         except Exception as e:
-            _logger.error(f"Error finding records with filter: {str(e)}")
+            _logger.error(f"Error paging records with filter: {str(e)}")
             raise DatabaseQueryError(
                 message=f"Failed to find {self.model_cls.__name__} records",
                 details={"error": str(e)},
             )
 
+        next_cursor = None
+        if len(rows) > pagination.page_size:
+            rows = rows[: pagination.page_size]
+            next_cursor = KeysetPagination.encode_cursor([rows[-1][field] for field in sort_fields])
+
+        return KeysetPage(
+            items=[self._row_to_model(row) for row in rows],
+            next_cursor=next_cursor,
+            page_size=pagination.page_size,
+            total=total,
+            total_is_estimate=count == "approximate",
+        )
+
+    def _data_dict(self, data: Union[T, Dict[str, Any]]) -> Dict[str, Any]:
+        """Field values of a model instance or dictionary."""
+        if isinstance(data, BaseModel):
+            # Use model_dump() for Pydantic v2, fallback to dict() for v1
+            if hasattr(data, "model_dump"):
+                return data.model_dump(exclude_unset=True)
+            return data.dict(exclude_unset=True)
+        return data
+
+    def _insert_values(self, data: Union[T, Dict[str, Any]]) -> Dict[str, Any]:
+        """Model fields to insert, with timestamps if enabled."""
+        filtered_data = {
+            k: v for k, v in self._data_dict(data).items() if k in self.model_fields
+        }
+        if self.timestamps:
+            now = datetime.utcnow()
+            if self.created_at_field in self.model_fields:
+                filtered_data[self.created_at_field] = now
+            if self.updated_at_field in self.model_fields:
+                filtered_data[self.updated_at_field] = now
+        return filtered_data
+
+    def _update_values(self, data: Union[T, Dict[str, Any]]) -> Dict[str, Any]:
+        """Model fields to update (never the ID), with updated timestamp if enabled."""
+        filtered_data = {
+            k: v
+            for k, v in self._data_dict(data).items()
+            if k in self.model_fields and k != self.id_field
+        }
+        if filtered_data and self.timestamps and self.updated_at_field in self.model_fields:
+            filtered_data[self.updated_at_field] = datetime.utcnow()
+        return filtered_data
+
+    def _write_error(self, action: str, e: Exception) -> Exception:
+        if isinstance(e, (ValueError, TypeError)):
+            return DataValidationException(
+                message=f"Invalid data for {self.model_cls.__name__}",
+                details={"error": str(e)},
+            )
+        return DatabaseError(
+            message=f"Failed to {action} {self.model_cls.__name__}",
+            details={"error": str(e)},
+        )
+
     async def create(self, data: Union[T, Dict[str, Any]]) -> T:
         """
         Create a new record.
@@ -407,60 +705,74 @@ class BaseRepository(Generic[T, ID]):
             DataValidationException: If validation fails
         """
         try:
-            # Convert to dict if it's a model
-            if isinstance(data, BaseModel):
-                # Use model_dump() for Pydantic v2, fallback to dict() for v1
-                if hasattr(data, "model_dump"):
-                    data_dict = data.model_dump(exclude_unset=True)
-                else:
-                    data_dict = data.dict(exclude_unset=True)
-            else:
-                data_dict = data
-
-            # Filter out fields not in model
-            filtered_data = {
-                k: v for k, v in data_dict.items() if k in self.model_fields
-            }
-
-            # Add timestamps if enabled
-            if self.timestamps:
-                now = datetime.utcnow()
-                if self.created_at_field in self.model_fields:
-                    filtered_data[self.created_at_field] = now
-                if self.updated_at_field in self.model_fields:
-                    filtered_data[self.updated_at_field] = now
-
-            # Build query
+            filtered_data = self._insert_values(data)
             fields = list(filtered_data.keys())
-            placeholders = ["%s"] * len(fields)
             field_str = ", ".join(fields)
-            placeholder_str = ", ".join(placeholders)
+            placeholder_str = ", ".join(["%s"] * len(fields))
             values = [filtered_data[field] for field in fields]
+            query = f"""
+                INSERT INTO {self.table_name} ({field_str})
+                VALUES ({placeholder_str})
+                RETURNING *
+            """
 
-            async with self.db.transaction() as conn:
-                query = f"""
-                    INSERT INTO {self.table_name} ({field_str})
-                    VALUES ({placeholder_str})
-                    RETURNING *
-                """
+            def work(conn):
                 cursor = conn.cursor()
                 cursor.execute(query, values)
-                row = cursor.fetchone()
-
-                return self._row_to_model(dict(row))
+                return _fetch_one(cursor)
 
+            row = await self.db.run_in_transaction(work)
         except Exception as e:
             _logger.error(f"Error creating record: {str(e)}")
-            if isinstance(e, (ValueError, TypeError)):
-                raise DataValidationException(
-                    message=f"Invalid data for {self.model_cls.__name__}",
-                    details={"error": str(e)},
-                )
-            else:
-                raise DatabaseError(
-                    message=f"Failed to create {self.model_cls.__name__}",
-                    details={"error": str(e)},
-                )
+            raise self._write_error("create", e)
+
+        return self._row_to_model(row)
+
+    async def create_many(
+        self, items: Iterable[Union[T, Dict[str, Any]]], chunk_size: int = 500
+    ) -> List[T]:
+        """
+        Create many records in one transaction with multi-row INSERTs.
+
+        Consecutive items that set the same fields share one
+        `INSERT ... VALUES (...), (...) RETURNING *` of up to `chunk_size`
+        rows. Either every record is created or none is.
+
+        Args:
+            items: Model instances or dictionaries of field values
+            chunk_size: Maximum rows per INSERT statement
+
+        Returns:
+            Created model instances, in input order
+
+        Raises:
+            DatabaseError: If a database error occurs
+            DataValidationException: If validation fails
+        """
+        try:
+            rows = [self._insert_values(item) for item in items]
+            if not rows:
+                return []
+
+            def work(conn):
+                cursor = conn.cursor()
+                created: List[Dict[str, Any]] = []
+                for fields, chunk in _runs_by_fields(rows, chunk_size):
+                    row_placeholder = f"({', '.join(['%s'] * len(fields))})"
+                    query = (
+                        f"INSERT INTO {self.table_name} ({', '.join(fields)}) "
+                        f"VALUES {', '.join([row_placeholder] * len(chunk))} RETURNING *"
+                    )
+                    cursor.execute(query, [row[field] for row in chunk for field in fields])
+                    created.extend(_fetch_all(cursor))
+                return created
+
+            created = await self.db.run_in_transaction(work)
+        except Exception as e:
+            _logger.error(f"Error creating records: {str(e)}")
+            raise self._write_error("create", e)
+
+        return [self._row_to_model(row) for row in created]
 
     async def update(self, id: ID, data: Union[T, Dict[str, Any]]) -> T:
         """
@@ -479,69 +791,28 @@ class BaseRepository(Generic[T, ID]):
             DataValidationException: If validation fails
         """
         try:
-            # Check if record exists
-            existing = await self.get_by_id(id)
-            if existing is None:
-                raise DataNotFoundError(
-                    message=f"{self.model_cls.__name__} with ID {id} not found",
-                    data_type=self.model_cls.__name__,
-                    data_id=str(id),
-                )
-
-            # Convert to dict if it's a model
-            if isinstance(data, BaseModel):
-                # Use model_dump() for Pydantic v2, fallback to dict() for v1
-                if hasattr(data, "model_dump"):
-                    data_dict = data.model_dump(exclude_unset=True)
-                else:
-                    data_dict = data.dict(exclude_unset=True)
-            else:
-                data_dict = data
-
-            # Filter out fields not in model and ID field
-            filtered_data = {
-                k: v
-                for k, v in data_dict.items()
-                if k in self.model_fields and k != self.id_field
-            }
+            filtered_data = self._update_values(data)
 
-            # Add updated timestamp if enabled
-            if self.timestamps and self.updated_at_field in self.model_fields:
-                filtered_data[self.updated_at_field] = datetime.utcnow()
-
-            # If no fields to update, return existing
+            # If no fields to update, return the existing record
             if not filtered_data:
-                return existing
-
-            # Build query
-            set_clauses = [f"{field} = %s" for field in filtered_data.keys()]
-            set_clause = ", ".join(set_clauses)
-            values = list(filtered_data.values())
-            values.append(id)  # Add ID for WHERE clause
-
-            async with self.db.transaction() as conn:
+                query = f"SELECT * FROM {self.table_name} WHERE {self.id_field} = %s"
+                values: List[Any] = [id]
+            else:
+                set_clause = ", ".join(f"{field} = %s" for field in filtered_data.keys())
+                values = list(filtered_data.values()) + [id]
                 query = f"""
                     UPDATE {self.table_name}
                     SET {set_clause}
                     WHERE {self.id_field} = %s
                     RETURNING *
                 """
+
+            def work(conn):
                 cursor = conn.cursor()
                 cursor.execute(query, values)
-                row = cursor.fetchone()
-
-                if row is None:
-                    raise DataNotFoundError(
-                        message=f"{self.model_cls.__name__} with ID {id} not found",
-                        data_type=self.model_cls.__name__,
-                        data_id=str(id),
-                    )
-
-                return self._row_to_model(dict(row))
+                return _fetch_one(cursor)
 
-        except DataNotFoundError:
-            # Re-raise not found errors
-            raise
+            row = await self.db.run_in_transaction(work)
         except Exception as e:
             _logger.error(f"Error updating record with ID {id}: {str(e)}")
             if isinstance(e, (ValueError, TypeError)):
@@ -549,11 +820,77 @@ class BaseRepository(Generic[T, ID]):
                     message=f"Invalid data for {self.model_cls.__name__}",
                     details={"error": str(e)},
                 )
-            else:
-                raise DatabaseError(
-                    message=f"Failed to update {self.model_cls.__name__} with ID {id}",
-                    details={"id": id, "error": str(e)},
-                )
+            raise DatabaseError(
+                message=f"Failed to update {self.model_cls.__name__} with ID {id}",
+                details={"id": id, "error": str(e)},
+            )
+
+        if row is None:
+            raise DataNotFoundError(
+                message=f"{self.model_cls.__name__} with ID {id} not found",
+                data_type=self.model_cls.__name__,
+                data_id=str(id),
+            )
+        return self._row_to_model(row)
+
+    async def update_many(
+        self,
+        updates: Union[Mapping[ID, Union[T, Dict[str, Any]]], Iterable[Tuple[ID, Union[T, Dict[str, Any]]]]],
+        chunk_size: int = 500,
+    ) -> List[T]:
+        """
+        Update many records in one transaction.
+
+        Consecutive updates that set the same fields share one
+        `UPDATE ... FROM jsonb_populate_recordset(...)` of up to
+        `chunk_size` rows; Postgres casts each value to its column type.
+        Values must therefore be JSON serializable (datetimes, UUIDs and
+        decimals are sent as strings). IDs with no matching record are
+        skipped rather than raising.
+
+        Args:
+            updates: Mapping or pairs of record ID -> model instance or field values
+            chunk_size: Maximum rows per UPDATE statement
+
+        Returns:
+            Updated model instances
+
+        Raises:
+            DatabaseError: If a database error occurs
+            DataValidationException: If validation fails
+        """
+        try:
+            pairs = updates.items() if isinstance(updates, Mapping) else updates
+            rows = []
+            for id, data in pairs:
+                values = self._update_values(data)
+                if values:
+                    rows.append({**values, self.id_field: id})
+            if not rows:
+                return []
+
+            def work(conn):
+                cursor = conn.cursor()
+                updated: List[Dict[str, Any]] = []
+                for fields, chunk in _runs_by_fields(rows, chunk_size):
+                    set_clause = ", ".join(
+                        f"{field} = v.{field}" for field in fields if field != self.id_field
+                    )
+                    query = (
+                        f"UPDATE {self.table_name} AS t SET {set_clause} "
+                        f"FROM jsonb_populate_recordset(NULL::{self.table_name}, %s::jsonb) AS v "
+                        f"WHERE t.{self.id_field} = v.{self.id_field} RETURNING t.*"
+                    )
+                    cursor.execute(query, [json.dumps(chunk, default=str)])
+                    updated.extend(_fetch_all(cursor))
+                return updated
+
+            updated = await self.db.run_in_transaction(work)
+        except Exception as e:
+            _logger.error(f"Error updating records: {str(e)}")
+            raise self._write_error("update", e)
+
+        return [self._row_to_model(row) for row in updated]
 
     async def delete(self, id: ID) -> bool:
         """
@@ -568,15 +905,15 @@ class BaseRepository(Generic[T, ID]):
         Raises:
             DatabaseError: If a database error occurs
         """
-        try:
-            async with self.db.transaction() as conn:
-                query = f"DELETE FROM {self.table_name} WHERE {self.id_field} = %s RETURNING {self.id_field}"
-                cursor = conn.cursor()
-                cursor.execute(query, (id,))
-                result = cursor.fetchone()
+        query = f"DELETE FROM {self.table_name} WHERE {self.id_field} = %s RETURNING {self.id_field}"
 
-                return result is not None
+        def work(conn):
+            cursor = conn.cursor()
+            cursor.execute(query, (id,))
+            return cursor.fetchone() is not None
 
+        try:
+            return await self.db.run_in_transaction(work)
         except Exception as e:
             _logger.error(f"Error deleting record with ID {id}: {str(e)}")
             raise DatabaseError(
@@ -584,12 +921,13 @@ class BaseRepository(Generic[T, ID]):
                 details={"id": id, "error": str(e)},
             )
 
-    async def count(self, filter: Optional[QueryFilter] = None) -> int:
+    async def count(self, filter: Optional[QueryFilter] = None, approximate: bool = False) -> int:
         """
         Count records matching the filter.
 
         Args:
             filter: Query filter
+            approximate: Return the planner estimate instead of scanning with COUNT(*)
 
         Returns:
             Number of matching records
@@ -597,17 +935,18 @@ class BaseRepository(Generic[T, ID]):
         Raises:
             DatabaseError: If a database error occurs
         """
-        try:
-            where_clause, params = filter.build() if filter else ("", [])
-
-            async with self.db.transaction() as conn:
-                query = f"SELECT COUNT(*) FROM {self.table_name} {where_clause}"
-                cursor = conn.cursor()
-                cursor.execute(query, params)
-                result = cursor.fetchone()
+        where_clause, params = filter.build() if filter else ("", [])
+        query = f"SELECT COUNT(*) FROM {self.table_name} {where_clause}"
 
-                return result[0] if result else 0
+        def work(conn):
+            cursor = conn.cursor()
+            if approximate:
+                return _estimate_count(cursor, self.table_name, where_clause, params)
+            cursor.execute(query, params)
+            return _scalar(cursor) or 0
 
+        try:
+            return await self.db.run_in_transaction(work)
         except Exception as e:
             _logger.error(f"Error counting records: {str(e)}")
             raise DatabaseQueryError(
@@ -628,15 +967,15 @@ class BaseRepository(Generic[T, ID]):
         Raises:
             DatabaseError: If a database error occurs
         """
-        try:
-            async with self.db.transaction() as conn:
-                query = f"SELECT 1 FROM {self.table_name} WHERE {self.id_field} = %s LIMIT 1"
-                cursor = conn.cursor()
-                cursor.execute(query, (id,))
-                result = cursor.fetchone()
+        query = f"SELECT 1 FROM {self.table_name} WHERE {self.id_field} = %s LIMIT 1"
 
-                return result is not None
+        def work(conn):
+            cursor = conn.cursor()
+            cursor.execute(query, (id,))
+            return cursor.fetchone() is not None
 
+        try:
+            return await self.db.run_in_transaction(work)
         except Exception as e:
             _logger.error(f"Error checking if record exists with ID {id}: {str(e)}")
             raise DatabaseQueryError(
@@ -663,20 +1002,15 @@ class BaseRepository(Generic[T, ID]):
         Raises:
             DatabaseError: If a database error occurs
         """
-        try:
-            params = params or []
-
-            async with self.db.transaction() as conn:
-                cursor = conn.cursor()
-                cursor.execute(query, params)
+        params = params or []
 
-                if cursor.description:
-                    columns = [col[0] for col in cursor.description]
-                    rows = cursor.fetchall()
-                    return [dict(zip(columns, row)) for row in rows]
-
-                return []
+        def work(conn):
+            cursor = conn.cursor()
+            cursor.execute(query, params)
+            return _fetch_all(cursor) if cursor.description else []
 
+        try:
+            return await self.db.run_in_transaction(work)
         except Exception as e:
             _logger.error(f"Error executing raw query: {str(e)}")
             raise DatabaseQueryError(
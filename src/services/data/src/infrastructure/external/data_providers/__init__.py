@@ -1,7 +1,8 @@
 from fastapi import APIRouter
 
 # Re-export the base client
-from infrastructure.external.data_providers.clients.base import BaseClient
+from infrastructure.external.data_providers.base import BaseClient
+from infrastructure.external.routing import LatencyRouter
 
 # Import all client modules
 from .alpha import AlphaVantageClient
@@ -37,4 +38,5 @@ __all__ = [
     "ClientManager",
     "PolygonClient",
     "PolygonS3Client",
+    "LatencyRouter",
 ]
@@ -4,7 +4,7 @@ from typing import Any, Dict, List, Optional
 import pandas as pd
 import requests
 from fastapi import APIRouter, HTTPException, Query
-from infrastructure.external.data_providers.clients.base import BaseClient
+from infrastructure.external.data_providers.base import BaseClient
 from loguru import logger
 
 
@@ -2,7 +2,7 @@ import asyncio
 import os
 import threading
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from dotenv import load_dotenv
 from loguru import logger
@@ -11,7 +11,8 @@ from loguru import logger
 load_dotenv()
 
 # Import API clients
-from infrastructure.external.data_providers.clients.base import BaseClient
+from infrastructure.external.data_providers.base import BaseClient
+from infrastructure.external.routing import AllClientsFailedError, LatencyRouter, run_blocking
 
 from .alpha import AlphaVantageClient
 from .bitstamp import BitstampClient
@@ -35,6 +36,7 @@ class ClientManager:
       - Proactive rate limiting using asyncio.Semaphore.
       - Periodic health checks to verify client availability.
       - Configurable rate limits and health check intervals.
+      - Latency-aware client selection and hedged requests (see `fetch`).
     """
 
     MAX_RETRIES: int = 3  # Prevent infinite loops
@@ -46,6 +48,13 @@ class ClientManager:
         "alpha_vantage": 5,
         "bitstamp": 1000,
     }
+    DEFAULT_HEDGE_BUDGETS = {  # Hedged requests per minute a client may receive
+        "bitstamp": 60,
+        "polygon_s3": 12,
+        "cmc": 2,
+        "polygon": 1,
+        "alpha_vantage": 0,  # 5 requests/minute on the free tier; never hedge
+    }
 
     def __init__(
         self,
@@ -53,6 +62,7 @@ class ClientManager:
         metrics_manager: Optional[Any] = None,
         rate_limits: Optional[Dict[str, int]] = None,
         event_loop: Optional[asyncio.AbstractEventLoop] = None,
+        hedge_budgets: Optional[Dict[str, float]] = None,
     ) -> None:
         """
         Initialize the ClientManager with API clients, rate limiting, and health checks.
@@ -79,6 +89,11 @@ class ClientManager:
         self.assets = assets
         self.rate_limits = rate_limits or self.DEFAULT_RATE_LIMITS
 
+        # Latency and error EWMAs per client drive selection and hedging
+        self.router = LatencyRouter(
+            hedge_budgets=hedge_budgets or self.DEFAULT_HEDGE_BUDGETS
+        )
+
         # Use provided event loop or the current one
         self._event_loop = event_loop or asyncio.get_event_loop()
 
@@ -205,12 +220,29 @@ class ClientManager:
                         f"[ClientManager._periodic_health_check] Skipping health check for '{client_name}' (marked as failed)."
                     )
                     continue
+                stats = self.router.stats(client_name)
+                if (
+                    stats.last_sample_at is not None
+                    and time.monotonic() - stats.last_sample_at
+                    < self.HEALTH_CHECK_INTERVAL / 2
+                    and stats.error_ewma < 0.5
+                ):
+                    # Recent traffic already shows the client working
+                    logger.debug(
+                        f"[ClientManager._periodic_health_check] Skipping health check for '{client_name}' (recent traffic)."
+                    )
+                    continue
                 try:
                     client = self.clients[client_name]
                     logger.debug(
                         f"[ClientManager._periodic_health_check] Performing health check for {client_name}..."
                     )
+                    start = time.perf_counter()
                     healthy = await self._run_health_check(client)
+                    # Probe latency keeps statistics fresh for idle clients
+                    self.router.record(
+                        client_name, time.perf_counter() - start, bool(healthy)
+                    )
                     if healthy:
                         logger.info(f"✅ Health check passed for {client_name}.")
                     else:
@@ -275,21 +307,32 @@ class ClientManager:
                 f"Semaphore release attempted with invalid semaphore for client: {client_name}"
             )
 
+    def _available_clients(self, symbol: str) -> List[str]:
+        """
+        Names of usable clients for a symbol, fastest first.
+
+        Clients are ranked by latency EWMA penalised by error rate; clients
+        without measurements keep their preferred order.
+        """
+        candidates = [
+            client_name
+            for client_name in self.preferred_clients.get(symbol, [])
+            if client_name in self.clients and client_name not in self.failed_clients
+        ]
+        return self.router.rank(candidates)
+
     def get_client(self, symbol: str, retry_count: int = 0) -> BaseClient:
         """
-        Retrieves a client for the given asset symbol based on preferred order.
+        Retrieves the best client for the given asset symbol.
         Retries up to MAX_RETRIES if no client is immediately available.
         """
         with self._lock:
             symbol = symbol.upper()
-            client_list = self.preferred_clients.get(symbol, [])
-            for client_name in client_list:
-                if (
-                    client_name in self.clients
-                    and client_name not in self.failed_clients
-                ):
-                    logger.info(f"✅ Using {client_name} for symbol '{symbol}'.")
-                    return self.clients[client_name]
+            available = self._available_clients(symbol)
+            if available:
+                client_name = available[0]
+                logger.info(f"✅ Using {client_name} for symbol '{symbol}'.")
+                return self.clients[client_name]
             if retry_count < self.MAX_RETRIES:
                 logger.warning(
                     f"⚠️ No available API clients for symbol='{symbol}'. Retrying {retry_count + 1}/{self.MAX_RETRIES}..."
@@ -304,6 +347,62 @@ class ClientManager:
                     f"No available clients for {symbol} after {self.MAX_RETRIES} retries."
                 )
 
+    async def fetch(
+        self,
+        symbol: str,
+        request: Optional[Callable[[str, BaseClient], Any]] = None,
+        hedge: bool = True,
+        **kwargs,
+    ) -> Any:
+        """
+        Fetch data for a symbol from the best available client.
+
+        The fastest client is called first; if it has not answered after
+        its recent p95 latency, the next client is called as well (within
+        that client's hedge budget) and the first non-empty response wins.
+        Clients that raise or return nothing are failed over immediately.
+        Each call runs in the default executor, since the clients are
+        blocking, and holds the client's rate-limit semaphore until its
+        thread finishes, even when it lost a hedge and was cancelled.
+
+        Args:
+            symbol: Asset symbol
+            request: Blocking callable (client_name, client) -> response, for
+                clients whose `get` signatures differ; defaults to
+                `client.get(symbol, **kwargs)`
+            hedge: Whether to send hedged requests
+            **kwargs: Keyword arguments for the default `client.get` call
+
+        Returns:
+            The first valid response
+
+        Raises:
+            ClientNotFoundError: If no client is available or all of them failed
+        """
+        symbol = symbol.upper()
+        with self._lock:
+            candidates = self._available_clients(symbol)
+        if not candidates:
+            self.get_client(symbol)  # Retries cooled-down clients or raises
+            with self._lock:
+                candidates = self._available_clients(symbol)
+
+        async def call(client_name: str) -> Any:
+            client = self.clients[client_name]
+            semaphore = self._rate_limit_semaphores.get(client_name)
+            if request is not None:
+                return await run_blocking(request, client_name, client, semaphore=semaphore)
+            return await run_blocking(lambda: client.get(symbol, **kwargs), semaphore=semaphore)
+
+        try:
+            client_name, result = await self.router.call(
+                candidates, call, is_valid=_has_data, hedge=hedge
+            )
+        except AllClientsFailedError as e:
+            raise ClientNotFoundError(f"No client returned data for {symbol}: {e}") from e
+        logger.debug(f"Fetched {symbol} from {client_name}")
+        return result
+
     def report_failure(self, client_name: str) -> None:
         """
         Report a client failure, mark it as unavailable, and cancel its health check.
@@ -415,6 +514,19 @@ class ClientManager:
         return self.preferred_clients
 
 
+def _has_data(result: Any) -> bool:
+    """Whether a client response carries data (not None and not empty)."""
+    if result is None:
+        return False
+    empty = getattr(result, "empty", None)
+    if isinstance(empty, bool):
+        return not empty
+    try:
+        return len(result) > 0
+    except TypeError:
+        return True
+
+
 # ----------------------------
 # FastAPI Router Integration
 # ----------------------------
@@ -461,11 +573,13 @@ def list_all_clients() -> Dict[str, Any]:
 def get_status() -> Dict[str, Any]:
     """
     Retrieve the current status of the API clients.
-    Returns a list of failed clients (with timestamps) along with all client names.
+    Returns a list of failed clients (with timestamps) along with all client names
+    and per-client latency/error statistics.
     """
     return {
         "failed_clients": client_manager.failed_clients,
         "all_clients": list(client_manager.clients.keys()),
+        "latency": client_manager.router.snapshot(),
     }
 
 
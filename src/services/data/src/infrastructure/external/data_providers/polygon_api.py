@@ -5,7 +5,7 @@ from typing import Any, Dict, List, Optional, Tuple, Union
 
 import pandas as pd
 from fastapi import APIRouter, HTTPException, Query
-from infrastructure.external.data_providers.clients.base import BaseClient
+from infrastructure.external.data_providers.base import BaseClient
 from loguru import logger
 from pydantic import BaseModel
 
@@ -1,4 +1,3 @@
-import io
 import os
 import time
 from typing import Any, Dict, Optional
@@ -7,7 +6,7 @@ import boto3
 import pandas as pd
 from botocore.exceptions import ClientError
 from fastapi import APIRouter, HTTPException, Query
-from infrastructure.external.data_providers.clients.base import BaseClient
+from infrastructure.external.data_providers.base import BaseClient
 from loguru import logger
 from pydantic import BaseModel
 
@@ -73,10 +72,15 @@ class PolygonS3Client(BaseClient):
             )
 
             response = self.s3_client.get_object(Bucket=self.bucket, Key=key)
-            file_content = response["Body"].read().decode("utf-8")
 
             if file_format.lower() == "csv":
-                df = pd.read_csv(io.StringIO(file_content))
+                # Parse straight from the response stream, decompressing on the fly,
+                # instead of holding the raw bytes and a decoded copy alongside the frame
+                df = pd.read_csv(
+                    response["Body"],
+                    compression="gzip" if key.endswith(".gz") else None,
+                    encoding="utf-8",
+                )
             else:
                 logger.error(f"Unsupported file format: {file_format}")
                 duration_ms = (time.time() - start_time) * 1000
@@ -0,0 +1,408 @@
+"""
+Latency-aware client selection and hedged requests for data providers.
+
+`LatencyRouter` keeps an exponentially weighted moving average (EWMA) of
+latency and error rate for every provider, plus a short window of recent
+latencies for a p95 estimate. Providers are ranked by expected cost
+(latency EWMA plus a penalty per expected error), so a provider that is
+slow but not failing stops being picked before anyone reports a failure.
+
+A hedged call sends the request to the best provider and, if no valid
+response has arrived after that provider's p95 latency, sends it to the
+next one as well and takes whichever valid response comes first. Hedges
+draw from a per-provider token bucket so they never add more than a
+fixed number of requests per minute to any provider's rate limit.
+"""
+
+import asyncio
+import math
+import threading
+import time
+from collections import deque
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+from loguru import logger
+
+T = TypeVar("T")
+
+
+class AllClientsFailedError(Exception):
+    """Exception raised when no provider returned a valid response."""
+
+    pass
+
+
+class ClientStats:
+    """
+    Latency and error EWMAs for one provider.
+    """
+
+    def __init__(self, alpha: float = 0.2, window: int = 128):
+        """
+        Initialize empty statistics.
+
+        Args:
+            alpha: EWMA weight of the newest sample (0-1)
+            window: Number of recent successful latencies kept for the p95 estimate
+        """
+        self.alpha = alpha
+        self.latency_ewma: Optional[float] = None
+        self.error_ewma = 0.0
+        self.samples = 0
+        self.errors = 0
+        self.last_sample_at: Optional[float] = None
+        self._recent: Deque[float] = deque(maxlen=window)
+        self._p95: Optional[float] = None
+
+    def record(self, latency: float, ok: bool, now: float) -> None:
+        """Fold one request outcome into the averages."""
+        self.samples += 1
+        self.last_sample_at = now
+        self.error_ewma += self.alpha * ((0.0 if ok else 1.0) - self.error_ewma)
+        if ok:
+            self.latency_ewma = (
+                latency
+                if self.latency_ewma is None
+                else self.latency_ewma + self.alpha * (latency - self.latency_ewma)
+            )
+            self._recent.append(latency)
+            self._p95 = None
+        else:
+            self.errors += 1
+
+    def record_censored(self, elapsed: float, now: float) -> None:
+        """
+        Fold in a request cancelled after `elapsed` seconds.
+
+        The true latency is at least `elapsed`, so it only moves the
+        averages when it is slower than what they already expect; a
+        provider that slowed down and keeps losing to hedges still has
+        its estimate raised instead of frozen.
+        """
+        if self.latency_ewma is not None and elapsed <= self.latency_ewma:
+            return
+        self.record(elapsed, True, now)
+
+    @property
+    def p95(self) -> Optional[float]:
+        """95th percentile of recent successful latencies, None before any success."""
+        if self._p95 is None and self._recent:
+            ordered = sorted(self._recent)
+            self._p95 = ordered[min(len(ordered) - 1, math.ceil(0.95 * len(ordered)) - 1)]
+        return self._p95
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "latency_ewma_ms": None if self.latency_ewma is None else self.latency_ewma * 1000,
+            "p95_ms": None if self.p95 is None else self.p95 * 1000,
+            "error_rate": self.error_ewma,
+            "samples": self.samples,
+            "errors": self.errors,
+        }
+
+
+class HedgeBudget:
+    """
+    Token bucket limiting how many hedged requests a provider receives.
+    """
+
+    def __init__(
+        self,
+        per_minute: float,
+        burst: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize a full bucket.
+
+        Args:
+            per_minute: Hedges allowed per minute (0 disables hedging to the provider)
+            burst: Maximum hedges available at once (defaults to a tenth of a minute's worth, at least 1)
+            clock: Monotonic time source in seconds
+        """
+        self.rate = per_minute / 60.0
+        self.capacity = burst if burst is not None else max(1.0, per_minute / 10.0)
+        if per_minute <= 0:
+            self.capacity = 0.0
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> bool:
+        """Take one token if available."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return True
+            return False
+
+
+class LatencyRouter:
+    """
+    Ranks providers by observed latency and errors and runs hedged calls.
+
+    Thread-safe; `record` may be called from worker threads.
+    """
+
+    def __init__(
+        self,
+        alpha: float = 0.2,
+        window: int = 128,
+        error_cost: float = 5.0,
+        default_hedge_delay: float = 1.0,
+        min_hedge_delay: float = 0.05,
+        min_samples_for_p95: int = 10,
+        hedge_budgets: Optional[Dict[str, float]] = None,
+        default_hedge_budget: float = 6.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the router.
+
+        Args:
+            alpha: EWMA weight of the newest sample
+            window: Recent latencies kept per provider for the p95 estimate
+            error_cost: Seconds added to a provider's expected cost per unit of error rate
+            default_hedge_delay: Hedge delay until a provider has enough samples for a p95
+            min_hedge_delay: Lower bound on the hedge delay
+            min_samples_for_p95: Successful samples needed before the p95 is trusted
+            hedge_budgets: Hedges per minute allowed per provider name
+            default_hedge_budget: Hedges per minute for providers not in `hedge_budgets`
+            clock: Monotonic time source in seconds
+        """
+        self.alpha = alpha
+        self.window = window
+        self.error_cost = error_cost
+        self.default_hedge_delay = default_hedge_delay
+        self.min_hedge_delay = min_hedge_delay
+        self.min_samples_for_p95 = min_samples_for_p95
+        self.hedge_budgets = dict(hedge_budgets or {})
+        self.default_hedge_budget = default_hedge_budget
+        self._clock = clock
+        self._stats: Dict[str, ClientStats] = {}
+        self._budgets: Dict[str, HedgeBudget] = {}
+        self._lock = threading.Lock()
+        self.hedges_sent = 0
+        self.hedges_won = 0
+        self.hedges_denied = 0
+
+    def stats(self, name: str) -> ClientStats:
+        with self._lock:
+            stats = self._stats.get(name)
+            if stats is None:
+                stats = self._stats[name] = ClientStats(self.alpha, self.window)
+            return stats
+
+    def record(self, name: str, latency: float, ok: bool) -> None:
+        """Record the outcome of one request to a provider."""
+        stats = self.stats(name)
+        with self._lock:
+            stats.record(latency, ok, self._clock())
+
+    def record_cancelled(self, name: str, elapsed: float) -> None:
+        """Record a request to a provider that was cancelled after `elapsed` seconds."""
+        stats = self.stats(name)
+        with self._lock:
+            stats.record_censored(elapsed, self._clock())
+
+    def expected_cost(self, name: str) -> Optional[float]:
+        """Expected seconds per request, or None for a provider with no samples."""
+        stats = self.stats(name)
+        if stats.samples == 0:
+            return None
+        latency = stats.latency_ewma if stats.latency_ewma is not None else 0.0
+        return latency + stats.error_ewma * self.error_cost
+
+    def rank(self, candidates: Sequence[str]) -> List[str]:
+        """
+        Order candidates from cheapest to most expensive.
+
+        Providers without samples keep their position relative to each other
+        and rank ahead of measured ones, so each gets tried before the
+        ranking settles; ties keep the given (preferred) order.
+        """
+        def key(item: Tuple[int, str]) -> Tuple[int, float, int]:
+            index, name = item
+            cost = self.expected_cost(name)
+            return (0, 0.0, index) if cost is None else (1, cost, index)
+
+        return [name for _, name in sorted(enumerate(candidates), key=key)]
+
+    def hedge_delay(self, name: str) -> float:
+        """How long to wait on a provider before hedging: its recent p95 latency."""
+        stats = self.stats(name)
+        if stats.p95 is None or len(stats._recent) < self.min_samples_for_p95:
+            return self.default_hedge_delay
+        return max(self.min_hedge_delay, stats.p95)
+
+    def try_hedge(self, name: str) -> bool:
+        """Take a hedge token for a provider if its budget allows."""
+        with self._lock:
+            budget = self._budgets.get(name)
+            if budget is None:
+                budget = self._budgets[name] = HedgeBudget(
+                    self.hedge_budgets.get(name, self.default_hedge_budget), clock=self._clock
+                )
+        return budget.try_acquire()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Per-provider statistics and hedge counters for status endpoints."""
+        with self._lock:
+            providers = {name: stats.to_dict() for name, stats in self._stats.items()}
+        return {
+            "providers": providers,
+            "hedges_sent": self.hedges_sent,
+            "hedges_won": self.hedges_won,
+            "hedges_denied": self.hedges_denied,
+        }
+
+    async def call(
+        self,
+        candidates: Sequence[str],
+        fn: Callable[[str], Awaitable[T]],
+        is_valid: Callable[[T], bool] = lambda result: result is not None,
+        hedge: bool = True,
+    ) -> Tuple[str, T]:
+        """
+        Call `fn(name)` on the best provider, hedging and failing over as needed.
+
+        The best-ranked provider is called first. If it has not returned a
+        valid result after its hedge delay, the next provider is called as
+        well (when `hedge` is set and that provider's budget allows), and so
+        on after each hedged provider's own delay; the first valid result
+        wins and the slower calls are cancelled, counting the time they ran
+        as a lower bound on their latency. A provider
+        that raises or returns an invalid result is replaced by the next one
+        immediately, without using hedge budget.
+
+        Args:
+            candidates: Provider names in preferred order
+            fn: Coroutine function performing the request for a provider
+            is_valid: Predicate deciding whether a result is usable
+            hedge: Whether to send hedged requests
+
+        Returns:
+            Tuple of (provider name, result)
+
+        Raises:
+            AllClientsFailedError: If every provider failed or returned invalid results
+        """
+        queue = self.rank(candidates)
+        if not queue:
+            raise AllClientsFailedError("No providers to call")
+
+        pending: Dict[asyncio.Task, Tuple[str, float, bool]] = {}
+        last_error: Optional[BaseException] = None
+
+        def launch(is_hedge: bool) -> float:
+            """Start the next provider and return when to hedge it."""
+            name = queue.pop(0)
+            task = asyncio.ensure_future(fn(name))
+            started = time.perf_counter()
+            pending[task] = (name, started, is_hedge)
+            if is_hedge:
+                self.hedges_sent += 1
+            return started + self.hedge_delay(name)
+
+        hedge_at = launch(False)
+        try:
+            while pending:
+                timeout = None
+                if hedge and queue:
+                    timeout = max(0.0, hedge_at - time.perf_counter())
+                done, _ = await asyncio.wait(
+                    pending.keys(), timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+
+                if not done:
+                    # Hedge delay elapsed with nothing back
+                    if self.try_hedge(queue[0]):
+                        hedge_at = launch(True)
+                    else:
+                        self.hedges_denied += 1
+                        logger.debug(f"Hedge to '{queue[0]}' denied by its budget")
+                        hedge = False
+                    continue
+
+                for task in done:
+                    name, started, is_hedge = pending.pop(task)
+                    latency = time.perf_counter() - started
+                    error = task.exception()
+                    result = None if error is not None else task.result()
+                    ok = error is None and is_valid(result)
+                    self.record(name, latency, ok)
+                    if ok:
+                        if is_hedge:
+                            self.hedges_won += 1
+                        return name, result
+                    last_error = error or ValueError(f"Invalid response from '{name}'")
+                    logger.debug(f"Provider '{name}' failed after {latency:.3f}s: {last_error}")
+
+                # Fail over immediately when nothing else is in flight
+                if not pending and queue:
+                    hedge_at = launch(False)
+        finally:
+            now = time.perf_counter()
+            for task, (name, started, _) in pending.items():
+                task.cancel()
+                self.record_cancelled(name, now - started)
+
+        raise AllClientsFailedError(f"All providers failed: {last_error}") from last_error
+
+
+async def run_blocking(
+    func: Callable[..., T], *args: Any, semaphore: Optional[asyncio.Semaphore] = None
+) -> T:
+    """
+    Run blocking `func(*args)` in the default executor while holding `semaphore`.
+
+    Cancelling the caller (a hedge that lost, say) does not stop the
+    executor thread, so the permit is released by the worker future's
+    done-callback once the thread has finished rather than when the
+    await is cancelled; a provider never sees more concurrent requests
+    than its semaphore allows.
+
+    Args:
+        func: Blocking callable
+        *args: Positional arguments for `func`
+        semaphore: Rate-limit semaphore to hold for the duration of the call
+
+    Returns:
+        The result of `func(*args)`
+    """
+    if semaphore is not None:
+        await semaphore.acquire()
+    try:
+        future = asyncio.get_running_loop().run_in_executor(None, func, *args)
+    except BaseException:
+        if semaphore is not None:
+            semaphore.release()
+        raise
+    if semaphore is not None:
+        future.add_done_callback(lambda _: semaphore.release())
+    future.add_done_callback(_consume_exception)
+    return await asyncio.shield(future)
+
+
+def _consume_exception(future: "asyncio.Future[Any]") -> None:
+    """Mark an abandoned worker's exception as retrieved so asyncio doesn't log it."""
+    if not future.cancelled():
+        future.exception()
+
+
+__all__ = ["AllClientsFailedError", "ClientStats", "HedgeBudget", "LatencyRouter", "run_blocking"]
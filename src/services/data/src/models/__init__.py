@@ -4,6 +4,6 @@ Data models representing various market data structures
 
 from .candle import Candle
 from .market import MarketData
-from .tick import Tick
+from .tick import Tick, TickBatch
 
-__all__ = ["Candle", "MarketData", "Tick"]
+__all__ = ["Candle", "MarketData", "Tick", "TickBatch"]
@@ -7,7 +7,9 @@ and order books across all data sources and exchanges in the system.
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple, TypeVar, Union
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, TypeVar, Union
+
+import numpy as np
 
 # Try to use our centralized logging, fall back to loguru if not available
 try:
@@ -659,3 +661,401 @@ class OrderBook(Model):
             f"OrderBook({self.symbol}, {self.timestamp}, "
             f"Levels: {self.depth}, Best bid: {best_bid}, Best ask: {best_ask})"
         )
+
+
+class _BookSide:
+    """
+    One side of an L2 book held in preallocated sorted NumPy arrays.
+
+    Levels are ordered by ``key`` ascending with the best level last (bids use
+    ``key = price``, asks ``key = -price``), so the updates that dominate depth
+    feeds, near the top of book, only shift a few trailing elements. ``cum``
+    holds running size totals from the worst level up and is refreshed lazily
+    from the lowest dirtied index, which again is usually near the top.
+    """
+
+    __slots__ = ("sign", "keys", "sizes", "counts", "cum", "n", "_dirty")
+
+    def __init__(self, sign: float, capacity: int):
+        self.sign = sign
+        self.keys = np.empty(capacity, dtype=np.float64)
+        self.sizes = np.empty(capacity, dtype=np.float64)
+        self.counts = np.empty(capacity, dtype=np.int64)
+        self.cum = np.empty(capacity, dtype=np.float64)
+        self.n = 0
+        self._dirty = 0
+
+    def _grow(self) -> None:
+        capacity = max(2 * len(self.keys), 16)
+        for name in ("keys", "sizes", "counts", "cum"):
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[: self.n] = old[: self.n]
+            setattr(self, name, new)
+
+    def load(self, prices: np.ndarray, sizes: np.ndarray, counts: np.ndarray) -> None:
+        """Replace all levels with a snapshot."""
+        keep = sizes > 0
+        keys = prices[keep] * self.sign
+        order = np.argsort(keys, kind="stable")
+        n = len(order)
+        while len(self.keys) < n:
+            self._grow()
+        self.keys[:n] = keys[order]
+        self.sizes[:n] = sizes[keep][order]
+        self.counts[:n] = counts[keep][order]
+        self.n = n
+        self._dirty = 0
+
+    def set(self, price: float, size: float, count: int) -> None:
+        """Insert, update or (with ``size <= 0``) delete the level at ``price``."""
+        key = price * self.sign
+        n = self.n
+        i = int(self.keys[:n].searchsorted(key))
+        exists = i < n and self.keys[i] == key
+
+        if size <= 0:
+            if not exists:
+                return
+            for arr in (self.keys, self.sizes, self.counts):
+                arr[i : n - 1] = arr[i + 1 : n]
+            self.n = n - 1
+        elif exists:
+            self.sizes[i] = size
+            self.counts[i] = count
+        else:
+            if n == len(self.keys):
+                self._grow()
+            for arr in (self.keys, self.sizes, self.counts):
+                arr[i + 1 : n + 1] = arr[i:n]
+            self.keys[i] = key
+            self.sizes[i] = size
+            self.counts[i] = count
+            self.n = n + 1
+
+        self._dirty = min(self._dirty, i)
+
+    def _cumulative(self) -> np.ndarray:
+        """Running size totals, refreshed from the first dirty index."""
+        n = self.n
+        start = self._dirty
+        if start < n:
+            base = self.cum[start - 1] if start > 0 else 0.0
+            np.cumsum(self.sizes[start:n], out=self.cum[start:n])
+            self.cum[start:n] += base
+        self._dirty = n
+        return self.cum[:n]
+
+    @property
+    def total(self) -> float:
+        """Total size on this side."""
+        return float(self._cumulative()[-1]) if self.n else 0.0
+
+    def best(self) -> Optional[Tuple[float, float]]:
+        """Best (price, size), or None if the side is empty."""
+        if not self.n:
+            return None
+        return float(self.keys[self.n - 1] * self.sign), float(self.sizes[self.n - 1])
+
+    def top_volume(self, levels: int) -> float:
+        """Total size of the best ``levels`` levels."""
+        n = self.n
+        if n == 0 or levels <= 0:
+            return 0.0
+        cum = self._cumulative()
+        below = n - min(levels, n) - 1
+        return float(cum[-1] - (cum[below] if below >= 0 else 0.0))
+
+    def volume_through(self, price: float) -> float:
+        """Total size at ``price`` or better."""
+        n = self.n
+        if n == 0:
+            return 0.0
+        cum = self._cumulative()
+        i = int(self.keys[:n].searchsorted(price * self.sign))
+        return float(cum[-1] - (cum[i - 1] if i > 0 else 0.0))
+
+    def levels(self, depth: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Copies of (prices, sizes, counts), best level first."""
+        n = self.n
+        start = 0 if depth is None else max(n - depth, 0)
+        return (
+            self.keys[start:n][::-1] * self.sign,
+            self.sizes[start:n][::-1].copy(),
+            self.counts[start:n][::-1].copy(),
+        )
+
+
+def _level_arrays(
+    levels: Iterable[Union[OrderBookEntry, Sequence[Any]]],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Split entries or (price, volume[, count]) tuples into NumPy arrays."""
+    prices: List[float] = []
+    sizes: List[float] = []
+    counts: List[int] = []
+    for level in levels:
+        if isinstance(level, OrderBookEntry):
+            price, size, count = level.price, level.volume, level.count
+        else:
+            price, size = level[0], level[1]
+            count = level[2] if len(level) > 2 else None
+        prices.append(float(price))
+        sizes.append(float(size))
+        counts.append(-1 if count is None else int(count))
+    return (
+        np.asarray(prices, dtype=np.float64),
+        np.asarray(sizes, dtype=np.float64),
+        np.asarray(counts, dtype=np.int64),
+    )
+
+
+class L2OrderBook:
+    """
+    Incrementally maintained L2 order book backed by sorted NumPy arrays.
+
+    Intended for depth feeds that send a snapshot followed by many level
+    deltas: ``update`` inserts, changes or deletes one price level without
+    rebuilding the book, and running size totals make spread, imbalance and
+    depth queries O(1) or O(log n). ``to_order_book`` returns the familiar
+    ``OrderBook`` dataclass as a point-in-time view.
+
+    Example:
+        book = L2OrderBook.from_snapshot("BTC/USD", bids=[(100.0, 2.0)], asks=[(101.0, 1.5)])
+        book.update("bid", 100.5, 1.0)
+        book.update("ask", 101.0, 0)  # delete the level
+        imbalance = book.get_volume_imbalance(levels=5)
+    """
+
+    def __init__(
+        self,
+        symbol: str,
+        exchange: str = "unknown",
+        source: str = "unknown",
+        capacity: int = 256,
+    ):
+        self.symbol = symbol
+        self.exchange = exchange
+        self.source = source
+        self.timestamp = datetime.now()
+        self._bids = _BookSide(1.0, capacity)
+        self._asks = _BookSide(-1.0, capacity)
+
+    @classmethod
+    def from_snapshot(
+        cls,
+        symbol: str,
+        bids: Iterable[Union[OrderBookEntry, Sequence[Any]]],
+        asks: Iterable[Union[OrderBookEntry, Sequence[Any]]],
+        timestamp: Optional[datetime] = None,
+        exchange: str = "unknown",
+        source: str = "unknown",
+    ) -> "L2OrderBook":
+        """Create a book from snapshot levels."""
+        book = cls(symbol, exchange=exchange, source=source)
+        book.apply_snapshot(bids, asks, timestamp)
+        return book
+
+    @classmethod
+    def from_order_book(cls, order_book: OrderBook) -> "L2OrderBook":
+        """Create a book from an ``OrderBook`` snapshot."""
+        return cls.from_snapshot(
+            order_book.symbol,
+            order_book.bids,
+            order_book.asks,
+            timestamp=order_book.timestamp,
+            exchange=order_book.exchange,
+            source=order_book.source,
+        )
+
+    def _side(self, side: str) -> _BookSide:
+        if side in ("bid", "bids", "buy"):
+            return self._bids
+        if side in ("ask", "asks", "sell"):
+            return self._asks
+        raise ValueError(f"Invalid order book side: {side}")
+
+    def apply_snapshot(
+        self,
+        bids: Iterable[Union[OrderBookEntry, Sequence[Any]]],
+        asks: Iterable[Union[OrderBookEntry, Sequence[Any]]],
+        timestamp: Optional[datetime] = None,
+    ) -> None:
+        """Replace the whole book with snapshot levels."""
+        self._bids.load(*_level_arrays(bids))
+        self._asks.load(*_level_arrays(asks))
+        self.timestamp = timestamp or datetime.now()
+
+    def update(
+        self,
+        side: str,
+        price: float,
+        volume: float,
+        count: Optional[int] = None,
+        timestamp: Optional[datetime] = None,
+    ) -> None:
+        """
+        Apply a single level delta.
+
+        Args:
+            side: "bid" or "ask"
+            price: Price level
+            volume: New total volume at the level; zero or less deletes it
+            count: Number of orders at the level (if available)
+            timestamp: Time of the message carrying the delta; when omitted
+                the book keeps its current timestamp, so per-level feeds
+                don't read the clock on every delta (``apply_deltas`` stamps
+                a whole batch once)
+        """
+        self._side(side).set(float(price), float(volume), -1 if count is None else int(count))
+        if timestamp is not None:
+            self.timestamp = timestamp
+
+    def apply_deltas(
+        self,
+        bids: Iterable[Sequence[Any]] = (),
+        asks: Iterable[Sequence[Any]] = (),
+        timestamp: Optional[datetime] = None,
+    ) -> None:
+        """Apply batches of (price, volume[, count]) level deltas, stamped with ``timestamp`` (or now) once."""
+        for side, levels in ((self._bids, bids), (self._asks, asks)):
+            for level in levels:
+                count = level[2] if len(level) > 2 and level[2] is not None else -1
+                side.set(float(level[0]), float(level[1]), int(count))
+        self.timestamp = timestamp or datetime.now()
+
+    @property
+    def depth(self) -> int:
+        """Number of price levels on the deeper side."""
+        return max(self._bids.n, self._asks.n)
+
+    @property
+    def best_bid(self) -> Optional[Tuple[float, float]]:
+        """Best (highest) bid as (price, volume)."""
+        return self._bids.best()
+
+    @property
+    def best_ask(self) -> Optional[Tuple[float, float]]:
+        """Best (lowest) ask as (price, volume)."""
+        return self._asks.best()
+
+    @property
+    def spread(self) -> float:
+        """Best ask minus best bid, or 0 if either side is empty."""
+        if not self._bids.n or not self._asks.n:
+            return 0
+        return float(-self._asks.keys[self._asks.n - 1] - self._bids.keys[self._bids.n - 1])
+
+    @property
+    def mid_price(self) -> float:
+        """Average of best bid and best ask, or 0 if either side is empty."""
+        if not self._bids.n or not self._asks.n:
+            return 0
+        return float(-self._asks.keys[self._asks.n - 1] + self._bids.keys[self._bids.n - 1]) / 2
+
+    @property
+    def total_bid_volume(self) -> float:
+        """Total volume across all bid levels."""
+        return self._bids.total
+
+    @property
+    def total_ask_volume(self) -> float:
+        """Total volume across all ask levels."""
+        return self._asks.total
+
+    def bid_volume_at_price(self, price: float) -> float:
+        """Total bid volume at or above ``price``."""
+        return self._bids.volume_through(price)
+
+    def ask_volume_at_price(self, price: float) -> float:
+        """Total ask volume at or below ``price``."""
+        return self._asks.volume_through(price)
+
+    def get_volume_imbalance(self, levels: int = 5) -> float:
+        """
+        Volume imbalance over the best ``levels`` levels, between -1 and 1.
+
+        Positive values indicate more volume on the bid side, matching
+        ``OrderBook.get_volume_imbalance``.
+        """
+        bid_vol = self._bids.top_volume(levels)
+        ask_vol = self._asks.top_volume(levels)
+        total_vol = bid_vol + ask_vol
+        if total_vol == 0:
+            return 0
+        return (bid_vol - ask_vol) / total_vol
+
+    def depth_within_bps(self, bps: float) -> Tuple[float, float]:
+        """
+        Volume resting within ``bps`` basis points of the mid price.
+
+        Args:
+            bps: Distance from mid in basis points
+
+        Returns:
+            (bid volume, ask volume) within the band
+        """
+        mid = self.mid_price
+        if mid == 0:
+            return 0.0, 0.0
+        band = mid * bps / 10_000
+        return (
+            self._bids.volume_through(mid - band),
+            self._asks.volume_through(mid + band),
+        )
+
+    def levels(
+        self, side: str, depth: Optional[int] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Price and volume arrays for one side, best level first.
+
+        Args:
+            side: "bid" or "ask"
+            depth: Maximum number of levels (all levels if None)
+
+        Returns:
+            (prices, volumes) arrays
+        """
+        prices, sizes, _ = self._side(side).levels(depth)
+        return prices, sizes
+
+    def to_order_book(self, depth: Optional[int] = None) -> OrderBook:
+        """
+        Build an ``OrderBook`` view of the current state.
+
+        Args:
+            depth: Maximum number of levels per side (all levels if None)
+
+        Returns:
+            OrderBook snapshot
+        """
+
+        def entries(side: _BookSide) -> List[OrderBookEntry]:
+            prices, sizes, counts = side.levels(depth)
+            return [
+                OrderBookEntry(price=p, volume=v, count=None if c < 0 else c)
+                for p, v, c in zip(prices.tolist(), sizes.tolist(), counts.tolist(), strict=True)
+            ]
+
+        return OrderBook(
+            symbol=self.symbol,
+            timestamp=self.timestamp,
+            bids=entries(self._bids),
+            asks=entries(self._asks),
+            source=self.source,
+            exchange=self.exchange,
+        )
+
+    def __len__(self) -> int:
+        return self._bids.n + self._asks.n
+
+    def __str__(self) -> str:
+        """String representation of the order book"""
+        best_bid = self.best_bid
+        best_ask = self.best_ask
+        bid = f"@{best_bid[0]:.2f}" if best_bid else "None"
+        ask = f"@{best_ask[0]:.2f}" if best_ask else "None"
+        return (
+            f"L2OrderBook({self.symbol}, {self.timestamp}, "
+            f"Levels: {self.depth}, Best bid: {bid}, Best ask: {ask})"
+        )
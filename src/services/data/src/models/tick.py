@@ -6,8 +6,10 @@ across all data sources and exchanges in the system.
 """
 
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Any, Dict, Literal, Optional, Union
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Literal, Optional, Sequence, Union
+
+import numpy as np
 
 # Try to use our centralized logging, fall back to loguru if not available
 try:
@@ -220,3 +222,336 @@ class Tick(BaseClass):
             f"Tick({self.symbol}, {self.timestamp}, "
             f"P:{self.price:.2f}, V:{self.volume:.2f} {side_str})"
         )
+
+
+# Side codes used by TickBatch.sides
+SIDE_UNKNOWN = 0
+SIDE_BUY = 1
+SIDE_SELL = -1
+
+_SIDE_CODES = {"buy": SIDE_BUY, "sell": SIDE_SELL}
+_SIDE_NAMES = {SIDE_BUY: "buy", SIDE_SELL: "sell"}
+
+
+def _side_code(side: Any) -> int:
+    """Side code for one value; non-strings such as enums are matched by str()."""
+    if not side:
+        return SIDE_UNKNOWN
+    if isinstance(side, (int, np.integer)) and not isinstance(side, bool):
+        if side not in _SIDE_NAMES:
+            raise ValueError(f"Invalid side code {side!r}; expected {SIDE_BUY}, {SIDE_SELL} or {SIDE_UNKNOWN}")
+        return int(side)
+    code = _SIDE_CODES.get(side)
+    if code is None:
+        code = _SIDE_CODES.get(str(side).lower(), SIDE_UNKNOWN)
+    return code
+
+
+def _encode_sides(sides: Any, n: int) -> np.ndarray:
+    """Encode sides ("buy"/"sell"/None or int codes) as an int8 array."""
+    if sides is None:
+        return np.zeros(n, dtype=np.int8)
+    if isinstance(sides, np.ndarray):
+        if sides.dtype.kind in "iu":
+            return sides.astype(np.int8, copy=False)
+        sides = sides.tolist()
+    return np.fromiter((_side_code(s) for s in sides), dtype=np.int8, count=len(sides))
+
+
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _to_datetime64(timestamps: Any) -> np.ndarray:
+    """Convert datetimes, datetime64 or epoch-millisecond numbers to datetime64[ns]."""
+    if not isinstance(timestamps, np.ndarray) and len(timestamps) and isinstance(
+        timestamps[0], datetime
+    ):
+        # NumPy's object-to-datetime64 cast is slow; integer offsets are not.
+        # datetime64 has no timezone, so aware datetimes are stored as UTC.
+        epoch = _EPOCH if timestamps[0].tzinfo is None else _EPOCH_UTC
+        micros = np.fromiter(
+            ((t - epoch) // _MICROSECOND for t in timestamps),
+            dtype=np.int64,
+            count=len(timestamps),
+        )
+        return (micros * 1000).view("datetime64[ns]")
+
+    arr = np.asarray(timestamps)
+    if arr.dtype.kind == "M":
+        return arr.astype("datetime64[ns]", copy=False)
+    if arr.dtype.kind in "iuf":
+        return (arr.astype(np.int64, copy=False) * 1_000_000).view("datetime64[ns]")
+    return arr.astype("datetime64[ns]")
+
+
+class TickBatch:
+    """
+    Columnar batch of trades for a single symbol.
+
+    Stores timestamps, prices, volumes and sides as contiguous typed NumPy
+    arrays with one shared metadata dict, instead of one ``Tick`` object per
+    trade. Validation runs over whole arrays, slicing returns views, and
+    ``to_pandas`` / ``to_arrow`` hand the arrays over without copying.
+
+    Attributes:
+        symbol: The trading pair or ticker symbol
+        timestamps: datetime64[ns] trade times
+        prices: float64 trade prices
+        volumes: float64 trade volumes
+        sides: int8 side codes (SIDE_BUY, SIDE_SELL or SIDE_UNKNOWN)
+        trade_ids: Optional object array of trade identifiers
+        source: Data source that provided the ticks
+        metadata: Metadata shared by every tick in the batch
+    """
+
+    __slots__ = (
+        "symbol",
+        "timestamps",
+        "prices",
+        "volumes",
+        "sides",
+        "trade_ids",
+        "source",
+        "metadata",
+    )
+
+    def __init__(
+        self,
+        symbol: str,
+        timestamps: Any,
+        prices: Any,
+        volumes: Any,
+        sides: Any = None,
+        trade_ids: Any = None,
+        source: str = "unknown",
+        metadata: Optional[Dict[str, Any]] = None,
+        validate: bool = True,
+    ):
+        self.symbol = symbol
+        self.timestamps = _to_datetime64(timestamps)
+        self.prices = np.asarray(prices, dtype=np.float64)
+        self.volumes = np.asarray(volumes, dtype=np.float64)
+        self.sides = _encode_sides(sides, len(self.prices))
+        self.trade_ids = None if trade_ids is None else np.asarray(trade_ids, dtype=object)
+        self.source = source
+        self.metadata = metadata if metadata is not None else {}
+
+        if validate:
+            self.validate()
+
+    def validate(self) -> None:
+        """
+        Validate the whole batch at once.
+
+        Applies the same normalization as ``Tick.__post_init__`` (negative
+        prices and volumes become zero) and checks column lengths.
+
+        Raises:
+            ValueError: If the columns have different lengths
+        """
+        n = len(self.prices)
+        lengths = {len(self.timestamps), len(self.volumes), len(self.sides)}
+        if self.trade_ids is not None:
+            lengths.add(len(self.trade_ids))
+        if lengths != {n}:
+            raise ValueError(f"TickBatch columns have mismatched lengths: {sorted(lengths | {n})}")
+
+        # Copy only when something actually needs fixing, so inputs stay zero-copy
+        if (self.prices < 0).any():
+            self.prices = np.maximum(self.prices, 0)
+        if (self.volumes < 0).any():
+            self.volumes = np.maximum(self.volumes, 0)
+
+    @classmethod
+    def from_ticks(cls, ticks: Sequence[Tick]) -> "TickBatch":
+        """
+        Build a batch from ``Tick`` objects for a single symbol.
+
+        Args:
+            ticks: Ticks to convert; metadata from the first tick is shared
+
+        Returns:
+            A new TickBatch
+        """
+        if not ticks:
+            raise ValueError("Cannot build a TickBatch from an empty tick list")
+        first = ticks[0]
+        trade_ids = [t.trade_id for t in ticks]
+        return cls(
+            symbol=first.symbol,
+            timestamps=[t.timestamp for t in ticks],
+            prices=[t.price for t in ticks],
+            volumes=[t.volume for t in ticks],
+            sides=[t.side for t in ticks],
+            trade_ids=None if all(i is None for i in trade_ids) else trade_ids,
+            source=first.source,
+            metadata=dict(first.metadata),
+            validate=False,
+        )
+
+    @classmethod
+    def from_records(
+        cls,
+        records: Sequence[Dict[str, Any]],
+        symbol: Optional[str] = None,
+        price_key: str = "price",
+        volume_key: str = "volume",
+        source: str = "unknown",
+    ) -> "TickBatch":
+        """
+        Build a batch from tick dictionaries (e.g. collector output).
+
+        Args:
+            records: Tick dictionaries with timestamp, price and volume keys
+            symbol: Symbol for the batch (defaults to the first record's symbol)
+            price_key: Key holding the trade price
+            volume_key: Key holding the trade volume
+            source: Data source name
+
+        Returns:
+            A new TickBatch
+        """
+        n = len(records)
+        if symbol is None:
+            symbol = records[0].get("symbol", "UNKNOWN") if n else "UNKNOWN"
+        return cls(
+            symbol=symbol,
+            timestamps=[r.get("timestamp") for r in records],
+            prices=np.fromiter((float(r.get(price_key) or 0) for r in records), np.float64, n),
+            volumes=np.fromiter((float(r.get(volume_key) or 0) for r in records), np.float64, n),
+            sides=[r.get("side") for r in records],
+            source=source,
+        )
+
+    @classmethod
+    def concat(cls, batches: Iterable["TickBatch"]) -> "TickBatch":
+        """Concatenate batches for the same symbol into one."""
+        batches = list(batches)
+        if not batches:
+            raise ValueError("Cannot concatenate an empty list of batches")
+        first = batches[0]
+        has_ids = all(b.trade_ids is not None for b in batches)
+        return cls(
+            symbol=first.symbol,
+            timestamps=np.concatenate([b.timestamps for b in batches]),
+            prices=np.concatenate([b.prices for b in batches]),
+            volumes=np.concatenate([b.volumes for b in batches]),
+            sides=np.concatenate([b.sides for b in batches]),
+            trade_ids=np.concatenate([b.trade_ids for b in batches]) if has_ids else None,
+            source=first.source,
+            metadata=first.metadata,
+            validate=False,
+        )
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+    def __getitem__(self, index: Union[int, slice, np.ndarray]) -> Union[Tick, "TickBatch"]:
+        """Get a single ``Tick`` by position, or a sub-batch by slice or mask."""
+        if isinstance(index, (int, np.integer)):
+            return self.tick(int(index))
+        return TickBatch(
+            symbol=self.symbol,
+            timestamps=self.timestamps[index],
+            prices=self.prices[index],
+            volumes=self.volumes[index],
+            sides=self.sides[index],
+            trade_ids=None if self.trade_ids is None else self.trade_ids[index],
+            source=self.source,
+            metadata=self.metadata,
+            validate=False,
+        )
+
+    def tick(self, i: int) -> Tick:
+        """Materialize the tick at position ``i`` as a ``Tick`` object."""
+        return Tick(
+            symbol=self.symbol,
+            timestamp=self.timestamps[i].astype("datetime64[us]").item(),
+            price=float(self.prices[i]),
+            volume=float(self.volumes[i]),
+            side=_SIDE_NAMES.get(int(self.sides[i])),
+            trade_id=None if self.trade_ids is None else self.trade_ids[i],
+            source=self.source,
+            metadata=dict(self.metadata),
+        )
+
+    def to_ticks(self) -> List[Tick]:
+        """Materialize every tick as a ``Tick`` object."""
+        return [self.tick(i) for i in range(len(self))]
+
+    @property
+    def values(self) -> np.ndarray:
+        """Trade values (price * volume)."""
+        return self.prices * self.volumes
+
+    @property
+    def vwap(self) -> float:
+        """Volume-weighted average price, or 0 for an empty or zero-volume batch."""
+        total = self.volumes.sum()
+        return float(self.values.sum() / total) if total else 0.0
+
+    @property
+    def is_buy(self) -> np.ndarray:
+        """Boolean mask of buy trades."""
+        return self.sides == SIDE_BUY
+
+    @property
+    def is_sell(self) -> np.ndarray:
+        """Boolean mask of sell trades."""
+        return self.sides == SIDE_SELL
+
+    def to_pandas(self):
+        """
+        Convert to a pandas DataFrame indexed by timestamp.
+
+        Each column wraps the batch's array without copying.
+
+        Returns:
+            pandas.DataFrame with price, volume and side columns
+        """
+        import pandas as pd
+
+        columns = {
+            "price": pd.Series(self.prices, copy=False),
+            "volume": pd.Series(self.volumes, copy=False),
+            "side": pd.Series(self.sides, copy=False),
+        }
+        if self.trade_ids is not None:
+            columns["trade_id"] = pd.Series(self.trade_ids, copy=False)
+        df = pd.DataFrame(columns, copy=False)
+        df.index = pd.DatetimeIndex(self.timestamps, name="timestamp", copy=False)
+        df.attrs = {"symbol": self.symbol, "source": self.source, **self.metadata}
+        return df
+
+    def to_arrow(self):
+        """
+        Convert to a pyarrow Table.
+
+        Numeric columns are wrapped without copying.
+
+        Returns:
+            pyarrow.Table with timestamp, price, volume and side columns
+        """
+        import pyarrow as pa
+
+        columns = {
+            "timestamp": pa.array(self.timestamps),
+            "price": pa.array(self.prices),
+            "volume": pa.array(self.volumes),
+            "side": pa.array(self.sides),
+        }
+        if self.trade_ids is not None:
+            columns["trade_id"] = pa.array(self.trade_ids.tolist())
+        metadata = {"symbol": self.symbol, "source": self.source}
+        return pa.table(columns, metadata=metadata)
+
+    def __str__(self) -> str:
+        """String representation of the batch"""
+        if not len(self):
+            return f"TickBatch({self.symbol}, empty)"
+        return (
+            f"TickBatch({self.symbol}, {len(self)} ticks, "
+            f"{self.timestamps[0]} - {self.timestamps[-1]}, VWAP:{self.vwap:.2f})"
+        )
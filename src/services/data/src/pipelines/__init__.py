@@ -3,6 +3,6 @@ Data pipeline components for processing and transforming financial data
 """
 
 from .builder import PipelineBuilder
-from .executor import PipelineExecutor
+from .executor import PipelineExecutor, merge_outputs
 
-__all__ = ["PipelineBuilder", "PipelineExecutor"]
+__all__ = ["PipelineBuilder", "PipelineExecutor", "merge_outputs"]
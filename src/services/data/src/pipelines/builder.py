@@ -119,17 +119,51 @@ class PipelineBuilder(Component):
         logger.debug(f"Added custom processor '{processor_name}' to pipeline")
         return self
 
-    def build(self) -> PipelineExecutor:
+    def named(
+        self, name: str, depends_on: Optional[List[Union[str, int]]] = None
+    ) -> "PipelineBuilder":
+        """
+        Name the most recently added step and optionally declare its dependencies.
+
+        Declaring dependencies on any step makes the built pipeline run as a
+        DAG, with independent steps executed concurrently.
+
+        Args:
+            name: Unique step name
+            depends_on: Names or indices of steps whose output this step consumes;
+                an empty list means the step reads the pipeline input
+
+        Returns:
+            Self for method chaining
+        """
+        if not self.steps:
+            raise ValueError("Add a step before naming it")
+        self.steps[-1]["name"] = name
+        if depends_on is not None:
+            self.steps[-1]["depends_on"] = list(depends_on)
+        logger.debug(f"Named pipeline step '{name}' (depends_on={depends_on})")
+        return self
+
+    def build(
+        self,
+        max_workers: Optional[int] = None,
+        merge: Optional[Callable[[List[Any]], Any]] = None,
+    ) -> PipelineExecutor:
         """
         Build and return a pipeline executor.
 
+        Args:
+            max_workers: Thread pool size when steps declare dependencies
+            merge: Custom merge for parallel branch outputs
+
         Returns:
             A configured PipelineExecutor ready to process data
         """
         if not self.steps:
             logger.warning("Building empty pipeline with no processing steps")
 
-        executor = PipelineExecutor(self.steps)
+        options = {"merge": merge} if merge is not None else {}
+        executor = PipelineExecutor(self.steps, max_workers=max_workers, **options)
         logger.debug(f"Built pipeline with {len(self.steps)} steps")
         return executor
 
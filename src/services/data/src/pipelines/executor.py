@@ -3,9 +3,12 @@ Data pipeline executor for running data processing workflows
 """
 
 import importlib
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from typing import Any, Callable, Dict, List, Optional, Union
 
+import pandas as pd
 from framework.base.component import Component
 from framework.common.exceptions import DataProcessingError, InvalidPipelineError
 from loguru import logger
@@ -13,26 +16,141 @@ from loguru import logger
 logger = logger.opt(colors=True)
 
 
+def merge_outputs(outputs: List[Any]) -> Any:
+    """
+    Merge the outputs of parallel pipeline branches, in step order.
+
+    DataFrames are joined column-wise on their index, with later branches
+    overriding columns of the same name; dicts are merged the same way.
+    Anything else is returned as a list.
+
+    Args:
+        outputs: Branch outputs in step order
+
+    Returns:
+        Merged output
+    """
+    if len(outputs) == 1:
+        return outputs[0]
+
+    if all(isinstance(output, pd.DataFrame) for output in outputs):
+        merged = pd.concat(outputs, axis=1)
+        return merged.loc[:, ~merged.columns.duplicated(keep="last")]
+
+    if all(isinstance(output, dict) for output in outputs):
+        merged = {}
+        for output in outputs:
+            merged.update(output)
+        return merged
+
+    return list(outputs)
+
+
 class PipelineExecutor(Component):
     """
     Executor that runs a configured data processing pipeline.
 
     Takes the pipeline configuration from a PipelineBuilder and
     processes data through each step in sequence.
+
+    Processors are created once per step, on first use, and reused for
+    every later execution.
+
+    If any step declares ``depends_on`` (a list of step names or indices),
+    the pipeline runs as a DAG instead: steps without dependencies receive
+    the pipeline input, other steps receive the output of their
+    dependencies (merged with ``merge`` when there are several), and steps
+    whose dependencies are done run concurrently on a thread pool, which
+    suits NumPy/pandas work that releases the GIL. The result is the merged
+    output of the steps nothing depends on. Branches share their input
+    object, so processors in parallel branches must not modify it in place.
     """
 
-    def __init__(self, steps: List[Dict[str, Any]]):
+    def __init__(
+        self,
+        steps: List[Dict[str, Any]],
+        max_workers: Optional[int] = None,
+        merge: Callable[[List[Any]], Any] = merge_outputs,
+    ):
         """
         Initialize the pipeline executor.
 
         Args:
             steps: List of processing steps to execute
+            max_workers: Thread pool size for DAG mode (defaults to the widest possible fan-out)
+            merge: Combines the outputs of several branches, in step order
         """
         super().__init__()
         self.steps = steps
+        self.merge = merge
+        self._names = [self._step_name(i, step) for i, step in enumerate(steps)]
+        self._dependencies = self._resolve_dependencies()
         self._validate_pipeline()
+        self._processors: List[Any] = [None] * len(steps)
+        self._processor_lock = threading.Lock()
+        self._max_workers = max_workers
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+        self.step_timings: Dict[str, Dict[str, float]] = {}
         logger.debug(f"Initialized pipeline executor with {len(steps)} steps")
 
+    @staticmethod
+    def _step_name(index: int, step: Dict[str, Any]) -> str:
+        return step.get("name") or f"{index}:{step.get('type', 'unknown')}"
+
+    @property
+    def is_dag(self) -> bool:
+        """Whether any step declares dependencies."""
+        return self._dependencies is not None
+
+    def _resolve_dependencies(self) -> Optional[List[List[int]]]:
+        """
+        Map each step's ``depends_on`` entries to step indices.
+
+        Returns:
+            Per-step dependency indices, or None for a purely sequential pipeline
+
+        Raises:
+            InvalidPipelineError: If a dependency is unknown or the steps form a cycle
+        """
+        if not any("depends_on" in step for step in self.steps):
+            return None
+
+        if len(set(self._names)) != len(self._names):
+            raise InvalidPipelineError("Step names must be unique in a DAG pipeline")
+        index_by_name = {name: i for i, name in enumerate(self._names)}
+
+        dependencies = []
+        for i, step in enumerate(self.steps):
+            resolved = []
+            for dep in step.get("depends_on") or []:
+                if isinstance(dep, int) and 0 <= dep < len(self.steps):
+                    resolved.append(dep)
+                elif dep in index_by_name:
+                    resolved.append(index_by_name[dep])
+                else:
+                    raise InvalidPipelineError(
+                        f"Step {i} ({self._names[i]}) depends on unknown step {dep!r}"
+                    )
+            dependencies.append(resolved)
+
+        # Kahn's algorithm: every step must become ready eventually
+        remaining = [len(deps) for deps in dependencies]
+        ready = [i for i, count in enumerate(remaining) if count == 0]
+        visited = 0
+        while ready:
+            done = ready.pop()
+            visited += 1
+            for i, deps in enumerate(dependencies):
+                if done in deps:
+                    remaining[i] -= deps.count(done)
+                    if remaining[i] == 0:
+                        ready.append(i)
+        if visited != len(self.steps):
+            raise InvalidPipelineError("Pipeline steps contain a dependency cycle")
+
+        return dependencies
+
     def _validate_pipeline(self) -> None:
         """
         Validate the pipeline configuration.
@@ -128,6 +246,113 @@ class PipelineExecutor(Component):
         else:
             raise InvalidPipelineError(f"Unknown step type: {step_type}")
 
+    def _get_processor(self, index: int) -> Any:
+        """
+        Return the processor for a step, creating it on first use.
+
+        Args:
+            index: Step index
+
+        Returns:
+            Processor instance
+        """
+        processor = self._processors[index]
+        if processor is None:
+            with self._processor_lock:
+                processor = self._processors[index]
+                if processor is None:
+                    processor = self._create_processor(self.steps[index])
+                    self._processors[index] = processor
+        return processor
+
+    def _run_step(self, index: int, data: Any) -> Any:
+        """Run one step on its input and record how long it took."""
+        step_start = time.perf_counter()
+        processor = self._get_processor(index)
+        result = (
+            processor.process(data)
+            if hasattr(processor, "process")
+            else processor(data)
+        )
+        step_duration = time.perf_counter() - step_start
+        self._record_timing(self._names[index], step_duration)
+        logger.debug(f"Step {self._names[index]} completed in {step_duration:.3f}s")
+        return result
+
+    def _record_timing(self, name: str, duration: float) -> None:
+        with self._processor_lock:
+            stats = self.step_timings.setdefault(
+                name, {"count": 0, "total": 0.0, "max": 0.0, "last": 0.0}
+            )
+            stats["count"] += 1
+            stats["total"] += duration
+            stats["max"] = max(stats["max"], duration)
+            stats["last"] = duration
+
+    def get_step_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get per-step timing statistics, slowest steps first.
+
+        Returns:
+            Dict of step name to count, total, mean, max and last duration in seconds
+        """
+        with self._processor_lock:
+            stats = {
+                name: {**timing, "mean": timing["total"] / timing["count"]}
+                for name, timing in self.step_timings.items()
+            }
+        return dict(sorted(stats.items(), key=lambda item: item[1]["total"], reverse=True))
+
+    def _execute_sequential(self, data: Any) -> Any:
+        result = data
+        for i, step in enumerate(self.steps):
+            logger.debug(
+                f"Executing pipeline step {i+1}/{len(self.steps)} ({step['type']})"
+            )
+            result = self._run_step(i, result)
+        return result
+
+    def _execute_dag(self, data: Any) -> Any:
+        dependencies = self._dependencies
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self._max_workers or len(self.steps),
+                    thread_name_prefix="pipeline-step",
+                )
+            pool = self._pool
+
+        outputs: Dict[int, Any] = {}
+        pending = set(range(len(self.steps)))
+        running: Dict[Future, int] = {}
+
+        def submit_ready() -> None:
+            for i in sorted(pending):
+                if all(dep in outputs for dep in dependencies[i]):
+                    deps = dependencies[i]
+                    step_input = (
+                        data if not deps else self.merge([outputs[dep] for dep in deps])
+                    )
+                    running[pool.submit(self._run_step, i, step_input)] = i
+                    pending.discard(i)
+
+        submit_ready()
+        try:
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    outputs[running.pop(future)] = future.result()
+                submit_ready()
+        except Exception:
+            for future in running:
+                future.cancel()
+            raise
+
+        # The result is whatever no other step consumed
+        consumed = {dep for deps in dependencies for dep in deps}
+        sinks = [i for i in range(len(self.steps)) if i not in consumed]
+        return self.merge([outputs[i] for i in sinks])
+
     def execute(self, data: Any) -> Any:
         """
         Execute the pipeline on the input data.
@@ -145,32 +370,15 @@ class PipelineExecutor(Component):
             logger.debug("Executing empty pipeline (no-op)")
             return data
 
-        result = data
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
-            for i, step in enumerate(self.steps):
-                step_start = time.time()
-                step_type = step["type"]
-
-                logger.debug(
-                    f"Executing pipeline step {i+1}/{len(self.steps)} ({step_type})"
-                )
-
-                # Create and execute the processor
-                processor = self._create_processor(step)
-                result = (
-                    processor.process(result)
-                    if hasattr(processor, "process")
-                    else processor(result)
-                )
-
-                step_duration = time.time() - step_start
-                logger.debug(
-                    f"Step {i+1} ({step_type}) completed in {step_duration:.3f}s"
-                )
+            if self.is_dag:
+                result = self._execute_dag(data)
+            else:
+                result = self._execute_sequential(data)
 
-            total_duration = time.time() - start_time
+            total_duration = time.perf_counter() - start_time
             logger.info(f"Pipeline execution completed in {total_duration:.3f}s")
 
             return result
@@ -179,6 +387,13 @@ class PipelineExecutor(Component):
             logger.error(f"Error executing pipeline: {str(e)}")
             raise DataProcessingError(f"Pipeline execution failed: {str(e)}")
 
+    def close(self) -> None:
+        """Shut down the DAG thread pool, if one was started."""
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+
     def __call__(self, data: Any) -> Any:
         """
         Call operator for executing the pipeline.
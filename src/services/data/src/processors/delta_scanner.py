@@ -12,11 +12,16 @@ Phase: AI Enhancement Plan Phase 1 - Data Preparation
 
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
 from decimal import Decimal
 from dataclasses import dataclass
 from enum import Enum
 
+import numpy as np
+
+if TYPE_CHECKING:
+    from models.tick import TickBatch
+
 logger = logging.getLogger(__name__)
 
 
@@ -164,18 +169,21 @@ class DeltaScanner:
     
     def scan_ticks(
         self,
-        ticks: List[Dict],
+        ticks: Union[List[Dict], "TickBatch"],
         price_key: str = 'last'
     ) -> List[PriceChange]:
         """Scan multiple ticks for price changes.
         
         Args:
-            ticks: List of tick dictionaries
+            ticks: List of tick dictionaries, or a TickBatch
             price_key: Key to extract price from tick dict (default: 'last')
             
         Returns:
             List of detected price changes
         """
+        if hasattr(ticks, 'prices'):
+            return self.scan_batch(ticks)
+
         changes = []
         
         for tick in ticks:
@@ -192,6 +200,76 @@ class DeltaScanner:
         
         return changes
     
+    def scan_batch(self, batch: "TickBatch") -> List[PriceChange]:
+        """Scan a columnar TickBatch for price changes.
+        
+        Deltas, directions and micro-change flags are computed over the whole
+        price array at once; results match calling scan_tick per tick, except
+        that arithmetic is done in float64 rather than Decimal.
+        
+        Args:
+            batch: TickBatch of trades for one symbol
+            
+        Returns:
+            List of detected price changes
+        """
+        prices = batch.prices
+        if len(prices) == 0:
+            return []
+
+        if self.last_price is None:
+            self.last_price = Decimal(repr(float(prices[0])))
+            prices = prices[1:]
+            timestamps = batch.timestamps[1:]
+        else:
+            timestamps = batch.timestamps
+        if len(prices) == 0:
+            return []
+
+        previous = np.empty_like(prices)
+        previous[0] = float(self.last_price)
+        previous[1:] = prices[:-1]
+
+        delta = prices - previous
+        # Tolerance so a delta of exactly min_change (exact in Decimal) still counts
+        moved = np.abs(delta) >= float(self.min_change) * (1 - 1e-9)
+        direction = np.where(moved, np.sign(delta), 0).astype(np.int8)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            delta_pct = np.where(previous != 0, delta / previous * 100, 0.0)
+        is_micro = np.abs(delta_pct) < self.micro_threshold
+
+        n = len(prices)
+        self.total_changes += n
+        self.micro_changes += int(is_micro.sum())
+        self.up_changes += int((direction > 0).sum())
+        self.down_changes += int((direction < 0).sum())
+        self.neutral_changes += int((direction == 0).sum())
+
+        directions = {1: PriceDirection.UP, -1: PriceDirection.DOWN, 0: PriceDirection.NEUTRAL}
+        times = timestamps.astype('datetime64[us]').tolist()
+        new_prices = [Decimal(repr(p)) for p in prices.tolist()]
+        old_price = self.last_price
+        changes = []
+        for i, (d, pct, micro) in enumerate(
+            zip(direction.tolist(), delta_pct.tolist(), is_micro.tolist())
+        ):
+            new_price = new_prices[i]
+            changes.append(PriceChange(
+                timestamp=times[i],
+                symbol=batch.symbol,
+                old_price=old_price,
+                new_price=new_price,
+                delta=new_price - old_price,
+                delta_pct=pct,
+                direction=directions[d],
+                is_micro=micro
+            ))
+            old_price = new_price
+
+        self.last_price = old_price
+        self.changes.extend(changes)
+        return changes
+
     def get_binary_sequence(self, max_length: Optional[int] = None) -> str:
         """Get binary sequence of price changes for BTR encoding.
         
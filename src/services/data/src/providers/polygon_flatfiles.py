@@ -1,9 +1,72 @@
-"""Polygon Flat Files (S3) helper functions."""
+"""Polygon Flat Files (S3) helper functions.
+
+Flat files are gzipped CSVs (one per day and data type). Everything here
+streams: objects are decompressed incrementally and parsed in fixed-size
+blocks with explicit column types, so memory stays bounded by the block
+size rather than the file size. `flatfile_to_parquet` writes
+ticker/date-partitioned Parquet and `flatfile_to_ohlcv` feeds aggregate
+files to the bulk OHLCV loader.
+"""
 from __future__ import annotations
-from typing import Any, Dict, List, Optional, Tuple
-import os, gzip, io
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Tuple
+import gzip
+import io
+import os
+import re
+import time
+
+import numpy as np
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+    import pyarrow.dataset as pads
+except ImportError:  # pragma: no cover
+    pa = None  # type: ignore
 
 BucketName = "flatfiles"
+GZIP_MAGIC = b"\x1f\x8b"
+DEFAULT_BLOCK_SIZE = 4 << 20  # bytes of CSV parsed per batch
+_OHLCV_COLUMNS = ("open", "high", "low", "close", "volume")
+
+# Column types across stocks/options/crypto/forex trades, quotes and aggregates.
+# Sizes are float because crypto volumes are fractional; ids and condition
+# lists stay strings. Columns missing from a file are ignored.
+FLATFILE_COLUMN_TYPES: Dict[str, str] = {
+    "ticker": "string",
+    "volume": "float64",
+    "open": "float64",
+    "close": "float64",
+    "high": "float64",
+    "low": "float64",
+    "window_start": "int64",
+    "transactions": "int64",
+    "conditions": "string",
+    "correction": "int32",
+    "exchange": "int32",
+    "id": "string",
+    "participant_timestamp": "int64",
+    "price": "float64",
+    "sequence_number": "int64",
+    "sip_timestamp": "int64",
+    "size": "float64",
+    "tape": "int32",
+    "trf_id": "int64",
+    "trf_timestamp": "int64",
+    "ask_exchange": "int32",
+    "ask_price": "float64",
+    "ask_size": "float64",
+    "bid_exchange": "int32",
+    "bid_price": "float64",
+    "bid_size": "float64",
+    "indicators": "string",
+}
+
+# Without a date in the key, the first column present derives the date partition (ns since epoch)
+TIMESTAMP_COLUMNS = ("window_start", "sip_timestamp", "participant_timestamp")
+# Trading dates follow the exchange calendar, so 19:59 ET post-market prints stay on their session day
+MARKET_TIMEZONE = "America/New_York"
 
 
 def list_objects(s3_client, prefix: str, max_items: int) -> Dict[str, Any]:
@@ -26,17 +89,61 @@ def list_objects(s3_client, prefix: str, max_items: int) -> Dict[str, Any]:
     return {"ok": True, "items": items, "count": len(items)}
 
 
+class _Replay(io.RawIOBase):
+    """Raw stream that returns already-consumed bytes before the rest of `body`."""
+
+    def __init__(self, prefix: bytes, body: Any):
+        self._prefix = prefix
+        self._body = body
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        if self._prefix:
+            n = min(len(buffer), len(self._prefix))
+            buffer[:n] = self._prefix[:n]
+            self._prefix = self._prefix[n:]
+            return n
+        chunk = self._body.read(len(buffer))
+        buffer[: len(chunk)] = chunk
+        return len(chunk)
+
+    def close(self) -> None:
+        close = getattr(self._body, "close", None)
+        if close:
+            close()
+        super().close()
+
+
+def open_flatfile(source: str, s3_client=None) -> Tuple[io.BufferedReader, bool]:
+    """Open an S3 key (when `s3_client` is given) or local path as a buffered byte stream.
+
+    Nothing is read beyond the first two bytes, which decide whether the
+    content is gzipped. Returns (stream, is_gzip); the caller closes it.
+    """
+    body = s3_client.get_object(Bucket=BucketName, Key=source)["Body"] if s3_client else open(source, "rb")
+    prefix = body.read(2)
+    return io.BufferedReader(_Replay(prefix, body), buffer_size=64 << 10), prefix == GZIP_MAGIC
+
+
 def sample_object(s3_client, key: str, n: int, include_header: bool) -> Dict[str, Any]:
     if not s3_client:
         return {"ok": False, "error": "missing s3 client"}
-    obj = s3_client.get_object(Bucket=BucketName, Key=key)
-    body = obj["Body"].read()
-    try:
-        with gzip.GzipFile(fileobj=io.BytesIO(body)) as gz:
-            text = gz.read().decode("utf-8", errors="replace")
-    except Exception:  # noqa: BLE001
-        text = body.decode("utf-8", errors="replace")
-    lines = text.splitlines()
+    stream, is_gzip = open_flatfile(key, s3_client)
+    wanted = max(1, n) + (0 if include_header else 1)
+    with stream:
+        # Decompress only as much as the requested lines need
+        raw = gzip.GzipFile(fileobj=stream) if is_gzip else stream
+        text = io.TextIOWrapper(raw, encoding="utf-8", errors="replace", newline="")
+        lines: List[str] = []
+        try:
+            for line in text:
+                lines.append(line.rstrip("\r\n"))
+                if len(lines) >= wanted:
+                    break
+        except (OSError, EOFError):  # truncated or corrupt gzip: keep what decoded
+            pass
     if not include_header and lines:
         lines = lines[1:]
     out_lines = lines[: max(1, n)]
@@ -50,3 +157,177 @@ def download_object(s3_client, key: str, dest_abs: str) -> Tuple[bool, Dict[str,
     s3_client.download_file(BucketName, key, dest_abs)
     size = os.path.getsize(dest_abs) if os.path.exists(dest_abs) else None
     return True, {"ok": True, "key": key, "path": dest_abs, "size": size}
+
+
+def iter_flatfile_batches(
+    source: str,
+    s3_client=None,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    column_types: Optional[Mapping[str, str]] = None,
+) -> Iterator["pa.RecordBatch"]:
+    """Yield Arrow record batches of about `block_size` CSV bytes each.
+
+    Decompression and parsing both run incrementally in Arrow's native
+    readers; only one block is held at a time.
+    """
+    if pa is None:
+        raise ImportError("pyarrow is required for flat file streaming")
+    types = {name: pa.type_for_alias(alias) for name, alias in (column_types or FLATFILE_COLUMN_TYPES).items()}
+    stream, is_gzip = open_flatfile(source, s3_client)
+    native = pa.PythonFile(stream, mode="r")
+    if is_gzip:
+        native = pa.CompressedInputStream(native, "gzip")
+    try:
+        reader = pacsv.open_csv(
+            native,
+            read_options=pacsv.ReadOptions(block_size=block_size),
+            convert_options=pacsv.ConvertOptions(column_types=types, strings_can_be_null=True),
+        )
+        for batch in reader:
+            if batch.num_rows:
+                yield batch
+    finally:
+        native.close()
+        stream.close()
+
+
+def _date_from_key(source: str) -> Optional[str]:
+    match = re.search(r"(\d{4}-\d{2}-\d{2})", os.path.basename(source))
+    return match.group(1) if match else None
+
+
+def _with_date(batch: "pa.RecordBatch", key_date: Optional[str]) -> "pa.RecordBatch":
+    """Append a date32 `date` column: the key's trading date, else the New York date of the first timestamp column."""
+    if key_date is not None:
+        return batch.append_column("date", pa.array(np.full(batch.num_rows, np.datetime64(key_date, "D")), pa.date32()))
+    for column in TIMESTAMP_COLUMNS:
+        if column in batch.schema.names:
+            ts = pc.cast(batch.column(column), pa.timestamp("ns", MARKET_TIMEZONE))
+            return batch.append_column("date", pc.cast(pc.local_timestamp(ts), pa.date32()))
+    raise ValueError("flat file has no timestamp column and its key has no date")
+
+
+def flatfile_to_parquet(
+    source: str,
+    dest_dir: str,
+    s3_client=None,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    max_open_files: int = 128,
+    min_rows_per_group: int = 0,
+) -> Dict[str, Any]:
+    """Stream a flat file into Hive-partitioned Parquet: dest_dir/ticker=X/date=YYYY-MM-DD/.
+
+    Rows land in the key's trading date (one file per session), or the New
+    York date of their timestamp when the key has none. Each partition the
+    file writes to is cleared first, so re-ingesting a day replaces its
+    parts even if the block layout changed, and leaves other days alone;
+    keep one `dest_dir` per data type. Peak memory is a few blocks
+    in flight plus up to `min_rows_per_group` buffered rows per open
+    partition file (0 writes each block's rows straight out; flat files
+    are sorted by ticker, so few files are open at once anyway).
+    """
+    if pa is None:
+        return {"ok": False, "error": "pyarrow not installed"}
+    started = time.perf_counter()
+    key_date = _date_from_key(source)
+    batches = iter_flatfile_batches(source, s3_client, block_size)
+    try:
+        first = _with_date(next(batches), key_date)
+    except StopIteration:
+        return {"ok": True, "key": source, "rows": 0, "files": 0, "bytes": 0, "seconds": 0.0, "rows_per_sec": 0.0}
+
+    counts = {"rows": 0}
+    written: List[Any] = []
+
+    def dated() -> Iterator["pa.RecordBatch"]:
+        counts["rows"] += first.num_rows
+        yield first
+        for batch in batches:
+            batch = _with_date(batch, key_date)
+            counts["rows"] += batch.num_rows
+            yield batch
+
+    stem = os.path.basename(source).split(".")[0] or "part"
+    pads.write_dataset(
+        dated(),
+        dest_dir,
+        schema=first.schema,
+        format="parquet",
+        partitioning=pads.partitioning(
+            pa.schema([("ticker", pa.string()), ("date", pa.date32())]), flavor="hive"
+        ),
+        basename_template=f"{stem}-{{i}}.parquet",
+        existing_data_behavior="delete_matching",
+        max_open_files=max_open_files,
+        min_rows_per_group=min_rows_per_group,
+        file_visitor=written.append,
+    )
+    seconds = time.perf_counter() - started
+    rows = counts["rows"]
+    return {
+        "ok": True,
+        "key": source,
+        "rows": rows,
+        "files": len(written),
+        "bytes": sum(f.size for f in written if f.size is not None),
+        "seconds": seconds,
+        "rows_per_sec": rows / seconds if seconds else 0.0,
+    }
+
+
+def flatfile_to_ohlcv(
+    source: str,
+    upsert: Optional[Callable[[str, str, str, Mapping[str, Any]], int]] = None,
+    s3_client=None,
+    interval: str = "1m",
+    provider: str = "polygon",
+    block_size: int = DEFAULT_BLOCK_SIZE,
+) -> Dict[str, Any]:
+    """Stream a minute/day aggregates flat file into the OHLCV table, one upsert per ticker per block.
+
+    `upsert(provider, ticker, interval, columns)` defaults to
+    `store.bulk_upsert_ohlcv`, which takes the epoch-second `ts` and OHLCV
+    arrays directly. Rows missing the ticker, timestamp or any OHLCV value
+    are skipped and counted.
+    """
+    if pa is None:
+        return {"ok": False, "error": "pyarrow not installed"}
+    if upsert is None:
+        from store import bulk_upsert_ohlcv as upsert  # type: ignore
+    started = time.perf_counter()
+    rows = written = skipped = 0
+    tickers = set()
+    required = ("ticker", "window_start", *_OHLCV_COLUMNS)
+    for batch in iter_flatfile_batches(source, s3_client, block_size):
+        if "window_start" not in batch.schema.names:
+            return {"ok": False, "error": "not an aggregates flat file (no window_start column)"}
+        rows += batch.num_rows
+        if any(batch.column(name).null_count for name in required):
+            valid = pc.is_valid(batch.column("ticker"))
+            for name in required[1:]:
+                valid = pc.and_(valid, pc.is_valid(batch.column(name)))
+            before = batch.num_rows
+            batch = batch.filter(valid)
+            skipped += before - batch.num_rows
+        symbols = batch.column("ticker").to_numpy(zero_copy_only=False)
+        ts = batch.column("window_start").to_numpy() // 1_000_000_000
+        columns = {name: batch.column(name).to_numpy() for name in _OHLCV_COLUMNS}
+        names, inverse = np.unique(symbols, return_inverse=True)
+        order = np.argsort(inverse, kind="stable")
+        bounds = np.searchsorted(inverse[order], np.arange(len(names) + 1))
+        for i, ticker in enumerate(names):
+            index = order[bounds[i] : bounds[i + 1]]
+            group = {"ts": ts[index], **{name: values[index] for name, values in columns.items()}}
+            written += upsert(provider, str(ticker), interval, group)
+            tickers.add(str(ticker))
+    seconds = time.perf_counter() - started
+    return {
+        "ok": True,
+        "key": source,
+        "rows": rows,
+        "written": written,
+        "skipped": skipped,
+        "tickers": len(tickers),
+        "seconds": seconds,
+        "rows_per_sec": rows / seconds if seconds else 0.0,
+    }
@@ -1,16 +1,31 @@
 """
-Dataset splitting helpers: create 80/10/10 time-based splits from managed CSVs.
+Dataset splitting helpers.
+
+`split_managed_csv` creates 80/10/10 time-based splits from managed CSVs.
+
+For walk-forward and purged k-fold evaluation, `walk_forward_folds` and
+`purged_kfold` compute folds as row ranges over one time-sorted dataset,
+and `SplitDataset` hands out slices of a single in-memory DataFrame or
+memory-mapped Parquet/Arrow table for them, so no fold is serialized.
+Only fold boundaries are persisted (`fold_splits` /
+`write_fold_manifest`, or `store.materialize_splits`).
 """
 from __future__ import annotations
 
+import json
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Any, Iterator, List, Optional, Sequence, Tuple, Union
 
+import numpy as np
 import pandas as pd
 from loguru import logger
 
-from .validation import compute_time_splits
-from .active_assets import csv_path_for
+from validation import compute_time_splits
+
+# A fold size: a number of rows or a time span ("365D", pd.Timedelta)
+Size = Union[int, str, pd.Timedelta]
+Range = Tuple[int, int]
 
 
 def _dt_col(df: pd.DataFrame) -> Optional[str]:
@@ -22,6 +37,8 @@ def _dt_col(df: pd.DataFrame) -> Optional[str]:
 
 
 def split_managed_csv(source: str, symbol: str, interval: str, out_dir: Optional[Path] = None) -> List[Path]:
+    from active_assets import csv_path_for  # type: ignore
+
     src = csv_path_for(source, symbol, interval)
     if not src.exists():
         return []
@@ -45,3 +62,298 @@ def split_managed_csv(source: str, symbol: str, interval: str, out_dir: Optional
         out_paths.append(p)
     logger.info(f"Wrote splits for {source}:{symbol}:{interval} -> {len(out_paths)} files")
     return out_paths
+
+
+@dataclass(frozen=True)
+class Fold:
+    """One fold as half-open row ranges over a time-sorted dataset.
+
+    `train` may hold several ranges (purged k-fold trains on both sides of
+    the test block).
+    """
+
+    index: int
+    train: Tuple[Range, ...]
+    test: Range
+
+    @property
+    def train_rows(self) -> int:
+        return sum(stop - start for start, stop in self.train)
+
+    @property
+    def test_rows(self) -> int:
+        return self.test[1] - self.test[0]
+
+    def train_indices(self) -> np.ndarray:
+        return np.concatenate([np.arange(start, stop) for start, stop in self.train])
+
+    def test_indices(self) -> np.ndarray:
+        return np.arange(*self.test)
+
+
+def _as_times(times: Any) -> np.ndarray:
+    """Sorted datetimes (Series, Index, array, Arrow column or int64 ns) as int64 nanoseconds."""
+    if isinstance(times, np.ndarray) and times.dtype == np.int64:
+        ns = times
+    else:
+        if not isinstance(times, (pd.Series, pd.Index, np.ndarray)):
+            times = times.to_numpy()  # Arrow array or chunked array
+        values = pd.DatetimeIndex(pd.to_datetime(times))
+        if values.tz is not None:
+            values = values.tz_convert("UTC").tz_localize(None)
+        ns = values.as_unit("ns").asi8
+    if len(ns) > 1 and not (np.diff(ns) >= 0).all():
+        raise ValueError("times must be sorted ascending")
+    return ns
+
+
+def _is_rows(size: Size) -> bool:
+    return isinstance(size, (int, np.integer)) and not isinstance(size, bool)
+
+
+def _before(times: np.ndarray, boundary: int, gap: Size) -> int:
+    """First row of the `gap` (rows or time span) that ends at `boundary`."""
+    if _is_rows(gap):
+        return max(0, boundary - int(gap))
+    if boundary >= len(times):
+        return boundary
+    return int(np.searchsorted(times, times[boundary] - pd.Timedelta(gap).value, "left"))
+
+
+def _after(times: np.ndarray, boundary: int, gap: Size) -> int:
+    """First row past the `gap` (rows or time span) that starts at `boundary`."""
+    if _is_rows(gap):
+        return min(len(times), boundary + int(gap))
+    if boundary <= 0:
+        return boundary
+    return int(np.searchsorted(times, times[boundary - 1] + pd.Timedelta(gap).value, "right"))
+
+
+def walk_forward_folds(
+    times: Any,
+    train_size: Size,
+    test_size: Size,
+    step: Optional[Size] = None,
+    expanding: bool = False,
+    purge: Size = 0,
+    max_folds: Optional[int] = None,
+) -> List[Fold]:
+    """Walk-forward folds: train on a window, test on the period right after it, then step forward.
+
+    Args:
+        times: Sorted timestamps of the dataset rows
+        train_size: Training window (rolling) or initial training window (expanding)
+        test_size: Test window
+        step: Distance between consecutive test windows (defaults to test_size)
+        expanding: Keep the training start at the first row instead of rolling it
+        purge: Rows or time span dropped from the end of training before each
+            test window, so labels computed over a horizon cannot leak
+        max_folds: Stop after this many folds
+
+    Sizes are all row counts or all time spans; a time-based test window
+    ending past the data is truncated, a row-based one is dropped.
+    """
+    ts = _as_times(times)
+    n = len(ts)
+    step = test_size if step is None else step
+    by_rows = _is_rows(train_size)
+    if any(_is_rows(s) != by_rows for s in (test_size, step)):
+        raise ValueError("train_size, test_size and step must all be rows or all time spans")
+    if n == 0:
+        return []
+
+    if by_rows:
+        train_size, test_size, step = int(train_size), int(test_size), int(step)
+        if min(train_size, test_size, step) <= 0:
+            raise ValueError("sizes must be positive")
+
+        def bounds(k: int) -> Tuple[int, int, int]:
+            test_start = train_size + k * step
+            return test_start - train_size, test_start, test_start + test_size
+    else:
+        origin = int(ts[0])
+        train_ns, test_ns, step_ns = (pd.Timedelta(s).value for s in (train_size, test_size, step))
+        if min(train_ns, test_ns, step_ns) <= 0:
+            raise ValueError("sizes must be positive")
+
+        def bounds(k: int) -> Tuple[int, int, int]:
+            test_at = origin + train_ns + k * step_ns
+            edges = np.searchsorted(ts, [test_at - train_ns, test_at, test_at + test_ns], "left")
+            return int(edges[0]), int(edges[1]), int(edges[2])
+
+    folds: List[Fold] = []
+    k = 0
+    while max_folds is None or len(folds) < max_folds:
+        train_start, test_start, test_stop = bounds(k)
+        k += 1
+        if test_start >= n or (by_rows and test_stop > n):
+            break
+        test_stop = min(test_stop, n)
+        if expanding:
+            train_start = 0
+        train_stop = _before(ts, test_start, purge)
+        if train_stop <= train_start or test_stop <= test_start:
+            continue
+        folds.append(Fold(len(folds), ((train_start, train_stop),), (test_start, test_stop)))
+    return folds
+
+
+def purged_kfold(times: Any, n_splits: int = 5, purge: Size = 0, embargo: Size = 0) -> List[Fold]:
+    """K contiguous test blocks, each trained on every other row minus purge and embargo gaps.
+
+    Args:
+        times: Sorted timestamps of the dataset rows
+        n_splits: Number of folds
+        purge: Rows or time span dropped from training right before the test block
+        embargo: Rows or time span dropped from training right after the test block
+    """
+    ts = _as_times(times)
+    n = len(ts)
+    if n_splits < 2 or n_splits > n:
+        raise ValueError("n_splits must be between 2 and the number of rows")
+    edges = np.linspace(0, n, n_splits + 1).astype(int)
+    folds: List[Fold] = []
+    for i in range(n_splits):
+        test_start, test_stop = int(edges[i]), int(edges[i + 1])
+        train: List[Range] = []
+        before = _before(ts, test_start, purge)
+        if before > 0:
+            train.append((0, before))
+        after = _after(ts, test_stop, embargo)
+        if after < n:
+            train.append((after, n))
+        folds.append(Fold(i, tuple(train), (test_start, test_stop)))
+    return folds
+
+
+def fold_splits(folds: Sequence[Fold], times: Any) -> List[Tuple[str, pd.Timestamp, pd.Timestamp]]:
+    """Fold boundaries as (split_name, start_ts, end_ts) with inclusive timestamps.
+
+    The format matches `compute_time_splits` and `store.materialize_splits`;
+    names are `fold_000_train` (`fold_000_train_1` for a second training
+    range) and `fold_000_test`.
+    """
+    ts = _as_times(times)
+    out: List[Tuple[str, pd.Timestamp, pd.Timestamp]] = []
+    for fold in folds:
+        for j, (start, stop) in enumerate(fold.train):
+            name = f"fold_{fold.index:03d}_train" + (f"_{j}" if j else "")
+            out.append((name, pd.Timestamp(ts[start]), pd.Timestamp(ts[stop - 1])))
+        out.append((f"fold_{fold.index:03d}_test", pd.Timestamp(ts[fold.test[0]]), pd.Timestamp(ts[fold.test[1] - 1])))
+    return out
+
+
+def folds_from_splits(splits: Sequence[Tuple[str, Any, Any]], times: Any) -> List[Fold]:
+    """Rebuild folds from boundaries produced by `fold_splits` against the same dataset."""
+    ts = _as_times(times)
+    train: dict = {}
+    test: dict = {}
+    for name, start, end in splits:
+        parts = str(name).split("_")
+        if len(parts) < 3 or parts[0] != "fold":
+            continue
+        index = int(parts[1])
+        rng = (
+            int(np.searchsorted(ts, pd.Timestamp(start).value, "left")),
+            int(np.searchsorted(ts, pd.Timestamp(end).value, "right")),
+        )
+        if parts[2] == "test":
+            test[index] = rng
+        else:
+            train.setdefault(index, []).append((int(parts[3]) if len(parts) > 3 else 0, rng))
+    return [
+        Fold(index, tuple(rng for _, rng in sorted(train.get(index, []))), test[index])
+        for index in sorted(test)
+    ]
+
+
+def write_fold_manifest(path: Union[str, Path], folds: Sequence[Fold], times: Any, **meta: Any) -> Path:
+    """Persist fold boundaries (not data) as JSON; extra keyword arguments are stored as metadata."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    splits = [{"split": name, "start": a.isoformat(), "end": b.isoformat()} for name, a, b in fold_splits(folds, times)]
+    path.write_text(json.dumps({**meta, "splits": splits}, indent=2))
+    return path
+
+
+def read_fold_manifest(path: Union[str, Path], times: Any) -> List[Fold]:
+    """Load folds written by `write_fold_manifest` for the same dataset."""
+    data = json.loads(Path(path).read_text())
+    return folds_from_splits([(s["split"], s["start"], s["end"]) for s in data["splits"]], times)
+
+
+class SplitDataset:
+    """One time-sorted dataset that folds are taken from as slices.
+
+    Wraps a pandas DataFrame or a pyarrow Table (e.g. a memory-mapped
+    Parquet or Arrow file). Contiguous ranges are returned as slices of
+    the underlying data (`iloc` / `Table.slice`), never written out.
+    """
+
+    def __init__(self, data: Any, times: Any):
+        self.data = data
+        self.times = _as_times(times)
+        if len(self.times) != len(data):
+            raise ValueError("times and data must have the same length")
+        self._is_arrow = not isinstance(data, pd.DataFrame)
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, time_col: Optional[str] = None) -> "SplitDataset":
+        """Use a DataFrame as-is if sorted by `time_col` (or a DatetimeIndex), else a sorted copy."""
+        col = time_col or (None if isinstance(df.index, pd.DatetimeIndex) else _dt_col(df))
+        times = df.index if col is None else df[col]
+        if not pd.Index(times).is_monotonic_increasing:
+            df = df.sort_values(col) if col is not None else df.sort_index()
+            times = df.index if col is None else df[col]
+        return cls(df, times)
+
+    @classmethod
+    def from_parquet(
+        cls, path: Union[str, Path], time_col: Optional[str] = None, columns: Optional[List[str]] = None
+    ) -> "SplitDataset":
+        """Memory-map a Parquet file (.parquet) or Arrow IPC file (.arrow/.feather) sorted by time."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        path = Path(path)
+        if path.suffix in (".arrow", ".feather", ".ipc"):
+            table = pa.ipc.open_file(pa.memory_map(str(path))).read_all()
+            if columns:
+                table = table.select(columns)
+        else:
+            table = pq.read_table(path, columns=columns, memory_map=True)
+        col = time_col or next((c for c in table.column_names if "date" in c.lower() or "time" in c.lower()), None)
+        if col is None:
+            raise ValueError("datetime column not found")
+        return cls(table, table.column(col))
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def slice(self, start: int, stop: int) -> Any:
+        """Rows [start, stop) without copying."""
+        if self._is_arrow:
+            return self.data.slice(start, stop - start)
+        return self.data.iloc[start:stop]
+
+    def take(self, ranges: Sequence[Range]) -> Any:
+        """Rows of several ranges; a single range is a plain slice."""
+        if len(ranges) == 1:
+            return self.slice(*ranges[0])
+        parts = [self.slice(start, stop) for start, stop in ranges]
+        if self._is_arrow:
+            import pyarrow as pa
+
+            return pa.concat_tables(parts)  # references the same buffers
+        return pd.concat(parts)
+
+    def iter_folds(self, folds: Sequence[Fold]) -> Iterator[Tuple[Fold, Any, Any]]:
+        """Yield (fold, train, test) for each fold."""
+        for fold in folds:
+            yield fold, self.take(fold.train), self.slice(*fold.test)
+
+    def walk_forward(self, train_size: Size, test_size: Size, **kwargs: Any) -> List[Fold]:
+        return walk_forward_folds(self.times, train_size, test_size, **kwargs)
+
+    def purged_kfold(self, n_splits: int = 5, **kwargs: Any) -> List[Fold]:
+        return purged_kfold(self.times, n_splits, **kwargs)
@@ -4,13 +4,23 @@ PostgreSQL storage facade for OHLCV data and dataset splits.
 Tables (TimescaleDB-first schema, compatible with plain Postgres):
   - ohlcv (source, symbol, interval, ts, open, high, low, close, volume, PRIMARY KEY (source, symbol, interval, ts))
   - dataset_splits (source, symbol, interval, split, start_ts, end_ts, created_at)
+
+With TimescaleDB, ohlcv is a compressed hypertable and 1m rows feed the
+ohlcv_5m / ohlcv_1h / ohlcv_1d continuous aggregates (see
+sql/migrations/006_ohlcv_hypertable.sql). read_ohlcv routes reads to the
+coarsest aggregate that divides the requested interval. Refresh policies only
+cover a trailing window, so ensure_schema materializes newly created views
+and bulk_upsert_ohlcv refreshes the windows it backfills.
 """
 from __future__ import annotations
 
+import io
+import re
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 from loguru import logger
 
@@ -47,6 +57,127 @@ DDL = {
 }
 
 
+# Interval stored as raw rows that the continuous aggregates are built from
+BASE_INTERVAL = "1m"
+
+# Continuous aggregates over BASE_INTERVAL rows, coarsest first: (interval, view, bucket seconds)
+OHLCV_AGGREGATES: List[Tuple[str, str, int]] = [
+    ("1d", "ohlcv_1d", 86400),
+    ("1h", "ohlcv_1h", 3600),
+    ("5m", "ohlcv_5m", 300),
+]
+
+# (start_offset, end_offset, schedule_interval) for each aggregate's refresh policy
+_AGGREGATE_POLICIES = {
+    "ohlcv_5m": ("1 day", "5 minutes", "5 minutes"),
+    "ohlcv_1h": ("3 days", "1 hour", "30 minutes"),
+    "ohlcv_1d": ("7 days", "1 day", "1 hour"),
+}
+
+
+def _aggregate_ddl(view: str, bucket_seconds: int) -> List[str]:
+    start_offset, end_offset, schedule = _AGGREGATE_POLICIES[view]
+    return [
+        f"""
+        CREATE MATERIALIZED VIEW IF NOT EXISTS {view}
+        WITH (timescaledb.continuous, timescaledb.materialized_only = false) AS
+        SELECT source, symbol, time_bucket(INTERVAL '{bucket_seconds} seconds', ts) AS bucket,
+               first(open, ts) AS open, max(high) AS high, min(low) AS low,
+               last(close, ts) AS close, sum(volume) AS volume
+        FROM ohlcv
+        WHERE interval = '{BASE_INTERVAL}'
+        GROUP BY source, symbol, bucket
+        WITH NO DATA;
+        """,
+        f"CREATE INDEX IF NOT EXISTS idx_{view}_series ON {view} (source, symbol, bucket DESC);",
+        f"""
+        SELECT add_continuous_aggregate_policy('{view}',
+            start_offset => INTERVAL '{start_offset}',
+            end_offset => INTERVAL '{end_offset}',
+            schedule_interval => INTERVAL '{schedule}',
+            if_not_exists => TRUE);
+        """,
+    ]
+
+
+# Compression settings cannot change once chunks are compressed, so ensure_schema applies them once
+_COMPRESSION_DDL = """
+    ALTER TABLE ohlcv SET (
+        timescaledb.compress,
+        timescaledb.compress_segmentby = 'source, symbol, interval',
+        timescaledb.compress_orderby = 'ts DESC');
+    """
+
+# Applied by ensure_schema only when the timescaledb extension is installed
+TIMESCALE_DDL: List[str] = [
+    """
+    SELECT create_hypertable('ohlcv', 'ts',
+        partitioning_column => 'symbol', number_partitions => 4,
+        chunk_time_interval => INTERVAL '1 day',
+        migrate_data => TRUE, if_not_exists => TRUE);
+    """,
+    _COMPRESSION_DDL,
+    "SELECT add_compression_policy('ohlcv', INTERVAL '7 days', if_not_exists => TRUE);",
+] + [stmt for _, view, seconds in reversed(OHLCV_AGGREGATES) for stmt in _aggregate_ddl(view, seconds)]
+
+# Set to False once a read or refresh finds the aggregate views missing (plain Postgres)
+_aggregates_available: Optional[bool] = None
+
+
+def _sqlstate(error: Exception) -> Optional[str]:
+    return getattr(error, "pgcode", None) or getattr(error, "sqlstate", None)
+
+
+def _is_undefined_table(error: Exception) -> bool:
+    return _sqlstate(error) == "42P01"
+
+
+def _refresh_aggregates(conn: Any, windows: List[Tuple[str, Optional[datetime], Optional[datetime]]]) -> None:
+    """Materialize (view, start, end) windows; None bounds refresh the whole history.
+
+    refresh_continuous_aggregate cannot run inside a transaction block, so
+    the calls run in autocommit mode.
+    """
+    if not windows:
+        return
+    conn.autocommit = True
+    try:
+        with conn.cursor() as cur:
+            for view, start, end in windows:
+                cur.execute(
+                    "CALL refresh_continuous_aggregate(%s, %s::timestamptz, %s::timestamptz)",
+                    (view, start, end),
+                )
+    finally:
+        conn.autocommit = False
+
+
+def backfill_windows(ts_us: np.ndarray, now: Optional[datetime] = None) -> List[Tuple[str, datetime, datetime]]:
+    """Aggregate windows to refresh after writing 1m rows at `ts_us` (epoch microseconds).
+
+    Refresh policies only re-materialize their trailing window and real-time
+    aggregation only covers buckets above the watermark, so rows older than
+    a view's policy start_offset would otherwise never reach it. Windows are
+    widened to whole buckets so partial buckets at either edge are included.
+    """
+    if len(ts_us) == 0:
+        return []
+    now_us = pd.Timestamp(now or datetime.now(timezone.utc)).value // 1000
+    start_us = int(ts_us.min())
+    end_us = int(ts_us.max()) + 60_000_000
+    windows = []
+    for _, view, bucket in OHLCV_AGGREGATES:
+        horizon_us = now_us - pd.Timedelta(_AGGREGATE_POLICIES[view][0]).value // 1000
+        if start_us >= horizon_us:
+            continue
+        width = bucket * 1_000_000
+        lo = start_us // width * width
+        hi = -(-end_us // width) * width
+        windows.append((view, pd.Timestamp(lo, unit="us", tz="UTC").to_pydatetime(),
+                        pd.Timestamp(hi, unit="us", tz="UTC").to_pydatetime()))
+    return windows
+
+
 def ensure_schema() -> None:
     try:
         with get_connection() as conn:
@@ -56,6 +187,309 @@ def ensure_schema() -> None:
             conn.commit()
     except Exception as e:
         logger.warning(f"ensure_schema error: {e}")
+        return
+    try:
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1 FROM pg_extension WHERE extname = 'timescaledb'")
+                if cur.fetchone() is None:
+                    return
+                cur.execute(
+                    "SELECT 1 FROM timescaledb_information.compression_settings "
+                    "WHERE hypertable_name = 'ohlcv' LIMIT 1"
+                )
+                compression_configured = cur.fetchone() is not None
+                views = [view for _, view, _ in OHLCV_AGGREGATES]
+                cur.execute(
+                    "SELECT view_name FROM timescaledb_information.continuous_aggregates "
+                    "WHERE view_name = ANY(%s)",
+                    (views,),
+                )
+                existing = {row[0] for row in cur.fetchall()}
+                for sql in TIMESCALE_DDL:
+                    if sql is _COMPRESSION_DDL and compression_configured:
+                        continue
+                    cur.execute(sql)
+            conn.commit()
+            # Views are created WITH NO DATA; materialize existing history once
+            _refresh_aggregates(conn, [(view, None, None) for view in reversed(views) if view not in existing])
+    except Exception as e:
+        logger.warning(f"ensure_schema timescale setup error: {e}")
+
+
+_INTERVAL_RE = re.compile(r"^(\d+)\s*(m|min|h|d|w)$")
+_UNIT_SECONDS = {"m": 60, "min": 60, "h": 3600, "d": 86400, "w": 604800}
+
+
+def interval_seconds(interval: str) -> Optional[int]:
+    """Parse an interval such as '5m', '4h' or '1d' to seconds; None if unrecognised."""
+    match = _INTERVAL_RE.match(interval.strip().lower())
+    if not match:
+        return None
+    return int(match.group(1)) * _UNIT_SECONDS[match.group(2)]
+
+
+def route_ohlcv_interval(interval: str) -> Optional[Tuple[str, int]]:
+    """Pick the relation to read an interval from.
+
+    Returns (relation, bucket_seconds) for the coarsest continuous aggregate
+    whose bucket divides the interval, ("ohlcv", 60) when only raw 1m rows
+    can build it, or None when the interval isn't a whole number of minutes.
+    """
+    seconds = interval_seconds(interval)
+    if seconds is None or seconds % 60:
+        return None
+    if _aggregates_available is not False:
+        for _, view, bucket in OHLCV_AGGREGATES:
+            if seconds % bucket == 0:
+                return view, bucket
+    return "ohlcv", 60
+
+
+def _fetch_frame(sql: str, params: Tuple) -> pd.DataFrame:
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(sql, params)
+            rows = cur.fetchall()
+    df = pd.DataFrame(rows, columns=["ts", "open", "high", "low", "close", "volume"])
+    df["ts"] = pd.to_datetime(df["ts"], utc=True)
+    return df
+
+
+def _resample(df: pd.DataFrame, seconds: int) -> pd.DataFrame:
+    # Origin matches time_bucket's default so resampled and aggregated bars align
+    out = (
+        df.set_index("ts")
+        .resample(f"{seconds}s", origin=pd.Timestamp("2000-01-03", tz="UTC"), label="left", closed="left")
+        .agg({"open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum"})
+        .dropna(subset=["open"])
+    )
+    return out.reset_index()
+
+
+def read_ohlcv(source: str, symbol: str, interval: str, start: datetime, end: datetime) -> pd.DataFrame:
+    """Read OHLCV bars with ts in [start, end] as a DataFrame (ts, open, high, low, close, volume).
+
+    Higher timeframes are served from the coarsest continuous aggregate that
+    divides the interval (e.g. 4h from ohlcv_1h, 15m from ohlcv_5m) and
+    resampled only when the aggregate is finer than requested. When the
+    aggregate has no rows for the range, raw 1m rows are resampled instead,
+    then rows stored at exactly `interval` are used when no 1m data exists
+    either, e.g. for providers that deliver daily bars directly. Empty frame
+    on error.
+    """
+    global _aggregates_available
+    seconds = interval_seconds(interval)
+    route = route_ohlcv_interval(interval) if interval != BASE_INTERVAL else None
+    try:
+        if route is not None:
+            relation, bucket = route
+            if relation == "ohlcv":
+                sql = (
+                    "SELECT ts, open, high, low, close, volume FROM ohlcv "
+                    "WHERE source=%s AND symbol=%s AND interval=%s AND ts BETWEEN %s AND %s ORDER BY ts ASC"
+                )
+                params: Tuple = (source, symbol, BASE_INTERVAL, start, end)
+            else:
+                sql = (
+                    f"SELECT bucket, open, high, low, close, volume FROM {relation} "
+                    "WHERE source=%s AND symbol=%s AND bucket BETWEEN %s AND %s ORDER BY bucket ASC"
+                )
+                params = (source, symbol, start, end)
+            try:
+                df = _fetch_frame(sql, params)
+            except Exception as e:
+                if relation == "ohlcv" or not _is_undefined_table(e):
+                    raise
+                logger.info(f"OHLCV aggregates unavailable, reading raw rows: {e}")
+                _aggregates_available = False
+                return read_ohlcv(source, symbol, interval, start, end)
+            if not df.empty:
+                return _resample(df, seconds) if bucket < seconds else df
+            if relation != "ohlcv":
+                df = _fetch_frame(
+                    "SELECT ts, open, high, low, close, volume FROM ohlcv "
+                    "WHERE source=%s AND symbol=%s AND interval=%s AND ts BETWEEN %s AND %s ORDER BY ts ASC",
+                    (source, symbol, BASE_INTERVAL, start, end),
+                )
+                if not df.empty:
+                    return _resample(df, seconds)
+
+        sql = (
+            "SELECT ts, open, high, low, close, volume FROM ohlcv "
+            "WHERE source=%s AND symbol=%s AND interval=%s AND ts BETWEEN %s AND %s ORDER BY ts ASC"
+        )
+        return _fetch_frame(sql, (source, symbol, interval, start, end))
+    except Exception as e:
+        logger.warning(f"read_ohlcv error: {e}")
+        return pd.DataFrame(columns=["ts", "open", "high", "low", "close", "volume"])
+
+
+OHLCV_COLUMNS = ("open", "high", "low", "close", "volume")
+
+# Binary COPY framing: signature, flags and header-extension length, then int16 -1 after the last tuple
+_COPY_SIGNATURE = b"PGCOPY\n\xff\r\n\x00"
+_COPY_HEADER = _COPY_SIGNATURE + b"\x00\x00\x00\x00" + b"\x00\x00\x00\x00"
+_COPY_TRAILER = b"\xff\xff"
+
+# One (ts, open, high, low, close, volume) tuple: field count, then (length, value) per field.
+# Every field is 8 bytes wide, so a whole COPY stream maps onto one numpy structured array.
+_OHLCV_TUPLE = np.dtype(
+    [("nfields", ">i2"), ("ts_len", ">i4"), ("ts", ">i8")]
+    + [item for col in OHLCV_COLUMNS for item in ((f"{col}_len", ">i4"), (col, ">f8"))]
+)
+
+# Postgres timestamps count microseconds from 2000-01-01 UTC
+_PG_EPOCH_US = 946_684_800 * 1_000_000
+
+_STAGE_DDL = (
+    "CREATE TEMP TABLE IF NOT EXISTS ohlcv_stage ("
+    "ts TIMESTAMPTZ, open DOUBLE PRECISION, high DOUBLE PRECISION, low DOUBLE PRECISION, "
+    "close DOUBLE PRECISION, volume DOUBLE PRECISION) ON COMMIT DELETE ROWS"
+)
+
+
+def _epoch_micros(values: Any) -> np.ndarray:
+    """Timestamps as int64 microseconds since the Unix epoch.
+
+    Numeric input is taken as epoch seconds; anything else goes through
+    pd.to_datetime, with naive values treated as UTC.
+    """
+    kind = getattr(getattr(values, "dtype", None), "kind", None)
+    if kind is None:
+        values = np.asarray(values)
+        kind = values.dtype.kind
+    if kind in "iu":
+        return np.asarray(values, dtype=np.int64) * 1_000_000
+    if kind == "f":
+        return np.round(np.asarray(values, dtype=np.float64) * 1_000_000).astype(np.int64)
+    stamps = pd.DatetimeIndex(pd.to_datetime(values, utc=True)).tz_localize(None)
+    return stamps.as_unit("us").asi8
+
+
+def encode_ohlcv_copy(ts_us: np.ndarray, columns: Mapping[str, np.ndarray]) -> bytes:
+    """Encode OHLCV columns as a binary COPY stream for (ts, open, high, low, close, volume).
+
+    NaN is written as a float NaN rather than NULL so every tuple keeps the
+    same width; bulk_upsert_ohlcv turns it back into NULL on insert.
+    """
+    n = len(ts_us)
+    tuples = np.empty(n, dtype=_OHLCV_TUPLE)
+    tuples["nfields"] = 1 + len(OHLCV_COLUMNS)
+    tuples["ts_len"] = 8
+    tuples["ts"] = np.asarray(ts_us, dtype=np.int64) - _PG_EPOCH_US
+    for col in OHLCV_COLUMNS:
+        tuples[f"{col}_len"] = 8
+        tuples[col] = columns[col]
+    return b"".join((_COPY_HEADER, tuples.tobytes(), _COPY_TRAILER))
+
+
+def decode_ohlcv_copy(payload: bytes) -> Dict[str, np.ndarray]:
+    """Decode a binary COPY stream of (ts, open, high, low, close, volume) into columns.
+
+    ts is returned as datetime64[us] (UTC) and the prices/volume as float64,
+    without building a Python object per row. Every field must be non-NULL;
+    readers select COALESCE(col, 'NaN') to guarantee that.
+    """
+    view = memoryview(payload)
+    if bytes(view[: len(_COPY_SIGNATURE)]) != _COPY_SIGNATURE:
+        raise ValueError("not a binary COPY stream")
+    extension = int.from_bytes(view[15:19], "big")
+    offset = 19 + extension
+    n, remainder = divmod(len(payload) - offset - len(_COPY_TRAILER), _OHLCV_TUPLE.itemsize)
+    if remainder or bytes(view[len(payload) - len(_COPY_TRAILER) :]) != _COPY_TRAILER:
+        raise ValueError("unexpected binary COPY layout; expected 6 non-NULL 8-byte fields per row")
+    tuples = np.frombuffer(payload, dtype=_OHLCV_TUPLE, count=n, offset=offset)
+    widths = [tuples[f"{col}_len"] for col in ("ts",) + OHLCV_COLUMNS]
+    if n and ((tuples["nfields"] != 1 + len(OHLCV_COLUMNS)).any() or any((w != 8).any() for w in widths)):
+        raise ValueError("unexpected binary COPY layout; expected 6 non-NULL 8-byte fields per row")
+    out: Dict[str, np.ndarray] = {"ts": (tuples["ts"].astype(np.int64) + _PG_EPOCH_US).astype("datetime64[us]")}
+    for col in OHLCV_COLUMNS:
+        out[col] = tuples[col].astype(np.float64)
+    return out
+
+
+def _copy_in(cur: Any, sql: str, payload: bytes) -> None:
+    if hasattr(cur, "copy_expert"):  # psycopg2
+        cur.copy_expert(sql, io.BytesIO(payload), size=1 << 20)
+    else:  # psycopg3
+        with cur.copy(sql) as copy:
+            copy.write(payload)
+
+
+def _copy_out(cur: Any, sql: str, params: Tuple) -> bytes:
+    if hasattr(cur, "copy_expert"):  # psycopg2 cannot bind parameters in COPY
+        buf = io.BytesIO()
+        query = cur.mogrify(sql, params)
+        cur.copy_expert(query.decode() if isinstance(query, bytes) else query, buf, size=1 << 20)
+        return buf.getvalue()
+    with cur.copy(sql, params) as copy:  # psycopg3
+        return b"".join(bytes(block) for block in copy)
+
+
+def bulk_upsert_ohlcv(source: str, symbol: str, interval: str, columns: Mapping[str, Any]) -> int:
+    """Upsert OHLCV columns with one binary COPY into a staging table and one INSERT ... SELECT.
+
+    `columns` is a DataFrame or mapping with a `ts` column (epoch seconds or
+    datetimes) and any of open/high/low/close/volume as array-likes; missing
+    or non-numeric values are stored as NULL. Later rows win when a
+    timestamp repeats. 1m rows older than the aggregate refresh policies
+    reach are materialized into the continuous aggregates right away (see
+    backfill_windows). Returns the number of rows written, 0 on error.
+    """
+    if columns is None or "ts" not in columns or len(columns["ts"]) == 0:
+        return 0
+    ts_us = _epoch_micros(columns["ts"])
+    n = len(ts_us)
+    values: Dict[str, np.ndarray] = {}
+    for col in OHLCV_COLUMNS:
+        if col not in columns:
+            values[col] = np.full(n, np.nan)
+            continue
+        arr = np.asarray(columns[col])
+        if arr.dtype.kind not in "fiu":
+            arr = pd.to_numeric(pd.Series(arr), errors="coerce").to_numpy()
+        values[col] = arr.astype(np.float64, copy=False)
+
+    # ON CONFLICT cannot touch the same key twice in one statement; keep the last row per ts
+    _, last_first = np.unique(ts_us[::-1], return_index=True)
+    if len(last_first) != n:
+        keep = np.sort(n - 1 - last_first)
+        ts_us = ts_us[keep]
+        values = {col: arr[keep] for col, arr in values.items()}
+
+    payload = encode_ohlcv_copy(ts_us, values)
+    nullif = ", ".join(f"NULLIF({col}, 'NaN')" for col in OHLCV_COLUMNS)
+    sql = (
+        "INSERT INTO ohlcv (source, symbol, interval, ts, open, high, low, close, volume) "
+        f"SELECT %s, %s, %s, ts, {nullif} FROM ohlcv_stage "
+        "ON CONFLICT (source, symbol, interval, ts) DO UPDATE SET "
+        "open=EXCLUDED.open, high=EXCLUDED.high, low=EXCLUDED.low, close=EXCLUDED.close, volume=EXCLUDED.volume"
+    )
+    try:
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(_STAGE_DDL)
+                _copy_in(cur, "COPY ohlcv_stage (ts, open, high, low, close, volume) FROM STDIN (FORMAT binary)", payload)
+                cur.execute(sql, (source, symbol, interval))
+            conn.commit()
+            if interval == BASE_INTERVAL and _aggregates_available is not False:
+                _refresh_backfill(conn, ts_us)
+        return len(ts_us)
+    except Exception as e:
+        logger.warning(f"bulk_upsert_ohlcv error: {e}")
+        return 0
+
+
+def _refresh_backfill(conn: Any, ts_us: np.ndarray) -> None:
+    global _aggregates_available
+    try:
+        _refresh_aggregates(conn, backfill_windows(ts_us))
+    except Exception as e:
+        if _sqlstate(e) in ("42P01", "42883"):  # undefined table / function: no aggregates to refresh
+            _aggregates_available = False
+            return
+        logger.warning(f"OHLCV aggregate refresh error: {e}")
 
 
 def upsert_ohlcv(source: str, symbol: str, interval: str, df: pd.DataFrame) -> int:
@@ -71,40 +505,33 @@ def upsert_ohlcv(source: str, symbol: str, interval: str, df: pd.DataFrame) -> i
             break
     if dt_col is None:
         return 0
-    work = df.copy()
-    work[dt_col] = pd.to_datetime(work[dt_col])
-    cols = {k: k for k in ["open", "high", "low", "close", "volume"] if k in work.columns}
-
-    rows: List[Tuple] = []
-    for _, r in work.iterrows():
-        row = [source, symbol, interval, r[dt_col]]
-        vals: List[Optional[float]] = []
-        for k in ["open", "high", "low", "close", "volume"]:
-            if k in cols and k in r and pd.notna(r[k]):
-                try:
-                    vals.append(float(r[k]))
-                except Exception:
-                    vals.append(None)
-            else:
-                vals.append(None)
-        row += vals
-        rows.append(tuple(row))
+    ts = pd.to_datetime(df[dt_col], utc=True)
+    valid = ts.notna().to_numpy()
+    columns: Dict[str, Any] = {"ts": ts[valid]}
+    for k in OHLCV_COLUMNS:
+        if k in df.columns:
+            columns[k] = df[k].to_numpy()[valid]
+    return bulk_upsert_ohlcv(source, symbol, interval, columns)
+
+
+def read_ohlcv_columns(source: str, symbol: str, interval: str, start: datetime, end: datetime) -> Dict[str, np.ndarray]:
+    """Read rows stored at exactly `interval` with ts in [start, end] as numpy columns.
 
+    Streams a binary COPY and maps it onto arrays (ts as datetime64[us] UTC,
+    NULL prices/volume as NaN) without a Python object per row. Unlike
+    read_ohlcv there is no aggregate routing or resampling. Raises on
+    database errors.
+    """
     sql = (
-        "INSERT INTO ohlcv (source, symbol, interval, ts, open, high, low, close, volume) "
-        "VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s) "
-        "ON CONFLICT (source, symbol, interval, ts) DO UPDATE SET "
-        "open=EXCLUDED.open, high=EXCLUDED.high, low=EXCLUDED.low, close=EXCLUDED.close, volume=EXCLUDED.volume"
+        "COPY (SELECT ts, "
+        + ", ".join(f"COALESCE({col}::float8, 'NaN')" for col in OHLCV_COLUMNS)
+        + " FROM ohlcv WHERE source=%s AND symbol=%s AND interval=%s AND ts BETWEEN %s AND %s ORDER BY ts ASC) "
+        "TO STDOUT (FORMAT binary)"
     )
-    try:
-        with get_connection() as conn:
-            with conn.cursor() as cur:
-                cur.executemany(sql, rows)
-            conn.commit()
-        return len(rows)
-    except Exception as e:
-        logger.warning(f"upsert_ohlcv error: {e}")
-        return 0
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            payload = _copy_out(cur, sql, (source, symbol, interval, start, end))
+    return decode_ohlcv_copy(payload)
 
 
 def materialize_splits(source: str, symbol: str, interval: str, splits: List[Tuple[str, pd.Timestamp, pd.Timestamp]]) -> int:
@@ -0,0 +1,159 @@
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Ensure src root is on path
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import store  # type: ignore
+from bars import BarColumns, BarRepository, to_bar_columns, to_market_bars  # type: ignore
+
+
+def bar(ts, open=1.0, high=2.0, low=0.5, close=1.5, volume=10.0):
+    return {"ts": ts, "open": open, "high": high, "low": low, "close": close, "volume": volume}
+
+
+def make_stub(copy_out=b""):
+    """get_connection stub recording executed SQL and binary COPY traffic."""
+    executed = []
+    copied = []
+
+    class Cursor:
+        def execute(self, sql, params=None):
+            executed.append((sql, params))
+        def mogrify(self, sql, params):
+            return sql.encode()
+        def copy_expert(self, sql, file, size=8192):
+            if "FROM STDIN" in sql:
+                copied.append(file.read())
+            else:
+                file.write(copy_out)
+        def __enter__(self):
+            return self
+        def __exit__(self, *exc):
+            return False
+
+    class Conn:
+        def cursor(self):
+            return Cursor()
+        def commit(self):
+            pass
+        def __enter__(self):
+            return self
+        def __exit__(self, *exc):
+            return False
+
+    return (lambda: Conn()), executed, copied
+
+
+def test_rejected_rows_are_reported_with_reasons():
+    adapter_out = {
+        "provider": "binance",
+        "data": [
+            bar(1700000000),
+            bar("bad"),
+            bar(1700000120, close=None),
+            bar(1700000180, volume=-1.0),
+            bar(1700000240, open=3.0),
+            {"ts": 1700000300, "open": 1.0, "high": 2.0, "low": 0.5, "close": 1.5},
+        ],
+    }
+
+    columns = to_bar_columns(adapter_out)
+
+    assert columns.ts.tolist() == [1700000000, 1700000300]
+    assert columns.volume.tolist() == [10.0, 0.0]
+    assert columns.rejected == [
+        (1, "invalid ts"),
+        (2, "invalid close"),
+        (3, "negative volume"),
+        (4, "open/close outside high-low range"),
+    ]
+    assert len(to_bar_columns(adapter_out, validate=False)) == 3
+
+
+def test_dataframe_input_and_market_bars_match():
+    rows = [bar(1700000000 + 60 * i, close=1.0 + i / 10) for i in range(5)]
+    from_rows = to_bar_columns({"provider": "polygon", "data": rows})
+    from_frame = to_bar_columns({"provider": "polygon", "data": pd.DataFrame(rows)})
+
+    assert from_frame.ts.dtype == np.int64
+    np.testing.assert_array_equal(from_frame.ts, from_rows.ts)
+    np.testing.assert_array_equal(from_frame.close, from_rows.close)
+    bars = to_market_bars({"provider": "polygon", "data": rows})
+    assert [b.close for b in bars] == from_rows.close.tolist()
+    assert BarColumns.from_market_bars(bars, "polygon").ts.tolist() == from_rows.ts.tolist()
+    assert from_rows.to_frame()["ts"].iloc[0] == pd.Timestamp(1700000000, unit="s", tz="UTC")
+
+
+def test_copy_stream_round_trip():
+    ts = pd.date_range("2024-01-01", periods=4, freq="1min", tz="UTC")
+    ts_us = store._epoch_micros(ts)
+    values = {col: np.array([1.0, np.nan, 3.5, -2.0]) * (i + 1) for i, col in enumerate(store.OHLCV_COLUMNS)}
+
+    decoded = store.decode_ohlcv_copy(store.encode_ohlcv_copy(ts_us, values))
+
+    assert (pd.to_datetime(decoded["ts"], utc=True) == ts).all()
+    for col in store.OHLCV_COLUMNS:
+        np.testing.assert_array_equal(decoded[col], values[col])
+    with pytest.raises(ValueError):
+        store.decode_ohlcv_copy(b"not a copy stream")
+
+
+def test_bulk_upsert_stages_one_copy_and_keeps_last_duplicate(monkeypatch):
+    get_connection, executed, copied = make_stub()
+    monkeypatch.setattr(store, "get_connection", get_connection)
+    columns = to_bar_columns({"provider": "binance", "data": [bar(1700000000), bar(1700000060), bar(1700000000, close=1.9)]})
+
+    written = BarRepository().upsert_columns(provider="binance", symbol="BTCUSDT", interval="1m", columns=columns)
+
+    assert written == 2
+    assert len(copied) == 1
+    staged = store.decode_ohlcv_copy(copied[0])
+    assert staged["ts"].astype("datetime64[s]").astype(np.int64).tolist() == [1700000060, 1700000000]
+    assert staged["close"].tolist() == [1.5, 1.9]
+    insert_sql, params = next(entry for entry in executed if entry[0].startswith("INSERT INTO ohlcv"))
+    assert "ON CONFLICT (source, symbol, interval, ts)" in insert_sql
+    assert params == ("binance", "BTCUSDT", "1m")
+
+
+def test_upsert_ohlcv_frame_maps_missing_values_to_nan(monkeypatch):
+    get_connection, _, copied = make_stub()
+    monkeypatch.setattr(store, "get_connection", get_connection)
+    df = pd.DataFrame(
+        {
+            "datetime": ["2024-01-01 00:00", "2024-01-01 00:01"],
+            "open": [1.0, "x"],
+            "close": [1.5, 2.5],
+        }
+    )
+
+    assert store.upsert_ohlcv("binance", "BTCUSDT", "1m", df) == 2
+    staged = store.decode_ohlcv_copy(copied[0])
+    assert np.isnan(staged["open"][1]) and np.isnan(staged["high"]).all()
+    assert staged["close"].tolist() == [1.5, 2.5]
+
+
+def test_fetch_columns_decodes_copy_stream(monkeypatch):
+    ts = np.array([1704067200, 1704067260])
+    payload = store.encode_ohlcv_copy(
+        ts * 1_000_000, {col: np.array([100.0, 101.0]) for col in store.OHLCV_COLUMNS}
+    )
+    get_connection, executed, _ = make_stub(copy_out=payload)
+    monkeypatch.setattr(store, "get_connection", get_connection)
+
+    columns = BarRepository().fetch_columns(
+        provider="binance", symbol="BTCUSDT", interval="1m", start_ts=1704067200, end_ts=1704067260
+    )
+
+    assert columns.ts.tolist() == ts.tolist()
+    assert columns.open.tolist() == [100.0, 101.0]
+    assert columns.provider == "binance"
+    assert executed == []  # psycopg2 path binds parameters with mogrify, not execute
+    assert columns.to_frame()["ts"].iloc[-1] == pd.Timestamp(datetime(2024, 1, 1, 0, 1, tzinfo=timezone.utc))
@@ -0,0 +1,240 @@
+"""Tests for latency-aware provider selection and hedged requests with stub clients."""
+
+import asyncio
+import random
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+# Ensure src root is on path
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from infrastructure.external.routing import (  # type: ignore
+    AllClientsFailedError,
+    HedgeBudget,
+    LatencyRouter,
+    run_blocking,
+)
+
+
+class StubClient:
+    """Local provider whose latency is drawn from a configurable distribution."""
+
+    def __init__(self, name, latency=lambda rng: 0.01, error_rate=0.0, result="data", seed=0):
+        self.name = name
+        self.latency = latency
+        self.error_rate = error_rate
+        self.result = result
+        self.rng = random.Random(seed)
+        self.calls = 0
+        self.cancelled = 0
+
+    async def __call__(self):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.latency(self.rng))
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.rng.random() < self.error_rate:
+            raise ConnectionError(f"{self.name} unavailable")
+        return f"{self.result}:{self.name}"
+
+
+def run(router, clients, hedge=True, candidates=None):
+    by_name = {client.name: client for client in clients}
+    names = candidates or list(by_name)
+    return asyncio.run(router.call(names, lambda name: by_name[name](), hedge=hedge))
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_rank_orders_by_latency_and_keeps_preferred_order_for_unmeasured():
+    router = LatencyRouter()
+    for _ in range(5):
+        router.record("slow", 0.5, True)
+        router.record("fast", 0.05, True)
+
+    assert router.rank(["slow", "fast", "new_a", "new_b"]) == ["new_a", "new_b", "fast", "slow"]
+
+
+def test_errors_demote_a_fast_client():
+    router = LatencyRouter(error_cost=5.0)
+    for _ in range(5):
+        router.record("steady", 0.2, True)
+        router.record("flaky", 0.05, True)
+    for _ in range(3):
+        router.record("flaky", 0.01, False)
+
+    assert router.rank(["flaky", "steady"]) == ["steady", "flaky"]
+    assert router.snapshot()["providers"]["flaky"]["errors"] == 3
+
+
+def test_p95_hedge_delay_falls_back_until_enough_samples():
+    router = LatencyRouter(default_hedge_delay=0.8, min_samples_for_p95=10)
+    for latency in range(1, 6):
+        router.record("p", latency / 100, True)
+    assert router.hedge_delay("p") == 0.8
+
+    for latency in range(6, 21):
+        router.record("p", latency / 100, True)
+    assert router.hedge_delay("p") == pytest.approx(0.19)
+
+
+def test_slow_primary_is_hedged_and_loser_cancelled():
+    router = LatencyRouter(default_hedge_delay=0.05)
+    primary = StubClient("primary", latency=lambda rng: 1.0)
+    backup = StubClient("backup", latency=lambda rng: 0.01)
+
+    name, result = run(router, [primary, backup])
+
+    assert (name, result) == ("backup", "data:backup")
+    assert primary.cancelled == 1
+    assert router.hedges_sent == 1 and router.hedges_won == 1
+
+
+def test_hedges_are_staggered_by_each_hedge_delay():
+    router = LatencyRouter(default_hedge_delay=0.05)
+    clients = [
+        StubClient("a", latency=lambda rng: 1.0),
+        StubClient("b", latency=lambda rng: 0.03),
+        StubClient("c"),
+        StubClient("d"),
+    ]
+
+    assert run(router, clients) == ("b", "data:b")
+    assert router.hedges_sent == 1
+    assert clients[2].calls == 0 and clients[3].calls == 0
+
+
+def test_cancelled_loser_raises_its_latency_estimate():
+    router = LatencyRouter(default_hedge_delay=0.05)
+    for _ in range(5):
+        router.record("primary", 0.01, True)
+        router.record("backup", 0.015, True)
+    primary = StubClient("primary", latency=lambda rng: 1.0)
+    backup = StubClient("backup", latency=lambda rng: 0.01)
+
+    assert run(router, [primary, backup])[0] == "backup"
+    assert primary.cancelled == 1
+    assert router.stats("primary").latency_ewma > 0.02
+    assert router.stats("primary").errors == 0
+    assert router.rank(["primary", "backup"]) == ["backup", "primary"]
+
+
+def test_fast_primary_is_not_hedged():
+    router = LatencyRouter(default_hedge_delay=0.2)
+    primary = StubClient("primary", latency=lambda rng: 0.01)
+    backup = StubClient("backup")
+
+    assert run(router, [primary, backup]) == ("primary", "data:primary")
+    assert backup.calls == 0 and router.hedges_sent == 0
+
+
+def test_exhausted_budget_waits_for_primary():
+    clock = FakeClock()
+    router = LatencyRouter(default_hedge_delay=0.02, hedge_budgets={"backup": 1}, clock=clock)
+    primary = StubClient("primary", latency=lambda rng: 0.1)
+    backup = StubClient("backup", latency=lambda rng: 0.3)
+
+    for _ in range(2):
+        # Keep the unmeasured-first rule from reordering the clients
+        router._stats.clear()
+        run(router, [primary, backup])
+
+    assert backup.calls == 1
+    assert router.hedges_denied == 1
+
+    clock.now += 60  # one token per minute refills
+    router._stats.clear()
+    run(router, [primary, backup])
+    assert backup.calls == 2
+
+
+def test_failed_primary_fails_over_without_budget():
+    router = LatencyRouter(hedge_budgets={"backup": 0})
+    primary = StubClient("primary", error_rate=1.0)
+    empty = StubClient("empty")
+    backup = StubClient("backup")
+
+    async def call(name):
+        if name == "empty":
+            await empty()
+            return None
+        return await {"primary": primary, "backup": backup}[name]()
+
+    name, _ = asyncio.run(router.call(["primary", "empty", "backup"], call))
+
+    assert name == "backup"
+    assert router.hedges_sent == 0
+    assert router.stats("primary").error_ewma > 0 and router.stats("empty").errors == 1
+
+
+def test_all_failures_raise():
+    router = LatencyRouter()
+    clients = [StubClient("a", error_rate=1.0), StubClient("b", error_rate=1.0)]
+
+    with pytest.raises(AllClientsFailedError, match="unavailable"):
+        run(router, clients)
+
+
+def test_selection_converges_on_fastest_distribution():
+    router = LatencyRouter(default_hedge_delay=0.05, hedge_budgets={"slow": 0, "fast": 0})
+    slow = StubClient("slow", latency=lambda rng: rng.uniform(0.02, 0.04), seed=1)
+    fast = StubClient("fast", latency=lambda rng: rng.uniform(0.001, 0.005), seed=2)
+
+    winners = [run(router, [slow, fast])[0] for _ in range(10)]
+
+    assert winners[:2] == ["slow", "fast"]  # each unmeasured client is tried once
+    assert set(winners[2:]) == {"fast"}
+
+
+def test_hedge_budget_refills_over_time():
+    clock = FakeClock()
+    budget = HedgeBudget(per_minute=6, burst=2, clock=clock)
+
+    assert [budget.try_acquire() for _ in range(3)] == [True, True, False]
+    clock.now += 10
+    assert budget.try_acquire() and not budget.try_acquire()
+    assert not HedgeBudget(per_minute=0, clock=clock).try_acquire()
+
+
+def test_losing_blocking_hedge_keeps_its_permit_until_the_thread_finishes():
+    release = threading.Event()
+    router = LatencyRouter(default_hedge_delay=0.02)
+    semaphores = {"primary": None, "backup": None}
+    held = []
+
+    def blocking(name):
+        if name == "primary":
+            release.wait(5)
+        return f"data:{name}"
+
+    async def scenario():
+        semaphores.update(primary=asyncio.Semaphore(1), backup=asyncio.Semaphore(1))
+        name, _ = await router.call(
+            ["primary", "backup"],
+            lambda name: run_blocking(blocking, name, semaphore=semaphores[name]),
+        )
+        await asyncio.sleep(0.05)
+        held.append(semaphores["primary"].locked())
+        release.set()
+        for _ in range(100):
+            if not semaphores["primary"].locked():
+                break
+            await asyncio.sleep(0.01)
+        held.append(semaphores["primary"].locked())
+        return name
+
+    assert asyncio.run(scenario()) == "backup"
+    assert held == [True, False]
@@ -0,0 +1,119 @@
+import random
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Ensure src root is on path
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from models import market  # type: ignore  # noqa: E402
+from models.market import L2OrderBook, OrderBook  # type: ignore  # noqa: E402
+
+T0 = datetime(2025, 1, 2, 9, 30)
+
+
+def book():
+    return L2OrderBook.from_snapshot(
+        "BTC/USD",
+        bids=[(100.0, 2.0), (99.0, 1.0), (98.0, 0.0)],
+        asks=[(101.0, 1.5), (102.0, 3.0, 4)],
+        timestamp=T0,
+    )
+
+
+def test_snapshot_drops_zero_size_levels_and_orders_best_first():
+    l2 = book()
+
+    assert l2.best_bid == (100.0, 2.0) and l2.best_ask == (101.0, 1.5)
+    assert l2.spread == 1.0 and l2.mid_price == 100.5
+    assert l2.levels("bid")[0].tolist() == [100.0, 99.0]
+    assert l2.levels("ask")[0].tolist() == [101.0, 102.0]
+    assert len(l2) == 4 and l2.timestamp == T0
+
+
+def test_deltas_insert_change_and_remove_levels():
+    l2 = book()
+
+    l2.update("bid", 100.5, 1.0)  # new best bid
+    l2.update("ask", 101.0, 0)  # best ask removed
+    l2.update("ask", 102.0, 5.0, count=7)  # size change
+    l2.update("bid", 97.0, 0)  # deleting a missing level is a no-op
+
+    assert l2.best_bid == (100.5, 1.0)
+    assert l2.best_ask == (102.0, 5.0)
+    assert l2.levels("bid")[0].tolist() == [100.5, 100.0, 99.0]
+    assert l2.total_bid_volume == 4.0 and l2.total_ask_volume == 5.0
+    assert l2.to_order_book().asks[0].count == 7
+
+
+def test_removing_every_level_empties_the_side():
+    l2 = book()
+    l2.apply_deltas(asks=[(101.0, 0), (102.0, -1)])
+
+    assert l2.best_ask is None
+    assert l2.spread == 0 and l2.mid_price == 0
+    assert l2.total_ask_volume == 0.0 and l2.depth_within_bps(50) == (0.0, 0.0)
+
+
+def test_aggregates_match_a_rebuilt_order_book():
+    rng = random.Random(3)
+    l2 = L2OrderBook("BTC/USD", capacity=4)
+    bids, asks = {}, {}
+    for _ in range(2_000):
+        side, levels = rng.choice([("bid", bids), ("ask", asks)])
+        price = (rng.randint(9_900, 10_000) if side == "bid" else rng.randint(10_001, 10_100)) / 100
+        volume = rng.choice([0.0, rng.uniform(0.1, 5)])
+        l2.update(side, price, volume)
+        if volume > 0:
+            levels[price] = volume
+        else:
+            levels.pop(price, None)
+
+    reference = OrderBook(
+        symbol="BTC/USD", timestamp=T0, bids=list(bids.items()), asks=list(asks.items())
+    )
+
+    assert l2.best_bid == (reference.best_bid.price, reference.best_bid.volume)
+    assert l2.best_ask == (reference.best_ask.price, reference.best_ask.volume)
+    assert l2.spread == pytest.approx(reference.spread)
+    for levels in (1, 5, 50):
+        assert l2.get_volume_imbalance(levels) == pytest.approx(reference.get_volume_imbalance(levels))
+    for price in (99.5, 100.0, 100.5):
+        assert l2.bid_volume_at_price(price) == pytest.approx(reference.bid_volume_at_price(price))
+        assert l2.ask_volume_at_price(price) == pytest.approx(reference.ask_volume_at_price(price))
+    np.testing.assert_allclose(l2.levels("ask")[1], [e.volume for e in reference.asks])
+
+
+class CountingClock(datetime):
+    calls = 0
+
+    @classmethod
+    def now(cls, tz=None):
+        cls.calls += 1
+        return super().now(tz)
+
+
+def test_timestamps_come_from_messages_or_one_clock_read_per_batch(monkeypatch):
+    l2 = book()
+    monkeypatch.setattr(market, "datetime", CountingClock)
+
+    for i in range(100):
+        l2.update("bid", 90.0 + i / 100, 1.0)
+    assert l2.timestamp == T0 and CountingClock.calls == 0
+
+    stamped = datetime(2025, 1, 2, 9, 31)
+    l2.update("ask", 103.0, 1.0, timestamp=stamped)
+    assert l2.timestamp == stamped
+
+    l2.apply_deltas(bids=[(89.0 + i / 100, 1.0) for i in range(100)])
+    assert CountingClock.calls == 1 and l2.timestamp > stamped
+
+
+def test_invalid_side_is_rejected():
+    with pytest.raises(ValueError, match="Invalid order book side"):
+        book().update("mid", 100.0, 1.0)
@@ -0,0 +1,182 @@
+import sys
+import time
+import types
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+# Ensure src root is on path
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from pipelines import executor as executor_module  # type: ignore
+from pipelines.executor import PipelineExecutor, merge_outputs  # type: ignore
+
+
+class CountingProcessor:
+    instances = 0
+
+    def __init__(self, factor=1):
+        CountingProcessor.instances += 1
+        self.factor = factor
+
+    def process(self, df):
+        return df * self.factor
+
+
+@pytest.fixture
+def processor_module(monkeypatch):
+    module = types.ModuleType("pipeline_test_processors")
+    module.CountingProcessor = CountingProcessor
+    monkeypatch.setitem(sys.modules, "pipeline_test_processors", module)
+    CountingProcessor.instances = 0
+    return module
+
+
+def custom(fn, name=None, depends_on=None):
+    step = {"type": "custom", "processor": fn}
+    if name:
+        step["name"] = name
+    if depends_on is not None:
+        step["depends_on"] = depends_on
+    return step
+
+
+def sleepy(column, seconds=0.2):
+    def add_column(df):
+        time.sleep(seconds)
+        return pd.DataFrame({column: df["close"] * 2}, index=df.index)
+
+    return add_column
+
+
+@pytest.fixture
+def frame():
+    return pd.DataFrame({"close": [1.0, 2.0, 3.0]})
+
+
+def test_string_processor_is_created_once(processor_module, frame):
+    executor = PipelineExecutor(
+        [{"type": "custom", "processor": "pipeline_test_processors.CountingProcessor", "options": {"factor": 3}}]
+    )
+
+    for _ in range(5):
+        result = executor.execute(frame)
+
+    assert CountingProcessor.instances == 1
+    assert result["close"].tolist() == [3.0, 6.0, 9.0]
+
+
+def test_sequential_steps_chain_outputs(frame):
+    executor = PipelineExecutor([custom(lambda df: df + 1), custom(lambda df: df * 10)])
+
+    assert not executor.is_dag
+    assert executor(frame)["close"].tolist() == [20.0, 30.0, 40.0]
+
+
+def test_independent_branches_run_concurrently_and_merge(frame):
+    executor = PipelineExecutor(
+        [
+            custom(sleepy("a"), name="a", depends_on=[]),
+            custom(sleepy("b"), name="b", depends_on=[]),
+            custom(sleepy("c"), name="c", depends_on=[]),
+        ]
+    )
+
+    start = time.perf_counter()
+    result = executor.execute(frame)
+    elapsed = time.perf_counter() - start
+    executor.close()
+
+    assert elapsed < 0.45  # sequentially this takes >= 0.6s
+    assert list(result.columns) == ["a", "b", "c"]
+
+
+def test_concurrent_first_runs_share_one_thread_pool(frame, monkeypatch):
+    created = []
+    real_pool = executor_module.ThreadPoolExecutor
+
+    def slow_pool(*args, **kwargs):
+        time.sleep(0.05)  # widen the window between the check and the assignment
+        created.append(real_pool(*args, **kwargs))
+        return created[-1]
+
+    monkeypatch.setattr(executor_module, "ThreadPoolExecutor", slow_pool)
+    executor = PipelineExecutor(
+        [custom(sleepy("a", 0.01), name="a", depends_on=[]), custom(sleepy("b", 0.01), name="b", depends_on=[])]
+    )
+
+    with real_pool(max_workers=4) as callers:
+        results = list(callers.map(executor.execute, [frame] * 4))
+    executor.close()
+
+    assert len(created) == 1
+    assert all(list(result.columns) == ["a", "b"] for result in results)
+
+
+def test_dependent_step_receives_merged_branch_outputs(frame):
+    seen = []
+
+    def combine(df):
+        seen.append(list(df.columns))
+        return df.assign(total=df["close"] + df["a"])
+
+    executor = PipelineExecutor(
+        [
+            custom(lambda df: df, name="source"),
+            custom(lambda df: pd.DataFrame({"a": df["close"] * 10}), name="a", depends_on=["source"]),
+            custom(combine, name="combine", depends_on=["source", "a"]),
+        ]
+    )
+
+    result = executor.execute(frame)
+
+    assert seen == [["close", "a"]]
+    assert result["total"].tolist() == [11.0, 22.0, 33.0]
+
+
+@pytest.mark.parametrize(
+    "steps",
+    [
+        [custom(lambda df: df, name="a", depends_on=["b"]), custom(lambda df: df, name="b", depends_on=["a"])],
+        [custom(lambda df: df, name="a", depends_on=["missing"])],
+    ],
+    ids=["cycle", "unknown"],
+)
+def test_invalid_dependencies_are_rejected(steps):
+    with pytest.raises(executor_module.InvalidPipelineError):
+        PipelineExecutor(steps)
+
+
+def test_step_timings_are_recorded(frame):
+    executor = PipelineExecutor([custom(sleepy("slow", 0.05), name="slow"), custom(lambda df: df, name="fast")])
+
+    executor.execute(frame)
+    executor.execute(frame)
+    stats = executor.get_step_stats()
+
+    assert list(stats) == ["slow", "fast"]
+    assert stats["slow"]["count"] == 2
+    assert stats["slow"]["mean"] >= 0.05
+
+
+def test_branch_failure_raises_processing_error(frame):
+    def fail(df):
+        raise ValueError("bad input")
+
+    executor = PipelineExecutor([custom(fail, name="a", depends_on=[]), custom(sleepy("b", 0.0), name="b", depends_on=[])])
+
+    with pytest.raises(executor_module.DataProcessingError, match="bad input"):
+        executor.execute(frame)
+
+
+def test_merge_outputs_prefers_later_columns():
+    left = pd.DataFrame({"x": [1], "y": [2]})
+    right = pd.DataFrame({"y": [20], "z": [30]})
+
+    merged = merge_outputs([left, right])
+
+    assert merged.to_dict("list") == {"x": [1], "y": [20], "z": [30]}
+    assert merge_outputs([{"a": 1}, {"a": 2, "b": 3}]) == {"a": 2, "b": 3}
@@ -0,0 +1,194 @@
+import gzip
+import io
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+import pyarrow.dataset as pads  # noqa: E402
+
+# Ensure src root is on path
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from providers import polygon_flatfiles as pff  # type: ignore  # noqa: E402
+
+DAY_NS = 1_709_769_600_000_000_000  # 2024-03-07T00:00:00Z
+
+AGGS = "ticker,volume,open,close,high,low,window_start,transactions\n" + "".join(
+    f"{ticker},{100 + i},{10 + i}.5,{11 + i},{12 + i},{9 + i},{DAY_NS + i * 60_000_000_000},{i}\n"
+    for ticker in ("AAPL", "MSFT", "TSLA")
+    for i in range(50)
+)
+
+
+class TrackingBody(io.BytesIO):
+    """S3 StreamingBody stand-in that records how many bytes were read."""
+
+    def __init__(self, data):
+        super().__init__(data)
+        self.bytes_read = 0
+
+    def read(self, size=-1):
+        chunk = super().read(size)
+        self.bytes_read += len(chunk)
+        return chunk
+
+
+class FakeS3:
+    def __init__(self, objects):
+        self.objects = objects
+        self.bodies = []
+
+    def get_object(self, Bucket, Key):
+        body = TrackingBody(self.objects[Key])
+        self.bodies.append(body)
+        return {"Body": body}
+
+
+def test_sample_object_reads_only_the_lines_it_needs():
+    rows = "".join(f"AAPL,{i},1.0,1.0,1.0,1.0,{DAY_NS},1\n" for i in range(200_000))
+    payload = gzip.compress(("ticker,volume,open,close,high,low,window_start,transactions\n" + rows).encode())
+    s3 = FakeS3({"day.csv.gz": payload})
+
+    out = pff.sample_object(s3, "day.csv.gz", n=3, include_header=False)
+
+    assert out["lines"] == [f"AAPL,{i},1.0,1.0,1.0,1.0,{DAY_NS},1" for i in range(3)]
+    assert s3.bodies[0].bytes_read < len(payload) // 2
+
+
+def test_sample_object_handles_plain_csv():
+    s3 = FakeS3({"day.csv": AGGS.encode()})
+
+    out = pff.sample_object(s3, "day.csv", n=2, include_header=True)
+
+    assert out["lines"][0].startswith("ticker,volume") and out["returned"] == 2
+
+
+def test_batches_use_explicit_types_and_block_size(tmp_path):
+    path = tmp_path / "2024-03-07.csv.gz"
+    path.write_bytes(gzip.compress(AGGS.encode()))
+
+    batches = list(pff.iter_flatfile_batches(str(path), block_size=2048))
+
+    assert len(batches) > 1
+    assert sum(b.num_rows for b in batches) == 150
+    schema = batches[0].schema
+    assert schema.field("volume").type == pa.float64()
+    assert schema.field("window_start").type == pa.int64()
+    assert schema.field("ticker").type == pa.string()
+
+
+def test_flatfile_to_parquet_partitions_by_ticker_and_date(tmp_path):
+    source = tmp_path / "2024-03-07.csv.gz"
+    source.write_bytes(gzip.compress(AGGS.encode()))
+    dest = tmp_path / "parquet"
+
+    stats = pff.flatfile_to_parquet(str(source), str(dest), block_size=2048)
+    again = pff.flatfile_to_parquet(str(source), str(dest), block_size=2048)
+
+    assert stats["ok"] and stats["rows"] == 150
+    assert again["files"] == stats["files"]  # re-ingest overwrites the same parts
+    assert sorted(p.name for p in dest.iterdir()) == ["ticker=AAPL", "ticker=MSFT", "ticker=TSLA"]
+    assert [p.name for p in (dest / "ticker=AAPL").iterdir()] == ["date=2024-03-07"]
+
+    table = pads.dataset(str(dest), partitioning="hive").to_table()
+    assert table.num_rows == 150
+    msft = table.filter(pads.field("ticker") == "MSFT").sort_by("window_start")
+    assert msft.column("open").to_pylist()[:2] == [10.5, 11.5]
+
+
+def test_rerun_with_a_different_block_layout_replaces_stale_parts(tmp_path):
+    header, *rows = AGGS.splitlines()
+    interleaved = "\n".join([header, *sorted(rows, key=lambda line: int(line.rsplit(",", 1)[1]))]) + "\n"
+    source = tmp_path / "2024-03-07.csv.gz"
+    source.write_bytes(gzip.compress(interleaved.encode()))
+    dest = tmp_path / "parquet"
+
+    # one open file at a time: interleaved tickers keep closing and reopening parts
+    many = pff.flatfile_to_parquet(str(source), str(dest), block_size=1024, max_open_files=1)
+    few = pff.flatfile_to_parquet(str(source), str(dest), block_size=1 << 20)
+
+    assert many["files"] > few["files"] == 3
+    assert len(list(dest.rglob("*.parquet"))) == 3
+    assert pads.dataset(str(dest), partitioning="hive").to_table().num_rows == 150
+
+
+def test_post_market_rows_stay_on_their_trading_date(tmp_path):
+    # 2024-03-07 19:59 ET is already 2024-03-08 in UTC
+    late = 1_709_859_540_000_000_000
+    rows = "ticker,volume,open,close,high,low,window_start,transactions\n" + f"AAPL,1,1.0,1.0,1.0,1.0,{late},1\n"
+    keyed = tmp_path / "2024-03-07.csv"
+    keyed.write_text(rows)
+    unkeyed = tmp_path / "minute_aggs.csv"
+    unkeyed.write_text(rows)
+
+    pff.flatfile_to_parquet(str(keyed), str(tmp_path / "keyed"))
+    pff.flatfile_to_parquet(str(unkeyed), str(tmp_path / "unkeyed"))
+
+    assert [p.name for p in (tmp_path / "keyed" / "ticker=AAPL").iterdir()] == ["date=2024-03-07"]
+    assert [p.name for p in (tmp_path / "unkeyed" / "ticker=AAPL").iterdir()] == ["date=2024-03-07"]
+
+
+def test_flatfile_to_parquet_uses_key_date_without_timestamps(tmp_path):
+    source = tmp_path / "2024-03-08.csv"
+    source.write_text("ticker,price\nAAPL,1.5\nMSFT,2.5\n")
+
+    stats = pff.flatfile_to_parquet(str(source), str(tmp_path / "out"))
+
+    assert stats["rows"] == 2
+    assert (tmp_path / "out" / "ticker=MSFT" / "date=2024-03-08").is_dir()
+
+
+def test_flatfile_to_ohlcv_upserts_each_ticker_per_block():
+    shuffled = AGGS.splitlines()[0] + "\n" + "\n".join(sorted(AGGS.splitlines()[1:], key=lambda line: line[-3:])) + "\n"
+    s3 = FakeS3({"minute.csv.gz": gzip.compress(shuffled.encode())})
+    calls = []
+
+    def upsert(provider, ticker, interval, columns):
+        calls.append((provider, ticker, interval, columns))
+        return len(columns["ts"])
+
+    stats = pff.flatfile_to_ohlcv("minute.csv.gz", upsert=upsert, s3_client=s3)
+
+    assert stats["rows"] == stats["written"] == 150 and stats["tickers"] == 3
+    assert {c[1] for c in calls} == {"AAPL", "MSFT", "TSLA"}
+    aapl = next(c[3] for c in calls if c[1] == "AAPL")
+    order = np.argsort(aapl["ts"])
+    np.testing.assert_array_equal(aapl["ts"][order], DAY_NS // 1_000_000_000 + 60 * np.arange(50))
+    assert aapl["open"][order][0] == 10.5 and aapl["volume"].dtype == np.float64
+
+
+def test_flatfile_to_ohlcv_skips_rows_without_a_ticker():
+    payload = AGGS + f",1,1.0,1.0,1.0,1.0,{DAY_NS},1\n"
+    s3 = FakeS3({"minute.csv": payload.encode()})
+    tickers = []
+
+    def upsert(provider, ticker, interval, columns):
+        tickers.append(ticker)
+        return len(columns["ts"])
+
+    stats = pff.flatfile_to_ohlcv("minute.csv", upsert=upsert, s3_client=s3)
+
+    assert stats["ok"] and stats["rows"] == 151
+    assert stats["written"] == 150 and stats["skipped"] == 1
+    assert sorted(tickers) == ["AAPL", "MSFT", "TSLA"]
+
+
+def test_flatfile_to_ohlcv_skips_rows_with_null_prices():
+    payload = AGGS + f"AAPL,1,,1.0,1.0,1.0,{DAY_NS + 3_600_000_000_000},1\n"
+    s3 = FakeS3({"minute.csv": payload.encode()})
+    groups = {}
+
+    def upsert(provider, ticker, interval, columns):
+        groups[ticker] = columns
+        return len(columns["ts"])
+
+    stats = pff.flatfile_to_ohlcv("minute.csv", upsert=upsert, s3_client=s3)
+
+    assert stats["ok"] and stats["rows"] == 151
+    assert stats["written"] == 150 and stats["skipped"] == 1
+    assert len(groups["AAPL"]["ts"]) == 50 and not np.isnan(groups["AAPL"]["open"]).any()
@@ -0,0 +1,263 @@
+"""Tests for the thread-offloaded, keyset-paginated BaseRepository against a scripted connection."""
+
+import asyncio
+import json
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+from pydantic import BaseModel
+
+# Ensure src root is on path
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from framework.exceptions.data import DatabaseError, DataValidationException  # type: ignore
+from infrastructure.database import (  # type: ignore
+    BaseRepository,
+    Database,
+    KeysetPagination,
+    QueryFilter,
+)
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+    price: float = 0.0
+
+
+class ScriptedConnection:
+    """Connection whose cursors answer each query with `respond(sql, params)`."""
+
+    def __init__(self, respond, latency=0.0):
+        self.respond = respond
+        self.latency = latency
+        self.executed = []
+        self.commits = 0
+        self.rollbacks = 0
+
+    def cursor(self):
+        conn = self
+
+        class Cursor:
+            description = None
+
+            def execute(self, sql, params=None):
+                time.sleep(conn.latency)
+                conn.executed.append((" ".join(sql.split()), list(params or [])))
+                columns, self._rows = conn.respond(sql, params)
+                self.description = [(c,) for c in columns] if columns else None
+
+            def fetchone(self):
+                return self._rows[0] if self._rows else None
+
+            def fetchall(self):
+                return list(self._rows)
+
+        return Cursor()
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+
+class ScriptedDatabase(Database):
+    """Database that lends a ScriptedConnection instead of a pooled Postgres one."""
+
+    def __init__(self, conn, pool_max_size=4):
+        super().__init__()
+        self.configure({"dsn": "postgresql://test", "pool_max_size": pool_max_size})
+        self.conn = conn
+        self.threads = set()
+
+    @contextmanager
+    def _checkout(self):
+        self.threads.add(threading.get_ident())
+        yield self.conn
+
+
+ITEM_COLUMNS = ["id", "name", "price"]
+
+
+def item_rows(ids):
+    return [(i, f"item-{i}", float(i)) for i in ids]
+
+
+def test_queries_run_off_the_event_loop():
+    conn = ScriptedConnection(lambda sql, params: (ITEM_COLUMNS, item_rows([params[0]])), latency=0.2)
+    db = ScriptedDatabase(conn)
+    repo = BaseRepository(db, Item, table_name="items")
+
+    async def main():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        start = time.perf_counter()
+        items = await asyncio.gather(*(repo.get_by_id(i) for i in range(4)))
+        elapsed = time.perf_counter() - start
+        task.cancel()
+        return items, elapsed, ticks
+
+    items, elapsed, ticks = asyncio.run(main())
+
+    assert [item.id for item in items] == [0, 1, 2, 3]
+    assert elapsed < 0.6  # four 0.2s queries run side by side
+    assert ticks >= 10  # the loop kept ticking while they ran
+    assert threading.get_ident() not in db.threads
+    assert conn.commits == 4
+
+
+def test_failed_query_rolls_back_and_raises_database_error():
+    def respond(sql, params):
+        raise RuntimeError("connection reset")
+
+    conn = ScriptedConnection(respond)
+    repo = BaseRepository(ScriptedDatabase(conn), Item, table_name="items")
+
+    with pytest.raises(DatabaseError):
+        asyncio.run(repo.get_by_id(1))
+    assert conn.rollbacks == 1 and conn.commits == 0
+
+
+def test_keyset_pages_seek_past_the_previous_page():
+    def respond(sql, params):
+        if "EXPLAIN" in sql:
+            return ["QUERY PLAN"], [([{"Plan": {"Plan Rows": 12345}}],)]
+        return ITEM_COLUMNS, item_rows(range(1, params[-1] + 1))
+
+    conn = ScriptedConnection(respond)
+    repo = BaseRepository(ScriptedDatabase(conn), Item, table_name="items")
+    in_stock = QueryFilter().add("price", ">", 0)
+
+    first = asyncio.run(
+        repo.find_page(in_stock, KeysetPagination(page_size=3, order_by="price"), count="approximate")
+    )
+    sql, params = conn.executed[0]
+    assert sql == "SELECT * FROM items WHERE price > %s ORDER BY price ASC, id ASC LIMIT %s"
+    assert params == [0, 4]
+    assert [item.id for item in first.items] == [1, 2, 3]
+    assert first.total == 12345 and first.total_is_estimate
+    assert KeysetPagination.decode_cursor(first.next_cursor) == [3.0, 3]
+
+    conn.executed.clear()
+    asyncio.run(repo.find_page(in_stock, KeysetPagination(page_size=3, order_by="price", after=first.next_cursor)))
+    sql, params = conn.executed[0]
+    assert sql == "SELECT * FROM items WHERE price > %s AND ((price, id) > (%s, %s)) ORDER BY price ASC, id ASC LIMIT %s"
+    assert params == [0, 3.0, 3, 4]
+    assert in_stock.build() == ("WHERE price > %s", [0])  # caller's filter is untouched
+
+    with pytest.raises(DataValidationException):
+        asyncio.run(repo.find_page(pagination=KeysetPagination(order_by="price", after="not-a-cursor")))
+
+
+def test_last_page_has_no_cursor_and_desc_seeks_backwards():
+    conn = ScriptedConnection(lambda sql, params: (ITEM_COLUMNS, item_rows([9, 8])))
+    repo = BaseRepository(ScriptedDatabase(conn), Item, table_name="items")
+    cursor = KeysetPagination.encode_cursor([10])
+
+    page = asyncio.run(repo.find_page(pagination=KeysetPagination(page_size=5, order_dir="desc", after=cursor)))
+
+    assert conn.executed[0][0] == "SELECT * FROM items WHERE ((id) < (%s)) ORDER BY id DESC LIMIT %s"
+    assert page.next_cursor is None and not page.has_next()
+    assert page.to_dict()["pagination"]["total"] is None
+
+
+def test_create_many_batches_rows_with_the_same_fields():
+    def respond(sql, params):
+        columns = sql.split("(", 1)[1].split(")", 1)[0].split(", ")
+        return columns, [tuple(params[i : i + len(columns)]) for i in range(0, len(params), len(columns))]
+
+    conn = ScriptedConnection(respond)
+    repo = BaseRepository(ScriptedDatabase(conn), Item, table_name="items", timestamps=False)
+    items = [{"id": i, "name": f"n{i}", "price": float(i)} for i in range(5)] + [{"id": 5, "name": "free"}]
+
+    created = asyncio.run(repo.create_many(items, chunk_size=3))
+
+    assert [item.id for item in created] == [0, 1, 2, 3, 4, 5]
+    statements = [sql for sql, _ in conn.executed]
+    assert len(statements) == 3
+    assert statements[0].startswith("INSERT INTO items (id, name, price) VALUES (%s, %s, %s), (%s, %s, %s), (%s, %s, %s)")
+    assert statements[2].startswith("INSERT INTO items (id, name) VALUES (%s, %s) RETURNING *")
+    assert conn.commits == 1
+
+
+def test_update_many_sends_one_typed_recordset_per_chunk():
+    def respond(sql, params):
+        return ITEM_COLUMNS, [(row["id"], "x", row["price"]) for row in json.loads(params[0])]
+
+    conn = ScriptedConnection(respond)
+    repo = BaseRepository(ScriptedDatabase(conn), Item, table_name="items", timestamps=False)
+
+    updated = asyncio.run(repo.update_many({1: {"price": 1.5}, 2: {"price": 2.5}, 3: {}}))
+
+    assert [(item.id, item.price) for item in updated] == [(1, 1.5), (2, 2.5)]
+    sql, params = conn.executed[0]
+    assert sql == (
+        "UPDATE items AS t SET price = v.price FROM jsonb_populate_recordset(NULL::items, %s::jsonb) AS v "
+        "WHERE t.id = v.id RETURNING t.*"
+    )
+    assert json.loads(params[0]) == [{"price": 1.5, "id": 1}, {"price": 2.5, "id": 2}]
+
+
+def test_approximate_count_reads_the_plan():
+    conn = ScriptedConnection(lambda sql, params: (["QUERY PLAN"], [('[{"Plan": {"Plan Rows": 987}}]',)]))
+    repo = BaseRepository(ScriptedDatabase(conn), Item, table_name="items")
+
+    assert asyncio.run(repo.count(QueryFilter().add("name", "=", "a"), approximate=True)) == 987
+    assert conn.executed[0] == ("EXPLAIN (FORMAT JSON) SELECT 1 FROM items WHERE name = %s", ["a"])
+
+
+class PooledConnection:
+    """Stand-in for PostgresConnection drawing from a shared ThreadedConnectionPool-like pool."""
+
+    pool = None
+
+    def __init__(self, **params):
+        self.conn = None
+
+    def connect(self):
+        if not PooledConnection.pool.acquire(blocking=False):
+            return False  # psycopg2 raises PoolError, which connect() turns into False
+        self.conn = ScriptedConnection(lambda sql, params: (["ok"], [(1,)]), latency=0.05)
+        return True
+
+    def close(self):
+        if self.conn is not None:
+            self.conn = None
+            PooledConnection.pool.release()
+        return True
+
+
+def test_concurrent_transactions_leave_room_for_the_connect_connection(monkeypatch):
+    import infrastructure.database.base as base_module  # type: ignore
+
+    monkeypatch.setattr(PooledConnection, "pool", threading.BoundedSemaphore(4))
+    monkeypatch.setattr(base_module, "PostgresConnection", PooledConnection)
+    db = Database().configure({"dsn": "postgresql://test", "pool_max_size": 4})
+
+    def query(conn):
+        cur = conn.cursor()
+        cur.execute("SELECT 1")
+        return cur.fetchone()[0]
+
+    async def main():
+        assert await db.connect()
+        try:
+            return await asyncio.gather(*(db.run_in_transaction(query) for _ in range(8)))
+        finally:
+            await db.disconnect()
+
+    assert asyncio.run(main()) == [1] * 8
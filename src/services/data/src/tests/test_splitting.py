@@ -0,0 +1,133 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Ensure src root is on path
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from splitting import (  # type: ignore
+    Fold,
+    SplitDataset,
+    fold_splits,
+    folds_from_splits,
+    purged_kfold,
+    read_fold_manifest,
+    walk_forward_folds,
+    write_fold_manifest,
+)
+
+
+@pytest.fixture
+def minutes():
+    times = pd.date_range("2024-01-01", periods=10 * 24 * 60, freq="1min")
+    return pd.DataFrame({"timestamp": times, "close": np.arange(len(times), dtype=float)})
+
+
+def test_rolling_row_folds():
+    folds = walk_forward_folds(pd.date_range("2024-01-01", periods=100, freq="1h"), train_size=40, test_size=20)
+
+    assert [(f.train, f.test) for f in folds] == [
+        (((0, 40),), (40, 60)),
+        (((20, 60),), (60, 80)),
+        (((40, 80),), (80, 100)),
+    ]
+
+
+def test_expanding_folds_with_purge_and_step():
+    times = pd.date_range("2024-01-01", periods=100, freq="1h")
+
+    folds = walk_forward_folds(times, train_size=30, test_size=10, step=20, expanding=True, purge=5)
+
+    assert [(f.train, f.test) for f in folds] == [
+        (((0, 25),), (30, 40)),
+        (((0, 45),), (50, 60)),
+        (((0, 65),), (70, 80)),
+        (((0, 85),), (90, 100)),
+    ]
+
+
+def test_time_based_folds_follow_calendar(minutes):
+    folds = walk_forward_folds(minutes["timestamp"], train_size="3D", test_size="1D", purge="30min")
+
+    assert len(folds) == 7
+    first = folds[0]
+    assert first.train == ((0, 3 * 1440 - 30),)
+    assert first.test == (3 * 1440, 4 * 1440)
+    assert all(f.test_rows == 1440 and f.train_rows == 3 * 1440 - 30 for f in folds)
+
+
+def test_mixed_size_kinds_rejected(minutes):
+    with pytest.raises(ValueError):
+        walk_forward_folds(minutes["timestamp"], train_size=100, test_size="1D")
+
+
+def test_purged_kfold_drops_purge_and_embargo_rows():
+    times = pd.date_range("2024-01-01", periods=100, freq="1h")
+
+    folds = purged_kfold(times, n_splits=4, purge=3, embargo=2)
+
+    assert folds[0].train == ((27, 100),) and folds[0].test == (0, 25)
+    assert folds[1].train == ((0, 22), (52, 100)) and folds[1].test == (25, 50)
+    assert folds[3].train == ((0, 72),)
+    for fold in folds:
+        train = fold.train_indices()
+        assert not np.intersect1d(train, fold.test_indices()).size
+
+
+def test_boundaries_round_trip_through_manifest(tmp_path, minutes):
+    folds = purged_kfold(minutes["timestamp"], n_splits=3, purge="1h", embargo="1h")
+
+    splits = fold_splits(folds, minutes["timestamp"])
+    assert [s[0] for s in splits[:3]] == ["fold_000_train", "fold_000_test", "fold_001_train"]
+    assert splits[1][1] == minutes["timestamp"].iloc[0]
+
+    path = write_fold_manifest(tmp_path / "folds.json", folds, minutes["timestamp"], symbol="BTCUSD")
+    assert read_fold_manifest(path, minutes["timestamp"]) == folds
+    assert folds_from_splits(splits, minutes["timestamp"]) == folds
+
+
+def test_dataset_slices_share_memory(minutes):
+    dataset = SplitDataset.from_frame(minutes)
+    folds = dataset.walk_forward("2D", "1D", max_folds=2)
+
+    (fold, train, test), _ = list(dataset.iter_folds(folds))
+
+    assert len(train) == fold.train_rows and len(test) == fold.test_rows
+    assert np.shares_memory(train["close"].to_numpy(), minutes["close"].to_numpy())
+    assert test["timestamp"].iloc[0] == pd.Timestamp("2024-01-03")
+
+
+def test_memory_mapped_parquet_dataset(tmp_path, minutes):
+    pq = pytest.importorskip("pyarrow.parquet")
+    import pyarrow as pa
+
+    path = tmp_path / "bars.parquet"
+    pq.write_table(pa.Table.from_pandas(minutes, preserve_index=False), path)
+
+    dataset = SplitDataset.from_parquet(path)
+    folds = dataset.purged_kfold(n_splits=3, embargo=10)
+    fold, train, test = next(dataset.iter_folds(folds[1:]))
+
+    assert isinstance(train, pa.Table) and train.num_rows == fold.train_rows
+    assert test.column("close")[0].as_py() == float(fold.test[0])
+
+
+def test_unsorted_frame_is_sorted_once(minutes):
+    shuffled = minutes.sample(frac=1.0, random_state=0)
+
+    dataset = SplitDataset.from_frame(shuffled, time_col="timestamp")
+
+    assert dataset.slice(0, 3)["close"].tolist() == [0.0, 1.0, 2.0]
+    with pytest.raises(ValueError):
+        walk_forward_folds(shuffled["timestamp"], 10, 10)
+
+
+def test_fold_is_frozen():
+    fold = Fold(0, ((0, 5),), (5, 10))
+    with pytest.raises(AttributeError):
+        fold.index = 1  # type: ignore[misc]
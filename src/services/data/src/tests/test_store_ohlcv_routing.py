@@ -0,0 +1,236 @@
+import sys
+from pathlib import Path
+from datetime import datetime, timezone, timedelta
+
+import pandas as pd
+import pytest
+
+# Ensure src root is on path
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import store  # type: ignore
+
+
+class UndefinedTable(Exception):
+    pgcode = "42P01"
+
+
+def make_stub(responses):
+    """get_connection stub answering queries by the relation they read from."""
+    executed = []
+
+    class Cursor:
+        def execute(self, sql, params):
+            executed.append((sql, params))
+            relation = sql.split(" FROM ")[1].split()[0]
+            self._result = responses.get(relation, [])
+            if isinstance(self._result, Exception):
+                raise self._result
+        def fetchall(self):
+            if callable(self._result):
+                return self._result(executed[-1][1])
+            return self._result
+        def __enter__(self):
+            return self
+        def __exit__(self, *exc):
+            return False
+
+    class Conn:
+        def cursor(self):
+            return Cursor()
+        def __enter__(self):
+            return self
+        def __exit__(self, *exc):
+            return False
+
+    return (lambda: Conn()), executed
+
+
+def minute_rows(start, n):
+    return [
+        (start + timedelta(minutes=i), 100.0 + i, 101.0 + i, 99.0 + i, 100.5 + i, 1.0)
+        for i in range(n)
+    ]
+
+
+@pytest.fixture(autouse=True)
+def reset_availability(monkeypatch):
+    monkeypatch.setattr(store, "_aggregates_available", None)
+
+
+@pytest.mark.parametrize("interval,expected", [
+    ("5m", ("ohlcv_5m", 300)),
+    ("15m", ("ohlcv_5m", 300)),
+    ("1h", ("ohlcv_1h", 3600)),
+    ("4h", ("ohlcv_1h", 3600)),
+    ("1d", ("ohlcv_1d", 86400)),
+    ("1w", ("ohlcv_1d", 86400)),
+    ("2m", ("ohlcv", 60)),
+    ("30s", None),
+    ("1mo", None),
+])
+def test_route_picks_coarsest_dividing_aggregate(interval, expected):
+    assert store.route_ohlcv_interval(interval) == expected
+
+
+def test_read_resamples_finer_aggregate(monkeypatch):
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    hourly = [
+        (base + timedelta(hours=i), 100.0 + i, 110.0 + i, 90.0 + i, 101.0 + i, 2.0)
+        for i in range(8)
+    ]
+    stub, executed = make_stub({"ohlcv_1h": hourly})
+    monkeypatch.setattr(store, "get_connection", stub)
+
+    df = store.read_ohlcv("binance", "BTCUSDT", "4h", base, base + timedelta(hours=8))
+
+    assert "ohlcv_1h" in executed[0][0]
+    assert len(df) == 2
+    assert df.iloc[0].to_dict() == {
+        "ts": pd.Timestamp(base), "open": 100.0, "high": 113.0, "low": 90.0, "close": 104.0, "volume": 8.0,
+    }
+
+
+def test_read_falls_back_to_native_interval_rows(monkeypatch):
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    daily = [(base, 1.0, 2.0, 0.5, 1.5, 10.0)]
+    stub, executed = make_stub({"ohlcv_1d": [], "ohlcv": lambda params: daily if params[2] == "1d" else []})
+    monkeypatch.setattr(store, "get_connection", stub)
+
+    df = store.read_ohlcv("eodhd", "AAPL", "1d", base, base)
+
+    assert len(df) == 1
+    assert executed[-1][1] == ("eodhd", "AAPL", "1d", base, base)
+
+
+def test_read_without_timescale_resamples_raw_minutes(monkeypatch):
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    stub, executed = make_stub({"ohlcv_5m": UndefinedTable("relation does not exist"), "ohlcv": minute_rows(base, 10)})
+    monkeypatch.setattr(store, "get_connection", stub)
+
+    df = store.read_ohlcv("binance", "BTCUSDT", "5m", base, base + timedelta(minutes=9))
+
+    assert list(df["open"]) == [100.0, 105.0]
+    assert list(df["close"]) == [104.5, 109.5]
+    assert list(df["volume"]) == [5.0, 5.0]
+    assert store._aggregates_available is False
+    assert store.route_ohlcv_interval("1h") == ("ohlcv", 60)
+
+
+def test_read_resamples_raw_minutes_when_aggregate_is_empty(monkeypatch):
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    stub, executed = make_stub({"ohlcv_5m": [], "ohlcv": lambda params: minute_rows(base, 10) if params[2] == "1m" else []})
+    monkeypatch.setattr(store, "get_connection", stub)
+
+    df = store.read_ohlcv("binance", "BTCUSDT", "5m", base, base + timedelta(minutes=9))
+
+    assert list(df["open"]) == [100.0, 105.0]
+    assert [params[2] for _, params in executed[1:]] == ["1m"]
+
+
+def test_backfill_windows_cover_rows_older_than_each_policy():
+    now = datetime(2024, 6, 10, 12, 0, tzinfo=timezone.utc)
+    stamps = pd.DatetimeIndex([now - timedelta(days=2, minutes=7), now - timedelta(days=2)])
+    ts_us = stamps.as_unit("us").asi8
+
+    windows = store.backfill_windows(ts_us, now=now)
+
+    # Two days back is outside ohlcv_5m's 1 day policy window but inside the 1h and 1d ones
+    assert windows == [(
+        "ohlcv_5m",
+        datetime(2024, 6, 8, 11, 50, tzinfo=timezone.utc),
+        datetime(2024, 6, 8, 12, 5, tzinfo=timezone.utc),
+    )]
+    assert store.backfill_windows(pd.DatetimeIndex([now - timedelta(minutes=5)]).as_unit("us").asi8, now=now) == []
+    assert {view for view, _, _ in store.backfill_windows(ts_us - 30 * 86_400_000_000, now=now)} == {
+        "ohlcv_5m", "ohlcv_1h", "ohlcv_1d",
+    }
+
+
+class ScriptedCursor:
+    """Cursor answering fetches from a list of canned results and recording SQL."""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def execute(self, sql, params=None):
+        self.conn.executed.append((" ".join(sql.split()), params, self.conn.autocommit))
+        self._rows = self.conn.results.pop(0) if sql.lstrip().upper().startswith("SELECT") and self.conn.results else []
+
+    def fetchone(self):
+        return self._rows[0] if self._rows else None
+
+    def fetchall(self):
+        return list(self._rows)
+
+    def copy_expert(self, sql, file, size=8192):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class ScriptedConn:
+    def __init__(self, results=()):
+        self.results = list(results)
+        self.executed = []
+        self.autocommit = False
+
+    def cursor(self):
+        return ScriptedCursor(self)
+
+    def commit(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+def test_ensure_schema_skips_applied_compression_and_materializes_new_views(monkeypatch):
+    conn = ScriptedConn(results=[[(1,)], [(1,)], [("ohlcv_1d",)]])
+    monkeypatch.setattr(store, "get_connection", lambda: conn)
+
+    store.ensure_schema()
+
+    statements = [sql for sql, _, _ in conn.executed]
+    assert not any(sql.startswith("ALTER TABLE ohlcv SET") for sql in statements)
+    refreshes = [(params, autocommit) for sql, params, autocommit in conn.executed if sql.startswith("CALL")]
+    assert refreshes == [(("ohlcv_5m", None, None), True), (("ohlcv_1h", None, None), True)]
+    assert conn.autocommit is False
+
+
+def test_ensure_schema_configures_compression_once(monkeypatch):
+    conn = ScriptedConn(results=[[(1,)], [], []])
+    monkeypatch.setattr(store, "get_connection", lambda: conn)
+
+    store.ensure_schema()
+
+    assert sum(sql.startswith("ALTER TABLE ohlcv SET") for sql, _, _ in conn.executed) == 1
+
+
+def test_bulk_upsert_refreshes_backfilled_history(monkeypatch):
+    conn = ScriptedConn()
+    monkeypatch.setattr(store, "get_connection", lambda: conn)
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    ts = pd.date_range(base, periods=90, freq="1min")
+
+    assert store.bulk_upsert_ohlcv("polygon", "AAPL", "1m", {"ts": ts, "close": range(90)}) == 90
+
+    refreshes = [params for sql, params, autocommit in conn.executed if sql.startswith("CALL") and autocommit]
+    assert refreshes == [
+        ("ohlcv_1d", base, base + timedelta(days=1)),
+        ("ohlcv_1h", base, base + timedelta(hours=2)),
+        ("ohlcv_5m", base, base + timedelta(minutes=90)),
+    ]
+
+    conn.executed.clear()
+    store.bulk_upsert_ohlcv("polygon", "AAPL", "1d", {"ts": [base], "close": [1.0]})
+    assert not any(sql.startswith("CALL") for sql, _, _ in conn.executed)
@@ -0,0 +1,93 @@
+import enum
+import importlib.util
+import sys
+from datetime import datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Ensure src root is on path
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from processors.delta_scanner import DeltaScanner  # type: ignore  # noqa: E402
+
+# Load the tick module directly; the models package pulls in market/candle
+# dependencies that are unrelated to these tests
+_spec = importlib.util.spec_from_file_location("data_models_tick", ROOT / "models" / "tick.py")
+tick_module = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(tick_module)
+TickBatch = tick_module.TickBatch
+
+START = datetime(2025, 1, 2, 9, 30)
+# Flat runs, exact min_change steps, sub-threshold moves and a big jump
+PRICES = [1.10000, 1.10000, 1.10001, 1.10002, 1.100025, 1.10001, 1.09990, 1.09990, 1.20000, 1.19999]
+
+
+def batch(prices=PRICES):
+    return TickBatch(
+        symbol="EUR/USD",
+        timestamps=[START + timedelta(milliseconds=i) for i in range(len(prices))],
+        prices=prices,
+        volumes=np.ones(len(prices)),
+    )
+
+
+def summary(changes):
+    return [
+        (c.timestamp, c.old_price, c.new_price, c.delta, round(c.delta_pct, 12), c.direction, c.is_micro)
+        for c in changes
+    ]
+
+
+def counters(scanner):
+    return (scanner.total_changes, scanner.micro_changes, scanner.up_changes,
+            scanner.down_changes, scanner.neutral_changes, scanner.last_price)
+
+
+@pytest.mark.parametrize("chunks", [[PRICES], [PRICES[:4], PRICES[4:]]])
+def test_scan_batch_matches_scan_tick(chunks):
+    per_tick, batched = DeltaScanner(), DeltaScanner()
+    expected, actual = [], []
+    offset = 0
+    for chunk in chunks:
+        for i, price in enumerate(chunk):
+            change = per_tick.scan_tick(START + timedelta(milliseconds=offset + i), "EUR/USD", Decimal(repr(price)))
+            if change:
+                expected.append(change)
+        prices = batch(PRICES)[offset : offset + len(chunk)]
+        actual.extend(batched.scan_batch(prices))
+        offset += len(chunk)
+
+    assert summary(actual) == summary(expected)
+    assert counters(batched) == counters(per_tick)
+    assert {c.direction.name for c in actual} == {"UP", "DOWN", "NEUTRAL"}
+
+
+def test_scan_ticks_dispatches_batches():
+    scanner = DeltaScanner()
+
+    assert len(scanner.scan_ticks(batch())) == len(PRICES) - 1
+
+
+class Side(enum.Enum):
+    BUY = "buy"
+    SELL = "sell"
+
+    def __str__(self):
+        return self.value
+
+
+def test_sides_accept_mixed_case_codes_and_non_strings():
+    sides = ["BUY", "sell", None, "", Side.SELL, 1, -1, 0, "hold", b"buy"]
+    encoded = TickBatch("X", np.arange(len(sides)), np.ones(len(sides)), np.ones(len(sides)), sides=sides).sides
+
+    assert encoded.tolist() == [1, -1, 0, 0, -1, 1, -1, 0, 0, 0]
+
+
+def test_invalid_side_code_is_rejected():
+    with pytest.raises(ValueError, match="Invalid side code 2"):
+        TickBatch("X", [0], [1.0], [1.0], sides=[2])
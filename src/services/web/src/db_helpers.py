@@ -1,9 +1,10 @@
 """Database helper functions for web views."""
 
+from datetime import date, datetime, timedelta, timezone
 from decimal import Decimal
 from typing import Any, Dict, List, Optional
 
-from sqlalchemy import func
+from sqlalchemy import DateTime, case, column, func, literal_column, table, text
 from sqlalchemy.orm import Session
 
 from core.database.models import Account, BalanceHistory, Position, Trade, Session as DBSession
@@ -30,6 +31,163 @@ def get_user_accounts(user_id: int = None) -> List[Account]:
         close_db_session(session)
 
 
+# Daily P&L rollup created by sql/migrations/007_trade_pnl_rollup.sql
+PNL_ROLLUP = "daily_trade_pnl"
+PNL_FIELDS = (
+    "trades_count",
+    "winning_trades",
+    "losing_trades",
+    "gross_profit",
+    "gross_loss",
+    "total_pnl",
+    "total_fees",
+)
+
+# Dialects whose sessions aggregate in SQL; others (SQLite in tests) use the Python fallback
+SQL_AGGREGATE_DIALECTS = {"postgresql"}
+
+daily_trade_pnl = table(
+    PNL_ROLLUP,
+    column("day", DateTime(timezone=True)),
+    column("account_id"),
+    column("strategy_name"),
+    column("symbol"),
+    *(column(name) for name in PNL_FIELDS),
+)
+
+_rollup_available: Dict[str, bool] = {}
+
+
+def use_sql_aggregates(session: Session) -> bool:
+    """Whether statistics for this session are computed by the database."""
+    try:
+        return session.get_bind().dialect.name in SQL_AGGREGATE_DIALECTS
+    except Exception:
+        return False
+
+
+def has_pnl_rollup(session: Session) -> bool:
+    """Whether the daily P&L rollup exists (checked once per database)."""
+    bind = session.get_bind()
+    key = str(bind.url)
+    if key not in _rollup_available:
+        if bind.dialect.name != "postgresql":
+            _rollup_available[key] = False
+        else:
+            _rollup_available[key] = bool(
+                session.execute(text("SELECT to_regclass(:name) IS NOT NULL"), {"name": PNL_ROLLUP}).scalar()
+            )
+    return _rollup_available[key]
+
+
+def _pnl_source(session: Session):
+    """Return (from clause, key columns, P&L aggregates) for the rollup, or for raw trades."""
+    if has_pnl_rollup(session):
+        c = daily_trade_pnl.c
+        keys = {
+            "account_id": c.account_id,
+            "strategy": func.coalesce(c.strategy_name, literal_column("'Manual'")),
+            "symbol": c.symbol,
+            "day": c.day,
+            "since": c.day,
+        }
+        aggregates = [func.coalesce(func.sum(c[name]), 0).label(name) for name in PNL_FIELDS]
+        return daily_trade_pnl, keys, aggregates
+
+    pnl = Trade.realized_pnl
+    if session.get_bind().dialect.name == "postgresql":
+        day = func.date_trunc(literal_column("'day'"), func.timezone(literal_column("'UTC'"), Trade.time))
+    else:
+        day = func.date(Trade.time)
+    keys = {
+        "account_id": Trade.account_id,
+        "strategy": func.coalesce(Trade.strategy_name, literal_column("'Manual'")),
+        "symbol": Trade.symbol,
+        "day": day,
+        "since": Trade.time,
+    }
+    aggregates = [
+        func.count(Trade.id).label("trades_count"),
+        func.coalesce(func.sum(case((pnl > 0, 1), else_=0)), 0).label("winning_trades"),
+        func.coalesce(func.sum(case((pnl < 0, 1), else_=0)), 0).label("losing_trades"),
+        func.coalesce(func.sum(case((pnl > 0, pnl), else_=0)), 0).label("gross_profit"),
+        func.coalesce(func.sum(case((pnl < 0, -pnl), else_=0)), 0).label("gross_loss"),
+        func.coalesce(func.sum(pnl), 0).label("total_pnl"),
+        func.coalesce(func.sum(Trade.fee), 0).label("total_fees"),
+    ]
+    return Trade.__table__, keys, aggregates
+
+
+def query_pnl(session: Session, account_id: int = None, group_by: str = None, since: datetime = None):
+    """Aggregate trade P&L in the database, optionally grouped by strategy, symbol or day.
+
+    Returns one row of PNL_FIELDS, or (when grouped) rows with a leading ``key`` column.
+    """
+    source, keys, aggregates = _pnl_source(session)
+    columns = [keys[group_by].label("key")] if group_by else []
+    query = session.query(*columns, *aggregates).select_from(source)
+
+    if account_id:
+        query = query.filter(keys["account_id"] == account_id)
+    if since is not None:
+        query = query.filter(keys["since"] >= since)
+
+    if group_by:
+        return query.group_by(keys[group_by]).order_by(keys[group_by]).all()
+    return query.one()
+
+
+def _pnl_stats(row) -> Dict[str, float]:
+    """Convert an aggregate row to plain numbers."""
+    stats = {name: float(getattr(row, name) or 0) for name in PNL_FIELDS}
+    for name in ("trades_count", "winning_trades", "losing_trades"):
+        stats[name] = int(stats[name])
+    return stats
+
+
+def _pnl_stats_from_trades(trades: List[Trade]) -> Dict[str, float]:
+    """Python equivalent of the SQL aggregates, used when the database is not PostgreSQL."""
+    wins = [float(t.realized_pnl) for t in trades if t.realized_pnl and t.realized_pnl > 0]
+    losses = [float(t.realized_pnl) for t in trades if t.realized_pnl and t.realized_pnl < 0]
+    return {
+        'trades_count': len(trades),
+        'winning_trades': len(wins),
+        'losing_trades': len(losses),
+        'gross_profit': sum(wins),
+        'gross_loss': abs(sum(losses)),
+        'total_pnl': sum([float(t.realized_pnl or 0) for t in trades]),
+        'total_fees': sum([float(t.fee or 0) for t in trades]),
+    }
+
+
+def _group_trades(trades: List[Trade], key) -> Dict[Any, List[Trade]]:
+    """Group trades by key(trade), preserving first-seen order."""
+    groups: Dict[Any, List[Trade]] = {}
+    for trade in trades:
+        groups.setdefault(key(trade), []).append(trade)
+    return groups
+
+
+def _win_rate(stats: Dict[str, float]) -> float:
+    total = stats['trades_count']
+    return (stats['winning_trades'] / total * 100) if total > 0 else 0
+
+
+def _profit_factor(stats: Dict[str, float]) -> float:
+    return (stats['gross_profit'] / stats['gross_loss']) if stats['gross_loss'] > 0 else 0
+
+
+def _utc_day(value) -> date:
+    """Normalize a day bucket (date, naive/aware datetime or ISO string) to a UTC date."""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc)
+        return value.date()
+    return value
+
+
 def get_account_summary(account_id: int = None) -> Dict[str, Any]:
     """Get summary statistics for an account."""
     session = get_db_session()
@@ -44,44 +202,32 @@ def get_account_summary(account_id: int = None) -> Dict[str, Any]:
         if not account:
             return get_empty_account_summary()
         
-        # Get trades for this account
-        trades = session.query(Trade).filter(Trade.account_id == account.id).all()
-        
-        # Get positions for this account
-        positions = session.query(Position).filter(Position.account_id == account.id).all()
-        
-        # Calculate metrics
-        total_trades = len(trades)
-        winning_trades = len([t for t in trades if t.realized_pnl and t.realized_pnl > 0])
-        losing_trades = len([t for t in trades if t.realized_pnl and t.realized_pnl < 0])
-        
-        win_rate = (winning_trades / total_trades * 100) if total_trades > 0 else 0
-        
-        # Calculate total PnL
-        total_pnl = sum([float(t.realized_pnl or 0) for t in trades])
-        
-        # Calculate profit factor
-        total_wins = sum([float(t.realized_pnl) for t in trades if t.realized_pnl and t.realized_pnl > 0])
-        total_losses = abs(sum([float(t.realized_pnl) for t in trades if t.realized_pnl and t.realized_pnl < 0]))
-        profit_factor = (total_wins / total_losses) if total_losses > 0 else 0
-        
-        # Calculate unrealized PnL from positions
-        unrealized_pnl = sum([float(p.unrealized_pnl or 0) for p in positions])
-        
-        # Active positions value
-        active_positions_value = sum([float(p.quantity * p.current_price) if p.current_price else 0 for p in positions])
+        if use_sql_aggregates(session):
+            stats = _pnl_stats(query_pnl(session, account_id=account.id))
+            active_positions, unrealized_pnl, active_positions_value = session.query(
+                func.count(Position.id),
+                func.coalesce(func.sum(Position.unrealized_pnl), 0),
+                func.coalesce(func.sum(Position.quantity * Position.current_price), 0),
+            ).filter(Position.account_id == account.id).one()
+        else:
+            trades = session.query(Trade).filter(Trade.account_id == account.id).all()
+            positions = session.query(Position).filter(Position.account_id == account.id).all()
+            stats = _pnl_stats_from_trades(trades)
+            active_positions = len(positions)
+            unrealized_pnl = sum([float(p.unrealized_pnl or 0) for p in positions])
+            active_positions_value = sum([float(p.quantity * p.current_price) if p.current_price else 0 for p in positions])
         
         return {
             'account': account,
-            'total_trades': total_trades,
-            'winning_trades': winning_trades,
-            'losing_trades': losing_trades,
-            'win_rate': round(win_rate, 2),
-            'total_pnl': round(total_pnl, 2),
-            'unrealized_pnl': round(unrealized_pnl, 2),
-            'profit_factor': round(profit_factor, 2),
-            'active_positions': len(positions),
-            'active_positions_value': round(active_positions_value, 2),
+            'total_trades': stats['trades_count'],
+            'winning_trades': stats['winning_trades'],
+            'losing_trades': stats['losing_trades'],
+            'win_rate': round(_win_rate(stats), 2),
+            'total_pnl': round(stats['total_pnl'], 2),
+            'unrealized_pnl': round(float(unrealized_pnl), 2),
+            'profit_factor': round(_profit_factor(stats), 2),
+            'active_positions': active_positions,
+            'active_positions_value': round(float(active_positions_value), 2),
             'current_balance': float(account.current_balance),
         }
     finally:
@@ -186,40 +332,29 @@ def get_performance_metrics(account_id: int = None, days: int = 30) -> Dict[str,
     """Get detailed performance metrics."""
     session = get_db_session()
     try:
-        query = session.query(Trade)
-        
-        if account_id:
-            query = query.filter(Trade.account_id == account_id)
-        
-        trades = query.all()
+        if use_sql_aggregates(session):
+            stats = _pnl_stats(query_pnl(session, account_id=account_id))
+        else:
+            query = session.query(Trade)
+            if account_id:
+                query = query.filter(Trade.account_id == account_id)
+            stats = _pnl_stats_from_trades(query.all())
         
-        if not trades:
+        if not stats['trades_count']:
             return get_empty_performance_metrics()
         
-        # Calculate metrics
-        total_trades = len(trades)
-        winning_trades = [t for t in trades if t.realized_pnl and t.realized_pnl > 0]
-        losing_trades = [t for t in trades if t.realized_pnl and t.realized_pnl < 0]
-        
-        avg_win = sum([float(t.realized_pnl) for t in winning_trades]) / len(winning_trades) if winning_trades else 0
-        avg_loss = sum([float(t.realized_pnl) for t in losing_trades]) / len(losing_trades) if losing_trades else 0
-        
-        total_wins = sum([float(t.realized_pnl) for t in winning_trades])
-        total_losses = abs(sum([float(t.realized_pnl) for t in losing_trades]))
-        
-        profit_factor = (total_wins / total_losses) if total_losses > 0 else 0
-        
-        # Calculate total commissions
-        total_commissions = sum([float(t.fee or 0) for t in trades])
+        wins, losses = stats['winning_trades'], stats['losing_trades']
+        avg_win = stats['gross_profit'] / wins if wins else 0
+        avg_loss = -stats['gross_loss'] / losses if losses else 0
         
         return {
-            'total_trades': total_trades,
-            'winning_trades': len(winning_trades),
-            'losing_trades': len(losing_trades),
+            'total_trades': stats['trades_count'],
+            'winning_trades': wins,
+            'losing_trades': losses,
             'avg_win': round(avg_win, 2),
             'avg_loss': round(avg_loss, 2),
-            'profit_factor': round(profit_factor, 2),
-            'total_commissions': round(total_commissions, 2),
+            'profit_factor': round(_profit_factor(stats), 2),
+            'total_commissions': round(stats['total_fees'], 2),
             'expectancy': round(avg_win + avg_loss, 2),  # Simplified expectancy
         }
     finally:
@@ -244,41 +379,23 @@ def get_strategy_performance() -> List[Dict[str, Any]]:
     """Get performance breakdown by strategy."""
     session = get_db_session()
     try:
-        # Group trades by strategy
-        trades_by_strategy = {}
-        trades = session.query(Trade).all()
-        
-        for trade in trades:
-            strategy = trade.strategy_name or 'Manual'
-            if strategy not in trades_by_strategy:
-                trades_by_strategy[strategy] = []
-            trades_by_strategy[strategy].append(trade)
+        if use_sql_aggregates(session):
+            groups = [(row.key, _pnl_stats(row)) for row in query_pnl(session, group_by="strategy")]
+        else:
+            trades_by_strategy = _group_trades(session.query(Trade).all(), lambda t: t.strategy_name or 'Manual')
+            groups = [(name, _pnl_stats_from_trades(trades)) for name, trades in trades_by_strategy.items()]
         
         result = []
-        for strategy, strategy_trades in trades_by_strategy.items():
-            total_trades = len(strategy_trades)
-            winning_trades = [t for t in strategy_trades if t.realized_pnl and t.realized_pnl > 0]
-            losing_trades = [t for t in strategy_trades if t.realized_pnl and t.realized_pnl < 0]
-            
-            win_rate = (len(winning_trades) / total_trades * 100) if total_trades > 0 else 0
-            
-            total_wins = sum([float(t.realized_pnl) for t in winning_trades])
-            total_losses = abs(sum([float(t.realized_pnl) for t in losing_trades]))
-            profit_factor = (total_wins / total_losses) if total_losses > 0 else 0
-            
-            total_pnl = sum([float(t.realized_pnl or 0) for t in strategy_trades])
-            
-            avg_win = total_wins / len(winning_trades) if winning_trades else 0
-            avg_loss = total_losses / len(losing_trades) if losing_trades else 0
-            
+        for strategy, stats in groups:
+            wins, losses = stats['winning_trades'], stats['losing_trades']
             result.append({
                 'name': strategy,
-                'total_trades': total_trades,
-                'win_rate': round(win_rate, 2),
-                'profit_factor': round(profit_factor, 2),
-                'total_pnl': round(total_pnl, 2),
-                'avg_win': round(avg_win, 2),
-                'avg_loss': round(avg_loss, 2),
+                'total_trades': stats['trades_count'],
+                'win_rate': round(_win_rate(stats), 2),
+                'profit_factor': round(_profit_factor(stats), 2),
+                'total_pnl': round(stats['total_pnl'], 2),
+                'avg_win': round(stats['gross_profit'] / wins if wins else 0, 2),
+                'avg_loss': round(stats['gross_loss'] / losses if losses else 0, 2),
                 'sharpe': 0,  # Would need more data to calculate properly
                 'status': 'active',  # Could be determined from recent activity
             })
@@ -288,6 +405,65 @@ def get_strategy_performance() -> List[Dict[str, Any]]:
         close_db_session(session)
 
 
+def get_symbol_performance(account_id: int = None) -> List[Dict[str, Any]]:
+    """Get performance breakdown by symbol."""
+    session = get_db_session()
+    try:
+        if use_sql_aggregates(session):
+            groups = [(row.key, _pnl_stats(row)) for row in query_pnl(session, account_id=account_id, group_by="symbol")]
+        else:
+            query = session.query(Trade)
+            if account_id:
+                query = query.filter(Trade.account_id == account_id)
+            trades_by_symbol = _group_trades(query.all(), lambda t: t.symbol)
+            groups = [(symbol, _pnl_stats_from_trades(trades)) for symbol, trades in sorted(trades_by_symbol.items())]
+        
+        return [
+            {
+                'symbol': symbol,
+                'total_trades': stats['trades_count'],
+                'winning_trades': stats['winning_trades'],
+                'losing_trades': stats['losing_trades'],
+                'win_rate': round(_win_rate(stats), 2),
+                'profit_factor': round(_profit_factor(stats), 2),
+                'total_pnl': round(stats['total_pnl'], 2),
+                'total_commissions': round(stats['total_fees'], 2),
+            }
+            for symbol, stats in groups
+        ]
+    finally:
+        close_db_session(session)
+
+
+def get_daily_pnl(account_id: int = None, days: int = 7) -> Dict[str, List]:
+    """Get realized PnL per UTC day for the last `days` days (oldest first, zero-filled)."""
+    today = datetime.now(timezone.utc).date()
+    first_day = today - timedelta(days=days - 1)
+    since = datetime(first_day.year, first_day.month, first_day.day, tzinfo=timezone.utc)
+    
+    session = get_db_session()
+    try:
+        pnl_by_day = {}
+        if use_sql_aggregates(session):
+            for row in query_pnl(session, account_id=account_id, group_by="day", since=since):
+                pnl_by_day[_utc_day(row.key)] = float(row.total_pnl or 0)
+        else:
+            query = session.query(Trade).filter(Trade.time >= since)
+            if account_id:
+                query = query.filter(Trade.account_id == account_id)
+            for trade in query.all():
+                day = _utc_day(trade.time)
+                pnl_by_day[day] = pnl_by_day.get(day, 0) + float(trade.realized_pnl or 0)
+        
+        labels = [first_day + timedelta(days=i) for i in range(days)]
+        return {
+            'labels': [day.strftime('%Y-%m-%d') for day in labels],
+            'pnl': [round(pnl_by_day.get(day, 0), 2) for day in labels],
+        }
+    finally:
+        close_db_session(session)
+
+
 def get_balance_history(account_id: int = None, days: int = 30) -> Dict[str, List]:
     """Get balance history for charts."""
     session = get_db_session()
@@ -14,3 +14,8 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "web.django.settings")
 
 application = get_asgi_application()
+
+# Only server processes load this module, so management commands never start the refresher
+from monitor.services import start_background_refresh  # noqa: E402
+
+start_background_refresh()
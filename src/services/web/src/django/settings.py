@@ -222,6 +222,11 @@ CACHES = {
     }
 }
 
+# Service monitor health checks
+MONITOR_HEALTH_CACHE_TTL = float(os.getenv("MONITOR_HEALTH_CACHE_TTL", "10"))  # seconds a sweep is reused
+MONITOR_HEALTH_REFRESH_INTERVAL = float(os.getenv("MONITOR_HEALTH_REFRESH_INTERVAL", "0"))  # seconds between sweeps in WSGI/ASGI processes; 0 disables
+MONITOR_HEALTH_MAX_WORKERS = int(os.getenv("MONITOR_HEALTH_MAX_WORKERS", "16"))  # concurrent probes
+
 # Session settings - Redis-backed sessions
 SESSION_ENGINE = "django.contrib.sessions.backends.cache"
 SESSION_CACHE_ALIAS = "default"
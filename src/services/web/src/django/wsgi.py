@@ -14,3 +14,8 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "web.django.settings")
 
 application = get_wsgi_application()
+
+# Only server processes load this module, so management commands never start the refresher
+from monitor.services import start_background_refresh  # noqa: E402
+
+start_background_refresh()
@@ -3,8 +3,13 @@ Embeddings service for RAG system.
 Handles generating embeddings using OpenAI or local models with pgvector storage.
 """
 
+import io
 import os
-from typing import Any, Dict, List, Optional
+import struct
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 import numpy as np
 from openai import OpenAI
@@ -13,6 +18,63 @@ from sqlalchemy import text
 from core.database.models import Session
 from framework.config.constants import OPENAI_API_KEY
 
+# HNSW search settings (hnsw.iterative_scan needs pgvector >= 0.8; "" disables)
+HNSW_EF_SEARCH = int(os.getenv("RAG_HNSW_EF_SEARCH", "100"))
+HNSW_ITERATIVE_SCAN = os.getenv("RAG_HNSW_ITERATIVE_SCAN", "relaxed_order")
+
+# Maximum cached query embeddings per service (0 disables the cache)
+QUERY_CACHE_SIZE = int(os.getenv("RAG_QUERY_CACHE_SIZE", "512"))
+
+# PostgreSQL binary COPY framing
+_PGCOPY_HEADER = b"PGCOPY\n\xff\r\n\x00" + struct.pack(">ii", 0, 0)
+_PGCOPY_TRAILER = struct.pack(">h", -1)
+
+
+def vector_literal(embedding: Sequence[float]) -> str:
+    """Format an embedding as a pgvector text literal"""
+    return "[" + ",".join(map(repr, map(float, embedding))) + "]"
+
+
+def encode_copy_rows(chunk_ids: Sequence[int], embeddings: Sequence[Sequence[float]]) -> bytes:
+    """
+    Encode (chunk_id, embedding) rows as a binary COPY payload.
+
+    Vectors use pgvector's binary wire format (int16 dim, int16 unused,
+    big-endian float4 values), so Postgres never parses text literals.
+    All rows are packed with a single structured NumPy array.
+
+    Args:
+        chunk_ids: Chunk IDs
+        embeddings: Embedding vectors of equal dimension
+
+    Returns:
+        Payload for COPY ... FROM STDIN WITH (FORMAT BINARY)
+    """
+    vectors = np.asarray(embeddings, dtype=">f4")
+    if vectors.ndim != 2:
+        raise ValueError("All embeddings in a batch must have the same dimension")
+    n, dim = vectors.shape
+    row = np.dtype(
+        [
+            ("fields", ">i2"),
+            ("id_len", ">i4"),
+            ("id", ">i4"),
+            ("vec_len", ">i4"),
+            ("dim", ">i2"),
+            ("unused", ">i2"),
+            ("values", ">f4", (dim,)),
+        ]
+    )
+    rows = np.empty(n, dtype=row)
+    rows["fields"] = 2
+    rows["id_len"] = 4
+    rows["id"] = chunk_ids
+    rows["vec_len"] = 4 + 4 * dim
+    rows["dim"] = dim
+    rows["unused"] = 0
+    rows["values"] = vectors
+    return _PGCOPY_HEADER + rows.tobytes() + _PGCOPY_TRAILER
+
 
 class EmbeddingsService:
     """Generate and manage embeddings for RAG"""
@@ -22,6 +84,9 @@ class EmbeddingsService:
         model: str = "text-embedding-3-small",
         dimension: int = 1536,
         use_local: bool = True,
+        ef_search: int = HNSW_EF_SEARCH,
+        iterative_scan: Optional[str] = HNSW_ITERATIVE_SCAN,
+        query_cache_size: int = QUERY_CACHE_SIZE,
     ):
         """
         Initialize embeddings service.
@@ -30,10 +95,21 @@ class EmbeddingsService:
             model: Model name (OpenAI or HuggingFace)
             dimension: Embedding dimension
             use_local: Use local model instead of OpenAI API
+            ef_search: HNSW candidate list size for searches (higher = better recall)
+            iterative_scan: pgvector iterative scan mode ("relaxed_order",
+                "strict_order", or None/"" to disable)
+            query_cache_size: Maximum cached query embeddings
         """
         self.model = model
         self.dimension = dimension
         self.use_local = use_local
+        self.ef_search = ef_search
+        self.iterative_scan = iterative_scan or None
+        self.query_cache_size = query_cache_size
+        self._query_cache: OrderedDict[tuple[str, str], list[float]] = OrderedDict()
+        self._query_cache_lock = threading.Lock()
+        self.query_cache_hits = 0
+        self.query_cache_misses = 0
 
         if use_local:
             self._init_local_model()
@@ -87,6 +163,53 @@ class EmbeddingsService:
         else:
             return self._generate_openai(text)
 
+    @staticmethod
+    def normalize_query(text: str) -> str:
+        """Normalize query text for cache lookups (Unicode form and whitespace)"""
+        return " ".join(unicodedata.normalize("NFKC", text).split())
+
+    def embed_query(self, text: str) -> list[float]:
+        """
+        Generate a query embedding, served from an LRU cache when possible.
+
+        Queries are keyed by model and normalized text, so repeated or
+        re-spaced questions skip the embedding model entirely.
+
+        Args:
+            text: Query text
+
+        Returns:
+            Embedding vector as list of floats
+        """
+        normalized = self.normalize_query(text)
+        if self.query_cache_size <= 0:
+            return self.generate_embedding(normalized)
+
+        key = (self.model, normalized)
+        with self._query_cache_lock:
+            cached = self._query_cache.get(key)
+            if cached is not None:
+                self._query_cache.move_to_end(key)
+                self.query_cache_hits += 1
+                return list(cached)
+            self.query_cache_misses += 1
+
+        embedding = self.generate_embedding(normalized)
+
+        with self._query_cache_lock:
+            self._query_cache[key] = list(embedding)
+            self._query_cache.move_to_end(key)
+            while len(self._query_cache) > self.query_cache_size:
+                self._query_cache.popitem(last=False)
+        return embedding
+
+    def clear_query_cache(self) -> None:
+        """Drop all cached query embeddings"""
+        with self._query_cache_lock:
+            self._query_cache.clear()
+            self.query_cache_hits = 0
+            self.query_cache_misses = 0
+
     def _generate_openai(self, text: str) -> list[float]:
         """Generate embedding using OpenAI"""
         try:
@@ -189,6 +312,129 @@ class EmbeddingsService:
             if should_close:
                 session.close()
 
+    def store_chunk_embeddings(
+        self,
+        items: Iterable[Tuple[int, Sequence[float]]],
+        session: Optional[Session] = None,
+        batch_size: int = 1000,
+    ) -> int:
+        """
+        Store embeddings for many chunks in one transaction.
+
+        Rows are streamed into a temporary staging table with binary COPY
+        (psycopg2 or psycopg 3) and applied with a single UPDATE ... FROM per
+        batch. Drivers without COPY support fall back to one multi-row execute
+        per batch.
+
+        The caller's session is flushed but not committed, so embeddings
+        land in the same transaction as the chunks they belong to; a session
+        created here is committed before returning.
+
+        Args:
+            items: (chunk_id, embedding) pairs
+            session: SQLAlchemy session (creates new if not provided)
+            batch_size: Rows per COPY / execute
+
+        Returns:
+            Number of embeddings written
+        """
+        items = list(items)
+        if not items:
+            return 0
+
+        should_close = False
+        if session is None:
+            session = Session()
+            should_close = True
+
+        try:
+            written = 0
+            for i in range(0, len(items), batch_size):
+                batch = items[i : i + batch_size]
+                chunk_ids = [chunk_id for chunk_id, _ in batch]
+                embeddings = [embedding for _, embedding in batch]
+                written += self._write_embedding_batch(chunk_ids, embeddings, session)
+
+            if should_close:
+                session.commit()
+            return written
+        except Exception as e:
+            print(f"Error storing embeddings: {e}")
+            session.rollback()
+            raise
+        finally:
+            if should_close:
+                session.close()
+
+    def _write_embedding_batch(
+        self, chunk_ids: list[int], embeddings: list[Sequence[float]], session: Session
+    ) -> int:
+        """Write one batch of embeddings, using binary COPY when available"""
+        connection = session.connection()
+        dbapi_connection = connection.connection.dbapi_connection
+        cursor = dbapi_connection.cursor()
+
+        if not hasattr(cursor, "copy_expert") and not hasattr(cursor, "copy"):
+            cursor.close()
+            session.execute(
+                text(
+                    """
+                    UPDATE document_chunks
+                    SET embedding = CAST(:embedding AS vector)
+                    WHERE id = :chunk_id
+                """
+                ),
+                [
+                    {
+                        "chunk_id": chunk_id,
+                        "embedding": vector_literal(embedding),
+                    }
+                    for chunk_id, embedding in zip(chunk_ids, embeddings, strict=True)
+                ],
+            )
+            return len(chunk_ids)
+
+        try:
+            cursor.execute(
+                """
+                CREATE TEMP TABLE IF NOT EXISTS chunk_embedding_stage (
+                    chunk_id integer,
+                    embedding vector
+                ) ON COMMIT DROP
+            """
+            )
+            cursor.execute("TRUNCATE chunk_embedding_stage")
+            copy_sql = "COPY chunk_embedding_stage (chunk_id, embedding) FROM STDIN WITH (FORMAT BINARY)"
+            payload = encode_copy_rows(chunk_ids, embeddings)
+            if hasattr(cursor, "copy_expert"):  # psycopg2
+                cursor.copy_expert(copy_sql, io.BytesIO(payload))
+            else:  # psycopg 3
+                with cursor.copy(copy_sql) as copy:
+                    copy.write(payload)
+            cursor.execute(
+                """
+                UPDATE document_chunks dc
+                SET embedding = s.embedding
+                FROM chunk_embedding_stage s
+                WHERE dc.id = s.chunk_id
+            """
+            )
+            return cursor.rowcount
+        finally:
+            cursor.close()
+
+    def _configure_search(self, session: Session) -> None:
+        """Apply HNSW search settings for the current transaction"""
+        session.execute(
+            text("SELECT set_config('hnsw.ef_search', :ef_search, true)"),
+            {"ef_search": str(self.ef_search)},
+        )
+        if self.iterative_scan:
+            session.execute(
+                text("SELECT set_config('hnsw.iterative_scan', :mode, true)"),
+                {"mode": self.iterative_scan},
+            )
+
     def semantic_search(
         self,
         query_embedding: list[float],
@@ -200,6 +446,12 @@ class EmbeddingsService:
         """
         Perform semantic search using cosine similarity.
 
+        Filters are applied to the columns copied onto document_chunks, inside
+        the nearest-neighbour subquery, so the HNSW index (or a partial index
+        for the doc_type) serves the filtered search and iterative scans keep
+        fetching candidates until ``limit`` rows pass. The similarity
+        threshold and the join to documents run on that small result set.
+
         Args:
             query_embedding: Query embedding vector
             limit: Maximum number of results
@@ -217,49 +469,57 @@ class EmbeddingsService:
 
         try:
             # Build filter conditions
-            where_conditions = ["embedding IS NOT NULL"]
+            where_conditions = ["dc.embedding IS NOT NULL"]
             params = {
-                "query_embedding": str(query_embedding),
+                "query_embedding": vector_literal(query_embedding),
                 "limit": limit,
-                "threshold": similarity_threshold,
+                "max_distance": 1 - similarity_threshold,
             }
 
             if filters:
-                if "symbol" in filters:
-                    where_conditions.append("d.symbol = :symbol")
-                    params["symbol"] = filters["symbol"]
-
-                if "doc_type" in filters:
-                    where_conditions.append("d.doc_type = :doc_type")
-                    params["doc_type"] = filters["doc_type"]
-
-                if "timeframe" in filters:
-                    where_conditions.append("d.timeframe = :timeframe")
-                    params["timeframe"] = filters["timeframe"]
+                for column in ("symbol", "doc_type", "timeframe"):
+                    if column in filters:
+                        where_conditions.append(f"dc.{column} = :{column}")
+                        params[column] = filters[column]
 
             where_clause = " AND ".join(where_conditions)
 
-            # Semantic search query using pgvector cosine similarity
+            self._configure_search(session)
+
+            # Nearest neighbours first (index scan), then threshold and join.
+            # MATERIALIZED keeps the planner from pushing the join into the scan,
+            # and the outer ORDER BY restores exact order under relaxed_order.
             query = text(
                 f"""
+                WITH nearest AS MATERIALIZED (
+                    SELECT
+                        dc.id,
+                        dc.document_id,
+                        dc.content,
+                        dc.chunk_index,
+                        dc.metadata AS chunk_metadata,
+                        dc.embedding <=> CAST(:query_embedding AS vector) AS distance
+                    FROM document_chunks dc
+                    WHERE {where_clause}
+                    ORDER BY distance
+                    LIMIT :limit
+                )
                 SELECT
-                    dc.id,
-                    dc.document_id,
-                    dc.content,
-                    dc.chunk_index,
-                    dc.metadata as chunk_metadata,
+                    n.id,
+                    n.document_id,
+                    n.content,
+                    n.chunk_index,
+                    n.chunk_metadata,
                     d.doc_type,
                     d.title,
                     d.symbol,
                     d.timeframe,
                     d.metadata as doc_metadata,
-                    1 - (dc.embedding <=> :query_embedding::vector) as similarity
-                FROM document_chunks dc
-                JOIN documents d ON dc.document_id = d.id
-                WHERE {where_clause}
-                    AND (1 - (dc.embedding <=> :query_embedding::vector)) >= :threshold
-                ORDER BY dc.embedding <=> :query_embedding::vector
-                LIMIT :limit
+                    1 - n.distance as similarity
+                FROM nearest n
+                JOIN documents d ON n.document_id = d.id
+                WHERE n.distance <= :max_distance
+                ORDER BY n.distance
             """
             )
 
@@ -294,6 +554,9 @@ class EmbeddingsService:
         """
         Find similar chunks to a given chunk.
 
+        The source vector is looked up first and passed into the ORDER BY as a
+        constant, so the search is an HNSW index scan rather than a self-join.
+
         Args:
             chunk_id: Source chunk ID
             limit: Maximum number of results
@@ -308,25 +571,43 @@ class EmbeddingsService:
             should_close = True
 
         try:
+            source = session.execute(
+                text(
+                    """
+                    SELECT embedding::text
+                    FROM document_chunks
+                    WHERE id = :chunk_id AND embedding IS NOT NULL
+                """
+                ),
+                {"chunk_id": chunk_id},
+            ).scalar()
+            if source is None:
+                return []
+
+            self._configure_search(session)
+
             query = text(
                 """
-                SELECT
-                    dc2.id,
-                    dc2.content,
-                    dc2.document_id,
-                    1 - (dc1.embedding <=> dc2.embedding) as similarity
-                FROM document_chunks dc1
-                JOIN document_chunks dc2 ON dc1.id != dc2.id
-                WHERE dc1.id = :chunk_id
-                    AND dc1.embedding IS NOT NULL
-                    AND dc2.embedding IS NOT NULL
-                ORDER BY dc1.embedding <=> dc2.embedding
-                LIMIT :limit
+                WITH nearest AS MATERIALIZED (
+                    SELECT
+                        dc.id,
+                        dc.content,
+                        dc.document_id,
+                        dc.embedding <=> CAST(:source AS vector) AS distance
+                    FROM document_chunks dc
+                    WHERE dc.id != :chunk_id
+                        AND dc.embedding IS NOT NULL
+                    ORDER BY distance
+                    LIMIT :limit
+                )
+                SELECT id, content, document_id, 1 - distance as similarity
+                FROM nearest
+                ORDER BY distance
             """
             )
 
             results = session.execute(
-                query, {"chunk_id": chunk_id, "limit": limit}
+                query, {"source": source, "chunk_id": chunk_id, "limit": limit}
             ).fetchall()
 
             return [
@@ -49,26 +49,9 @@ class DataIngestionPipeline:
                 print(f"Trade {trade_id} not found")
                 return None
 
-            # Format trade analysis
-            content = self._format_trade_for_ingestion(trade)
-
-            # Create metadata
-            metadata = {
-                "trade_id": trade.id,
-                "pnl": float(trade.realized_pnl) if trade.realized_pnl else 0,
-                "pnl_percent": self._calculate_pnl_percent(trade),
-                "duration_hours": self._calculate_trade_duration(trade),
-                "strategy": trade.strategy_name,
-            }
-
             # Ingest
             doc_id = self.intelligence.ingest_document(
-                content=content,
-                doc_type="trade_analysis",
-                title=f"Trade Analysis: {trade.symbol} - {trade.position_side}",
-                symbol=trade.symbol,
-                metadata=metadata,
-                session=session,
+                **self._trade_document(trade), session=session
             )
 
             print(f"Ingested trade {trade_id} as document {doc_id}")
@@ -242,15 +225,17 @@ class DataIngestionPipeline:
 
             existing_trade_ids = set()
             for doc in existing_docs:
-                if doc.metadata and "trade_id" in doc.metadata:
-                    existing_trade_ids.add(doc.metadata["trade_id"])
-
-            # Ingest new trades
-            count = 0
-            for trade in trades:
-                if trade.id not in existing_trade_ids:
-                    if self.ingest_completed_trade(trade.id, session):
-                        count += 1
+                if doc.doc_metadata and "trade_id" in doc.doc_metadata:
+                    existing_trade_ids.add(doc.doc_metadata["trade_id"])
+
+            # Ingest new trades in a single batch
+            documents = [
+                self._trade_document(trade)
+                for trade in trades
+                if trade.id not in existing_trade_ids
+            ]
+            doc_ids = self.intelligence.ingest_documents(documents, session=session)
+            count = len(doc_ids)
 
             print(f"Batch ingested {count} trades")
             return count
@@ -262,6 +247,22 @@ class DataIngestionPipeline:
             if should_close:
                 session.close()
 
+    def _trade_document(self, trade: Trade) -> dict[str, Any]:
+        """Build the ingest_document arguments for a completed trade"""
+        return {
+            "content": self._format_trade_for_ingestion(trade),
+            "doc_type": "trade_analysis",
+            "title": f"Trade Analysis: {trade.symbol} - {trade.position_side}",
+            "symbol": trade.symbol,
+            "metadata": {
+                "trade_id": trade.id,
+                "pnl": float(trade.realized_pnl) if trade.realized_pnl else 0,
+                "pnl_percent": self._calculate_pnl_percent(trade),
+                "duration_hours": self._calculate_trade_duration(trade),
+                "strategy": trade.strategy_name,
+            },
+        }
+
     def _format_trade_for_ingestion(self, trade: Trade) -> str:
         """Format trade as natural language"""
         lines = [
@@ -41,8 +41,8 @@ class RetrievalService:
         Returns:
             List of relevant chunks with metadata
         """
-        # Generate query embedding
-        query_embedding = self.embeddings.generate_embedding(query)
+        # Generate query embedding (cached per normalized query text)
+        query_embedding = self.embeddings.embed_query(query)
 
         # Perform semantic search
         results = self.embeddings.semantic_search(
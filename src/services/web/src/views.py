@@ -18,6 +18,7 @@ from .db_helpers import (
     get_account_summary,
     get_active_positions,
     get_balance_history,
+    get_daily_pnl,
     get_performance_metrics,
     get_recent_trades,
     get_strategy_performance,
@@ -122,8 +123,10 @@ class DashboardView(LoginRequiredMixin, TemplateView):
                 context["price_labels"] = json.dumps(["Day 1", "Day 2", "Day 3", "Day 4", "Day 5", "Day 6"])
                 context["price_data"] = json.dumps([10000, 10000, 10000, 10000, 10000, 10000])
             
-            # Daily PnL would require more detailed time-series data
-            context["daily_pnl"] = json.dumps([0, 0, 0, 0, 0, 0, 0])
+            # Daily realized PnL for the account shown in the summary
+            account = summary.get('account')
+            daily_pnl = get_daily_pnl(account.id if account else None, days=7)
+            context["daily_pnl"] = json.dumps(daily_pnl['pnl'])
 
             # Recent signals - would come from a signals table or cache
             # For now, return empty list as signals are generated by Celery tasks
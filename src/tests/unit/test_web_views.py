@@ -69,7 +69,8 @@ class TestWebViewsWithMockDB:
         """Test dashboard view with empty database."""
         with patch('web.views.get_account_summary') as mock_summary, \
              patch('web.views.get_balance_history') as mock_history, \
-             patch('web.views.get_active_positions', return_value=[]):
+             patch('web.views.get_active_positions', return_value=[]), \
+             patch('web.views.get_daily_pnl', return_value={'labels': [], 'pnl': [0] * 7}):
             
             mock_summary.return_value = {
                 'total_pnl': 0,
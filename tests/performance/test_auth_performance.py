@@ -0,0 +1,66 @@
+"""
+Performance tests for request authentication using pytest-benchmark.
+Compares per-request token verification with and without the verified-token cache.
+"""
+import asyncio
+
+import pytest
+from fastapi.security import HTTPAuthorizationCredentials
+
+from src.framework.middleware import auth
+from src.framework.middleware.auth import JWTManager
+
+
+@pytest.mark.benchmark
+class TestTokenVerificationPerformance:
+    """Benchmark JWT verification on the request hot path."""
+
+    @pytest.fixture
+    def uncached_manager(self):
+        return JWTManager(secret_key="s" * 48, token_cache_size=0)
+
+    @pytest.fixture
+    def cached_manager(self):
+        return JWTManager(secret_key="s" * 48)
+
+    @pytest.fixture
+    def token(self, cached_manager):
+        return cached_manager.create_token(
+            user_id="user-1",
+            username="trader",
+            roles=["trader"],
+            permissions=["orders:read", "orders:write"],
+        )
+
+    def test_decode_token_uncached(self, benchmark, uncached_manager, token):
+        """Benchmark full signature verification on every call."""
+        result = benchmark(uncached_manager.decode_token, token)
+
+        assert result.sub == "user-1"
+
+    def test_decode_token_cached(self, benchmark, cached_manager, token):
+        """Benchmark repeated verification of the same token."""
+        cached_manager.decode_token(token)
+
+        result = benchmark(cached_manager.decode_token, token)
+
+        assert result.sub == "user-1"
+        assert cached_manager.token_cache.stats()["hits"] > 0
+
+    @pytest.mark.parametrize("cache_size", [0, auth.TOKEN_CACHE_SIZE])
+    def test_get_current_user(self, benchmark, monkeypatch, token, cache_size):
+        """Benchmark the FastAPI dependency used by authenticated routes."""
+        manager = JWTManager(secret_key="s" * 48, token_cache_size=cache_size)
+        monkeypatch.setattr(auth, "jwt_manager", manager)
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+        loop = asyncio.new_event_loop()
+
+        try:
+            user = benchmark(
+                lambda: loop.run_until_complete(auth.get_current_user(credentials))
+            )
+        finally:
+            loop.close()
+
+        assert user.user_id == "user-1"
+        assert user.has_permission("orders:write")
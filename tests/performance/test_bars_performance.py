@@ -0,0 +1,221 @@
+"""
+Performance tests for market bar conversion and persistence using pytest-benchmark.
+Compares the per-row MarketBar path in bars.py with the columnar path
+(to_bar_columns + binary COPY) for one million bars in each direction.
+
+The conversion and encode/decode benchmarks are CPU-only. The database
+round trips need a scratch Postgres/TimescaleDB reachable through the
+POSTGRES_* environment variables and OHLCV_BENCHMARK=1; rows are written
+under a dedicated source and deleted afterwards.
+"""
+import os
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+DATA_SRC = Path(__file__).resolve().parents[2] / "src/services/data/src"
+if str(DATA_SRC) not in sys.path:
+    sys.path.insert(0, str(DATA_SRC))
+
+N_BARS = 1_000_000
+START_TS = 1_704_067_200  # 2024-01-01 UTC
+SOURCE = "benchmark_bars"
+SYMBOL = "BTCUSDT"
+
+needs_db = pytest.mark.skipif(
+    not os.getenv("OHLCV_BENCHMARK"),
+    reason="OHLCV_BENCHMARK not set (needs a local Postgres via POSTGRES_* env)",
+)
+
+
+@pytest.fixture(scope="module")
+def bars_module():
+    import bars  # type: ignore
+
+    return bars
+
+
+@pytest.fixture(scope="module")
+def adapter_result():
+    """One million normalized adapter rows, as returned by adapter.fetch()."""
+    rng = np.random.default_rng(42)
+    close = 50000 * np.exp(rng.normal(0, 0.0008, N_BARS).cumsum())
+    spread = np.abs(rng.normal(0, 0.0005, N_BARS)) * close
+    frame = pd.DataFrame({
+        "ts": START_TS + 60 * np.arange(N_BARS),
+        "open": np.clip(np.roll(close, 1), close - spread, close + spread),
+        "high": close + spread,
+        "low": close - spread,
+        "close": close,
+        "volume": rng.exponential(2.0, N_BARS),
+    })
+    return {"provider": "binance", "data": frame.to_dict("records")}
+
+
+def to_market_bars_per_row(bars_module, adapter_result):
+    """The previous to_market_bars loop (schema validator omitted: its schema file is not in the tree)."""
+    provider = adapter_result.get("provider")
+    out = []
+    for r in adapter_result.get("data") or []:
+        try:
+            out.append(
+                bars_module.MarketBar(
+                    ts=int(r["ts"]),
+                    open=float(r["open"]),
+                    high=float(r["high"]),
+                    low=float(r["low"]),
+                    close=float(r["close"]),
+                    volume=float(r.get("volume", 0.0)),
+                    provider=provider,
+                )
+            )
+        except Exception:
+            continue
+    return out
+
+
+def upsert_rows_per_row(provider, bar_list):
+    """The previous BarRepository.upsert + upsert_ohlcv row building, up to executemany."""
+    df = pd.DataFrame([
+        {
+            "provider": b.provider or provider,
+            "symbol": SYMBOL,
+            "interval": "1m",
+            "datetime": datetime.fromtimestamp(b.ts, tz=timezone.utc),
+            "open": b.open,
+            "high": b.high,
+            "low": b.low,
+            "close": b.close,
+            "volume": b.volume,
+        }
+        for b in bar_list
+    ])
+    df["datetime"] = pd.to_datetime(df["datetime"])
+    rows = []
+    for _, r in df.iterrows():
+        row = [provider, SYMBOL, "1m", r["datetime"]]
+        row += [float(r[k]) if pd.notna(r[k]) else None for k in ["open", "high", "low", "close", "volume"]]
+        rows.append(tuple(row))
+    return rows
+
+
+def fetch_range_per_row(bars_module, rows):
+    """The previous fetch_range conversion of fetchall() tuples to MarketBar."""
+    return [
+        bars_module.MarketBar(
+            ts=int(r[0].timestamp()),
+            open=float(r[1]) if r[1] is not None else 0.0,
+            high=float(r[2]) if r[2] is not None else 0.0,
+            low=float(r[3]) if r[3] is not None else 0.0,
+            close=float(r[4]) if r[4] is not None else 0.0,
+            volume=float(r[5]) if r[5] is not None else 0.0,
+            provider="binance",
+        )
+        for r in rows
+    ]
+
+
+def _report(benchmark, label):
+    per_bar_ns = benchmark.stats.stats.min / N_BARS * 1e9
+    benchmark.extra_info["bars_per_second"] = N_BARS / benchmark.stats.stats.min
+    print(f"\n{label}: {benchmark.stats.stats.min:.2f}s for {N_BARS:,} bars ({per_bar_ns:.0f}ns per bar)")
+
+
+@pytest.mark.benchmark
+class TestBarConversionPerformance:
+    """Benchmark adapter result -> bars and bars -> write payload / read payload -> bars."""
+
+    def test_convert_per_row(self, benchmark, bars_module, adapter_result):
+        out = benchmark.pedantic(to_market_bars_per_row, args=(bars_module, adapter_result), rounds=3, iterations=1)
+        assert len(out) == N_BARS
+        _report(benchmark, "to_market_bars per row")
+
+    def test_convert_columnar(self, benchmark, bars_module, adapter_result):
+        columns = benchmark.pedantic(bars_module.to_bar_columns, args=(adapter_result,), rounds=3, iterations=1)
+        assert len(columns) == N_BARS and not columns.rejected
+        _report(benchmark, "to_bar_columns")
+
+    def test_write_payload_per_row(self, benchmark, bars_module, adapter_result):
+        bar_list = to_market_bars_per_row(bars_module, adapter_result)
+        rows = benchmark.pedantic(upsert_rows_per_row, args=("binance", bar_list), rounds=1, iterations=1)
+        assert len(rows) == N_BARS
+        _report(benchmark, "MarketBar -> DataFrame -> iterrows tuples")
+
+    def test_write_payload_columnar(self, benchmark, bars_module, adapter_result):
+        import store  # type: ignore
+
+        columns = bars_module.to_bar_columns(adapter_result)
+        values = {col: getattr(columns, col) for col in store.OHLCV_COLUMNS}
+        payload = benchmark.pedantic(
+            lambda: store.encode_ohlcv_copy(store._epoch_micros(columns.ts), values), rounds=3, iterations=1
+        )
+        assert len(payload) > N_BARS * 70
+        _report(benchmark, "BarColumns -> binary COPY stream")
+
+    def test_read_per_row(self, benchmark, bars_module, adapter_result):
+        data = adapter_result["data"]
+        rows = [
+            (datetime.fromtimestamp(r["ts"], tz=timezone.utc), r["open"], r["high"], r["low"], r["close"], r["volume"])
+            for r in data
+        ]
+        out = benchmark.pedantic(fetch_range_per_row, args=(bars_module, rows), rounds=3, iterations=1)
+        assert len(out) == N_BARS
+        _report(benchmark, "fetchall tuples -> MarketBar")
+
+    def test_read_columnar(self, benchmark, bars_module, adapter_result):
+        import store  # type: ignore
+
+        columns = bars_module.to_bar_columns(adapter_result)
+        payload = store.encode_ohlcv_copy(
+            store._epoch_micros(columns.ts), {col: getattr(columns, col) for col in store.OHLCV_COLUMNS}
+        )
+        decoded = benchmark.pedantic(store.decode_ohlcv_copy, args=(payload,), rounds=3, iterations=1)
+        assert len(decoded["ts"]) == N_BARS
+        _report(benchmark, "binary COPY stream -> numpy columns")
+
+
+@needs_db
+@pytest.mark.benchmark
+class TestBarDatabasePerformance:
+    """Benchmark 1M-bar round trips against a real database."""
+
+    @pytest.fixture(scope="class")
+    def repo(self, bars_module):
+        import store  # type: ignore
+
+        store.ensure_schema()
+        yield bars_module.BarRepository()
+        with store.get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("DELETE FROM ohlcv WHERE source = %s", (SOURCE,))
+            conn.commit()
+
+    def test_bulk_write(self, benchmark, bars_module, adapter_result, repo):
+        columns = bars_module.to_bar_columns(adapter_result)
+        written = benchmark.pedantic(
+            repo.upsert_columns,
+            kwargs={"provider": SOURCE, "symbol": SYMBOL, "interval": "1m", "columns": columns},
+            rounds=3,
+            iterations=1,
+        )
+        assert written == N_BARS
+        _report(benchmark, "upsert_columns (binary COPY + INSERT ... ON CONFLICT)")
+
+    @pytest.mark.parametrize("path", ["fetchall_frame", "copy_columns"])
+    def test_range_read(self, benchmark, repo, path):
+        import store  # type: ignore
+
+        end_ts = START_TS + 60 * (N_BARS - 1)
+        if path == "copy_columns":
+            read = lambda: repo.fetch_columns(provider=SOURCE, symbol=SYMBOL, interval="1m", start_ts=START_TS, end_ts=end_ts)  # noqa: E731
+        else:
+            start, end = (datetime.fromtimestamp(t, tz=timezone.utc) for t in (START_TS, end_ts))
+            read = lambda: store.read_ohlcv(SOURCE, SYMBOL, "1m", start, end)  # noqa: E731
+
+        out = benchmark.pedantic(read, rounds=3, iterations=1)
+        assert len(out) == N_BARS
+        _report(benchmark, f"range read ({path})")
@@ -0,0 +1,114 @@
+"""
+Performance tests for data-provider selection using pytest-benchmark.
+Compares request latency percentiles of the previous static preferred-order
+selection with the LatencyRouter (EWMA ranking, p95-delayed hedging) against
+stub providers whose latencies are drawn from heavy-tailed distributions.
+"""
+import asyncio
+import random
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+DATA_SRC = Path(__file__).resolve().parents[2] / "src/services/data/src"
+if str(DATA_SRC) not in sys.path:
+    sys.path.insert(0, str(DATA_SRC))
+
+from infrastructure.external.routing import LatencyRouter  # noqa: E402
+
+N_REQUESTS = 400
+CONCURRENCY = 20
+
+
+class StubProvider:
+    """Provider with lognormal latency and occasional multi-second stalls."""
+
+    def __init__(self, name, median, stall_rate, stall=0.5, seed=0):
+        self.name = name
+        self.median = median
+        self.stall_rate = stall_rate
+        self.stall = stall
+        self.rng = random.Random(seed)
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        latency = self.median * self.rng.lognormvariate(0.0, 0.3)
+        if self.rng.random() < self.stall_rate:
+            latency += self.stall
+        await asyncio.sleep(latency)
+        return [latency]
+
+
+def _providers():
+    # The preferred provider is a little slower in the median and stalls more
+    return {
+        "bitstamp": StubProvider("bitstamp", 0.020, 0.05, seed=1),
+        "polygon": StubProvider("polygon", 0.012, 0.02, seed=2),
+    }
+
+
+async def _static(providers, latencies):
+    """Previous behaviour: always the first preferred client."""
+    async def one():
+        start = asyncio.get_running_loop().time()
+        await providers["bitstamp"]()
+        latencies.append(asyncio.get_running_loop().time() - start)
+
+    await _drive(one)
+
+
+async def _routed(providers, latencies, hedge):
+    router = LatencyRouter(default_hedge_delay=0.05, default_hedge_budget=6_000)
+
+    async def one():
+        start = asyncio.get_running_loop().time()
+        await router.call(list(providers), lambda name: providers[name](), hedge=hedge)
+        latencies.append(asyncio.get_running_loop().time() - start)
+
+    await _drive(one)
+    return router
+
+
+async def _drive(one):
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    async def bounded():
+        async with semaphore:
+            await one()
+
+    await asyncio.gather(*(bounded() for _ in range(N_REQUESTS)))
+
+
+@pytest.mark.benchmark
+class TestClientRoutingPerformance:
+    """Benchmark provider request latency percentiles."""
+
+    @pytest.mark.parametrize("mode", ["static_order", "ewma_ranked", "ewma_hedged"])
+    def test_request_latency(self, benchmark, mode):
+        """Benchmark 400 requests at concurrency 20 across two stub providers."""
+        latencies = []
+        extra = {}
+
+        def run():
+            latencies.clear()
+            providers = _providers()
+            if mode == "static_order":
+                asyncio.run(_static(providers, latencies))
+            else:
+                router = asyncio.run(_routed(providers, latencies, hedge=mode == "ewma_hedged"))
+                extra.update(hedges=router.hedges_sent, hedges_won=router.hedges_won)
+            extra["load"] = sum(p.calls for p in providers.values()) / N_REQUESTS
+
+        benchmark.pedantic(run, rounds=2, iterations=1)
+
+        assert len(latencies) == N_REQUESTS
+        p50, p99 = np.percentile(latencies, [50, 99]) * 1000
+        benchmark.extra_info.update(p50_ms=p50, p99_ms=p99, **extra)
+        print(f"\n{mode}: p50 {p50:.1f}ms, p99 {p99:.1f}ms, {extra['load']:.2f} provider calls per request"
+              + (f", {extra['hedges']} hedges ({extra['hedges_won']} won)" if "hedges" in extra else ""))
+        if mode == "ewma_hedged":
+            assert p99 < 300  # stalls add 500ms without hedging
+            assert extra["load"] < 1.2
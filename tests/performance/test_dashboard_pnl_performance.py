@@ -0,0 +1,133 @@
+"""
+Performance tests for the web dashboard P&L statistics using pytest-benchmark.
+Compares the previous approach (load every trade as an ORM object and compute
+totals, win rate and strategy/daily breakdowns in Python loops) with grouped
+aggregate queries over the trades table and over the daily P&L rollup, at
+10k/100k/1M trades.
+
+"Page render" here is the set of db_helpers calls behind the dashboard and
+metrics pages. The database is a file-backed SQLite copy of the schema; the
+rollup is a table built with the same definition as the daily_trade_pnl
+continuous aggregate (sql/migrations/007_trade_pnl_rollup.sql). Set
+PNL_BENCHMARK_SIZES to change the trade counts, e.g. "10000,100000".
+"""
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import numpy as np
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import sessionmaker
+
+WEB_SRC = Path(__file__).resolve().parents[2] / "src/services/web/src"
+if str(WEB_SRC) not in sys.path:
+    sys.path.insert(0, str(WEB_SRC))
+
+from core.database.models import Account, Position, Trade  # noqa: E402
+import db_helpers  # noqa: E402
+
+SIZES = [int(n) for n in os.getenv("PNL_BENCHMARK_SIZES", "10000,100000,1000000").split(",")]
+SYMBOLS = [f"SYM{i:02d}USDT" for i in range(20)]
+STRATEGIES = ["momentum", "mean_reversion", "breakout", None]
+INSERT_CHUNK = 50_000
+
+ROLLUP_DDL = """
+CREATE TABLE daily_trade_pnl AS
+SELECT date(time) || ' 00:00:00.000000' AS day, account_id, strategy_name, symbol,
+       COUNT(*) AS trades_count,
+       SUM(CASE WHEN realized_pnl > 0 THEN 1 ELSE 0 END) AS winning_trades,
+       SUM(CASE WHEN realized_pnl < 0 THEN 1 ELSE 0 END) AS losing_trades,
+       SUM(CASE WHEN realized_pnl > 0 THEN realized_pnl ELSE 0 END) AS gross_profit,
+       SUM(CASE WHEN realized_pnl < 0 THEN -realized_pnl ELSE 0 END) AS gross_loss,
+       COALESCE(SUM(realized_pnl), 0) AS total_pnl,
+       COALESCE(SUM(fee), 0) AS total_fees
+FROM trades
+GROUP BY date(time), account_id, strategy_name, symbol
+"""
+
+
+@compiles(JSONB, "sqlite")
+def _jsonb_as_json(type_, compiler, **kw):
+    return "JSON"
+
+
+@pytest.fixture(scope="module", params=SIZES, ids=lambda n: f"{n // 1000}k")
+def trades_db(request, tmp_path_factory):
+    """A SQLite database with n trades spread over two years, plus its daily rollup."""
+    n = request.param
+    path = tmp_path_factory.mktemp("pnl") / f"trades_{n}.db"
+    engine = create_engine(f"sqlite:///{path}")
+    for model in (Account, Position, Trade):
+        model.__table__.create(engine)
+    with engine.begin() as conn:
+        conn.execute(Account.__table__.insert(), [{
+            "id": 1, "name": "main", "account_type": "personal", "initial_balance": 10_000,
+            "current_balance": 12_000, "is_active": True,
+        }])
+        conn.execute(Position.__table__.insert(), [{
+            "account_id": 1, "symbol": symbol, "quantity": 1, "entry_price": 100,
+            "current_price": 101, "unrealized_pnl": 1,
+        } for symbol in SYMBOLS[:5]])
+
+    rng = np.random.default_rng(7)
+    end = datetime.now(timezone.utc).replace(tzinfo=None)
+    for start in range(0, n, INSERT_CHUNK):
+        size = min(INSERT_CHUNK, n - start)
+        offsets = rng.integers(0, 730 * 86_400, size)
+        pnl = np.round(rng.normal(2, 50, size), 2)
+        closed = rng.random(size) < 0.5
+        rows = [{
+            "time": end - timedelta(seconds=int(offsets[i])),
+            "account_id": 1,
+            "symbol": SYMBOLS[i % len(SYMBOLS)],
+            "trade_type": "SELL" if closed[i] else "BUY",
+            "quantity": 1,
+            "price": 100,
+            "fee": 0.1,
+            "realized_pnl": float(pnl[i]) if closed[i] else None,
+            "strategy_name": STRATEGIES[i % len(STRATEGIES)],
+        } for i in range(size)]
+        with engine.begin() as conn:
+            conn.execute(Trade.__table__.insert(), rows)
+    with engine.begin() as conn:
+        conn.execute(text(ROLLUP_DDL))
+    return n, engine
+
+
+def render_pages():
+    """The db_helpers calls made by the dashboard and metrics views."""
+    summary = db_helpers.get_account_summary()
+    daily = db_helpers.get_daily_pnl(summary["account"].id, days=7)
+    metrics = db_helpers.get_performance_metrics()
+    strategies = db_helpers.get_strategy_performance()
+    return summary, daily, metrics, strategies
+
+
+@pytest.mark.benchmark
+class TestDashboardPnlPerformance:
+    """Benchmark dashboard statistics as the trade history grows."""
+
+    @pytest.mark.parametrize("mode", ["python_loops", "sql_aggregates", "sql_rollup"])
+    def test_render(self, benchmark, trades_db, monkeypatch, mode):
+        """Benchmark computing dashboard and metrics page statistics."""
+        n, engine = trades_db
+        monkeypatch.setattr(db_helpers, "get_db_session", sessionmaker(bind=engine))
+        monkeypatch.setattr(db_helpers, "_rollup_available", {})
+        if mode != "python_loops":
+            monkeypatch.setattr(db_helpers, "SQL_AGGREGATE_DIALECTS", {"postgresql", "sqlite"})
+        if mode == "sql_rollup":
+            monkeypatch.setattr(db_helpers, "has_pnl_rollup", lambda session: True)
+
+        rounds = 1 if mode == "python_loops" and n >= 1_000_000 else 3
+        summary, daily, metrics, strategies = benchmark.pedantic(render_pages, rounds=rounds, iterations=1)
+
+        assert summary["total_trades"] == metrics["total_trades"] == n
+        assert sum(s["total_trades"] for s in strategies) == n
+        assert len(daily["pnl"]) == 7
+        benchmark.extra_info.update(trades=n, mode=mode)
+        print(f"\n{mode} @ {n:,} trades: {benchmark.stats.stats.mean * 1000:,.1f}ms per render "
+              f"(win rate {summary['win_rate']}%, {len(strategies)} strategies)")
@@ -0,0 +1,121 @@
+"""
+Performance tests for the event pipeline Disruptor using pytest-benchmark.
+Compares the ring-buffer Disruptor with the previous asyncio.Queue implementation
+for throughput (events/second) and publish-to-handle p99 latency.
+"""
+import asyncio
+import contextlib
+import time
+
+import numpy as np
+import pytest
+
+from src.core.patterns.disruptor import Disruptor, EventProcessor
+
+N_EVENTS = 50_000
+BURST = 100
+N_PROCESSORS = 3
+
+
+class QueueDisruptor:
+    """The asyncio.Queue implementation the ring buffer replaced, kept as a baseline."""
+
+    def __init__(self, buffer_size: int = 65536) -> None:
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=buffer_size)
+        self._processors = []
+        self._worker_task = None
+        self._sequence = 0
+        self._stopped = asyncio.Event()
+
+    def add_processor(self, processor) -> None:
+        self._processors.append(processor)
+
+    async def start(self) -> None:
+        self._stopped.clear()
+        self._worker_task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        self._stopped.set()
+        with contextlib.suppress(asyncio.QueueFull):
+            self._queue.put_nowait(None)
+        if self._worker_task:
+            with contextlib.suppress(Exception):
+                await self._worker_task
+            self._worker_task = None
+
+    async def publish(self, event) -> None:
+        await self._queue.put(event)
+
+    async def _run(self) -> None:
+        while not self._stopped.is_set():
+            event = await self._queue.get()
+            if event is None:
+                break
+            seq = self._sequence
+            self._sequence += 1
+            await asyncio.gather(
+                *[self._safe_call(p, event, seq) for p in self._processors],
+                return_exceptions=True,
+            )
+
+    async def _safe_call(self, processor, event, seq) -> None:
+        try:
+            await processor.on_event(event, seq)
+        except Exception:
+            pass
+
+
+class LatencyRecorder(EventProcessor):
+    """Records publish-to-handle latency; events are publish timestamps."""
+
+    def __init__(self) -> None:
+        self.latencies = []
+
+    async def on_event(self, event, sequence) -> None:
+        self.latencies.append(time.perf_counter() - event)
+
+
+async def _drive(disruptor_cls):
+    disruptor = disruptor_cls(buffer_size=65536)
+    processors = [LatencyRecorder() for _ in range(N_PROCESSORS)]
+    for processor in processors:
+        disruptor.add_processor(processor)
+    await disruptor.start()
+
+    start = time.perf_counter()
+    for i in range(N_EVENTS):
+        await disruptor.publish(time.perf_counter())
+        if i % BURST == BURST - 1:
+            # Let consumers run between bursts, as a market data feed would
+            await asyncio.sleep(0)
+    # The queue version's stop() discards undelivered events, so wait for delivery
+    while min(len(p.latencies) for p in processors) < N_EVENTS:
+        await asyncio.sleep(0)
+    elapsed = time.perf_counter() - start
+    await disruptor.stop()
+
+    latencies = np.concatenate([p.latencies for p in processors])
+    assert len(latencies) == N_EVENTS * N_PROCESSORS
+    return N_EVENTS / elapsed, float(np.percentile(latencies, 99))
+
+
+@pytest.mark.benchmark
+class TestDisruptorPerformance:
+    """Benchmark event throughput and latency."""
+
+    @pytest.mark.parametrize("disruptor_cls", [QueueDisruptor, Disruptor], ids=["queue", "ring_buffer"])
+    def test_throughput_and_latency(self, benchmark, disruptor_cls):
+        """Benchmark bursts of events fanned out to three processors."""
+        results = []
+
+        def run():
+            results.append(asyncio.run(_drive(disruptor_cls)))
+
+        benchmark.pedantic(run, rounds=3, iterations=1)
+
+        events_per_second = max(r[0] for r in results)
+        p99 = min(r[1] for r in results)
+        benchmark.extra_info["events_per_second"] = events_per_second
+        benchmark.extra_info["p99_latency_us"] = p99 * 1e6
+        print(f"\n{disruptor_cls.__name__}: {events_per_second:,.0f} events/s, "
+              f"p99 latency {p99 * 1e6:.1f}us")
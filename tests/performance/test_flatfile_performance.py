@@ -0,0 +1,131 @@
+"""
+Performance tests for Polygon flat-file ingestion.
+Compares peak RSS and rows/second of the previous whole-object path (read the
+gzipped body, decode it to one string, pd.read_csv over StringIO) with the
+streaming Arrow path that writes ticker/date-partitioned Parquet.
+
+The fixture is a locally generated trades-schema .csv.gz. Its size defaults to
+2M rows (~190MB of CSV); set FLATFILE_BENCHMARK_ROWS to scale it, e.g. 40M rows
+for a ~3.8GB CSV / ~1GB gzip file. Each path runs in a fresh interpreter so
+its peak RSS is measured in isolation. The baseline is skipped when the decoded
+file would not fit comfortably in available memory.
+"""
+import gzip
+import json
+import os
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import psutil
+import pytest
+
+pytest.importorskip("pyarrow")
+
+DATA_SRC = Path(__file__).resolve().parents[2] / "src/services/data/src"
+N_ROWS = int(os.getenv("FLATFILE_BENCHMARK_ROWS", "2000000"))
+GEN_CHUNK = 500_000
+TICKERS = 2_000
+
+BASELINE = """
+import gzip, io
+import pandas as pd
+with open(SOURCE, "rb") as f:
+    body = f.read()
+with gzip.GzipFile(fileobj=io.BytesIO(body)) as gz:
+    text = gz.read().decode("utf-8")
+df = pd.read_csv(io.StringIO(text))
+rows = len(df)
+"""
+
+STREAMING = """
+from providers.polygon_flatfiles import flatfile_to_parquet
+rows = flatfile_to_parquet(SOURCE, DEST)["rows"]
+"""
+
+RUNNER = """
+import json, resource, sys, time
+sys.path.insert(0, {data_src!r})
+SOURCE, DEST = {source!r}, {dest!r}
+start = time.perf_counter()
+{body}
+seconds = time.perf_counter() - start
+print(json.dumps({{"rows": rows, "seconds": seconds,
+                  "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024}}))
+"""
+
+
+@pytest.fixture(scope="module")
+def trades_file(tmp_path_factory):
+    """A gzipped trades flat file, sorted by ticker like Polygon's."""
+    path = tmp_path_factory.mktemp("flatfiles") / "2024-03-07.csv.gz"
+    rng = np.random.default_rng(11)
+    day_ns = 1_709_769_600_000_000_000
+    bounds = np.linspace(0, N_ROWS, TICKERS + 1).astype(np.int64)
+    with gzip.open(path, "wt", compresslevel=1, newline="") as out:
+        header = True
+        for start in range(0, N_ROWS, GEN_CHUNK):
+            n = min(GEN_CHUNK, N_ROWS - start)
+            index = np.arange(start, start + n)
+            ticker = np.searchsorted(bounds, index, side="right") - 1
+            sip = day_ns + np.sort(rng.integers(0, 86_400_000_000_000, n))
+            frame = pd.DataFrame({
+                "ticker": pd.Series(ticker).map(lambda t: f"T{t:04d}"),
+                "conditions": np.where(rng.random(n) < 0.3, "12,37", ""),
+                "correction": 0,
+                "exchange": rng.integers(1, 20, n),
+                "id": index,
+                "participant_timestamp": sip - rng.integers(0, 1_000_000, n),
+                "price": np.round(rng.uniform(5, 500, n), 4),
+                "sequence_number": index,
+                "sip_timestamp": sip,
+                "size": rng.integers(1, 1000, n),
+                "tape": rng.integers(1, 4, n),
+                "trf_id": "",
+                "trf_timestamp": "",
+            })
+            frame.to_csv(out, header=header, index=False)
+            header = False
+    return path
+
+
+def _run(body, source, dest):
+    script = RUNNER.format(data_src=str(DATA_SRC), source=str(source), dest=str(dest), body=textwrap.dedent(body))
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+@pytest.mark.benchmark
+class TestFlatfileIngestPerformance:
+    """Benchmark peak memory and throughput of flat-file ingestion."""
+
+    @pytest.mark.parametrize("mode", ["whole_object", "streaming_parquet"])
+    def test_ingest(self, benchmark, trades_file, tmp_path, mode):
+        """Benchmark ingesting one generated trades file."""
+        gz_size = trades_file.stat().st_size
+        if mode == "whole_object":
+            # bytes + decoded string + DataFrame, roughly 6x the compressed size each for CSV
+            needed = gz_size * 20
+            if needed > psutil.virtual_memory().available:
+                pytest.skip(f"baseline would need ~{needed / 2**30:.1f}GB of memory")
+            body = BASELINE
+        else:
+            body = STREAMING
+
+        stats = {}
+
+        def run():
+            stats.update(_run(body, trades_file, tmp_path / "parquet"))
+
+        benchmark.pedantic(run, rounds=1, iterations=1)
+
+        assert stats["rows"] == N_ROWS
+        rows_per_sec = stats["rows"] / stats["seconds"]
+        benchmark.extra_info.update(peak_rss_mb=stats["peak_rss_mb"], rows_per_sec=rows_per_sec)
+        print(f"\n{mode}: {N_ROWS:,} rows from a {gz_size / 2**20:.0f}MB gzip in {stats['seconds']:.1f}s "
+              f"({rows_per_sec:,.0f} rows/s), peak RSS {stats['peak_rss_mb']:.0f}MB")
+        if mode == "streaming_parquet":
+            assert stats["peak_rss_mb"] < 1024
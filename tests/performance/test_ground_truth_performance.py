@@ -0,0 +1,85 @@
+"""
+Performance tests for ground truth evaluation using pytest-benchmark.
+Labels a year of synthetic minute bars and matches predictions to the optimal trades.
+"""
+import asyncio
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from src.services.ai.src.evaluators.ground_truth import (
+    AgentPrediction,
+    GroundTruthValidator,
+    PredictionType,
+)
+
+N_MINUTES = 365 * 24 * 60
+
+
+@pytest.fixture(scope="module")
+def minute_bars():
+    """Generate one year of minute OHLC bars."""
+    rng = np.random.default_rng(42)
+    start = datetime(2024, 1, 1)
+    close = 50000 * np.exp(rng.normal(0, 0.0008, N_MINUTES).cumsum())
+    spread = np.abs(rng.normal(0, 0.0005, N_MINUTES)) * close
+    return {
+        "times": [start + timedelta(minutes=i) for i in range(N_MINUTES)],
+        "high": close + spread,
+        "low": close - spread,
+        "close": close,
+    }
+
+
+@pytest.fixture(scope="module")
+def validator():
+    return GroundTruthValidator(profit_threshold=0.5)
+
+
+@pytest.mark.benchmark
+class TestGroundTruthPerformance:
+    """Benchmark ground truth labelling and matching."""
+
+    @pytest.mark.parametrize("timeframe_hours", [1, 24])
+    def test_label_optimal_trades(self, benchmark, validator, minute_bars, timeframe_hours):
+        """Benchmark labelling a year of minute bars."""
+        trades = benchmark(
+            validator._label_optimal_trades,
+            timeframe_hours=timeframe_hours,
+            **minute_bars,
+        )
+
+        assert trades
+        stats = benchmark.stats.stats
+        print(f"\n{timeframe_hours}h labelling over {N_MINUTES} bars: "
+              f"mean={stats.mean:.3f}s, trades={len(trades)}")
+
+    def test_compare_predictions(self, benchmark, validator, minute_bars):
+        """Benchmark matching hourly predictions against hourly optimal trades."""
+        trades = validator._label_optimal_trades(timeframe_hours=1, **minute_bars)
+        rng = np.random.default_rng(7)
+        predictions = [
+            AgentPrediction(
+                timestamp=minute_bars["times"][i],
+                agent_name="Bull",
+                symbol="BTCUSDT",
+                prediction=PredictionType.BULLISH if i % 2 else PredictionType.BEARISH,
+                confidence=0.8,
+                reasoning="",
+                timeframe="1h",
+                price_at_prediction=float(minute_bars["close"][i]),
+            )
+            for i in rng.integers(0, N_MINUTES, 8760)
+        ]
+
+        comparison = benchmark(
+            lambda: asyncio.run(
+                validator._compare_predictions_to_optimal(predictions, trades, "1h")
+            )
+        )
+
+        assert comparison["true_positives"] + comparison["false_positives"] > 0
+        stats = benchmark.stats.stats
+        print(f"\nMatched {len(predictions)} predictions to {len(trades)} trades: "
+              f"mean={stats.mean:.3f}s")
@@ -0,0 +1,91 @@
+"""
+Performance tests for framework logging sinks using pytest-benchmark.
+Compares log-call latency of the synchronous per-destination loguru sinks
+with the single-queue AsyncLogWriter under sustained multi-threaded load.
+"""
+import os
+import tempfile
+import threading
+import time
+
+import numpy as np
+import pytest
+
+# Importing the package applies a default configuration; keep its files out of the tree
+os.environ.setdefault("LOG_DIR", tempfile.mkdtemp(prefix="log-bench-"))
+
+from src.framework.logging.setup import (  # noqa: E402
+    LogConfig,
+    configure_logging,
+    flush_logging,
+    logger,
+    shutdown_logging,
+)
+
+N_THREADS = 4
+CALLS_PER_THREAD = 5_000
+
+
+@pytest.fixture
+def configure(tmp_path, monkeypatch):
+    monkeypatch.setenv("LOG_DIR", str(tmp_path))
+
+    def _configure(async_sinks, json_logs):
+        return configure_logging(
+            LogConfig(
+                level="INFO",
+                console=False,
+                json_logs=json_logs,
+                async_sinks=async_sinks,
+                queue_size=100_000,
+            )
+        )
+
+    yield _configure
+    shutdown_logging()
+    logger.remove()
+
+
+def _log_calls(latencies):
+    bound = logger.bind(request_id="req-1")
+    for i in range(CALLS_PER_THREAD):
+        start = time.perf_counter()
+        if i % 10 == 0:
+            bound.bind(performance=True).info("GET /api/v1/orders - 200 in {:.3f}s", 0.012)
+        else:
+            bound.info("Processed order {} for account {}", i, "acct-42")
+        latencies.append(time.perf_counter() - start)
+
+
+@pytest.mark.benchmark
+class TestLogSinkPerformance:
+    """Benchmark log-call latency under sustained load."""
+
+    @pytest.mark.parametrize("json_logs", [False, True], ids=["text", "json"])
+    @pytest.mark.parametrize("async_sinks", [False, True], ids=["sync_sinks", "async_writer"])
+    def test_log_call_latency(self, benchmark, configure, tmp_path, async_sinks, json_logs):
+        """Benchmark 4 threads logging to app, error, audit, performance and security sinks."""
+        configure(async_sinks, json_logs)
+        latencies = []
+
+        def run():
+            threads = [threading.Thread(target=_log_calls, args=(latencies,)) for _ in range(N_THREADS)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        benchmark.pedantic(run, rounds=3, iterations=1)
+        assert flush_logging(timeout=60)
+
+        total = 3 * N_THREADS * CALLS_PER_THREAD
+        with open(tmp_path / "app.log", encoding="utf-8") as app_log:
+            assert sum(1 for _ in app_log) >= total
+        with open(tmp_path / "performance.log", encoding="utf-8") as perf_log:
+            assert sum(1 for _ in perf_log) == total // 10
+
+        p50, p99 = np.percentile(latencies, [50, 99]) * 1e6
+        benchmark.extra_info["p50_us"] = p50
+        benchmark.extra_info["p99_us"] = p99
+        mode = "async writer" if async_sinks else "sync sinks"
+        print(f"\n{mode} ({'json' if json_logs else 'text'}): p50 {p50:.1f}us, p99 {p99:.1f}us per log call")
@@ -0,0 +1,314 @@
+"""
+Performance tests for the request MetricsCollector using pytest-benchmark.
+Compares the sharded, sketch-based collector with the previous global-lock
+collector for recording throughput, /metrics scrape time, memory and p99
+accuracy after one million recorded requests.
+"""
+import gc
+import threading
+from collections import defaultdict, deque
+from threading import Lock
+from typing import Any
+
+import numpy as np
+import psutil
+import pytest
+
+from src.framework.middleware.metrics import MetricsCollector, RequestMetrics
+
+N_REQUESTS = 1_000_000
+N_ENDPOINTS = 50
+POOL_SIZE = 20_000
+
+
+class LockedCollector:
+    """The previous MetricsCollector, kept verbatim as a baseline.
+
+    Every request takes one global lock; p95 sorts the last 100 durations
+    of each endpoint on every scrape.
+    """
+
+    def __init__(self, max_samples: int = 10000, retention_hours: int = 24):
+        """
+        Initialize metrics collector.
+
+        Args:
+            max_samples: Maximum number of samples to keep in memory
+            retention_hours: How long to retain metrics in hours
+        """
+        self.max_samples = max_samples
+        self.retention_hours = retention_hours
+        self._lock = Lock()
+
+        # Raw metrics storage
+        self.metrics: deque = deque(maxlen=max_samples)
+
+        # Aggregated statistics
+        self.request_count = 0
+        self.error_count = 0
+        self.total_duration = 0.0
+
+        # Per-endpoint statistics
+        self.endpoint_stats = defaultdict(
+            lambda: {
+                "count": 0,
+                "errors": 0,
+                "total_duration": 0.0,
+                "status_codes": defaultdict(int),
+                "response_sizes": deque(maxlen=100),
+                "durations": deque(maxlen=100),
+            }
+        )
+
+        # Per-method statistics
+        self.method_stats = defaultdict(
+            lambda: {"count": 0, "errors": 0, "total_duration": 0.0}
+        )
+
+        # Performance buckets
+        self.performance_buckets = {
+            "fast": 0,  # < 100ms
+            "normal": 0,  # 100ms - 500ms
+            "slow": 0,  # 500ms - 1s
+            "very_slow": 0,  # > 1s
+        }
+
+        # Status code tracking
+        self.status_codes = defaultdict(int)
+
+    def add_metrics(self, metrics: RequestMetrics) -> None:
+        """
+        Add metrics to the collector.
+
+        Args:
+            metrics: Request metrics to add
+        """
+        with self._lock:
+            # Add to raw metrics
+            self.metrics.append(metrics)
+
+            # Update global counters
+            self.request_count += 1
+            if metrics.error or (metrics.status_code and metrics.status_code >= 400):
+                self.error_count += 1
+
+            if metrics.duration:
+                self.total_duration += metrics.duration
+
+                # Update performance buckets
+                duration_ms = metrics.duration * 1000
+                if duration_ms < 100:
+                    self.performance_buckets["fast"] += 1
+                elif duration_ms < 500:
+                    self.performance_buckets["normal"] += 1
+                elif duration_ms < 1000:
+                    self.performance_buckets["slow"] += 1
+                else:
+                    self.performance_buckets["very_slow"] += 1
+
+            # Update endpoint statistics
+            endpoint_key = f"{metrics.method} {metrics.endpoint}"
+            endpoint_stat = self.endpoint_stats[endpoint_key]
+            endpoint_stat["count"] += 1
+
+            if metrics.error or (metrics.status_code and metrics.status_code >= 400):
+                endpoint_stat["errors"] += 1
+
+            if metrics.duration:
+                endpoint_stat["total_duration"] += metrics.duration
+                endpoint_stat["durations"].append(metrics.duration)
+
+            if metrics.status_code:
+                endpoint_stat["status_codes"][metrics.status_code] += 1
+                self.status_codes[metrics.status_code] += 1
+
+            if metrics.response_size:
+                endpoint_stat["response_sizes"].append(metrics.response_size)
+
+            # Update method statistics
+            method_stat = self.method_stats[metrics.method]
+            method_stat["count"] += 1
+            if metrics.error or (metrics.status_code and metrics.status_code >= 400):
+                method_stat["errors"] += 1
+            if metrics.duration:
+                method_stat["total_duration"] += metrics.duration
+
+    def get_summary(self) -> dict[str, Any]:
+        """
+        Get summary statistics.
+
+        Returns:
+            Dict containing summary metrics
+        """
+        with self._lock:
+            avg_duration = (
+                (self.total_duration / self.request_count)
+                if self.request_count > 0
+                else 0
+            )
+            error_rate = (
+                (self.error_count / self.request_count) if self.request_count > 0 else 0
+            )
+
+            return {
+                "total_requests": self.request_count,
+                "total_errors": self.error_count,
+                "error_rate": error_rate,
+                "avg_duration_ms": avg_duration * 1000,
+                "performance_distribution": self.performance_buckets.copy(),
+                "status_code_distribution": dict(self.status_codes),
+                "samples_in_memory": len(self.metrics),
+                "retention_hours": self.retention_hours,
+            }
+
+    def get_endpoint_stats(self, top_n: int = 10) -> dict[str, Any]:
+        """
+        Get per-endpoint statistics.
+
+        Args:
+            top_n: Number of top endpoints to return
+
+        Returns:
+            Dict containing endpoint statistics
+        """
+        with self._lock:
+            endpoint_summaries = {}
+
+            for endpoint, stats in self.endpoint_stats.items():
+                avg_duration = (
+                    (stats["total_duration"] / stats["count"])
+                    if stats["count"] > 0
+                    else 0
+                )
+                error_rate = (
+                    (stats["errors"] / stats["count"]) if stats["count"] > 0 else 0
+                )
+
+                # Calculate percentiles if we have duration data
+                p95_duration = 0
+                avg_response_size = 0
+
+                if stats["durations"]:
+                    try:
+                        durations_sorted = sorted(stats["durations"])
+                        p95_index = int(0.95 * len(durations_sorted))
+                        p95_duration = durations_sorted[
+                            min(p95_index, len(durations_sorted) - 1)
+                        ]
+                    except (IndexError, ValueError):
+                        p95_duration = avg_duration
+
+                if stats["response_sizes"]:
+                    avg_response_size = sum(stats["response_sizes"]) / len(
+                        stats["response_sizes"]
+                    )
+
+                endpoint_summaries[endpoint] = {
+                    "count": stats["count"],
+                    "errors": stats["errors"],
+                    "error_rate": error_rate,
+                    "avg_duration_ms": avg_duration * 1000,
+                    "p95_duration_ms": p95_duration * 1000,
+                    "avg_response_size_bytes": avg_response_size,
+                    "status_codes": dict(stats["status_codes"]),
+                }
+
+            # Sort by request count and return top N
+            sorted_endpoints = sorted(
+                endpoint_summaries.items(), key=lambda x: x[1]["count"], reverse=True
+            )
+
+            return {
+                "endpoints": dict(sorted_endpoints[:top_n]),
+                "total_endpoints": len(endpoint_summaries),
+            }
+
+
+COLLECTORS = [LockedCollector, MetricsCollector]
+IDS = ["global_lock", "sharded_sketch"]
+
+
+@pytest.fixture(scope="module")
+def pool():
+    """Request metrics with lognormal latencies spread over many endpoints."""
+    rng = np.random.default_rng(7)
+    durations = rng.lognormal(-4.0, 1.0, POOL_SIZE)
+    pool = []
+    for i, duration in enumerate(durations):
+        metrics = RequestMetrics(endpoint=f"/api/v1/resource/{i % N_ENDPOINTS}", method="GET", start_time=0.0)
+        metrics.duration = float(duration)
+        metrics.status_code = 500 if i % 50 == 0 else 200
+        metrics.response_size = int(rng.integers(200, 20_000))
+        pool.append(metrics)
+    return pool
+
+
+def _record(collector, pool, n):
+    add = collector.add_metrics
+    size = len(pool)
+    for i in range(n):
+        add(pool[i % size])
+
+
+@pytest.fixture(scope="module", params=COLLECTORS, ids=IDS)
+def loaded(request, pool):
+    """A collector that has recorded one million requests, with its RSS growth."""
+    gc.collect()
+    process = psutil.Process()
+    before = process.memory_info().rss
+    collector = request.param()
+    _record(collector, pool, N_REQUESTS)
+    gc.collect()
+    return collector, process.memory_info().rss - before
+
+
+@pytest.mark.benchmark
+class TestMetricsCollectorPerformance:
+    """Benchmark the request-path and scrape costs of the metrics collector."""
+
+    @pytest.mark.parametrize("collector_cls", COLLECTORS, ids=IDS)
+    def test_record_throughput(self, benchmark, pool, collector_cls):
+        """Benchmark add_metrics from four request threads."""
+        per_thread = 50_000
+
+        def run():
+            collector = collector_cls()
+            threads = [threading.Thread(target=_record, args=(collector, pool, per_thread)) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        benchmark.pedantic(run, rounds=3, iterations=1)
+
+        per_request_us = benchmark.stats.stats.min / (4 * per_thread) * 1e6
+        benchmark.extra_info["per_request_us"] = per_request_us
+        print(f"\n{collector_cls.__name__}: {per_request_us:.2f}us per recorded request")
+
+    def test_scrape_after_1m_requests(self, benchmark, loaded):
+        """Benchmark get_endpoint_stats once a million requests are recorded."""
+        collector, rss_growth = loaded
+
+        stats = benchmark(collector.get_endpoint_stats, N_ENDPOINTS)
+
+        assert stats["total_endpoints"] == N_ENDPOINTS
+        assert sum(s["count"] for s in stats["endpoints"].values()) == N_REQUESTS
+        benchmark.extra_info["rss_growth_mb"] = rss_growth / 2**20
+        print(f"\n{type(collector).__name__}: scrape {benchmark.stats.stats.mean * 1000:.2f}ms, "
+              f"RSS growth {rss_growth / 2**20:.1f}MB after {N_REQUESTS:,} requests")
+
+    def test_percentile_accuracy(self, pool, loaded):
+        """The sketch p95 stays within its 1% relative error over all requests."""
+        collector, _ = loaded
+        endpoint = "GET /api/v1/resource/0"
+        durations = np.array([m.duration for m in pool[::N_ENDPOINTS]])
+        exact_p95 = np.percentile(np.tile(durations, N_REQUESTS // POOL_SIZE), 95) * 1000
+
+        reported = collector.get_endpoint_stats(N_ENDPOINTS)["endpoints"][endpoint]["p95_duration_ms"]
+        error = abs(reported - exact_p95) / exact_p95
+        print(f"\n{type(collector).__name__}: p95 {reported:.2f}ms vs exact {exact_p95:.2f}ms ({error:.1%} error)")
+        if isinstance(collector, MetricsCollector):
+            assert error < 0.02
+            p99 = collector.get_endpoint_stats(N_ENDPOINTS)["endpoints"][endpoint]["p99_duration_ms"]
+            exact_p99 = np.percentile(durations, 99) * 1000
+            assert abs(p99 - exact_p99) / exact_p99 < 0.02
@@ -0,0 +1,103 @@
+"""
+Performance tests for OHLCV range reads using pytest-benchmark.
+Compares resampling raw 1m rows against reading the TimescaleDB continuous aggregates.
+
+Needs a scratch TimescaleDB reachable through the POSTGRES_* environment
+variables and OHLCV_BENCHMARK=1. Rows are written under a dedicated source
+and deleted afterwards.
+"""
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytestmark = pytest.mark.skipif(
+    not os.getenv("OHLCV_BENCHMARK"),
+    reason="OHLCV_BENCHMARK not set (needs a local TimescaleDB via POSTGRES_* env)",
+)
+
+DATA_SRC = Path(__file__).resolve().parents[2] / "src/services/data/src"
+if str(DATA_SRC) not in sys.path:
+    sys.path.insert(0, str(DATA_SRC))
+
+SOURCE = "benchmark"
+SYMBOL = "BTCUSDT"
+DAYS = 90
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+END = START + timedelta(days=DAYS) - timedelta(minutes=1)
+
+
+@pytest.fixture(scope="module")
+def store():
+    """Seed 90 days of 1m bars and materialize the aggregates."""
+    import store as store_module  # type: ignore
+
+    store_module.ensure_schema()
+    n = DAYS * 24 * 60
+    rng = np.random.default_rng(42)
+    close = 50000 * np.exp(rng.normal(0, 0.0008, n).cumsum())
+    spread = np.abs(rng.normal(0, 0.0005, n)) * close
+    df = pd.DataFrame({
+        "datetime": pd.date_range(START, periods=n, freq="1min"),
+        "open": np.roll(close, 1),
+        "high": close + spread,
+        "low": close - spread,
+        "close": close,
+        "volume": rng.exponential(2.0, n),
+    })
+    store_module.upsert_ohlcv(SOURCE, SYMBOL, "1m", df)
+    _refresh_aggregates(store_module)
+
+    yield store_module
+
+    with store_module.get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("DELETE FROM ohlcv WHERE source = %s", (SOURCE,))
+        conn.commit()
+    _refresh_aggregates(store_module)
+
+
+def _refresh_aggregates(store_module):
+    with store_module.get_connection() as conn:
+        conn.autocommit = True
+        with conn.cursor() as cur:
+            for _, view, _ in store_module.OHLCV_AGGREGATES:
+                cur.execute("CALL refresh_continuous_aggregate(%s, %s, %s)", (view, START, END + timedelta(days=1)))
+        conn.autocommit = False
+
+
+def _read_raw_resampled(store_module, interval):
+    """The pre-aggregate read path: fetch every 1m row and resample."""
+    raw = store_module._fetch_frame(
+        "SELECT ts, open, high, low, close, volume FROM ohlcv "
+        "WHERE source=%s AND symbol=%s AND interval='1m' AND ts BETWEEN %s AND %s ORDER BY ts ASC",
+        (SOURCE, SYMBOL, START, END),
+    )
+    return store_module._resample(raw, store_module.interval_seconds(interval))
+
+
+@pytest.mark.benchmark
+class TestOHLCVRangeReadPerformance:
+    """Benchmark 90-day range reads at higher timeframes."""
+
+    @pytest.mark.parametrize("interval", ["5m", "1h", "4h", "1d"])
+    def test_raw_resample(self, benchmark, store, interval):
+        """Benchmark resampling raw 1m rows on every request."""
+        df = benchmark(_read_raw_resampled, store, interval)
+
+        assert not df.empty
+
+    @pytest.mark.parametrize("interval", ["5m", "1h", "4h", "1d"])
+    def test_routed_aggregate(self, benchmark, store, interval):
+        """Benchmark read_ohlcv routed to the coarsest continuous aggregate."""
+        df = benchmark(store.read_ohlcv, SOURCE, SYMBOL, interval, START, END)
+
+        expected = _read_raw_resampled(store, interval)
+        assert len(df) == len(expected)
+        np.testing.assert_allclose(df["close"].to_numpy(), expected["close"].to_numpy())
+        print(f"\n{interval}: {len(df)} bars from {store.route_ohlcv_interval(interval)[0]}, "
+              f"mean={benchmark.stats.stats.mean * 1000:.2f}ms")
@@ -2,12 +2,17 @@
 Performance tests for RAG system using pytest-benchmark.
 Benchmarks critical paths for embeddings, retrieval, and query processing.
 """
+import itertools
+import os
+import time
+
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 import numpy as np
 
 from web.rag.document_processor import DocumentProcessor
-from web.rag.embeddings import EmbeddingsService
+from web.rag.embeddings import EmbeddingsService, encode_copy_rows
+from web.rag.intelligence import FKSIntelligence
 from web.rag.retrieval import RetrievalService
 
 
@@ -167,6 +172,219 @@ class TestEmbeddingsServicePerformance:
         print(f"\nCosine similarity: mean={stats.mean:.4f}s, stddev={stats.stddev:.4f}s")
 
 
+@pytest.mark.benchmark
+class TestEmbeddingStorePerformance:
+    """Benchmark bulk embedding writes and ingestion throughput."""
+
+    @pytest.fixture
+    def chunk_embeddings(self):
+        """Generate chunk IDs and embeddings."""
+        return list(range(1000)), np.random.rand(1000, 384).tolist()
+
+    @pytest.fixture
+    def mock_session(self):
+        """Create a session that assigns IDs and whose DB-API cursor accepts COPY."""
+        ids = itertools.count(1)
+
+        def add_all(records):
+            for record in records:
+                record.id = next(ids)
+
+        session = MagicMock()
+        session.add_all.side_effect = add_all
+        cursor = session.connection.return_value.connection.dbapi_connection.cursor.return_value
+        cursor.rowcount = 1000
+        return session
+
+    def test_text_vector_encoding_performance(self, benchmark, chunk_embeddings):
+        """Benchmark the old per-chunk text literal encoding."""
+        _, embeddings = chunk_embeddings
+
+        result = benchmark(lambda: [str(embedding) for embedding in embeddings])
+
+        assert len(result) == 1000
+        stats = benchmark.stats.stats
+        print(f"\nText encoding (1000x384): mean={stats.mean:.4f}s, stddev={stats.stddev:.4f}s")
+
+    def test_binary_copy_encoding_performance(self, benchmark, chunk_embeddings):
+        """Benchmark binary COPY encoding of the same rows."""
+        chunk_ids, embeddings = chunk_embeddings
+
+        result = benchmark(encode_copy_rows, chunk_ids, embeddings)
+
+        assert len(result) > 1000 * 384 * 4
+        stats = benchmark.stats.stats
+        print(f"\nBinary COPY encoding (1000x384): mean={stats.mean:.4f}s, stddev={stats.stddev:.4f}s")
+
+    def test_ingestion_throughput(self, benchmark, mock_session):
+        """Benchmark multi-document ingestion and report chunks/second."""
+        intelligence = FKSIntelligence.__new__(FKSIntelligence)
+        intelligence.processor = DocumentProcessor()
+        intelligence.embeddings = EmbeddingsService.__new__(EmbeddingsService)
+        intelligence.embeddings.generate_embeddings_batch = lambda texts, batch_size=64: (
+            np.random.rand(len(texts), 384).tolist()
+        )
+        documents = [
+            {
+                'content': f"Trade journal {i}: BTCUSDT long, momentum breakout. " * 40,
+                'doc_type': 'trade_analysis',
+                'symbol': 'BTCUSDT',
+            }
+            for i in range(50)
+        ]
+
+        result = benchmark(intelligence.ingest_documents, documents, session=mock_session)
+
+        assert len(result) == 50
+        ingest_stats = intelligence.last_ingest_stats
+        benchmark.extra_info['chunks_per_second'] = ingest_stats['chunks_per_second']
+        print(f"\nIngestion: {ingest_stats['chunks']} chunks, "
+              f"{ingest_stats['chunks_per_second']:.1f} chunks/s")
+
+
+@pytest.mark.benchmark
+class TestQueryEmbeddingCachePerformance:
+    """Benchmark the query embedding LRU cache."""
+
+    @pytest.fixture
+    def service(self):
+        """Create a service whose model is a mock."""
+        with patch.object(EmbeddingsService, '_init_local_model'):
+            service = EmbeddingsService(model='all-MiniLM-L6-v2', dimension=384)
+        service.embeddings = MagicMock()
+        service.embeddings.generate_embedding.side_effect = lambda text: np.random.rand(384).tolist()
+        return service
+
+    def test_cached_query_embedding_performance(self, benchmark, service):
+        """Benchmark repeated queries that differ only in whitespace."""
+        queries = ["What signals  were generated for BTCUSDT?", "What signals were generated for BTCUSDT? "]
+
+        result = benchmark(lambda: [service.embed_query(q) for q in queries])
+
+        assert len(result[0]) == 384
+        assert service.embeddings.generate_embedding.call_count == 1
+        stats = benchmark.stats.stats
+        print(f"\nCached query embedding: mean={stats.mean:.6f}s, hits={service.query_cache_hits}")
+
+
+@pytest.mark.benchmark
+@pytest.mark.skipif(
+    not os.getenv('RAG_BENCHMARK_DATABASE_URL'),
+    reason="RAG_BENCHMARK_DATABASE_URL not set (needs Postgres with pgvector and RAG migrations)",
+)
+class TestFilteredANNSearchPerformance:
+    """Benchmark filtered HNSW search latency and recall against exact search.
+
+    Seeds a clustered corpus into document_chunks inside a transaction that is
+    rolled back afterwards, so the target database is left unchanged.
+    """
+
+    DIMENSION = 1536
+    N_DOCUMENTS = 200
+    CHUNKS_PER_DOCUMENT = 25
+    DOC_TYPES = ['signal', 'backtest', 'trade_analysis', 'strategy']
+    SYMBOLS = ['BTCUSDT', 'ETHUSDT', 'SOLUSDT']
+
+    @pytest.fixture(scope='class')
+    def seeded(self):
+        """Seed the corpus and yield (service, session, vectors, chunk rows)."""
+        from sqlalchemy import create_engine
+        from sqlalchemy.orm import Session as OrmSession
+        from core.database.models import Document, DocumentChunk
+
+        rng = np.random.default_rng(7)
+        centers = rng.normal(size=(50, self.DIMENSION))
+        n_chunks = self.N_DOCUMENTS * self.CHUNKS_PER_DOCUMENT
+        vectors = centers[rng.integers(0, 50, n_chunks)] + rng.normal(scale=0.3, size=(n_chunks, self.DIMENSION))
+
+        engine = create_engine(os.environ['RAG_BENCHMARK_DATABASE_URL'])
+        connection = engine.connect()
+        transaction = connection.begin()
+        session = OrmSession(bind=connection)
+
+        documents = [
+            Document(
+                doc_type=self.DOC_TYPES[i % len(self.DOC_TYPES)],
+                symbol=self.SYMBOLS[i % len(self.SYMBOLS)],
+                title=f"Benchmark document {i}",
+                content="benchmark",
+            )
+            for i in range(self.N_DOCUMENTS)
+        ]
+        session.add_all(documents)
+        session.flush()
+        chunks = [
+            DocumentChunk(
+                document_id=doc.id,
+                chunk_index=j,
+                content=f"chunk {j}",
+                doc_type=doc.doc_type,
+                symbol=doc.symbol,
+            )
+            for doc in documents
+            for j in range(self.CHUNKS_PER_DOCUMENT)
+        ]
+        session.add_all(chunks)
+        session.flush()
+
+        with patch.object(EmbeddingsService, '_init_local_model'):
+            service = EmbeddingsService(dimension=self.DIMENSION)
+        service.store_chunk_embeddings(
+            zip([c.id for c in chunks], vectors.tolist()), session=session
+        )
+
+        rows = [(c.id, c.doc_type, c.symbol) for c in chunks]
+        try:
+            yield service, session, vectors, rows
+        finally:
+            session.close()
+            transaction.rollback()
+            connection.close()
+            engine.dispose()
+
+    def _exact_top_k(self, vectors, rows, query, k, filters):
+        """Exact cosine top-k over the seeded corpus."""
+        candidates = np.array([
+            i for i, (_, doc_type, symbol) in enumerate(rows)
+            if filters.get('doc_type', doc_type) == doc_type and filters.get('symbol', symbol) == symbol
+        ])
+        subset = vectors[candidates]
+        similarity = subset @ query / (np.linalg.norm(subset, axis=1) * np.linalg.norm(query))
+        top = candidates[np.argsort(-similarity)[:k]]
+        return {rows[i][0] for i in top}
+
+    @pytest.mark.parametrize("filters", [
+        {},
+        {'doc_type': 'signal'},
+        {'doc_type': 'backtest', 'symbol': 'ETHUSDT'},
+    ])
+    def test_filtered_search_latency_and_recall(self, benchmark, seeded, filters):
+        """Benchmark filtered ANN search and report recall@10 vs exact search."""
+        service, session, vectors, rows = seeded
+        rng = np.random.default_rng(11)
+        queries = vectors[rng.integers(0, len(vectors), 20)] + rng.normal(scale=0.1, size=(20, self.DIMENSION))
+
+        recalls = []
+        for query in queries:
+            found = service.semantic_search(
+                query.tolist(), limit=10, similarity_threshold=-1.0, filters=filters, session=session
+            )
+            exact = self._exact_top_k(vectors, rows, query, 10, filters)
+            recalls.append(len({r['chunk_id'] for r in found} & exact) / len(exact))
+
+        result = benchmark(
+            service.semantic_search, queries[0].tolist(), limit=10,
+            similarity_threshold=-1.0, filters=filters, session=session,
+        )
+
+        recall = float(np.mean(recalls))
+        benchmark.extra_info['recall_at_10'] = recall
+        print(f"\nFiltered ANN {filters or 'unfiltered'}: recall@10={recall:.3f}, "
+              f"mean={benchmark.stats.stats.mean * 1000:.2f}ms")
+        assert len(result) == 10
+        assert recall >= 0.9
+
+
 @pytest.mark.benchmark
 class TestRetrievalServicePerformance:
     """Benchmark retrieval service operations."""
@@ -0,0 +1,105 @@
+"""
+Performance tests for ServiceRegistry cold start using pytest-benchmark.
+Compares the previous approach (await each service's start() one at a time in
+topological order, then stop them one at a time) with layered startup, where
+services whose dependencies are running start concurrently.
+
+The stub services model a typical API process: Redis client, DB pool, model
+loaders and HTTP clients with artificial init delays, a cache and a feature
+store on top of the infrastructure, and the API depending on everything.
+"""
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+SRC = Path(__file__).resolve().parents[2] / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from framework.services.registry import ServiceRegistry  # noqa: E402
+
+# name: (start delay seconds, dependencies)
+SERVICES = {
+    "redis": (0.08, set()),
+    "db_pool": (0.25, set()),
+    "price_model": (0.40, set()),
+    "sentiment_model": (0.35, set()),
+    "regime_model": (0.30, set()),
+    "binance_http": (0.12, set()),
+    "polygon_http": (0.15, set()),
+    "cache": (0.05, {"redis", "db_pool"}),
+    "feature_store": (0.20, {"db_pool", "cache"}),
+    "api": (0.05, {"feature_store", "price_model", "sentiment_model", "regime_model",
+                   "binance_http", "polygon_http"}),
+}
+
+
+class StubService:
+    """Service whose start/stop take a fixed amount of time."""
+
+    def __init__(self, delay):
+        self.delay = delay
+
+    async def start(self):
+        await asyncio.sleep(self.delay)
+
+    async def stop(self):
+        await asyncio.sleep(self.delay / 4)
+
+
+def _registry():
+    registry = ServiceRegistry()
+    for name, (delay, deps) in SERVICES.items():
+        registry.register(name, StubService(delay), dependencies=deps)
+    return registry
+
+
+async def _serial_lifecycle(registry):
+    """The previous start_all/stop_all: one service at a time."""
+    order = registry._resolve_startup_order()
+    for name in order:
+        assert await registry._start_service(name)
+    ready = time.perf_counter()
+    for name in reversed(order):
+        await registry._stop_service(name)
+    return ready
+
+
+async def _layered_lifecycle(registry):
+    await registry.start_all(enable_health_checks=False)
+    ready = time.perf_counter()
+    await registry.stop_all()
+    return ready
+
+
+@pytest.mark.benchmark
+class TestRegistryStartupPerformance:
+    """Benchmark cold start and shutdown of a stub service graph."""
+
+    @pytest.mark.parametrize("mode", ["serial", "layered"])
+    def test_cold_start(self, benchmark, mode):
+        """Benchmark start_all followed by stop_all."""
+        lifecycle = _serial_lifecycle if mode == "serial" else _layered_lifecycle
+        timings = {}
+
+        def run():
+            registry = _registry()
+            started = time.perf_counter()
+            ready = asyncio.run(lifecycle(registry))
+            timings["startup"] = ready - started
+            timings["shutdown"] = time.perf_counter() - ready
+            return registry
+
+        registry = benchmark.pedantic(run, rounds=3, iterations=1)
+
+        assert all(info.stop_time for info in map(registry.get_service_info, registry.list_services()))
+        critical_path = 0.25 + 0.05 + 0.20 + 0.05
+        if mode == "layered":
+            assert timings["startup"] < critical_path + 0.25
+        benchmark.extra_info.update(startup_seconds=timings["startup"], shutdown_seconds=timings["shutdown"])
+        print(f"\n{mode}: {len(SERVICES)} services ready in {timings['startup']:.2f}s "
+              f"(sum of init delays {sum(d for d, _ in SERVICES.values()):.2f}s, "
+              f"critical path {critical_path:.2f}s), stopped in {timings['shutdown']:.2f}s")
@@ -0,0 +1,208 @@
+"""
+Performance tests for the data service BaseRepository using pytest-benchmark.
+Measures event-loop lag while many repository queries are in flight, comparing
+the previous pattern (blocking cursor calls on the loop) with queries run via
+Database.run_in_transaction, and compares OFFSET with keyset pagination on
+deep pages.
+
+The event-loop benchmarks simulate 5ms of query latency per call. The deep
+page benchmarks need a scratch Postgres reachable through the POSTGRES_*
+environment variables and REPOSITORY_BENCHMARK=1; they create and drop their
+own table.
+"""
+import asyncio
+import os
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from pydantic import BaseModel
+
+DATA_SRC = Path(__file__).resolve().parents[2] / "src/services/data/src"
+if str(DATA_SRC) not in sys.path:
+    sys.path.insert(0, str(DATA_SRC))
+
+QUERY_LATENCY = 0.005
+N_QUERIES = 400
+CONCURRENCY = 50
+TICK = 0.005
+
+
+class Bar(BaseModel):
+    id: int
+    symbol: str
+    close: float
+
+
+class SimulatedConnection:
+    """Connection whose queries wait QUERY_LATENCY like a network round trip."""
+
+    def cursor(self):
+        class Cursor:
+            description = [("id",), ("symbol",), ("close",)]
+
+            def execute(self, sql, params=None):
+                time.sleep(QUERY_LATENCY)
+                self._row = (params[0], "BTCUSDT", 50000.0)
+
+            def fetchone(self):
+                return self._row
+
+        return Cursor()
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+
+@pytest.fixture(scope="module")
+def repository_module():
+    from infrastructure.database import base, repository  # type: ignore
+
+    class SimulatedDatabase(base.Database):
+        def __init__(self):
+            super().__init__()
+            self.configure({"dsn": "postgresql://benchmark", "pool_max_size": 10})
+            # Single shared connection used by the old transaction() path
+            self._is_connected = True
+            self._pg_connection = SimpleNamespace(conn=SimulatedConnection())
+
+        @contextmanager
+        def _checkout(self):
+            yield SimulatedConnection()
+
+    class BlockingRepository(repository.BaseRepository):
+        """get_by_id as it was: cursor calls made directly on the event loop."""
+
+        async def get_by_id(self, id):
+            async with self.db.transaction() as conn:
+                query = f"SELECT * FROM {self.table_name} WHERE {self.id_field} = %s"
+                cursor = conn.cursor()
+                cursor.execute(query, (id,))
+                row = cursor.fetchone()
+                if row is None:
+                    return None
+                return self._row_to_model(dict(zip(["id", "symbol", "close"], row)))
+
+    return SimpleNamespace(
+        Database=SimulatedDatabase,
+        repositories={"blocking_cursor": BlockingRepository, "run_in_transaction": repository.BaseRepository},
+        module=repository,
+    )
+
+
+async def _measure_lag(repo):
+    """Run N_QUERIES get_by_id calls, CONCURRENCY at a time, while sampling loop lag."""
+    lags = []
+    done = asyncio.Event()
+
+    async def monitor():
+        loop = asyncio.get_running_loop()
+        while not done.is_set():
+            start = loop.time()
+            await asyncio.sleep(TICK)
+            lags.append(loop.time() - start - TICK)
+
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    async def query(i):
+        async with semaphore:
+            return await repo.get_by_id(i)
+
+    monitor_task = asyncio.create_task(monitor())
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    results = await asyncio.gather(*(query(i) for i in range(N_QUERIES)))
+    elapsed = time.perf_counter() - start
+    done.set()
+    await monitor_task
+    return results, elapsed, np.array(lags)
+
+
+@pytest.mark.benchmark
+class TestRepositoryEventLoopLag:
+    """Benchmark event-loop responsiveness with queries in flight."""
+
+    @pytest.mark.parametrize("path", ["blocking_cursor", "run_in_transaction"])
+    def test_event_loop_lag(self, benchmark, repository_module, path):
+        db = repository_module.Database()
+        repo = repository_module.repositories[path](db, Bar, table_name="bars")
+        runs = []
+
+        def run():
+            runs.append(asyncio.run(_measure_lag(repo)))
+
+        benchmark.pedantic(run, rounds=3, iterations=1)
+
+        results, elapsed, lags = runs[-1]
+        assert [bar.id for bar in results] == list(range(N_QUERIES))
+        p50, p99, worst = (np.percentile(lags, [50, 99, 100]) * 1000) if lags.size else (0.0, 0.0, 0.0)
+        benchmark.extra_info.update(p99_lag_ms=p99, max_lag_ms=worst, queries_per_second=N_QUERIES / elapsed)
+        print(f"\n{path}: {N_QUERIES / elapsed:,.0f} queries/s, loop lag p50 {p50:.2f}ms, "
+              f"p99 {p99:.2f}ms, max {worst:.1f}ms ({lags.size} samples)")
+
+
+@pytest.mark.skipif(
+    not os.getenv("REPOSITORY_BENCHMARK"),
+    reason="REPOSITORY_BENCHMARK not set (needs a local Postgres via POSTGRES_* env)",
+)
+@pytest.mark.benchmark
+class TestRepositoryPaginationPerformance:
+    """Benchmark reading a deep page with OFFSET and with a keyset cursor."""
+
+    N_ROWS = 500_000
+    PAGE_SIZE = 100
+    DEPTH = 4_000  # page number, i.e. 400k rows in
+
+    @pytest.fixture(scope="class")
+    def repo(self, repository_module):
+        from infrastructure.database import Database  # type: ignore
+
+        db = Database().configure({
+            "host": os.getenv("POSTGRES_HOST", "localhost"),
+            "dbname": os.getenv("POSTGRES_DB"),
+            "user": os.getenv("POSTGRES_USER"),
+            "password": os.getenv("POSTGRES_PASSWORD"),
+        })
+
+        def setup(conn):
+            cursor = conn.cursor()
+            cursor.execute("DROP TABLE IF EXISTS bench_bars")
+            cursor.execute("CREATE TABLE bench_bars (id BIGINT PRIMARY KEY, symbol TEXT NOT NULL, close DOUBLE PRECISION NOT NULL)")
+            cursor.execute(
+                "INSERT INTO bench_bars SELECT g, 'BTCUSDT', 50000 + random() * 1000 FROM generate_series(1, %s) g",
+                (self.N_ROWS,),
+            )
+            cursor.execute("CREATE INDEX bench_bars_close_id ON bench_bars (close, id)")
+            cursor.execute("ANALYZE bench_bars")
+
+        asyncio.run(db.run_in_transaction(setup))
+        yield repository_module.module.BaseRepository(db, Bar, table_name="bench_bars", timestamps=False)
+        asyncio.run(db.run_in_transaction(lambda conn: conn.cursor().execute("DROP TABLE bench_bars")))
+
+    def test_deep_page_offset(self, benchmark, repository_module, repo):
+        pagination = repository_module.module.Pagination(page=self.DEPTH, page_size=self.PAGE_SIZE, order_by="close")
+        page = benchmark(lambda: asyncio.run(repo.find_all(pagination=pagination)))
+        assert len(page.items) == self.PAGE_SIZE
+        print(f"\nOFFSET page {self.DEPTH}: {benchmark.stats.stats.mean * 1000:.1f}ms (with COUNT(*))")
+
+    @pytest.mark.parametrize("count", [None, "approximate"])
+    def test_deep_page_keyset(self, benchmark, repository_module, repo, count):
+        KeysetPagination = repository_module.module.KeysetPagination
+        # Seek to the same depth once, then benchmark reading the next page from there
+        rows = asyncio.run(repo.execute_raw(
+            "SELECT close, id FROM bench_bars ORDER BY close, id OFFSET %s LIMIT 1",
+            [(self.DEPTH - 1) * self.PAGE_SIZE - 1],
+        ))
+        close, id_ = rows[0]["close"], rows[0]["id"]
+        pagination = KeysetPagination(page_size=self.PAGE_SIZE, order_by="close",
+                                      after=KeysetPagination.encode_cursor([close, id_]))
+        page = benchmark(lambda: asyncio.run(repo.find_page(pagination=pagination, count=count)))
+        assert len(page.items) == self.PAGE_SIZE
+        print(f"\nkeyset page {self.DEPTH} (count={count}): {benchmark.stats.stats.mean * 1000:.1f}ms")
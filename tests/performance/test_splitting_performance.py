@@ -0,0 +1,99 @@
+"""
+Performance tests for walk-forward fold generation using pytest-benchmark.
+Compares the previous approach (write every fold's train/test rows to CSV
+with to_csv and read them back with read_csv) with SplitDataset folds taken
+as slices of one memory-mapped Parquet file, for a multi-year minute dataset.
+Reports generation time and disk usage.
+
+The dataset defaults to 2 years of 1-minute bars (~1.05M rows); set
+SPLIT_BENCHMARK_YEARS to change it.
+"""
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+DATA_SRC = Path(__file__).resolve().parents[2] / "src/services/data/src"
+if str(DATA_SRC) not in sys.path:
+    sys.path.insert(0, str(DATA_SRC))
+
+from splitting import SplitDataset, walk_forward_folds, write_fold_manifest  # noqa: E402
+
+YEARS = float(os.getenv("SPLIT_BENCHMARK_YEARS", "2"))
+TRAIN, TEST, STEP = "365D", "30D", "30D"
+
+
+@pytest.fixture(scope="module")
+def bars():
+    n = int(YEARS * 365 * 24 * 60)
+    rng = np.random.default_rng(5)
+    close = 30_000 * np.exp(np.cumsum(rng.normal(0, 0.0005, n)))
+    spread = np.abs(rng.normal(0, 0.0004, n)) * close
+    return pd.DataFrame({
+        "timestamp": pd.date_range("2022-01-01", periods=n, freq="1min"),
+        "open": close + rng.normal(0, 1, n),
+        "high": close + spread,
+        "low": close - spread,
+        "close": close,
+        "volume": rng.gamma(2.0, 3.0, n),
+    })
+
+
+def _disk_usage(path: Path) -> int:
+    return sum(p.stat().st_size for p in path.rglob("*") if p.is_file())
+
+
+def csv_folds(df, out_dir):
+    """The previous pattern: every split is written to CSV and read back."""
+    folds = walk_forward_folds(df["timestamp"], TRAIN, TEST, step=STEP)
+    checksum = 0.0
+    for fold in folds:
+        for name, (start, stop) in (("train", fold.train[0]), ("test", fold.test)):
+            path = out_dir / f"BTCUSD_1m_fold{fold.index:03d}_{name}.csv"
+            df.iloc[start:stop].to_csv(path, index=False)
+            part = pd.read_csv(path, parse_dates=["timestamp"])
+            checksum += part["close"].iloc[-1]
+    return len(folds), checksum
+
+
+def view_folds(parquet_path, out_dir):
+    """Folds as slices of one memory-mapped Parquet file; only boundaries are written."""
+    dataset = SplitDataset.from_parquet(parquet_path, time_col="timestamp")
+    folds = dataset.walk_forward(TRAIN, TEST, step=STEP)
+    write_fold_manifest(out_dir / "BTCUSD_1m_folds.json", folds, dataset.times, symbol="BTCUSD", interval="1m")
+    checksum = 0.0
+    for _, train, test in dataset.iter_folds(folds):
+        checksum += train.column("close")[-1].as_py() + test.column("close")[-1].as_py()
+    return len(folds), checksum
+
+
+@pytest.mark.benchmark
+class TestFoldGenerationPerformance:
+    """Benchmark walk-forward fold generation over a multi-year minute dataset."""
+
+    @pytest.mark.parametrize("mode", ["csv_roundtrip", "parquet_views"])
+    def test_walk_forward(self, benchmark, bars, tmp_path, mode):
+        """Benchmark generating rolling 365D/30D folds and touching each one."""
+        out_dir = tmp_path / "splits"
+        out_dir.mkdir()
+        if mode == "csv_roundtrip":
+            run = lambda: csv_folds(bars, out_dir)  # noqa: E731
+            dataset_bytes = 0
+        else:
+            parquet_path = tmp_path / "BTCUSD_1m.parquet"
+            bars.to_parquet(parquet_path, index=False)
+            dataset_bytes = parquet_path.stat().st_size
+            run = lambda: view_folds(parquet_path, out_dir)  # noqa: E731
+
+        n_folds, checksum = benchmark.pedantic(run, rounds=1, iterations=1)
+
+        assert n_folds >= 1 and checksum > 0
+        fold_bytes = _disk_usage(out_dir)
+        benchmark.extra_info.update(folds=n_folds, fold_bytes=fold_bytes, dataset_bytes=dataset_bytes)
+        print(f"\n{mode}: {n_folds} folds over {len(bars):,} rows in {benchmark.stats.stats.mean:.2f}s, "
+              f"fold files {fold_bytes / 1024:,.1f}KB (+ dataset {dataset_bytes / 2**20:.1f}MB)")
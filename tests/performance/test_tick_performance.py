@@ -0,0 +1,96 @@
+"""
+Performance tests for tick storage using pytest-benchmark.
+Compares lists of Tick objects with the columnar TickBatch for memory and construction throughput.
+"""
+import importlib.util
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Load the data service tick module directly; the models package pulls in
+# market/candle dependencies that are unrelated to this benchmark
+_TICK_PATH = Path(__file__).resolve().parents[2] / "src/services/data/src/models/tick.py"
+_spec = importlib.util.spec_from_file_location("data_models_tick", _TICK_PATH)
+tick_module = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(tick_module)
+
+Tick = tick_module.Tick
+TickBatch = tick_module.TickBatch
+
+N_TICKS = 100_000
+
+
+@pytest.fixture(scope="module")
+def raw_ticks():
+    """Generate raw trade columns."""
+    rng = np.random.default_rng(42)
+    start = datetime(2025, 1, 2, 9, 30)
+    return {
+        "timestamps": [start + timedelta(milliseconds=i) for i in range(N_TICKS)],
+        "prices": (50000 + rng.normal(0, 5, N_TICKS).cumsum()).tolist(),
+        "volumes": rng.exponential(0.5, N_TICKS).tolist(),
+        "sides": rng.choice(["buy", "sell"], N_TICKS).tolist(),
+    }
+
+
+def _build_ticks(raw):
+    return [
+        Tick(symbol="BTCUSDT", timestamp=ts, price=p, volume=v, side=s)
+        for ts, p, v, s in zip(raw["timestamps"], raw["prices"], raw["volumes"], raw["sides"])
+    ]
+
+
+def _build_batch(raw):
+    return TickBatch(
+        symbol="BTCUSDT",
+        timestamps=raw["timestamps"],
+        prices=raw["prices"],
+        volumes=raw["volumes"],
+        sides=raw["sides"],
+    )
+
+
+def _allocated_bytes(builder, raw):
+    tracemalloc.start()
+    result = builder(raw)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return size
+
+
+@pytest.mark.benchmark
+class TestTickBatchPerformance:
+    """Benchmark per-object ticks against columnar batches."""
+
+    def test_tick_list_construction(self, benchmark, raw_ticks):
+        """Benchmark building one Tick object per trade."""
+        ticks = benchmark(_build_ticks, raw_ticks)
+
+        assert len(ticks) == N_TICKS
+
+    def test_tick_batch_construction(self, benchmark, raw_ticks):
+        """Benchmark building a TickBatch with bulk validation."""
+        batch = benchmark(_build_batch, raw_ticks)
+
+        assert len(batch) == N_TICKS
+
+    def test_tick_batch_vwap(self, benchmark, raw_ticks):
+        """Benchmark a vectorized aggregate over the batch."""
+        batch = _build_batch(raw_ticks)
+
+        vwap = benchmark(lambda: batch.vwap)
+
+        assert vwap > 0
+
+    def test_memory_footprint(self, raw_ticks):
+        """TickBatch should use a fraction of the memory of Tick objects."""
+        list_bytes = _allocated_bytes(_build_ticks, raw_ticks)
+        batch_bytes = _allocated_bytes(_build_batch, raw_ticks)
+
+        print(f"\nTick list: {list_bytes / N_TICKS:.1f} B/tick, "
+              f"TickBatch: {batch_bytes / N_TICKS:.1f} B/tick")
+        assert batch_bytes * 5 < list_bytes
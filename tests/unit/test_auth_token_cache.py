@@ -0,0 +1,137 @@
+"""
+Test suite for the verified-token cache: revocation, key rotation, expiry and disabling it
+"""
+
+import os
+from datetime import timedelta
+from types import SimpleNamespace
+
+import jwt
+import pytest
+
+from framework.middleware import auth
+from framework.middleware.auth import InvalidTokenError, JWTManager, TokenExpiredError, VerifiedTokenCache
+
+SECRET = "s" * 48
+
+
+class Clock:
+    def __init__(self, now):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def local_secret_only(monkeypatch):
+    monkeypatch.setattr(auth, "AUTHELIA_JWT_SECRET", None)
+
+
+def issue(manager, **kwargs):
+    return manager.create_token(user_id="user-1", roles=["trader"], permissions=["orders:read"], **kwargs)
+
+
+def test_repeat_tokens_are_served_from_the_cache():
+    manager = JWTManager(secret_key=SECRET)
+    token = issue(manager)
+
+    first = manager.decode_token(token)
+    first.roles.append("admin")
+    second = manager.decode_token(token)
+
+    assert second.sub == "user-1" and second.roles == ["trader"]
+    stats = manager.token_cache.stats()
+    assert (stats["size"], stats["hits"], stats["misses"]) == (1, 1, 1)
+
+
+def test_revoked_token_is_rejected_even_when_cached():
+    manager = JWTManager(secret_key=SECRET)
+    token, other = issue(manager), issue(manager)
+    manager.decode_token(token)
+    manager.decode_token(other)
+
+    manager.revoke_token(token)
+
+    with pytest.raises(InvalidTokenError, match="revoked"):
+        manager.decode_token(token)
+    assert manager.decode_token(other).sub == "user-1"
+    assert manager.token_cache.stats()["size"] == 1
+
+
+def test_token_without_jti_cannot_be_revoked():
+    manager = JWTManager(secret_key=SECRET)
+    token = jwt.encode({"sub": "user-1"}, SECRET, algorithm=manager.algorithm)
+
+    with pytest.raises(InvalidTokenError, match="jti"):
+        manager.revoke_token(token)
+
+
+def test_rotated_secret_invalidates_cached_tokens():
+    manager = JWTManager(secret_key=SECRET)
+    old_token = issue(manager)
+    manager.decode_token(old_token)
+
+    manager.secret_key = "r" * 48
+
+    with pytest.raises(InvalidTokenError):
+        manager.decode_token(old_token)
+    assert manager.decode_token(issue(manager)).sub == "user-1"
+
+
+def test_cached_entries_expire_with_the_token(monkeypatch):
+    manager = JWTManager(secret_key=SECRET)
+    token = issue(manager, expires_delta=timedelta(seconds=60))
+    payload = manager.decode_token(token)
+    entry = next(iter(manager.token_cache._entries.values()))
+    assert entry.expires_at == payload.exp
+
+    clock = Clock(payload.exp + 1)
+    monkeypatch.setattr(auth, "time", SimpleNamespace(time=clock.time))
+
+    assert manager.token_cache.get(token, {entry.secret_id}) is None
+    assert manager.token_cache.stats()["size"] == 0
+
+
+def test_cache_lifetime_is_capped_by_max_ttl(monkeypatch):
+    clock = Clock(1_000_000.0)
+    monkeypatch.setattr(auth, "time", SimpleNamespace(time=clock.time))
+    cache = VerifiedTokenCache(max_size=8, max_ttl=30)
+    payload = auth.TokenPayload(sub="user-1", exp=int(clock.now) + 3600, jti="a")
+    cache.put("token", payload, "secret")
+
+    clock.now += 29
+    assert cache.get("token", {"secret"}) is payload
+    clock.now += 2
+    assert cache.get("token", {"secret"}) is None
+
+
+def test_expired_tokens_are_rejected_and_not_cached():
+    manager = JWTManager(secret_key=SECRET)
+    token = issue(manager, expires_delta=timedelta(seconds=-10))
+
+    with pytest.raises(TokenExpiredError):
+        manager.decode_token(token)
+    assert manager.decode_token(token, verify_exp=False).sub == "user-1"
+    assert manager.token_cache.stats()["size"] == 0
+
+
+def test_zero_cache_size_disables_caching_but_not_revocation():
+    manager = JWTManager(secret_key=SECRET, token_cache_size=0)
+    token = issue(manager)
+
+    for _ in range(3):
+        assert manager.decode_token(token).sub == "user-1"
+    manager.revoke_token(token)
+
+    assert manager.token_cache.stats() == {"size": 0, "max_size": 0, "revoked": 1, "hits": 0, "misses": 0}
+    with pytest.raises(InvalidTokenError, match="revoked"):
+        manager.decode_token(token)
+
+
+def test_cache_is_enabled_by_default():
+    manager = JWTManager(secret_key=SECRET)
+
+    if "TOKEN_CACHE_SIZE" not in os.environ:
+        assert auth.TOKEN_CACHE_SIZE == 4096
+    assert manager.token_cache.stats()["max_size"] == auth.TOKEN_CACHE_SIZE
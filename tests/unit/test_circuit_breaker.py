@@ -0,0 +1,168 @@
+"""
+Test suite for CircuitBreaker state transitions and timeout handling
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from framework.middleware.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerConfig,
+    CircuitOpenError,
+    CircuitState,
+    CircuitTimeoutError,
+    with_circuit_breaker,
+)
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+@pytest.fixture(autouse=True)
+def isolated_instances():
+    yield
+    with CircuitBreaker._lock:
+        CircuitBreaker._instances.clear()
+
+
+def breaker(**overrides):
+    settings = {"failure_threshold": 2, "reset_timeout": 30, "success_threshold": 2, "timeout": 0, "persist_interval": 0}
+    return CircuitBreaker("test", config=CircuitBreakerConfig(**{**settings, **overrides}))
+
+
+def failing():
+    raise RuntimeError("upstream down")
+
+
+def open_breaker(circuit):
+    for _ in range(circuit.config.failure_threshold):
+        with pytest.raises(RuntimeError):
+            circuit.execute(failing)
+    return circuit
+
+
+def elapse_reset_timeout(circuit):
+    circuit.last_failure_time -= circuit.config.reset_timeout
+
+
+def test_failures_open_the_circuit_and_reject_requests():
+    circuit = breaker()
+
+    with pytest.raises(RuntimeError):
+        circuit.execute(failing)
+    assert circuit.is_closed()
+    with pytest.raises(RuntimeError):
+        circuit.execute(failing)
+
+    assert circuit.is_open()
+    with pytest.raises(CircuitOpenError) as excinfo:
+        circuit.execute(lambda: "unreachable")
+    assert 0 < excinfo.value.retry_after_seconds <= 30
+    assert circuit.metrics.rejected_requests == 1
+
+
+def test_half_open_closes_after_success_threshold():
+    circuit = breaker()
+    transitions = []
+    circuit.register_state_change_hook(lambda name, old, new: transitions.append((old, new)))
+    open_breaker(circuit)
+    elapse_reset_timeout(circuit)
+
+    assert circuit.execute(lambda: "ok") == "ok"
+    assert circuit.is_half_open()
+    assert circuit.execute(lambda: "ok") == "ok"
+
+    assert circuit.is_closed() and circuit.failure_count == 0
+    assert transitions == [
+        (CircuitState.CLOSED, CircuitState.OPEN),
+        (CircuitState.OPEN, CircuitState.HALF_OPEN),
+        (CircuitState.HALF_OPEN, CircuitState.CLOSED),
+    ]
+    assert [change for _, change in circuit.metrics.state_changes] == [
+        "closed -> open", "open -> half_open", "half_open -> closed",
+    ]
+
+
+def test_failure_while_half_open_reopens_the_circuit():
+    circuit = open_breaker(breaker())
+    elapse_reset_timeout(circuit)
+
+    with pytest.raises(RuntimeError):
+        circuit.execute(failing)
+
+    assert circuit.is_open()
+    with pytest.raises(CircuitOpenError):
+        circuit.execute(lambda: "unreachable")
+
+
+def test_excluded_exceptions_do_not_count_as_failures():
+    circuit = breaker(excluded_exceptions=[KeyError])
+
+    def missing():
+        raise KeyError("absent")
+
+    for _ in range(3):
+        with pytest.raises(KeyError):
+            circuit.execute(missing)
+
+    assert circuit.is_closed() and circuit.failure_count == 0
+
+
+def test_sync_timeout_is_a_builtin_timeout_error():
+    circuit = breaker(failure_threshold=1)
+
+    with pytest.raises(TimeoutError) as excinfo:
+        circuit.execute(time.sleep, 0.5, _timeout=0.05)
+
+    assert isinstance(excinfo.value, CircuitTimeoutError)
+    assert excinfo.value.timeout_seconds == 0.05
+    assert circuit.is_open()
+    assert circuit.metrics.timeout_requests == 1
+
+
+def test_async_timeout_opens_the_circuit():
+    circuit = breaker(failure_threshold=1)
+
+    async def slow():
+        await asyncio.sleep(1)
+
+    async def scenario():
+        try:
+            await circuit.execute_async(slow, _timeout=0.05)
+        except TimeoutError as error:
+            return error
+
+    error = run(scenario())
+
+    assert isinstance(error, CircuitTimeoutError)
+    assert error.circuit_name == "test"
+    assert circuit.get_state() == CircuitState.OPEN
+    assert circuit.metrics.timeout_requests == 1
+
+
+def test_async_decorator_keeps_except_timeout_error_callers_working():
+    calls = []
+
+    @with_circuit_breaker("decorated", failure_threshold=2, timeout=0.05)
+    async def fetch(delay):
+        calls.append(delay)
+        await asyncio.sleep(delay)
+        return "fetched"
+
+    async def scenario():
+        outcomes = []
+        for delay in (0, 1, 1, 0):
+            try:
+                outcomes.append(await fetch(delay))
+            except TimeoutError:
+                outcomes.append("timeout")
+            except CircuitOpenError:
+                outcomes.append("open")
+        return outcomes
+
+    assert run(scenario()) == ["fetched", "timeout", "timeout", "open"]
+    assert calls == [0, 1, 1]
+    assert CircuitBreaker.get_instance("decorated").is_open()
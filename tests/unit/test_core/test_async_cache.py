@@ -0,0 +1,145 @@
+"""
+Test suite for AsyncCache TTL expiry, timer-wheel draining and LRU eviction
+"""
+
+import asyncio
+import importlib
+from types import SimpleNamespace
+
+import pytest
+
+from core.cache.cache import AsyncCache
+
+# core.cache re-exports a `cache` decorator that shadows the submodule attribute
+cache_module = importlib.import_module("core.cache.cache")
+
+
+class Clock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(cache_module, "time", SimpleNamespace(time=clock.time))
+    return clock
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = AsyncCache(default_ttl=10)
+
+    async def scenario():
+        await cache.set("a", 1)
+        await cache.set("b", 2, ttl=30)
+        clock.now += 5
+        assert await cache.get("a") == 1
+        clock.now += 6
+        assert await cache.get("a") is None
+        assert await cache.get("b") == 2
+
+    run(scenario())
+    assert cache.keys() == ["b"]
+    assert cache.stats.expirations == 1
+
+
+def test_due_buckets_are_drained_without_memory_pressure(clock):
+    cache = AsyncCache(default_ttl=2, max_size=1000)
+
+    async def scenario():
+        for i in range(50_000):
+            if i % 100 == 0:
+                clock.now += 0.5
+            await cache.set(f"k{i % 10}", i)
+
+    run(scenario())
+
+    assert len(cache) == 10
+    assert len(cache._wheel) == 10
+    # only ticks inside the 2s TTL window are pending
+    assert len(cache._wheel.buckets) <= 4
+    assert len(cache._wheel.ticks) <= 4
+
+
+def test_overwrites_within_a_tick_do_not_grow_the_wheel(clock):
+    cache = AsyncCache(default_ttl=300)
+
+    async def scenario():
+        for i in range(10_000):
+            await cache.set(f"k{i % 10}", i, ttl=100 + i % 50)
+
+    run(scenario())
+
+    assert len(cache._wheel) == 10
+    assert len(cache._wheel.ticks) <= 50
+
+
+def test_expired_entries_are_purged_by_unrelated_operations(clock):
+    cache = AsyncCache(default_ttl=1)
+
+    async def scenario():
+        for i in range(100):
+            await cache.set(f"old{i}", i)
+        clock.now += 5
+        await cache.get("missing")
+
+    run(scenario())
+
+    assert len(cache) == 0
+    assert cache.stats.total_size_bytes == 0
+    assert cache.stats.expirations == 100
+
+
+def test_lru_eviction_by_count(clock):
+    cache = AsyncCache(max_size=3)
+
+    async def scenario():
+        for key in "abc":
+            await cache.set(key, key)
+            clock.now += 1
+        await cache.get("a")  # a becomes most recently used
+        await cache.set("d", "d")
+
+    run(scenario())
+
+    assert cache.keys() == ["c", "a", "d"]
+    assert cache.stats.evictions == 1
+    assert len(cache._wheel) == 3
+
+
+def test_lru_eviction_by_bytes(clock):
+    cache = AsyncCache(max_size=100, max_bytes=3000)
+
+    async def scenario():
+        for key in "abcd":
+            await cache.set(key, "x" * 900)
+
+    run(scenario())
+
+    assert cache.keys() == ["b", "c", "d"]
+    assert cache.stats.total_size_bytes <= 3000
+
+
+def test_invalidate_and_clear_keep_accounting_consistent(clock):
+    cache = AsyncCache()
+
+    async def scenario():
+        for i in range(5):
+            await cache.set(f"user:{i}", i)
+        await cache.set("other", 1)
+        assert await cache.invalidate("user:0")
+        assert await cache.invalidate_by_pattern(r"^user:") == 4
+        assert cache.keys() == ["other"]
+        await cache.clear()
+
+    run(scenario())
+
+    assert len(cache) == 0 and len(cache._wheel) == 0
+    assert cache.stats.total_size_bytes == 0
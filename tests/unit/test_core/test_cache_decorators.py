@@ -0,0 +1,145 @@
+"""
+Test suite for single-flight, negative caching and early refresh in async_cached
+"""
+
+import asyncio
+
+import pytest
+
+from core.cache import MemoryBackend, async_cached
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def counting(delay=0.05, fail=False, result="value"):
+    calls = []
+
+    async def fetch(key):
+        calls.append(key)
+        await asyncio.sleep(delay)
+        if fail:
+            raise RuntimeError("upstream down")
+        return f"{result}:{key}:{len(calls)}"
+
+    return fetch, calls
+
+
+def test_concurrent_misses_are_coalesced():
+    fetch, calls = counting()
+    cached_fetch = async_cached(ttl=60, backend=MemoryBackend())(fetch)
+
+    async def scenario():
+        results = await asyncio.gather(*(cached_fetch("a") for _ in range(10)))
+        return results, await cached_fetch("a")
+
+    results, later = run(scenario())
+
+    assert calls == ["a"]
+    assert set(results) == {"value:a:1"} and later == "value:a:1"
+    assert cached_fetch._cache_config._inflight == {}
+
+
+def test_single_flight_can_be_disabled():
+    fetch, calls = counting()
+    cached_fetch = async_cached(ttl=60, backend=MemoryBackend(), single_flight=False)(fetch)
+
+    async def scenario():
+        await asyncio.gather(*(cached_fetch("a") for _ in range(3)))
+
+    run(scenario())
+
+    assert len(calls) == 3
+
+
+def test_leader_failure_is_shared_and_not_cached():
+    fetch, calls = counting(fail=True)
+    cached_fetch = async_cached(ttl=60, backend=MemoryBackend())(fetch)
+
+    async def scenario():
+        results = await asyncio.gather(*(cached_fetch("a") for _ in range(5)), return_exceptions=True)
+        with pytest.raises(RuntimeError):
+            await cached_fetch("a")
+        return results
+
+    results = run(scenario())
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert len(calls) == 2  # one coalesced failure, then a fresh attempt
+
+
+def test_cancelled_leader_hands_over_to_a_joiner():
+    fetch, calls = counting(delay=0.05)
+    cached_fetch = async_cached(ttl=60, backend=MemoryBackend())(fetch)
+
+    async def scenario():
+        leader = asyncio.create_task(cached_fetch("a"))
+        await asyncio.sleep(0.01)
+        joiners = [asyncio.create_task(cached_fetch("a")) for _ in range(4)]
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        results = await asyncio.gather(*joiners)
+        return leader, results
+
+    leader, results = run(scenario())
+
+    assert leader.cancelled()
+    assert set(results) == {"value:a:2"}
+    assert len(calls) == 2  # the cancelled leader's call and one retry
+
+
+def test_cancelled_joiner_leaves_the_leader_running():
+    fetch, calls = counting(delay=0.05)
+    cached_fetch = async_cached(ttl=60, backend=MemoryBackend())(fetch)
+
+    async def scenario():
+        leader = asyncio.create_task(cached_fetch("a"))
+        await asyncio.sleep(0.01)
+        joiner = asyncio.create_task(cached_fetch("a"))
+        await asyncio.sleep(0.01)
+        joiner.cancel()
+        return await leader, joiner
+
+    result, joiner = run(scenario())
+
+    assert result == "value:a:1" and joiner.cancelled()
+    assert calls == ["a"]
+
+
+def test_negative_results_are_cached_for_negative_ttl():
+    calls = []
+
+    async def lookup(key):
+        calls.append(key)
+        return None
+
+    cached_lookup = async_cached(ttl=60, backend=MemoryBackend(), negative_ttl=30)(lookup)
+
+    async def scenario():
+        return [await cached_lookup("missing") for _ in range(3)]
+
+    assert run(scenario()) == [None, None, None]
+    assert calls == ["missing"]
+
+
+def test_stale_value_is_served_while_refreshing_in_background():
+    fetch, calls = counting(delay=0.02)
+    # A huge beta makes every hit fall inside the early-refresh window
+    cached_fetch = async_cached(ttl=60, backend=MemoryBackend(), early_refresh_beta=1e9)(fetch)
+    config = cached_fetch._cache_config
+
+    async def scenario():
+        first = await cached_fetch("a")
+        stale = await cached_fetch("a")
+        assert len(config._refresh_tasks) == 1
+        again = await cached_fetch("a")  # refresh already running: no second task
+        assert len(config._refresh_tasks) == 1
+        await asyncio.gather(*config._refresh_tasks.values())
+        assert config._refresh_tasks == {}
+        return first, stale, again, await cached_fetch("a")
+
+    first, stale, again, refreshed = run(scenario())
+
+    assert first == stale == again == "value:a:1"
+    assert refreshed == "value:a:2"
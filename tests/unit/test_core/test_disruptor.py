@@ -0,0 +1,187 @@
+"""
+Test suite for the ring-buffer Disruptor
+"""
+
+import asyncio
+
+import pytest
+
+from core.patterns.disruptor import Disruptor, EventProcessor, RingBuffer
+
+
+class Recorder(EventProcessor):
+    """Records (event, sequence) pairs, optionally checking an upstream stage."""
+
+    def __init__(self, upstream=None, fail_on=None):
+        self.seen = []
+        self.batches = 0
+        self.upstream = upstream
+        self.fail_on = fail_on
+        self.upstream_lag_violations = 0
+
+    async def on_batch(self, events, first_sequence):
+        self.batches += 1
+        await super().on_batch(events, first_sequence)
+
+    async def on_event(self, event, sequence):
+        if self.upstream is not None and (event, sequence) not in self.upstream.seen:
+            self.upstream_lag_violations += 1
+        if event == self.fail_on:
+            raise ValueError("boom")
+        self.seen.append((event, sequence))
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+@pytest.mark.unit
+class TestRingBuffer:
+    """Test ring buffer sizing and publication"""
+
+    def test_size_must_be_power_of_two(self):
+        with pytest.raises(ValueError):
+            RingBuffer(1000)
+
+    def test_event_factory_preallocates_slots(self):
+        ring = RingBuffer(8, event_factory=dict)
+
+        assert len(ring.slots) == 8
+        assert len({id(slot) for slot in ring.slots}) == 8
+
+    def test_cursor_waits_for_contiguous_publication(self):
+        async def scenario():
+            ring = RingBuffer(8)
+            first = await ring.next()
+            second = await ring.next()
+            ring.publish(second)
+            assert ring.cursor.value == -1
+            ring.publish(first)
+            assert ring.cursor.value == second
+
+        run(scenario())
+
+
+@pytest.mark.unit
+class TestDisruptor:
+    """Test event dispatch, stages and shutdown"""
+
+    def test_all_processors_see_events_in_order(self):
+        async def scenario():
+            disruptor = Disruptor(buffer_size=16)
+            a, b = Recorder(), Recorder()
+            disruptor.add_processor(a)
+            disruptor.add_processor(b)
+            await disruptor.start()
+            for i in range(100):
+                await disruptor.publish(i)
+            await disruptor.stop()
+            return a, b
+
+        a, b = run(scenario())
+
+        expected = [(i, i) for i in range(100)]
+        assert a.seen == expected
+        assert b.seen == expected
+
+    def test_consumers_process_batches(self):
+        async def scenario():
+            disruptor = Disruptor(buffer_size=1024)
+            recorder = Recorder()
+            disruptor.add_processor(recorder)
+            await disruptor.start()
+            await disruptor.publish_batch(list(range(500)))
+            await disruptor.stop()
+            return recorder
+
+        recorder = run(scenario())
+
+        assert len(recorder.seen) == 500
+        assert recorder.batches < 5
+
+    def test_dependent_stage_runs_after_upstream(self):
+        async def scenario():
+            disruptor = Disruptor(buffer_size=8)
+            first = Recorder()
+            second = Recorder(upstream=first)
+            disruptor.add_processor(first)
+            disruptor.add_processor(second, depends_on=[first])
+            await disruptor.start()
+            await disruptor.publish_batch(list(range(50)))
+            await disruptor.stop()
+            return first, second
+
+        first, second = run(scenario())
+
+        assert len(second.seen) == 50
+        assert second.upstream_lag_violations == 0
+
+    def test_publisher_waits_for_slowest_processor(self):
+        class Slow(Recorder):
+            async def on_event(self, event, sequence):
+                await asyncio.sleep(0)
+                await super().on_event(event, sequence)
+
+        async def scenario():
+            disruptor = Disruptor(buffer_size=4)
+            slow = Slow()
+            disruptor.add_processor(slow)
+            await disruptor.start()
+            for i in range(20):
+                await disruptor.publish(i)
+                assert disruptor.ring_buffer.remaining_capacity() >= 0
+            await disruptor.stop()
+            return slow
+
+        slow = run(scenario())
+
+        assert [event for event, _ in slow.seen] == list(range(20))
+
+    def test_processor_errors_are_isolated(self):
+        async def scenario():
+            disruptor = Disruptor(buffer_size=16)
+            recorder = Recorder(fail_on=3)
+            disruptor.add_processor(recorder)
+            await disruptor.start()
+            await disruptor.publish_batch(list(range(6)))
+            await disruptor.stop()
+            return recorder
+
+        recorder = run(scenario())
+
+        assert [event for event, _ in recorder.seen] == [0, 1, 2, 4, 5]
+
+    def test_publish_event_fills_preallocated_slot(self):
+        def translate(slot, sequence, price):
+            slot["price"] = price
+            slot["sequence"] = sequence
+
+        async def scenario():
+            disruptor = Disruptor(buffer_size=4, event_factory=dict)
+            recorder = Recorder()
+            disruptor.add_processor(recorder)
+            await disruptor.start()
+            for price in (1.0, 2.0):
+                await disruptor.publish_event(translate, price)
+            await disruptor.stop()
+            return disruptor, recorder
+
+        disruptor, recorder = run(scenario())
+
+        assert [event["price"] for event, _ in recorder.seen] == [1.0, 2.0]
+        assert disruptor.ring_buffer.slots[1] == {"price": 2.0, "sequence": 1}
+
+    def test_restart_resumes_after_last_sequence(self):
+        async def scenario():
+            disruptor = Disruptor(buffer_size=8)
+            recorder = Recorder()
+            disruptor.add_processor(recorder)
+            await disruptor.start()
+            await disruptor.publish(0)
+            await disruptor.stop()
+            await disruptor.start()
+            await disruptor.publish(1)
+            await disruptor.stop()
+            return recorder
+
+        assert run(scenario()).seen == [(0, 0), (1, 1)]
@@ -0,0 +1,202 @@
+"""
+Test suite for the queued AsyncLogWriter: overflow policies, rotation and retention
+"""
+
+import gzip
+import os
+import queue
+import tempfile
+import time
+from datetime import datetime
+from datetime import time as clock_time
+
+import pytest
+
+# Importing the package applies a default configuration; keep its files out of the tree
+os.environ.setdefault("LOG_DIR", tempfile.mkdtemp(prefix="log-test-"))
+
+from framework.logging import setup  # noqa: E402
+from framework.logging.setup import (  # noqa: E402
+    AsyncLogWriter,
+    LogConfig,
+    configure_logging,
+    flush_logging,
+    logger,
+    shutdown_logging,
+)
+
+
+class FullQueue(queue.Queue):
+    """Queue that is always full for put_nowait and records blocking puts."""
+
+    def __init__(self):
+        super().__init__()
+        self.kept = []
+
+    def put_nowait(self, item):
+        raise queue.Full
+
+    def put(self, item, block=True, timeout=None):
+        self.kept.append(item)
+
+
+def app_only(tmp_path, **overrides):
+    return LogConfig(
+        console=False,
+        log_dir=str(tmp_path),
+        enable_audit_logging=False,
+        enable_performance_logging=False,
+        enable_security_logging=False,
+        **overrides,
+    )
+
+
+@pytest.fixture
+def overflowing(tmp_path):
+    """Log `n` records at `level` through an unstarted writer whose queue is full."""
+    writers = []
+
+    def emit(policy, n, level="INFO"):
+        writer = AsyncLogWriter(app_only(tmp_path, overflow_policy=policy, overflow_sample_every=10))
+        writer._queue = FullQueue()
+        handler = logger.add(writer.sink, format="{message}", level="DEBUG")
+        try:
+            for i in range(n):
+                logger.log(level, f"record {i}")
+        finally:
+            logger.remove(handler)
+        writers.append(writer)
+        return writer
+
+    yield emit
+    for writer in writers:
+        writer.stop(timeout=0)
+
+
+@pytest.fixture
+def restore_logging(monkeypatch, tmp_path):
+    monkeypatch.setenv("LOG_DIR", str(tmp_path))
+    yield tmp_path
+    shutdown_logging()
+    logger.remove()
+
+
+def test_drop_policy_discards_overflow(overflowing):
+    writer = overflowing("drop", 30)
+
+    assert writer.dropped == 30 and writer._queue.kept == []
+
+
+def test_sample_policy_keeps_every_nth_overflowing_record(overflowing):
+    writer = overflowing("sample", 30)
+
+    assert len(writer._queue.kept) == 3
+    assert writer.dropped == 27
+
+
+def test_block_policy_and_errors_are_never_dropped(overflowing):
+    assert len(overflowing("block", 20)._queue.kept) == 20
+    errors = overflowing("drop", 5, level="ERROR")
+    assert len(errors._queue.kept) == 5 and errors.dropped == 0
+
+
+def test_dropped_records_are_reported_in_the_app_log(tmp_path):
+    writer = AsyncLogWriter(app_only(tmp_path)).start()
+    writer.dropped = 4
+    logger_id = logger.add(writer.sink, format="{message}", level="INFO")
+    try:
+        logger.info("after overflow")
+        assert writer.flush()
+    finally:
+        logger.remove(logger_id)
+        writer.stop()
+
+    lines = (tmp_path / "app.log").read_text().splitlines()
+    assert lines[0] == "after overflow"
+    assert "dropped 4 records" in lines[1]
+
+
+@pytest.mark.parametrize("rotation,expected", [
+    ("500 MB", setup._Rotation(max_bytes=100 * 1000**2)),
+    ("50 MB", setup._Rotation(max_bytes=50 * 1000**2)),
+    ("00:00", setup._Rotation(max_bytes=100 * 1000**2, at=clock_time(0, 0))),
+    ("at 13:30", setup._Rotation(max_bytes=100 * 1000**2, at=clock_time(13, 30))),
+    ("1 day", setup._Rotation(max_bytes=100 * 1000**2, every_seconds=86400)),
+    ("1 week, 3 days", setup._Rotation(max_bytes=100 * 1000**2, every_seconds=10 * 86400)),
+    ("2 hours 30 min", setup._Rotation(max_bytes=100 * 1000**2, every_seconds=9000)),
+])
+def test_parse_rotation_accepts_loguru_grammar(rotation, expected):
+    assert setup._parse_rotation(rotation, "100 MB") == expected
+
+
+@pytest.mark.parametrize("rotation", ["sunday at 12:00", "25:00", "often", "10 parsecs"])
+def test_parse_rotation_rejects_unsupported_values(rotation):
+    with pytest.raises(ValueError):
+        setup._parse_rotation(rotation, "100 MB")
+
+
+def test_daily_rollover_is_the_next_occurrence():
+    rotation = setup._Rotation(at=clock_time(0, 0))
+
+    assert rotation.next_rollover(datetime(2024, 1, 1, 13, 0)) == datetime(2024, 1, 2).timestamp()
+    assert setup._Rotation(every_seconds=60).next_rollover(datetime(2024, 1, 1)) == datetime(2024, 1, 1, 0, 1).timestamp()
+    assert setup._Rotation(max_bytes=10).next_rollover(datetime(2024, 1, 1)) is None
+
+
+def test_size_rotation_counts_bytes_and_gzips(tmp_path):
+    log = setup._BatchedLogFile(tmp_path / "app.log", setup._Rotation(max_bytes=100), retention="")
+
+    log.write(["é" * 60 + "\n"])  # 121 bytes, 61 characters
+    log.write(["next\n"])
+    log.close()
+
+    rotated = list(tmp_path.glob("app.*.log.gz"))
+    assert len(rotated) == 1
+    assert gzip.decompress(rotated[0].read_bytes()).decode() == "é" * 60 + "\n"
+    assert (tmp_path / "app.log").read_text() == "next\n"
+
+
+def test_time_rotation_and_retention(tmp_path):
+    stale = tmp_path / "app.2020-01-01_00-00-00_000000.log.gz"
+    stale.write_bytes(gzip.compress(b"old\n"))
+    os.utime(stale, (time.time() - 3 * 86400,) * 2)
+    log = setup._BatchedLogFile(tmp_path / "app.log", setup._Rotation(every_seconds=3600), retention="2 days")
+
+    log.write(["first\n"])
+    log._rollover_at = time.time() - 1
+    log.write(["second\n"])
+    log.close()
+
+    rotated = list(tmp_path.glob("app.*.log.gz"))
+    assert not stale.exists()
+    assert [gzip.decompress(path.read_bytes()) for path in rotated] == [b"first\n"]
+    assert (tmp_path / "app.log").read_text() == "second\n"
+
+
+def test_unsupported_rotation_falls_back_to_synchronous_sinks(restore_logging, capsys):
+    config = configure_logging(app_only(restore_logging, async_sinks=True, rotation="sunday at 12:00"))
+
+    assert config.async_sinks is False
+    assert "falling back to synchronous sinks" in capsys.readouterr().out
+    logger.info("still logging")
+    logger.remove()
+    assert "still logging" in (restore_logging / "app.log").read_text()
+
+
+def test_async_text_lines_follow_format_string(restore_logging):
+    configure_logging(app_only(
+        restore_logging, async_sinks=True, rotation="500 MB", format_string="<level>{level}</level>|{message}",
+        colorize=True, diagnose=False,
+    ))
+
+    logger.info("hello")
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        logger.exception("failed")
+    assert flush_logging()
+
+    text = (restore_logging / "app.log").read_text()
+    assert "INFO|hello\n" in text
+    assert "ERROR|failed\n" in text and "ValueError: boom" in text
+    assert "\x1b[" not in text
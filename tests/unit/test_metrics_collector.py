@@ -0,0 +1,131 @@
+"""
+Test suite for MetricsCollector per-thread shards and their merged statistics
+"""
+
+import random
+import threading
+
+import numpy as np
+import pytest
+
+from framework.middleware.metrics import MetricsCollector, RequestMetrics
+
+ENDPOINTS = ["/api/orders", "/api/positions", "/api/quotes", "/health"]
+METHODS = ["GET", "POST"]
+STATUS_CODES = [200, 200, 200, 201, 404, 500]
+KEYS = len(ENDPOINTS) * len(METHODS)
+
+
+def requests_for(seed, n=2_000):
+    rng = random.Random(seed)
+    requests = []
+    for _ in range(n):
+        start = rng.uniform(0, 1_000)
+        requests.append(
+            RequestMetrics(
+                endpoint=rng.choice(ENDPOINTS),
+                method=rng.choice(METHODS),
+                start_time=start,
+                end_time=start + rng.lognormvariate(-3, 1.2),
+                status_code=rng.choice(STATUS_CODES),
+                response_size=rng.randint(0, 50_000),
+            )
+        )
+    return requests
+
+
+def record_from_threads(collector, batches, keep_alive):
+    """Record each batch on its own thread; threads in keep_alive stay running until released."""
+    recorded = threading.Barrier(len(batches) + 1)
+    release = threading.Event()
+
+    def worker(index, batch):
+        for metrics in batch:
+            collector.add_metrics(metrics)
+        recorded.wait()
+        if index in keep_alive:
+            release.wait()
+
+    threads = [threading.Thread(target=worker, args=item) for item in enumerate(batches)]
+    for thread in threads:
+        thread.start()
+    recorded.wait()
+    for index, thread in enumerate(threads):
+        if index not in keep_alive:
+            thread.join()
+    return threads, release
+
+
+def comparable(collector):
+    summary = collector.get_summary()
+    endpoints = collector.get_endpoint_stats(top_n=KEYS)["endpoints"]
+    return {
+        "requests": (summary["total_requests"], summary["total_errors"]),
+        "buckets": summary["performance_distribution"],
+        "status_codes": summary["status_code_distribution"],
+        "methods": {m: (s["count"], s["errors"]) for m, s in collector.get_method_stats().items()},
+        "endpoints": {
+            key: (
+                stats["count"],
+                stats["errors"],
+                stats["status_codes"],
+                stats["p50_duration_ms"],
+                stats["p95_duration_ms"],
+                stats["p99_duration_ms"],
+                stats["p95_response_size_bytes"],
+            )
+            for key, stats in endpoints.items()
+        },
+    }
+
+
+def test_threaded_shards_merge_to_single_threaded_statistics():
+    batches = [requests_for(seed) for seed in range(8)]
+    everything = [metrics for batch in batches for metrics in batch]
+    single = MetricsCollector()
+    for metrics in everything:
+        single.add_metrics(metrics)
+
+    threaded = MetricsCollector()
+    threads, release = record_from_threads(threaded, batches, keep_alive={0, 2, 4, 6})
+    expected = comparable(single)
+
+    # Live shards and shards of finished threads are both counted
+    assert comparable(threaded) == expected
+    assert threaded.request_count == len(everything)
+    assert threaded.get_summary()["avg_duration_ms"] == pytest.approx(single.get_summary()["avg_duration_ms"])
+
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    # The first read folds the finished shards into the retired totals, the
+    # second reads only those totals; neither may double count
+    assert comparable(threaded) == expected
+    assert comparable(threaded) == expected
+
+
+def test_merged_percentiles_stay_within_sketch_accuracy():
+    batches = [requests_for(seed, n=1_000) for seed in range(6)]
+    collector = MetricsCollector()
+    threads, release = record_from_threads(collector, batches, keep_alive={1, 3})
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    endpoints = collector.get_endpoint_stats(top_n=KEYS)["endpoints"]
+    assert len(endpoints) == KEYS
+    for key, stats in endpoints.items():
+        method, endpoint = key.split(" ", 1)
+        durations = np.array(
+            [
+                m.duration * 1000
+                for batch in batches
+                for m in batch
+                if m.method == method and m.endpoint == endpoint
+            ]
+        )
+        assert stats["count"] == durations.size
+        for q in (0.5, 0.95, 0.99):
+            exact = np.quantile(durations, q, method="lower")
+            assert stats[f"p{round(q * 100)}_duration_ms"] == pytest.approx(exact, rel=0.01)
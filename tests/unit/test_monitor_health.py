@@ -0,0 +1,213 @@
+"""Tests for concurrent, cached service health checks against local stub servers."""
+
+import os
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import django
+import pytest
+from django.conf import settings
+
+if not settings.configured:
+    settings.configure(
+        INSTALLED_APPS=["django.contrib.contenttypes", "monitor"],
+        DATABASES={
+            "default": {
+                "ENGINE": "django.db.backends.sqlite3",
+                "NAME": os.path.join(tempfile.mkdtemp(), "monitor.sqlite3"),
+            }
+        },
+        CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+        USE_TZ=True,
+    )
+    django.setup()
+
+from django.apps import apps  # noqa: E402
+from django.core.cache import cache  # noqa: E402
+from django.db import connection  # noqa: E402
+from django.test import override_settings  # noqa: E402
+
+from monitor import services as monitor_services  # noqa: E402
+from monitor.models import HealthCheck, ServiceRegistry  # noqa: E402
+from monitor.services import HealthCheckService  # noqa: E402
+
+
+class StubHealthServer:
+    """Local HTTP server answering /health after an injected delay."""
+
+    def __init__(self, delay: float = 0.0, status: int = 200):
+        self.delay = delay
+        self.status = status
+        self.hits = 0
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                stub.hits += 1
+                time.sleep(stub.delay)
+                body = b'{"status": "ok", "version": "1.2.3"}'
+                try:
+                    self.send_response(stub.status)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.port = self.server.server_address[1]
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture(scope="module", autouse=True)
+def monitor_tables():
+    models = list(apps.get_app_config("monitor").get_models())
+    with connection.schema_editor() as editor:
+        for model in models:
+            editor.create_model(model)
+    yield
+    with connection.schema_editor() as editor:
+        for model in reversed(models):
+            editor.delete_model(model)
+
+
+@pytest.fixture
+def register():
+    servers = []
+
+    def _register(delay=0.0, status=200, timeout=None):
+        server = StubHealthServer(delay, status)
+        servers.append(server)
+        metadata = {"health_check_timeout": timeout} if timeout is not None else {}
+        ServiceRegistry.objects.create(
+            name=f"svc_{server.port}",
+            service_type="api",
+            host="127.0.0.1",
+            port=server.port,
+            health_endpoint="/health",
+            metadata=metadata,
+        )
+        return server
+
+    cache.clear()
+    yield _register
+    monitor_services.stop_background_refresh()
+    HealthCheck.objects.all().delete()
+    ServiceRegistry.objects.all().delete()
+    cache.clear()
+    for server in servers:
+        server.close()
+
+
+def test_sweep_probes_services_concurrently(register):
+    for _ in range(4):
+        register(delay=0.4)
+
+    start = time.perf_counter()
+    with HealthCheckService() as checker:
+        results = checker.check_all_services(max_age=0)
+    elapsed = time.perf_counter() - start
+
+    assert results["total"] == 4
+    assert results["healthy"] == 4
+    assert elapsed < 1.2  # sequential probing takes >= 1.6s
+    assert ServiceRegistry.objects.filter(status="healthy", version="1.2.3").count() == 4
+
+
+def test_slow_service_only_costs_its_own_timeout(register):
+    register(delay=0.0)
+    register(delay=0.0, status=503)
+    hung = register(delay=3.0, timeout=0.3)
+
+    start = time.perf_counter()
+    results = HealthCheckService(timeout=5.0).check_all_services(max_age=0)
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 1.5
+    assert (results["healthy"], results["unhealthy"]) == (1, 2)
+    timed_out = HealthCheck.objects.get(service__port=hung.port)
+    assert timed_out.error_message == "Request timeout after 0.3s"
+    assert ServiceRegistry.objects.get(port=hung.port).status == "down"
+
+
+def test_sweeps_are_cached_for_ttl(register):
+    server = register()
+    checker = HealthCheckService(cache_ttl=60)
+
+    first = checker.check_all_services()
+    second = checker.check_all_services()
+    forced = checker.check_all_services(max_age=0)
+
+    assert server.hits == 2
+    assert first["cached"] is False
+    assert second["cached"] is True
+    assert second["checks"] == first["checks"]
+    assert forced["cached"] is False
+
+
+def test_concurrent_viewers_share_one_sweep(register):
+    server = register(delay=0.3)
+    results = []
+
+    def view():
+        results.append(HealthCheckService(cache_ttl=60).check_all_services())
+
+    viewers = [threading.Thread(target=view) for _ in range(5)]
+    for viewer in viewers:
+        viewer.start()
+    for viewer in viewers:
+        viewer.join()
+
+    assert server.hits == 1
+    assert len(results) == 5
+
+
+def test_background_refresher_keeps_page_loads_off_probes(register):
+    server = register()
+    refresher = monitor_services.start_background_refresh(interval=0.1)
+    deadline = time.time() + 5
+    while cache.get(monitor_services.SWEEP_CACHE_KEY) is None and time.time() < deadline:
+        time.sleep(0.02)
+
+    server.delay = 2.0
+    start = time.perf_counter()
+    results = HealthCheckService(cache_ttl=0.01).check_all_services()
+    elapsed = time.perf_counter() - start
+
+    assert refresher.is_running
+    assert results["cached"] is True
+    assert results["healthy"] == 1
+    assert elapsed < 0.5
+
+
+def test_sweep_is_cached_before_the_lock_is_released(register, monkeypatch):
+    register()
+    set_under_lock = []
+    original_set = monitor_services.cache.set
+
+    def recording_set(*args, **kwargs):
+        set_under_lock.append(monitor_services._sweep_lock.locked())
+        return original_set(*args, **kwargs)
+
+    monkeypatch.setattr(monitor_services.cache, "set", recording_set)
+    HealthCheckService(cache_ttl=60).check_all_services()
+
+    assert set_under_lock == [True]
+
+
+def test_app_startup_does_not_start_the_refresher(register):
+    with override_settings(MONITOR_HEALTH_REFRESH_INTERVAL=0.1):
+        apps.get_app_config("monitor").ready()
+
+    assert monitor_services._refresher is None
@@ -0,0 +1,126 @@
+"""
+Test suite for QuantileSketch relative-error bounds, merging and bucket collapsing
+"""
+
+import numpy as np
+import pytest
+
+from framework.middleware.quantiles import QuantileSketch
+
+QS = [0.0, 0.01, 0.1, 0.25, 0.5, 0.75, 0.9, 0.95, 0.99, 0.999, 1.0]
+
+
+def latencies(n=20_000, seed=7):
+    return np.random.default_rng(seed).lognormal(mean=-3, sigma=1.5, size=n)
+
+
+def assert_within(sketch, values, accuracy, qs=QS):
+    exact = np.quantile(values, qs, method="lower")
+    estimates = np.array(sketch.quantiles(qs))
+    np.testing.assert_array_less(np.abs(estimates - exact), accuracy * exact + 1e-12)
+
+
+@pytest.mark.parametrize("accuracy", [0.01, 0.05])
+def test_quantiles_stay_within_relative_accuracy(accuracy):
+    values = latencies()
+    sketch = QuantileSketch(relative_accuracy=accuracy)
+    for value in values:
+        sketch.add(value)
+
+    assert sketch.count == values.size
+    assert sketch.min == values.min() and sketch.max == values.max()
+    assert sketch.mean == pytest.approx(values.mean())
+    assert_within(sketch, values, accuracy)
+
+
+def test_add_many_matches_add():
+    values = latencies(5_000)
+    one_by_one, vectorized = QuantileSketch(), QuantileSketch()
+    for value in values:
+        one_by_one.add(value)
+    vectorized.add_many(values)
+
+    assert one_by_one.quantiles(QS) == vectorized.quantiles(QS)
+
+
+def test_zero_and_tiny_values_share_the_zero_bucket():
+    sketch = QuantileSketch()
+    sketch.add_many([0.0, 1e-12, 0.0, 2.0])
+
+    assert sketch.bucket_count == 2
+    assert sketch.quantiles([0.0, 0.5]) == [0.0, 0.0]
+    assert sketch.quantile(1.0) == pytest.approx(2.0, rel=0.01)
+
+
+def test_empty_sketch_and_invalid_arguments():
+    sketch = QuantileSketch()
+
+    assert sketch.quantiles([0.5, 0.99]) == [0.0, 0.0]
+    assert (sketch.count, sketch.min, sketch.max, sketch.mean) == (0, 0.0, 0.0, 0.0)
+    with pytest.raises(ValueError):
+        sketch.quantile(1.5)
+    with pytest.raises(ValueError):
+        QuantileSketch(relative_accuracy=1.0)
+
+
+def test_merge_equals_a_single_sketch_over_all_values():
+    values = latencies()
+    parts = np.array_split(values, 4)
+    merged = QuantileSketch()
+    for part in parts:
+        sketch = QuantileSketch()
+        sketch.add_many(part)
+        merged.merge(sketch)
+    single = QuantileSketch()
+    single.add_many(values)
+
+    assert merged.count == single.count
+    assert merged.quantiles(QS) == single.quantiles(QS)
+    assert_within(merged, values, 0.01)
+
+
+def test_merge_rejects_different_accuracy():
+    other = QuantileSketch(relative_accuracy=0.05)
+    other.add(1.0)
+
+    with pytest.raises(ValueError, match="relative accuracy"):
+        QuantileSketch().merge(other)
+
+
+def test_round_trip_through_dict():
+    sketch = QuantileSketch()
+    sketch.add_many(latencies(1_000))
+
+    restored = QuantileSketch.from_dict(sketch.to_dict())
+
+    assert restored.quantiles(QS) == sketch.quantiles(QS)
+    assert (restored.count, restored.min, restored.max) == (sketch.count, sketch.min, sketch.max)
+
+
+def test_bucket_count_is_capped_and_lowest_buckets_collapse():
+    # Ten decades at 1% accuracy need about 1,150 buckets
+    values = np.logspace(-6, 4, 50_000)
+    sketch = QuantileSketch(max_buckets=200)
+    sketch.add_many(values)
+
+    assert sketch._counts.size == 200
+    assert sketch.count == values.size
+    # Upper quantiles keep the bound; the collapsed low end is overestimated
+    assert_within(sketch, values, 0.01, qs=[0.9, 0.95, 0.99, 0.999, 1.0])
+    assert sketch.quantile(0.01) > 1.01 * np.quantile(values, 0.01, method="lower")
+
+
+def test_merge_folds_ranges_below_a_collapsed_sketch():
+    gamma = 1.01 / 0.99
+    high = QuantileSketch(max_buckets=100)
+    high.add_many(0.999 * gamma ** np.arange(0, 50))
+    low = QuantileSketch(max_buckets=100)
+    low.add_many(0.999 * gamma ** np.arange(-130, -80))
+
+    high.merge(low)
+
+    assert high._counts.size == 100
+    assert high._counts.sum() == high.count == 100
+    # All of the low sketch lands in the lowest kept bucket; the top is untouched
+    assert high._counts[0] == 50
+    assert high.quantile(1.0) == pytest.approx(0.999 * gamma**49, rel=0.01)
@@ -0,0 +1,163 @@
+"""
+Test suite for layered ServiceRegistry startup and shutdown
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from framework.services.registry import ServiceRegistry, ServiceStatus
+
+
+class StubService:
+    """Async service that sleeps on start/stop and records event order."""
+
+    def __init__(self, name, log, start_delay=0.0, stop_delay=0.0, fail=False):
+        self.name = name
+        self.log = log
+        self.start_delay = start_delay
+        self.stop_delay = stop_delay
+        self.fail = fail
+
+    async def start(self):
+        self.log.append(("start", self.name))
+        await asyncio.sleep(self.start_delay)
+        if self.fail:
+            raise RuntimeError(f"{self.name} failed")
+        self.log.append(("started", self.name))
+
+    async def stop(self):
+        self.log.append(("stop", self.name))
+        await asyncio.sleep(self.stop_delay)
+        self.log.append(("stopped", self.name))
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def build(log, delay=0.05, **overrides):
+    registry = ServiceRegistry()
+    specs = {
+        "redis": set(),
+        "db": set(),
+        "models": set(),
+        "http": set(),
+        "cache": {"redis", "db"},
+        "api": {"cache", "models", "http"},
+    }
+    for name, deps in specs.items():
+        registry.register(name, StubService(name, log, start_delay=delay, stop_delay=delay, **overrides.get(name, {})),
+                          dependencies=deps)
+    return registry
+
+
+def test_layers_follow_dependency_depth():
+    registry = build([])
+
+    assert registry._resolve_startup_layers() == [["db", "http", "models", "redis"], ["cache"], ["api"]]
+
+
+def test_independent_services_start_concurrently():
+    log = []
+    registry = build(log, delay=0.1)
+
+    started = time.perf_counter()
+    run(registry.start_all(enable_health_checks=False))
+    elapsed = time.perf_counter() - started
+
+    # three layers of 0.1s each, not six services in sequence
+    assert elapsed < 0.45
+    assert all(registry.is_service_running(name) for name in registry.list_services())
+    assert {name for _, name in log[:4]} == {"redis", "db", "models", "http"}
+    assert log.index(("start", "cache")) > max(log.index(("started", n)) for n in ("redis", "db"))
+    assert log.index(("start", "api")) > log.index(("started", "cache"))
+
+
+def test_startup_timings_are_recorded():
+    registry = build([], delay=0.05)
+
+    run(registry.start_all(enable_health_checks=False))
+    timings = registry.get_startup_timings()
+
+    assert timings["layers"] == [["db", "http", "models", "redis"], ["cache"], ["api"]]
+    assert 0.15 <= timings["total_seconds"] < 0.4
+    assert timings["services"]["db"]["startup_seconds"] >= 0.05
+    assert registry.get_service_info("api").startup_duration >= 0.05
+
+
+def test_stop_all_runs_layers_in_reverse():
+    log = []
+    registry = build(log, delay=0.05)
+
+    async def lifecycle():
+        await registry.start_all(enable_health_checks=False)
+        log.clear()
+        started = time.perf_counter()
+        await registry.stop_all()
+        return time.perf_counter() - started
+
+    elapsed = run(lifecycle())
+
+    assert elapsed < 0.3
+    assert log[0] == ("stop", "api")
+    assert log.index(("stop", "cache")) > log.index(("stopped", "api"))
+    assert min(log.index(("stop", n)) for n in ("redis", "db")) > log.index(("stopped", "cache"))
+    assert registry.get_services_by_status(ServiceStatus.STOPPED) == registry.list_services()
+    assert registry.get_service_info("redis").shutdown_duration >= 0.05
+
+
+def test_failure_in_a_layer_stops_started_services():
+    log = []
+    registry = build(log, delay=0.01, models={"fail": True})
+
+    with pytest.raises(RuntimeError, match="models"):
+        run(registry.start_all(enable_health_checks=False))
+
+    assert ("start", "cache") not in log
+    assert registry.get_service_info("models").status == ServiceStatus.ERROR
+    assert registry.get_service_info("db").status == ServiceStatus.STOPPED
+
+
+def test_per_service_startup_timeout():
+    registry = ServiceRegistry()
+    registry.register("slow", StubService("slow", [], start_delay=1.0), startup_timeout=0.05)
+
+    with pytest.raises(RuntimeError, match="slow"):
+        run(registry.start_all(enable_health_checks=False))
+
+    info = registry.get_service_info("slow")
+    assert info.error_message == "Startup timeout"
+    assert info.startup_duration < 0.5
+
+
+def test_health_checks_fan_out_concurrently():
+    registry = ServiceRegistry()
+    registry._health_check_timeout = 0.2
+    calls = []
+
+    def checker(name, healthy=True, delay=0.1):
+        async def check():
+            calls.append(name)
+            await asyncio.sleep(delay)
+            return healthy
+        return check
+
+    registry.register("a", object(), health_check=checker("a"))
+    registry.register("b", object(), health_check=checker("b", healthy=False))
+    registry.register("c", object(), health_check=checker("c", delay=1.0))
+
+    async def check_all():
+        await registry.start_all(enable_health_checks=False)
+        started = time.perf_counter()
+        await registry._check_all_services_health()
+        return time.perf_counter() - started
+
+    elapsed = run(check_all())
+
+    assert sorted(calls) == ["a", "b", "c"]
+    assert elapsed < 0.35
+    assert registry.is_service_running("a")
+    assert registry.get_service_info("b").error_message == "Health check failed"
+    assert registry.get_service_info("c").error_message == "Health check timeout"
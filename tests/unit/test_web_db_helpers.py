@@ -0,0 +1,178 @@
+"""Tests for SQL-side P&L aggregation in web db_helpers, run against SQLite."""
+
+import sys
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+WEB_SRC = Path(__file__).resolve().parents[2] / "src/services/web/src"
+if str(WEB_SRC) not in sys.path:
+    sys.path.insert(0, str(WEB_SRC))
+
+from core.database.models import Account, Position, Trade  # noqa: E402
+import db_helpers  # type: ignore  # noqa: E402
+
+
+@compiles(JSONB, "sqlite")
+def _jsonb_as_json(type_, compiler, **kw):
+    return "JSON"
+
+
+NOW = datetime.now(timezone.utc).replace(hour=12, minute=0, second=0, microsecond=0)
+
+TRADES = [
+    # (days ago, account, symbol, strategy, pnl, fee)
+    (0, 1, "BTCUSDT", "momentum", "120.5", "1.2"),
+    (0, 1, "BTCUSDT", "momentum", "-40", "0.8"),
+    (1, 1, "ETHUSDT", None, "35", "0.5"),
+    (1, 1, "ETHUSDT", "Manual", None, "0.5"),
+    (3, 1, "SOLUSDT", "mean_reversion", "-15.25", None),
+    (6, 1, "ETHUSDT", "momentum", "5", "0.1"),
+    (10, 1, "BTCUSDT", "mean_reversion", "60", "1"),
+    (2, 2, "BTCUSDT", "momentum", "-500", "2"),
+]
+
+
+@pytest.fixture
+def session_factory(monkeypatch):
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Account.__table__.create(engine)
+    Position.__table__.create(engine)
+    Trade.__table__.create(engine)
+    factory = sessionmaker(bind=engine)
+
+    session = factory()
+    for account_id in (1, 2):
+        session.add(Account(id=account_id, name=f"acct-{account_id}", account_type="personal",
+                            initial_balance=Decimal("10000"), current_balance=Decimal("10500"),
+                            is_active=True))
+    for days_ago, account_id, symbol, strategy, pnl, fee in TRADES:
+        session.add(Trade(time=NOW - timedelta(days=days_ago), account_id=account_id, symbol=symbol,
+                          trade_type="SELL", quantity=Decimal("1"), price=Decimal("100"),
+                          realized_pnl=Decimal(pnl) if pnl else None, fee=Decimal(fee) if fee else None,
+                          strategy_name=strategy))
+    session.add(Position(account_id=1, symbol="BTCUSDT", quantity=Decimal("2"), entry_price=Decimal("100"),
+                         current_price=Decimal("110"), unrealized_pnl=Decimal("20")))
+    session.add(Position(account_id=1, symbol="ETHUSDT", quantity=Decimal("1"), entry_price=Decimal("50"),
+                         current_price=None, unrealized_pnl=None))
+    session.commit()
+    session.close()
+
+    monkeypatch.setattr(db_helpers, "get_db_session", factory)
+    monkeypatch.setattr(db_helpers, "_rollup_available", {})
+    return factory
+
+
+@pytest.fixture(params=["python", "sql"])
+def mode(request, session_factory, monkeypatch):
+    if request.param == "sql":
+        monkeypatch.setattr(db_helpers, "SQL_AGGREGATE_DIALECTS", {"postgresql", "sqlite"})
+    return request.param
+
+
+def _all_helpers():
+    return {
+        "summary": {k: v for k, v in db_helpers.get_account_summary(1).items() if k != "account"},
+        "metrics": db_helpers.get_performance_metrics(),
+        "strategies": sorted(db_helpers.get_strategy_performance(), key=lambda s: s["name"]),
+        "symbols": db_helpers.get_symbol_performance(account_id=1),
+        "daily": db_helpers.get_daily_pnl(account_id=1, days=7),
+    }
+
+
+def test_account_summary(mode):
+    summary = db_helpers.get_account_summary(1)
+
+    assert summary["total_trades"] == 7
+    assert (summary["winning_trades"], summary["losing_trades"]) == (4, 2)
+    assert summary["win_rate"] == 57.14
+    assert summary["total_pnl"] == 165.25
+    assert summary["profit_factor"] == round(220.5 / 55.25, 2)
+    assert summary["active_positions"] == 2
+    assert summary["unrealized_pnl"] == 20
+    assert summary["active_positions_value"] == 220
+
+
+def test_strategies_group_missing_names_under_manual(mode):
+    strategies = {s["name"]: s for s in db_helpers.get_strategy_performance()}
+
+    assert set(strategies) == {"Manual", "mean_reversion", "momentum"}
+    assert strategies["Manual"]["total_trades"] == 2
+    assert strategies["momentum"]["total_pnl"] == -414.5
+    assert strategies["momentum"]["avg_loss"] == 270
+
+
+def test_daily_pnl_is_zero_filled_oldest_first(mode):
+    daily = db_helpers.get_daily_pnl(account_id=1, days=7)
+
+    assert len(daily["labels"]) == 7
+    assert daily["labels"][-1] == NOW.strftime("%Y-%m-%d")
+    assert daily["pnl"] == [5, 0, 0, -15.25, 0, 35, 80.5]
+
+
+def test_daily_pnl_fallback_only_loads_trades_in_the_window(session_factory):
+    loaded = []
+
+    def on_load(trade, context):
+        loaded.append(trade.time)
+
+    event.listen(Trade, "load", on_load)
+    try:
+        daily = db_helpers.get_daily_pnl(account_id=1, days=7)
+    finally:
+        event.remove(Trade, "load", on_load)
+
+    # The trade from ten days ago is filtered in the query, not after loading
+    assert len(loaded) == 6
+    assert daily["pnl"] == [5, 0, 0, -15.25, 0, 35, 80.5]
+
+
+def test_sql_aggregates_match_python_fallback(session_factory, monkeypatch):
+    python = _all_helpers()
+    monkeypatch.setattr(db_helpers, "SQL_AGGREGATE_DIALECTS", {"postgresql", "sqlite"})
+
+    assert _all_helpers() == python
+
+
+def test_rollup_rows_give_same_results_as_raw_trades(session_factory, monkeypatch):
+    monkeypatch.setattr(db_helpers, "SQL_AGGREGATE_DIALECTS", {"postgresql", "sqlite"})
+    raw = _all_helpers()
+
+    # Stand-in for the daily_trade_pnl continuous aggregate
+    session = session_factory()
+    session.execute(text(
+        "CREATE TABLE daily_trade_pnl AS SELECT date(time) || ' 00:00:00.000000' AS day, account_id, strategy_name, symbol,"
+        " COUNT(*) AS trades_count,"
+        " SUM(CASE WHEN realized_pnl > 0 THEN 1 ELSE 0 END) AS winning_trades,"
+        " SUM(CASE WHEN realized_pnl < 0 THEN 1 ELSE 0 END) AS losing_trades,"
+        " SUM(CASE WHEN realized_pnl > 0 THEN realized_pnl ELSE 0 END) AS gross_profit,"
+        " SUM(CASE WHEN realized_pnl < 0 THEN -realized_pnl ELSE 0 END) AS gross_loss,"
+        " COALESCE(SUM(realized_pnl), 0) AS total_pnl, COALESCE(SUM(fee), 0) AS total_fees"
+        " FROM trades GROUP BY date(time), account_id, strategy_name, symbol"
+    ))
+    session.commit()
+    session.close()
+    monkeypatch.setattr(db_helpers, "has_pnl_rollup", lambda session: True)
+
+    assert _all_helpers() == raw
+
+
+def test_rollup_query_compiles_for_postgres(monkeypatch):
+    from sqlalchemy import select
+    from sqlalchemy.dialects import postgresql
+
+    monkeypatch.setattr(db_helpers, "has_pnl_rollup", lambda session: True)
+    source, keys, aggregates = db_helpers._pnl_source(session=None)
+
+    stmt = select(keys["strategy"].label("key"), *aggregates).select_from(source).group_by(keys["strategy"])
+    sql = str(stmt.compile(dialect=postgresql.dialect())).replace("\n", " ")
+
+    assert "FROM daily_trade_pnl GROUP BY coalesce(daily_trade_pnl.strategy_name, 'Manual')" in sql
+    assert "sum(daily_trade_pnl.gross_profit)" in sql